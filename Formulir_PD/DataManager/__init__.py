@@ -2,10 +2,23 @@ from .save_function import DataSave
 from .load_function import DataLoad
 from .reset_function_report import DataResetReport
 from .reset_function_extract import DataResetExtract
+from .sidecar_titik import SidecarTitik
+from .penyimpanan_sqlite import PenyimpananSQLite, buka_penyimpanan
+from .arsip_survey import ArsipSurvey
+from .sqlite_function import DataSaveSQLite, DataLoadSQLite, DataResetSQLite, SECTION_LAPORAN, SECTION_EKSTRAKSI
 
 __all__ = [
     "DataSave",
     "DataLoad",
     "DataResetReport",
-    "DataResetExtract"
+    "DataResetExtract",
+    "SidecarTitik",
+    "PenyimpananSQLite",
+    "buka_penyimpanan",
+    "DataSaveSQLite",
+    "DataLoadSQLite",
+    "DataResetSQLite",
+    "ArsipSurvey",
+    "SECTION_LAPORAN",
+    "SECTION_EKSTRAKSI"
 ]
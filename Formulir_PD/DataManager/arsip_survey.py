@@ -0,0 +1,253 @@
+import datetime
+from .penyimpanan_sqlite import PenyimpananSQLite, LOKASI_TRAFO
+
+# =========================================================
+# MODUL : ARSIP SURVEY (BANYAK SURVEY, PENCARIAN TERINDEKS)
+# =========================================================
+# Urutan tingkat keparahan (sama dengan StandardValue); "Tidak Ada Data" / kosong = -1
+PERINGKAT_KEPARAHAN = {
+    "Noise / Insignifikan": 0,
+    "Rendah": 1,
+    "Sedang": 2,
+    "Tinggi": 3
+}
+
+# Nama tabel pengukuran → jenis sensor
+SENSOR_TABEL = {
+    "tev": "TEV",
+    "hfct": "HFCT",
+    "ultradish": "Ultrasonik",
+    "flexible_mic": "Ultrasonik",
+    "contact_probe": "Ultrasonik"
+}
+
+SKEMA_ARSIP = """
+CREATE TABLE IF NOT EXISTS arsip (
+    survey_id   INTEGER PRIMARY KEY REFERENCES survey(id) ON DELETE CASCADE,
+    gardu_induk TEXT NOT NULL,
+    tanggal     TEXT NOT NULL,
+    jam         TEXT NOT NULL DEFAULT '',
+    UNIQUE (gardu_induk, tanggal)
+);
+CREATE TABLE IF NOT EXISTS indeks_temuan (
+    survey_id           INTEGER NOT NULL REFERENCES survey(id) ON DELETE CASCADE,
+    gardu_induk         TEXT NOT NULL,
+    tanggal             TEXT NOT NULL,
+    trafo               TEXT NOT NULL,
+    lokasi              TEXT NOT NULL,
+    sensor              TEXT NOT NULL,
+    tabel               TEXT NOT NULL,
+    titik               TEXT NOT NULL DEFAULT '',
+    nilai               TEXT NOT NULL DEFAULT '',
+    tingkat_keparahan   TEXT NOT NULL DEFAULT '',
+    peringkat           INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_arsip_tanggal ON arsip (tanggal);
+CREATE INDEX IF NOT EXISTS idx_temuan_sensor ON indeks_temuan (sensor, peringkat, tanggal);
+CREATE INDEX IF NOT EXISTS idx_temuan_lokasi ON indeks_temuan (lokasi, peringkat, tanggal);
+CREATE INDEX IF NOT EXISTS idx_temuan_keparahan ON indeks_temuan (peringkat, tanggal);
+CREATE INDEX IF NOT EXISTS idx_temuan_tanggal ON indeks_temuan (tanggal);
+CREATE INDEX IF NOT EXISTS idx_temuan_survey ON indeks_temuan (survey_id);
+"""
+
+
+def peringkat_keparahan(tingkat):
+    """Label tingkat keparahan → angka 0–3 (-1 jika kosong / tidak dikenal)."""
+    if isinstance(tingkat, int):
+        return tingkat
+    return PERINGKAT_KEPARAHAN.get((tingkat or "").strip(), -1)
+
+
+def _iso(tanggal):
+    """date/datetime/'YYYY-MM-DD' → 'YYYY-MM-DD'."""
+    if tanggal is None or isinstance(tanggal, str):
+        return tanggal
+    if isinstance(tanggal, datetime.datetime):
+        tanggal = tanggal.date()
+    return tanggal.isoformat()
+
+
+class ArsipSurvey(PenyimpananSQLite):
+    """
+    Arsip laporan PD yang sudah selesai, satu database untuk bertahun-tahun survey.
+    - Setiap laporan disimpan sebagai survey bernama 'Gardu Induk/YYYY-MM-DD'
+      (tabel section/trafo/baris_pengukuran/hasil_plot milik PenyimpananSQLite).
+    - Setiap baris pengukuran juga dicatat di tabel indeks_temuan (gardu induk, tanggal,
+      trafo, lokasi, sensor, tingkat keparahan) yang terindeks, sehingga pencarian lintas
+      survey tidak perlu membuka isi laporan.
+
+    Contoh:
+        arsip = ArsipSurvey("arsip_survey.db")
+        arsip.arsipkan({"halaman_depan": ..., "formulir_laporan": ..., "hasil_plot": ...})
+        arsip.cari_trafo(sensor="HFCT", keparahan_min="Sedang",
+                         sejak=datetime.date.today() - datetime.timedelta(days=730))
+    """
+
+    def __init__(self, db_file="arsip_survey.db"):
+        super().__init__(db_file)
+        with self._kunci:
+            self.koneksi.executescript(SKEMA_ARSIP)
+
+    # ---------------------------------------------------------
+    # SIMPAN
+    # ---------------------------------------------------------
+    @staticmethod
+    def kunci_survey(gardu_induk, tanggal):
+        return f"{gardu_induk}/{_iso(tanggal)}"
+
+    @staticmethod
+    def tanggal_laporan(halaman_depan):
+        """Tanggal survey (ISO) dari isian halaman depan (DD / MM / YYYY)."""
+        try:
+            return datetime.date(
+                int(halaman_depan.get("tahun", "")),
+                int(halaman_depan.get("bulan", "")),
+                int(halaman_depan.get("hari", ""))
+            ).isoformat()
+        except (TypeError, ValueError):
+            raise ValueError("Tanggal pada halaman depan belum lengkap / tidak valid.")
+
+    def arsipkan(self, data):
+        """
+        Simpan satu laporan lengkap ke arsip (menimpa arsip dengan gardu induk + tanggal yang sama).
+
+        Args:
+            data (dict): section laporan, minimal "halaman_depan" (gardu_induk, hari, bulan, tahun);
+                         "formulir_laporan" dan "hasil_plot" ikut disimpan jika ada.
+
+        Return:
+            str: kunci arsip 'Gardu Induk/YYYY-MM-DD'.
+        """
+        depan = data.get("halaman_depan") or {}
+        gardu_induk = (depan.get("gardu_induk") or "").strip()
+        if not gardu_induk:
+            raise ValueError("Gardu induk pada halaman depan belum diisi.")
+        tanggal = self.tanggal_laporan(depan)
+        jam = f"{depan.get('jam', '')}:{depan.get('menit', '')}".strip(":")
+        kunci = self.kunci_survey(gardu_induk, tanggal)
+
+        def kerja(cur):
+            survey_id = self._id_survey(cur, kunci, buat=True)
+            for nama, isi in data.items():
+                self._tulis_section(cur, survey_id, nama, isi)
+            self._tandai_berubah(cur, survey_id)
+
+            cur.execute(
+                "INSERT INTO arsip (survey_id, gardu_induk, tanggal, jam) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(survey_id) DO UPDATE SET jam = excluded.jam",
+                (survey_id, gardu_induk, tanggal, jam)
+            )
+            cur.execute("DELETE FROM indeks_temuan WHERE survey_id = ?", (survey_id,))
+            cur.executemany(
+                "INSERT INTO indeks_temuan (survey_id, gardu_induk, tanggal, trafo, lokasi, sensor, tabel, "
+                "titik, nilai, tingkat_keparahan, peringkat) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(survey_id, gardu_induk, tanggal) + temuan
+                 for temuan in self._temuan(data.get("formulir_laporan") or {})]
+            )
+
+        self._transaksi(kerja)
+        return kunci
+
+    def _temuan(self, formulir):
+        """Baris pengukuran formulir_laporan → (trafo, lokasi, sensor, tabel, titik, nilai, tingkat, peringkat)."""
+        for lokasi, per_nomor in formulir.items():
+            if lokasi not in LOKASI_TRAFO or not isinstance(per_nomor, dict):
+                continue
+            for nomor, isi_tab in per_nomor.items():
+                _, tabel = self._pecah_tab(isi_tab if isinstance(isi_tab, dict) else {})
+                for jalur, daftar in tabel.items():
+                    nama_tabel = jalur.partition("/")[2]
+                    sensor = SENSOR_TABEL.get(nama_tabel, nama_tabel)
+                    for baris in daftar:
+                        if not isinstance(baris, dict):
+                            continue
+                        tingkat = baris.get("tingkat_keparahan", "") or ""
+                        yield (f"TRF#{nomor}", lokasi, sensor, nama_tabel,
+                               str(baris.get("titik", "") or ""), str(baris.get("nilai", "") or ""),
+                               tingkat, peringkat_keparahan(tingkat))
+
+    # ---------------------------------------------------------
+    # BACA / CARI
+    # ---------------------------------------------------------
+    def daftar_arsip(self, gardu_induk=None):
+        """List (gardu_induk, tanggal, jam) semua laporan di arsip, terbaru dulu."""
+        sql = "SELECT gardu_induk, tanggal, jam FROM arsip"
+        args = ()
+        if gardu_induk:
+            sql += " WHERE gardu_induk = ?"
+            args = (gardu_induk,)
+        with self._kunci:
+            return self.koneksi.execute(sql + " ORDER BY tanggal DESC, gardu_induk", args).fetchall()
+
+    def muat(self, gardu_induk, tanggal):
+        """Isi lengkap satu laporan arsip (dict section → isi), kosong jika tidak ada."""
+        kunci = self.kunci_survey(gardu_induk, tanggal)
+        return {nama: self.baca_section(kunci, nama) for nama in self.daftar_section(kunci)}
+
+    def hapus_arsip(self, gardu_induk, tanggal):
+        kunci = self.kunci_survey(gardu_induk, tanggal)
+        self._transaksi(lambda cur: cur.execute("DELETE FROM survey WHERE nama = ?", (kunci,)))
+
+    @staticmethod
+    def _filter(sensor=None, lokasi=None, keparahan_min=None, gardu_induk=None, trafo=None, sejak=None, sampai=None):
+        syarat, args = [], []
+        for kolom, nilai in (("sensor", sensor), ("lokasi", lokasi), ("gardu_induk", gardu_induk), ("trafo", trafo)):
+            if nilai is None:
+                continue
+            if isinstance(nilai, (list, tuple, set)):
+                syarat.append(f"{kolom} IN ({', '.join('?' * len(nilai))})")
+                args.extend(nilai)
+            else:
+                syarat.append(f"{kolom} = ?")
+                args.append(nilai)
+        if keparahan_min is not None:
+            syarat.append("peringkat >= ?")
+            args.append(peringkat_keparahan(keparahan_min))
+        if sejak is not None:
+            syarat.append("tanggal >= ?")
+            args.append(_iso(sejak))
+        if sampai is not None:
+            syarat.append("tanggal <= ?")
+            args.append(_iso(sampai))
+        return (" WHERE " + " AND ".join(syarat)) if syarat else "", args
+
+    def cari_temuan(self, **filter):
+        """
+        Cari baris pengukuran di seluruh arsip.
+
+        Args (semua opsional):
+            sensor, lokasi, gardu_induk, trafo (str atau list);
+            keparahan_min (str label / int 0–3) → "Sedang" berarti Sedang atau lebih parah;
+            sejak, sampai (date / 'YYYY-MM-DD').
+
+        Return:
+            list of dict: gardu_induk, tanggal, trafo, lokasi, sensor, tabel, titik, nilai, tingkat_keparahan.
+        """
+        where, args = self._filter(**filter)
+        kolom = ("gardu_induk", "tanggal", "trafo", "lokasi", "sensor", "tabel", "titik", "nilai", "tingkat_keparahan")
+        with self._kunci:
+            baris = self.koneksi.execute(
+                f"SELECT {', '.join(kolom)} FROM indeks_temuan{where} ORDER BY tanggal DESC, gardu_induk, trafo", args
+            ).fetchall()
+        return [dict(zip(kolom, b)) for b in baris]
+
+    def cari_trafo(self, **filter):
+        """
+        Seperti cari_temuan, tetapi dikelompokkan per kunci gardu induk / tanggal / trafo
+        dengan tingkat keparahan terburuk yang memenuhi filter.
+
+        Return:
+            list of dict: gardu_induk, tanggal, trafo, tingkat_keparahan, jumlah_temuan.
+        """
+        where, args = self._filter(**filter)
+        with self._kunci:
+            baris = self.koneksi.execute(
+                f"SELECT gardu_induk, tanggal, trafo, MAX(peringkat), COUNT(*) FROM indeks_temuan{where} "
+                "GROUP BY survey_id, trafo ORDER BY tanggal DESC, gardu_induk, trafo", args
+            ).fetchall()
+        label = {v: k for k, v in PERINGKAT_KEPARAHAN.items()}
+        return [
+            {"gardu_induk": gi, "tanggal": tgl, "trafo": trafo,
+             "tingkat_keparahan": label.get(peringkat, ""), "jumlah_temuan": jumlah}
+            for gi, tgl, trafo, peringkat, jumlah in baris
+        ]
@@ -0,0 +1,107 @@
+import os
+import atexit
+import threading
+from collections import OrderedDict
+
+# =========================================================
+# MODUL : PENULIS LATAR BELAKANG (AUTOSAVE)
+# =========================================================
+class PenulisLatar:
+    """
+    Satu thread penulis di latar belakang untuk autosave.
+    - Halaman menyiapkan snapshot data di thread UI, lalu mengirim fungsi tulis ke sini.
+    - Pekerjaan dikelompokkan per kunci (path file): jika file yang sama dikirim lagi
+      sebelum sempat ditulis, hanya versi terbaru yang ditulis (coalescing).
+    - Urutan antar file tetap dijaga (FIFO), misal sidecar titik ditulis sebelum JSON yang merujuknya.
+    - Pembaca dapat mengambil data yang belum ditulis (data_tertunda) atau menunggu (tunggu).
+    - Kunci dinormalisasi ke path absolut, sehingga "saved_data.json" dan path lengkapnya
+      menunjuk pekerjaan yang sama.
+    - Saat aplikasi ditutup, semua pekerjaan yang tertunda diselesaikan dulu (atexit).
+    """
+
+    def __init__(self):
+        self._kondisi = threading.Condition()
+        self._antrean = OrderedDict()   # kunci → (fungsi, data)
+        self._berjalan = None           # (kunci, data) yang sedang ditulis
+        self._galat = {}                # kunci → pesan error terakhir
+        self._thread = None
+
+    def _pastikan_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="PenulisLatar", daemon=True)
+            self._thread.start()
+
+    def kirim(self, kunci, fungsi, data=None):
+        """
+        Jadwalkan penulisan.
+
+        Args:
+            kunci (str): identitas target (path file) untuk coalescing.
+            fungsi (callable): fungsi tanpa argumen yang melakukan penulisan.
+            data: snapshot data yang akan ditulis (dikembalikan oleh data_tertunda).
+        """
+        kunci = self._normal(kunci)
+        with self._kondisi:
+            # Versi lama yang belum ditulis digantikan; pindah ke belakang antrean
+            self._antrean.pop(kunci, None)
+            self._antrean[kunci] = (fungsi, data)
+            self._pastikan_thread()
+            self._kondisi.notify_all()
+
+    def data_tertunda(self, kunci):
+        """Data terbaru untuk kunci yang belum selesai ditulis, atau None."""
+        kunci = self._normal(kunci)
+        with self._kondisi:
+            if kunci in self._antrean:
+                return self._antrean[kunci][1]
+            if self._berjalan is not None and self._berjalan[0] == kunci:
+                return self._berjalan[1]
+            return None
+
+    def tunggu(self, kunci=None):
+        """Tunggu sampai penulisan kunci tertentu (None = semua) selesai."""
+        if threading.current_thread() is self._thread:
+            return
+        if kunci is not None:
+            kunci = self._normal(kunci)
+        with self._kondisi:
+            while self._sibuk(kunci):
+                self._kondisi.wait()
+
+    def ambil_galat(self, kunci):
+        """Ambil (dan hapus) pesan error penulisan latar belakang terakhir untuk kunci."""
+        kunci = self._normal(kunci)
+        with self._kondisi:
+            return self._galat.pop(kunci, None)
+
+    @staticmethod
+    def _normal(kunci):
+        return os.path.abspath(kunci)
+
+    def _sibuk(self, kunci):
+        if kunci is None:
+            return bool(self._antrean) or self._berjalan is not None
+        return kunci in self._antrean or (self._berjalan is not None and self._berjalan[0] == kunci)
+
+    def _loop(self):
+        while True:
+            with self._kondisi:
+                while not self._antrean:
+                    self._kondisi.wait()
+                kunci, (fungsi, data) = self._antrean.popitem(last=False)
+                self._berjalan = (kunci, data)
+
+            try:
+                fungsi()
+            except Exception as e:
+                with self._kondisi:
+                    self._galat[kunci] = str(e)
+            finally:
+                with self._kondisi:
+                    self._berjalan = None
+                    self._kondisi.notify_all()
+
+
+# Satu penulis untuk seluruh aplikasi
+penulis_latar = PenulisLatar()
+atexit.register(penulis_latar.tunggu)
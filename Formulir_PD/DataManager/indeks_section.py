@@ -0,0 +1,190 @@
+import os
+import re
+import json
+import threading
+from .autosave import penulis_latar
+
+# =========================================================
+# MODUL : INDEKS & CACHE SECTION FILE JSON (LOAD MALAS)
+# =========================================================
+# Key level-1 (section) dan level-2 (misal 'Lokasi|Sensor') pada file berformat json indent=4
+_POLA_KEY = {
+    # (diawali "\n" + spasi literal agar pencarian memakai prefix literal, jauh lebih cepat dari ^ + re.M)
+    1: re.compile(r'\n    ("(?:[^"\\\n]|\\.)*"): '),
+    2: re.compile(r'\n        ("(?:[^"\\\n]|\\.)*"): '),
+}
+# Awal objek: "{", baris baru (LF/CRLF), lalu key pertama pada indentasi level tersebut
+_POLA_BUKA = {
+    1: re.compile(r'\{\r?\n {4}"'),
+    2: re.compile(r'\{\r?\n {8}"'),
+}
+
+
+class _FormatTidakDikenal(Exception):
+    """Teks file tidak berformat indent=4 → dibaca penuh."""
+
+
+class CacheSection:
+    """
+    Cache isi file JSON per section, dipakai bersama oleh semua DataLoad (bertahan saat pindah halaman).
+    - File berformat json indent=4 (format yang ditulis DataSave) diindeks tanpa di-parse:
+      hanya posisi awal/akhir tiap section (dan tiap key di dalam section) yang dicatat.
+    - Section / key diparse saat pertama kali diminta, lalu disimpan di memori.
+    - Cache dibuang jika tanda file (mtime_ns, size) berubah atau file ditulis ulang (buang).
+    - File dengan format lain (ditulis tangan / rusak) dibaca penuh lewat JurnalData.baca().
+
+    Objek yang dikembalikan dipakai bersama → perlakukan sebagai read-only.
+    """
+
+    def __init__(self):
+        self._kunci = threading.Lock()
+        self._file = {}  # abspath → state cache
+
+    # ---------------------------------------------------------
+    # API
+    # ---------------------------------------------------------
+    def daftar_section(self, jurnal):
+        """Nama semua section yang ada di file (tanpa mem-parse isinya)."""
+        state = self._state(jurnal)
+        if state["penuh"] is not None:
+            return list(state["penuh"])
+        return list(state["indeks"])
+
+    def section(self, jurnal, nama, default=None):
+        """Isi satu section (diparse sekali, lalu diambil dari cache)."""
+        state = self._state(jurnal)
+        if state["penuh"] is not None:
+            return state["penuh"].get(nama, default)
+        if nama not in state["indeks"]:
+            return default
+        if nama not in state["section"]:
+            state["section"][nama] = self._parse(jurnal, state, state["indeks"][nama])
+            if state["penuh"] is not None:
+                return state["penuh"].get(nama, default)
+        return state["section"][nama]
+
+    def entri(self, jurnal, nama, key, default=None):
+        """Isi satu key di dalam section (misal hasil_plot → 'Lokasi|Sensor') tanpa mem-parse key lain."""
+        state = self._state(jurnal)
+        if state["penuh"] is not None:
+            return self._ambil(state["penuh"].get(nama), key, default)
+        if nama in state["section"]:
+            return self._ambil(state["section"][nama], key, default)
+        if nama not in state["indeks"]:
+            return default
+
+        if nama not in state["sub_indeks"]:
+            try:
+                a, b = state["indeks"][nama]
+                if state["teks"][a:b].strip() == "{}":
+                    state["sub_indeks"][nama] = {}
+                else:
+                    state["sub_indeks"][nama] = self._indeks(state["teks"], a, b, level=2)
+            except _FormatTidakDikenal:
+                return self._ambil(self.section(jurnal, nama), key, default)
+
+        rentang = state["sub_indeks"][nama].get(key)
+        if rentang is None:
+            return default
+        if (nama, key) not in state["entri"]:
+            state["entri"][(nama, key)] = self._parse(jurnal, state, rentang)
+            if state["penuh"] is not None:
+                return self._ambil(state["penuh"].get(nama), key, default)
+        return state["entri"][(nama, key)]
+
+    def buang(self, path):
+        """Buang cache file tertentu (dipanggil setiap kali file ditulis ulang)."""
+        with self._kunci:
+            self._file.pop(os.path.abspath(path), None)
+
+    # ---------------------------------------------------------
+    # INTERNAL
+    # ---------------------------------------------------------
+    @staticmethod
+    def _ambil(data, key, default):
+        return data.get(key, default) if isinstance(data, dict) else default
+
+    @staticmethod
+    def _state_baru(tanda=None, teks="", penuh=None):
+        return {"tanda": tanda, "teks": teks, "indeks": {}, "sub_indeks": {},
+                "section": {}, "entri": {}, "penuh": penuh}
+
+    def _state(self, jurnal):
+        path = os.path.abspath(jurnal.json_file)
+
+        # Autosave yang belum ditulis → datanya sudah lengkap di memori
+        tertunda = penulis_latar.data_tertunda(jurnal.json_file)
+        if tertunda is not None:
+            return self._state_baru(penuh=tertunda)
+
+        # Proses mati sebelum file JSON diperbarui → pulihkan dulu dari jurnal
+        if jurnal.perlu_pemulihan():
+            jurnal.baca()
+
+        try:
+            st = os.stat(path)
+            tanda = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return self._state_baru(penuh={})
+
+        with self._kunci:
+            state = self._file.get(path)
+        if state is not None and state["tanda"] == tanda:
+            return state
+
+        # Tanda diambil SEBELUM membaca: jika file berganti di tengah jalan, cache dibaca ulang nanti
+        with open(path, "r", encoding="utf-8") as f:
+            teks = f.read()
+        state = self._state_baru(tanda, teks)
+        try:
+            if teks.strip() == "{}":
+                state["penuh"] = {}
+            else:
+                state["indeks"] = self._indeks(teks, 0, len(teks), level=1)
+        except _FormatTidakDikenal:
+            state["penuh"] = jurnal.baca()
+
+        with self._kunci:
+            self._file[path] = state
+        return state
+
+    @staticmethod
+    def _indeks(teks, awal, akhir, level):
+        """
+        Petakan key → (awal, akhir) teks nilainya di dalam objek teks[awal:akhir].
+        Mengandalkan format json indent=4: key level-n selalu diawali 4*n spasi di awal baris.
+        """
+        buka = teks.find("{", awal, akhir)
+        tutup = teks.rfind("}", awal, akhir)
+        if buka == -1 or tutup == -1 or teks[awal:buka].strip() or not _POLA_BUKA[level].match(teks, buka):
+            raise _FormatTidakDikenal()
+
+        cocok = list(_POLA_KEY[level].finditer(teks, buka, tutup))
+        indeks = {}
+        for i, m in enumerate(cocok):
+            batas = cocok[i + 1].start() if i + 1 < len(cocok) else tutup
+            nilai_akhir = batas
+            while nilai_akhir > m.end() and teks[nilai_akhir - 1] in " \r\n\t":
+                nilai_akhir -= 1
+            if teks[nilai_akhir - 1] == ",":
+                nilai_akhir -= 1
+            try:
+                key = json.loads(m.group(1))
+            except json.JSONDecodeError:
+                raise _FormatTidakDikenal()
+            indeks[key] = (m.end(), nilai_akhir)
+        return indeks
+
+    @staticmethod
+    def _parse(jurnal, state, rentang):
+        """Parse satu potongan nilai; jika gagal (file rusak/tak terduga), baca penuh lewat jurnal."""
+        a, b = rentang
+        try:
+            return json.loads(state["teks"][a:b])
+        except json.JSONDecodeError:
+            state["penuh"] = jurnal.baca()
+            return None
+
+
+# Satu cache untuk seluruh aplikasi (bertahan saat halaman dibuat ulang)
+cache_section = CacheSection()
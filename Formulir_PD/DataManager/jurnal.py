@@ -0,0 +1,222 @@
+import os
+import json
+import time
+import copy
+import shutil
+from .autosave import penulis_latar
+from .indeks_section import cache_section
+
+# =========================================================
+# MODUL : PENULISAN AMAN (ATOMIK + JURNAL)
+# =========================================================
+def tulis_atomik(path, isi):
+    """
+    Tulis file secara atomik: tulis ke file sementara di folder yang sama,
+    fsync, lalu rename menimpa file lama. Jika proses mati di tengah jalan,
+    file lama tetap utuh (tidak pernah terpotong).
+
+    Args:
+        path (str): file tujuan.
+        isi (str | bytes): isi file.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    sementara = f"{path}.{os.getpid()}.tmp"
+    mode = "wb" if isinstance(isi, (bytes, bytearray)) else "w"
+    try:
+        if mode == "wb":
+            f = open(sementara, mode)
+        else:
+            f = open(sementara, mode, encoding="utf-8")
+        with f:
+            f.write(isi)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(sementara, path)
+    finally:
+        if os.path.exists(sementara):
+            os.remove(sementara)
+        cache_section.buang(path)
+
+    # Pastikan entri folder (hasil rename) juga sampai ke disk (tidak didukung di Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+
+class JurnalData:
+    """
+    File JSON + jurnal append-only ("<file>.jurnal", satu operasi JSON per baris).
+    - Setiap perubahan dicatat (dan di-fsync) ke jurnal SEBELUM file JSON ditulis ulang secara atomik.
+    - Baris pertama jurnal selalu "snapshot" seluruh isi, sehingga isi file bisa dibangun ulang
+      dari jurnal saja bila file JSON rusak.
+    - Jika jurnal lebih baru dari file JSON (proses mati sebelum rename), operasi jurnal
+      diputar ulang (replay) saat dibaca.
+    - Jurnal dipadatkan (compaction) menjadi satu snapshot jika ukurannya membengkak.
+
+    Operasi:
+        {"op": "snapshot", "data": {...}}                      → ganti seluruh isi
+        {"op": "set", "section": s, "data": {...}}             → ganti satu section
+        {"op": "hapus", "section": s, "key": k}                → hapus satu key di section
+        {"op": "kosongkan"}                                     → kosongkan seluruh isi
+    """
+
+    BATAS_JURNAL_MIN = 1024 * 1024      # bytes; jurnal dipadatkan jika melebihi
+    FAKTOR_JURNAL = 2                   # ... dan lebih dari 2× ukuran file JSON
+
+    def __init__(self, json_file):
+        self.json_file = json_file
+        self.jurnal_file = f"{json_file}.jurnal"
+
+    # ---------------------------------------------------------
+    # BACA + PEMULIHAN
+    # ---------------------------------------------------------
+    def baca(self):
+        """
+        Baca isi terkini: file JSON, ditambah replay jurnal jika file rusak/tertinggal.
+        Jika masih ada autosave yang belum ditulis untuk file ini, data tertunda itulah yang dikembalikan.
+
+        Return:
+            dict: isi data (kosong jika belum ada apa-apa).
+        """
+        tertunda = penulis_latar.data_tertunda(self.json_file)
+        if tertunda is not None:
+            return copy.deepcopy(tertunda)
+
+        data, rusak = self._baca_json()
+
+        if os.path.exists(self.jurnal_file) and (rusak or self._jurnal_lebih_baru()):
+            operasi = self._baca_jurnal()
+            if operasi:
+                if rusak:
+                    data = {}
+                for op in operasi:
+                    data = self._terapkan(data, op)
+                # Wujudkan hasil pemulihan ke file JSON
+                tulis_atomik(self.json_file, json.dumps(data, indent=4, ensure_ascii=False))
+        return data
+
+    def perlu_pemulihan(self):
+        """True jika jurnal lebih baru dari file JSON (perubahan terakhir belum sampai ke file)."""
+        return os.path.exists(self.jurnal_file) and self._jurnal_lebih_baru()
+
+    def _baca_json(self):
+        """Return (data, rusak). File rusak disalin ke "<file>.rusak" agar tidak hilang diam-diam."""
+        if not os.path.exists(self.json_file):
+            return {}, False
+        try:
+            with open(self.json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return (data if isinstance(data, dict) else {}), False
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            try:
+                shutil.copy2(self.json_file, f"{self.json_file}.rusak")
+            except OSError:
+                pass
+            return {}, True
+
+    def _jurnal_lebih_baru(self):
+        try:
+            return os.stat(self.jurnal_file).st_mtime_ns > os.stat(self.json_file).st_mtime_ns
+        except OSError:
+            return True
+
+    def _baca_jurnal(self):
+        """Baca operasi jurnal; baris yang terpotong (crash saat append) diabaikan."""
+        operasi = []
+        with open(self.jurnal_file, "r", encoding="utf-8") as f:
+            for baris in f:
+                baris = baris.strip()
+                if not baris:
+                    continue
+                try:
+                    operasi.append(json.loads(baris))
+                except json.JSONDecodeError:
+                    continue
+        return operasi
+
+    @staticmethod
+    def _terapkan(data, op):
+        jenis = op.get("op")
+        if jenis == "snapshot":
+            return copy.deepcopy(op.get("data", {}))
+        if jenis == "kosongkan":
+            return {}
+        if jenis == "set":
+            data[op["section"]] = op.get("data", {})
+        elif jenis == "hapus":
+            section = data.get(op["section"])
+            if isinstance(section, dict):
+                section.pop(op["key"], None)
+        return data
+
+    # ---------------------------------------------------------
+    # TULIS
+    # ---------------------------------------------------------
+    def tulis(self, data, operasi, teks=None, menunggu=True):
+        """
+        Catat operasi ke jurnal (fsync), lalu tulis isi lengkap ke file JSON secara atomik.
+
+        Args:
+            data (dict): isi lengkap setelah operasi diterapkan.
+            operasi (list of dict): operasi yang menghasilkan perubahan (lihat docstring kelas).
+            teks (str): teks JSON siap tulis (opsional, default json.dumps indent=4).
+            menunggu (bool): tunggu autosave tertunda untuk file ini selesai dulu (menjaga urutan).
+        """
+        if menunggu:
+            penulis_latar.tunggu(self.json_file)
+        self._catat(operasi)
+        if teks is None:
+            teks = json.dumps(data, indent=4, ensure_ascii=False)
+        tulis_atomik(self.json_file, teks)
+        self._padatkan_jika_perlu(data)
+
+    def _catat(self, operasi):
+        baris = []
+        if not os.path.exists(self.jurnal_file):
+            # Jurnal baru → mulai dengan snapshot isi sebelum perubahan ini
+            lama, _ = self._baca_json()
+            baris.append({"op": "snapshot", "data": lama, "waktu": time.time()})
+        for op in operasi:
+            baris.append(dict(op, waktu=time.time()))
+
+        # Baris terakhir terpotong (crash saat append) → mulai di baris baru
+        baris_baru = False
+        if os.path.exists(self.jurnal_file) and os.path.getsize(self.jurnal_file) > 0:
+            with open(self.jurnal_file, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                baris_baru = f.read(1) != b"\n"
+
+        with open(self.jurnal_file, "a", encoding="utf-8") as f:
+            if baris_baru:
+                f.write("\n")
+            for op in baris:
+                f.write(json.dumps(op, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _padatkan_jika_perlu(self, data):
+        try:
+            ukuran_jurnal = os.path.getsize(self.jurnal_file)
+            ukuran_json = os.path.getsize(self.json_file)
+        except OSError:
+            return
+        if ukuran_jurnal > max(self.BATAS_JURNAL_MIN, self.FAKTOR_JURNAL * ukuran_json):
+            self.padatkan(data)
+
+    def padatkan(self, data):
+        """Ganti seluruh jurnal dengan satu snapshot isi saat ini (atomik)."""
+        snapshot = {"op": "snapshot", "data": data, "waktu": time.time()}
+        tulis_atomik(self.jurnal_file, json.dumps(snapshot, ensure_ascii=False) + "\n")
+        # Jurnal hasil pemadatan tidak boleh dianggap lebih baru dari file JSON
+        try:
+            st = os.stat(self.jurnal_file)
+            os.utime(self.json_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        except OSError:
+            pass
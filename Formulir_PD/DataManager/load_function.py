@@ -1,6 +1,8 @@
 import os
-import json
 from PySide6.QtWidgets import QMessageBox
+from .jurnal import JurnalData
+from .indeks_section import cache_section
+from .autosave import penulis_latar
 
 # =========================================================
 # MODUL : FUNGSI LOAD
@@ -9,6 +11,8 @@ class DataLoad:
     """
     Modul untuk memuat data dari file JSON dan mengaplikasikannya ke
     bagian-bagian (sections) yang telah didaftarkan melalui callback.
+    Hanya section yang diminta yang diparse (lihat CacheSection); hasil parse
+    disimpan di memori dan dipakai ulang antar halaman selama file tidak berubah.
     """
     
     def __init__(self, json_file="saved_data.json"):
@@ -19,8 +23,9 @@ class DataLoad:
             json_file (str): Nama file JSON yang akan dibaca.
         """
         self.json_file = json_file
+        self.jurnal = JurnalData(json_file)  # pemulihan dari jurnal jika file rusak
         self.section_setters = {}  # Dictionary untuk menyimpan callback per section
-        self.data = {}  # Menyimpan data JSON yang dibaca
+        self.data = {}  # Menyimpan data JSON yang dibaca (hanya section yang sudah dimuat)
 
     def register_section_load(self, section_name, load_callback):
         """
@@ -33,21 +38,79 @@ class DataLoad:
         """
         self.section_setters[section_name] = load_callback
 
-    def load_from_file(self):
+    def load_from_file(self, sections=None):
+        """
+        Muat section yang didaftarkan lalu panggil callback-nya.
+        Section lain di file tidak diparse sama sekali.
+
+        Args:
+            sections (list of str): batasi ke section tertentu (default: semua yang didaftarkan).
+        """
         try:
-            if not os.path.exists(self.json_file):
-                QMessageBox.warning(None, "Peringatan", "Tidak ditemukan file tersimpan.")
+            if not self.file_tersedia():
                 return
 
-            with open(self.json_file, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
-
-            for section, data in self.data.items():
-                if section in self.section_setters:
-                    self.section_setters[section](data)
+            # Urutan mengikuti urutan section di file (sama seperti sebelumnya)
+            for section in self._daftar_section():
+                if section not in self.section_setters:
+                    continue
+                if sections is not None and section not in sections:
+                    continue
+                data = self.load_section(section)
+                self.section_setters[section](data)
 
             # ❌ jangan tampilkan QMessageBox disini
             # QMessageBox.information(None, "Sukses", "Data berhasil dimuat.")
 
         except Exception as e:
             QMessageBox.critical(None, "Kesalahan", f"Data gagal dimuat: {e}")
+
+    def load_section(self, section, default=None):
+        """
+        Ambil isi satu section tanpa memanggil callback (dan tanpa mem-parse section lain).
+        Objek hasil dipakai bersama cache → jangan diubah di tempat.
+
+        Return:
+            isi section, atau default ({}) jika tidak ada.
+        """
+        if not self.file_tersedia():
+            return {} if default is None else default
+        data = self._baca_section(section)
+        if data is None:
+            return {} if default is None else default
+        self.data[section] = data
+        return data
+
+    def load_key(self, section, key, default=None):
+        """
+        Ambil satu key di dalam section, misal load_key("hasil_plot", "Kabel Power|TEV").
+        Hanya teks milik key tersebut yang diparse.
+
+        Return:
+            isi key, atau default (None) jika tidak ada.
+        """
+        value = self._baca_key(section, key)
+        return default if value is None else value
+
+    def file_tersedia(self):
+        """Cek file tersimpan (atau jurnal / autosave tertundanya) ada; tampilkan peringatan jika tidak."""
+        if not self._tersedia():
+            QMessageBox.warning(None, "Peringatan", "Tidak ditemukan file tersimpan.")
+            return False
+        return True
+
+    # ---------------------------------------------------------
+    # SUMBER DATA (file JSON; di-override backend lain, misal SQLite)
+    # ---------------------------------------------------------
+    def _tersedia(self):
+        return (os.path.exists(self.json_file) or os.path.exists(self.jurnal.jurnal_file)
+                or penulis_latar.data_tertunda(self.json_file) is not None)
+
+    def _daftar_section(self):
+        return cache_section.daftar_section(self.jurnal)
+
+    def _baca_section(self, section):
+        return cache_section.section(self.jurnal, section)
+
+    def _baca_key(self, section, key):
+        return cache_section.entri(self.jurnal, section, key)
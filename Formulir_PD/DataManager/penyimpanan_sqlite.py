@@ -0,0 +1,443 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from .jurnal import JurnalData
+
+# =========================================================
+# MODUL : PENYIMPANAN SURVEY (SQLITE, MODE WAL)
+# =========================================================
+# Lokasi di formulir_laporan yang berisi tab per trafo ({nomor: isi tab})
+LOKASI_TRAFO = ("sisi_lv_trafo", "kabel_power", "jalur_kabel", "kubikel_incoming")
+
+# Key di dalam isi tab yang menampung tabel pengukuran ({nama tabel: [baris, ...]})
+WADAH_TABEL = ("tables", "table")
+
+SKEMA = """
+CREATE TABLE IF NOT EXISTS survey (
+    id      INTEGER PRIMARY KEY,
+    nama    TEXT NOT NULL UNIQUE,
+    dibuat  REAL NOT NULL,
+    diubah  REAL NOT NULL,
+    versi   INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS section (
+    survey_id   INTEGER NOT NULL REFERENCES survey(id) ON DELETE CASCADE,
+    nama        TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (survey_id, nama)
+);
+CREATE TABLE IF NOT EXISTS trafo (
+    survey_id   INTEGER NOT NULL REFERENCES survey(id) ON DELETE CASCADE,
+    lokasi      TEXT NOT NULL,
+    nomor       TEXT NOT NULL,
+    atribut     TEXT NOT NULL,
+    tabel       TEXT NOT NULL,
+    PRIMARY KEY (survey_id, lokasi, nomor)
+);
+CREATE TABLE IF NOT EXISTS baris_pengukuran (
+    survey_id           INTEGER NOT NULL,
+    lokasi              TEXT NOT NULL,
+    nomor               TEXT NOT NULL,
+    tabel               TEXT NOT NULL,
+    urutan              INTEGER NOT NULL,
+    tingkat_keparahan   TEXT NOT NULL DEFAULT '',
+    data                TEXT NOT NULL,
+    PRIMARY KEY (survey_id, lokasi, nomor, tabel, urutan),
+    FOREIGN KEY (survey_id, lokasi, nomor) REFERENCES trafo(survey_id, lokasi, nomor) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS hasil_plot (
+    survey_id   INTEGER NOT NULL REFERENCES survey(id) ON DELETE CASCADE,
+    kunci       TEXT NOT NULL,
+    lokasi      TEXT NOT NULL,
+    sensor      TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (survey_id, kunci)
+);
+"""
+VERSI_SKEMA = 1
+
+
+def _json(nilai):
+    """Serialisasi kanonik (dipakai juga untuk membandingkan isi baris lama vs baru)."""
+    return json.dumps(nilai, ensure_ascii=False, separators=(",", ":"))
+
+
+class PenyimpananSQLite:
+    """
+    Penyimpanan data survey di satu file SQLite (mode WAL) sebagai alternatif file JSON.
+    - survey            : satu baris per survey (nama unik, misal "aktif")
+    - section           : isi section yang tidak dipecah (halaman_depan, data_umum, indikasi_pd, ...)
+    - trafo             : satu baris per tab trafo (lokasi + nomor) beserta isian non-tabelnya
+    - baris_pengukuran  : satu baris per baris tabel pengukuran
+    - hasil_plot        : satu baris per key 'Lokasi|Sensor' hasil ekstraksi
+
+    Penulisan section membandingkan isi per baris, sehingga hanya baris yang berubah yang ditulis.
+    Satu koneksi per file database dipakai bersama (lihat buka_penyimpanan), dijaga dengan lock.
+    """
+
+    def __init__(self, db_file="survey_pd.db"):
+        """
+        Args:
+            db_file (str): path file database SQLite.
+        """
+        self.db_file = db_file
+        self._kunci = threading.RLock()
+        self.koneksi = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+        self.koneksi.execute("PRAGMA journal_mode=WAL")
+        self.koneksi.execute("PRAGMA synchronous=NORMAL")
+        self.koneksi.execute("PRAGMA foreign_keys=ON")
+        with self._kunci:
+            self.koneksi.executescript(SKEMA)
+            self.koneksi.execute(f"PRAGMA user_version={VERSI_SKEMA}")
+
+    def tutup(self):
+        with self._kunci:
+            self.koneksi.close()
+
+    # ---------------------------------------------------------
+    # TRANSAKSI & SURVEY
+    # ---------------------------------------------------------
+    def _transaksi(self, fungsi, *args):
+        """Jalankan fungsi(cur, *args) dalam satu transaksi (BEGIN IMMEDIATE ... COMMIT)."""
+        with self._kunci:
+            cur = self.koneksi.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                hasil = fungsi(cur, *args)
+                cur.execute("COMMIT")
+                return hasil
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+
+    def _id_survey(self, cur, survey, buat=False):
+        baris = cur.execute("SELECT id FROM survey WHERE nama = ?", (survey,)).fetchone()
+        if baris is not None:
+            return baris[0]
+        if not buat:
+            return None
+        sekarang = time.time()
+        cur.execute("INSERT INTO survey (nama, dibuat, diubah) VALUES (?, ?, ?)", (survey, sekarang, sekarang))
+        return cur.lastrowid
+
+    def _tandai_berubah(self, cur, survey_id):
+        cur.execute("UPDATE survey SET diubah = ?, versi = versi + 1 WHERE id = ?", (time.time(), survey_id))
+
+    def versi(self, survey):
+        """Nomor versi survey (naik setiap kali ada penulisan); 0 jika survey belum ada."""
+        with self._kunci:
+            baris = self.koneksi.execute("SELECT versi FROM survey WHERE nama = ?", (survey,)).fetchone()
+        return baris[0] if baris else 0
+
+    def daftar_survey(self):
+        """List nama survey yang tersimpan (urut dari yang terakhir diubah)."""
+        with self._kunci:
+            return [b[0] for b in self.koneksi.execute("SELECT nama FROM survey ORDER BY diubah DESC")]
+
+    # ---------------------------------------------------------
+    # BACA
+    # ---------------------------------------------------------
+    def daftar_section(self, survey):
+        with self._kunci:
+            return [b[0] for b in self.koneksi.execute(
+                "SELECT s.nama FROM section s JOIN survey v ON v.id = s.survey_id WHERE v.nama = ? ORDER BY s.rowid",
+                (survey,)
+            )]
+
+    def baca_section(self, survey, nama):
+        """
+        Isi satu section, disusun ulang dari tabel-tabelnya.
+
+        Return:
+            dict | None: isi section, None jika section belum ada.
+        """
+        with self._kunci:
+            cur = self.koneksi.cursor()
+            survey_id = self._id_survey(cur, survey)
+            if survey_id is None:
+                return None
+            baris = cur.execute(
+                "SELECT data FROM section WHERE survey_id = ? AND nama = ?", (survey_id, nama)
+            ).fetchone()
+            if baris is None:
+                return None
+            data = json.loads(baris[0])
+
+            if nama == "formulir_laporan":
+                self._susun_trafo(cur, survey_id, data)
+            elif nama == "hasil_plot":
+                data = {kunci: json.loads(isi) for kunci, isi in cur.execute(
+                    "SELECT kunci, data FROM hasil_plot WHERE survey_id = ? ORDER BY rowid", (survey_id,)
+                )}
+            return data
+
+    def baca_key(self, survey, nama, key):
+        """Isi satu key di dalam section (hasil_plot: satu baris 'Lokasi|Sensor'); None jika tidak ada."""
+        if nama != "hasil_plot":
+            data = self.baca_section(survey, nama)
+            return data.get(key) if isinstance(data, dict) else None
+        with self._kunci:
+            baris = self.koneksi.execute(
+                "SELECT h.data FROM hasil_plot h JOIN survey v ON v.id = h.survey_id WHERE v.nama = ? AND h.kunci = ?",
+                (survey, key)
+            ).fetchone()
+        return json.loads(baris[0]) if baris else None
+
+    def _susun_trafo(self, cur, survey_id, data):
+        """Gabungkan kembali tab trafo + baris pengukurannya ke dalam dict formulir_laporan."""
+        tab = {}
+        for lokasi, nomor, atribut, tabel in cur.execute(
+            "SELECT lokasi, nomor, atribut, tabel FROM trafo WHERE survey_id = ? ORDER BY rowid", (survey_id,)
+        ).fetchall():
+            isi = json.loads(atribut)
+            for jalur in json.loads(tabel):
+                wadah, _, nama_tabel = jalur.partition("/")
+                isi.setdefault(wadah, {})[nama_tabel] = []
+            tab[(lokasi, nomor)] = isi
+            data.setdefault(lokasi, {})[nomor] = isi
+
+        for lokasi, nomor, jalur, isi in cur.execute(
+            "SELECT lokasi, nomor, tabel, data FROM baris_pengukuran WHERE survey_id = ? "
+            "ORDER BY lokasi, nomor, tabel, urutan", (survey_id,)
+        ):
+            wadah, _, nama_tabel = jalur.partition("/")
+            tab[(lokasi, nomor)][wadah][nama_tabel].append(json.loads(isi))
+
+    # ---------------------------------------------------------
+    # TULIS
+    # ---------------------------------------------------------
+    def tulis_sections(self, survey, sections):
+        """
+        Tulis beberapa section sekaligus dalam satu transaksi.
+
+        Args:
+            survey (str): nama survey.
+            sections (dict): nama section → isi.
+
+        Return:
+            int: versi survey setelah penulisan.
+        """
+        def kerja(cur):
+            survey_id = self._id_survey(cur, survey, buat=True)
+            for nama, isi in sections.items():
+                self._tulis_section(cur, survey_id, nama, isi)
+            self._tandai_berubah(cur, survey_id)
+            return cur.execute("SELECT versi FROM survey WHERE id = ?", (survey_id,)).fetchone()[0]
+
+        return self._transaksi(kerja)
+
+    def _tulis_section(self, cur, survey_id, nama, isi):
+        isi = isi if isinstance(isi, dict) else {}
+        sisa = isi
+        if nama == "formulir_laporan":
+            sisa = {k: v for k, v in isi.items() if not (k in LOKASI_TRAFO and isinstance(v, dict) and v)}
+            trafo = {k: v for k, v in isi.items() if k not in sisa}
+            self._tulis_trafo(cur, survey_id, trafo)
+        elif nama == "hasil_plot":
+            self._tulis_hasil_plot(cur, survey_id, isi)
+            sisa = {}
+
+        cur.execute(
+            "INSERT INTO section (survey_id, nama, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(survey_id, nama) DO UPDATE SET data = excluded.data WHERE data != excluded.data",
+            (survey_id, nama, _json(sisa))
+        )
+
+    @staticmethod
+    def _pecah_tab(isi_tab):
+        """Pisahkan isi tab menjadi (atribut non-tabel, {jalur 'wadah/nama': [baris]})."""
+        atribut, tabel = {}, {}
+        for k, v in isi_tab.items():
+            if k in WADAH_TABEL and isinstance(v, dict) and v and all(isinstance(b, list) for b in v.values()):
+                for nama_tabel, baris in v.items():
+                    tabel[f"{k}/{nama_tabel}"] = baris
+            else:
+                atribut[k] = v
+        return atribut, tabel
+
+    def _tulis_trafo(self, cur, survey_id, trafo):
+        lama = {(l, n) for l, n in cur.execute(
+            "SELECT lokasi, nomor FROM trafo WHERE survey_id = ?", (survey_id,)
+        )}
+        baru = set()
+        for lokasi, per_nomor in trafo.items():
+            for nomor, isi_tab in per_nomor.items():
+                baru.add((lokasi, nomor))
+                atribut, tabel = self._pecah_tab(isi_tab if isinstance(isi_tab, dict) else {})
+                cur.execute(
+                    "INSERT INTO trafo (survey_id, lokasi, nomor, atribut, tabel) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(survey_id, lokasi, nomor) DO UPDATE SET atribut = excluded.atribut, tabel = excluded.tabel "
+                    "WHERE atribut != excluded.atribut OR tabel != excluded.tabel",
+                    (survey_id, lokasi, nomor, _json(atribut), _json(list(tabel)))
+                )
+                self._tulis_baris(cur, survey_id, lokasi, nomor, tabel)
+
+        for lokasi, nomor in lama - baru:
+            cur.execute("DELETE FROM trafo WHERE survey_id = ? AND lokasi = ? AND nomor = ?", (survey_id, lokasi, nomor))
+
+    def _tulis_baris(self, cur, survey_id, lokasi, nomor, tabel):
+        """Bandingkan per baris; hanya baris yang berubah/baru yang ditulis, sisanya dihapus."""
+        lama = {(t, u): d for t, u, d in cur.execute(
+            "SELECT tabel, urutan, data FROM baris_pengukuran WHERE survey_id = ? AND lokasi = ? AND nomor = ?",
+            (survey_id, lokasi, nomor)
+        )}
+        baru = set()
+        for jalur, daftar in tabel.items():
+            for urutan, baris in enumerate(daftar):
+                baru.add((jalur, urutan))
+                teks = _json(baris)
+                if lama.get((jalur, urutan)) != teks:
+                    self._upsert_baris(cur, survey_id, lokasi, nomor, jalur, urutan, baris, teks)
+
+        for jalur, urutan in set(lama) - baru:
+            cur.execute(
+                "DELETE FROM baris_pengukuran WHERE survey_id = ? AND lokasi = ? AND nomor = ? AND tabel = ? AND urutan = ?",
+                (survey_id, lokasi, nomor, jalur, urutan)
+            )
+
+    @staticmethod
+    def _upsert_baris(cur, survey_id, lokasi, nomor, jalur, urutan, baris, teks=None):
+        keparahan = baris.get("tingkat_keparahan", "") if isinstance(baris, dict) else ""
+        cur.execute(
+            "INSERT INTO baris_pengukuran (survey_id, lokasi, nomor, tabel, urutan, tingkat_keparahan, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(survey_id, lokasi, nomor, tabel, urutan) DO UPDATE SET "
+            "tingkat_keparahan = excluded.tingkat_keparahan, data = excluded.data",
+            (survey_id, lokasi, nomor, jalur, urutan, keparahan or "", teks or _json(baris))
+        )
+
+    def _tulis_hasil_plot(self, cur, survey_id, hasil):
+        lama = dict(cur.execute("SELECT kunci, data FROM hasil_plot WHERE survey_id = ?", (survey_id,)))
+        for kunci, isi in hasil.items():
+            teks = _json(isi)
+            if lama.get(kunci) != teks:
+                self._upsert_hasil_plot(cur, survey_id, kunci, teks)
+        for kunci in set(lama) - set(hasil):
+            cur.execute("DELETE FROM hasil_plot WHERE survey_id = ? AND kunci = ?", (survey_id, kunci))
+
+    @staticmethod
+    def _upsert_hasil_plot(cur, survey_id, kunci, teks):
+        lokasi, _, sensor = kunci.partition("|")
+        cur.execute(
+            "INSERT INTO hasil_plot (survey_id, kunci, lokasi, sensor, data) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(survey_id, kunci) DO UPDATE SET data = excluded.data",
+            (survey_id, kunci, lokasi, sensor, teks)
+        )
+
+    def tulis_baris(self, survey, lokasi, nomor, tabel, urutan, baris):
+        """
+        Perbarui SATU baris tabel pengukuran (tanpa menulis ulang section lain).
+
+        Args:
+            lokasi (str): misal "sisi_lv_trafo"; nomor (str): nomor trafo;
+            tabel (str): jalur tabel 'wadah/nama', misal "tables/ultradish"; urutan (int): indeks baris.
+        """
+        def kerja(cur):
+            survey_id = self._id_survey(cur, survey, buat=True)
+            ada = cur.execute(
+                "SELECT tabel FROM trafo WHERE survey_id = ? AND lokasi = ? AND nomor = ?", (survey_id, lokasi, nomor)
+            ).fetchone()
+            if ada is None:
+                raise KeyError(f"Trafo {lokasi}/{nomor} belum ada di survey '{survey}'.")
+            daftar_tabel = json.loads(ada[0])
+            if tabel not in daftar_tabel:
+                cur.execute(
+                    "UPDATE trafo SET tabel = ? WHERE survey_id = ? AND lokasi = ? AND nomor = ?",
+                    (_json(daftar_tabel + [tabel]), survey_id, lokasi, nomor)
+                )
+            self._upsert_baris(cur, survey_id, lokasi, nomor, tabel, urutan, baris)
+            self._tandai_berubah(cur, survey_id)
+
+        self._transaksi(kerja)
+
+    def tulis_hasil_plot(self, survey, kunci, isi):
+        """Perbarui SATU entri hasil_plot ('Lokasi|Sensor')."""
+        def kerja(cur):
+            survey_id = self._id_survey(cur, survey, buat=True)
+            self._upsert_hasil_plot(cur, survey_id, kunci, _json(isi))
+            cur.execute(
+                "INSERT OR IGNORE INTO section (survey_id, nama, data) VALUES (?, 'hasil_plot', '{}')", (survey_id,)
+            )
+            self._tandai_berubah(cur, survey_id)
+
+        self._transaksi(kerja)
+
+    # ---------------------------------------------------------
+    # HAPUS
+    # ---------------------------------------------------------
+    def hapus_key(self, survey, nama, key):
+        """
+        Hapus satu key dari section (hasil_plot: satu 'Lokasi|Sensor').
+
+        Return:
+            bool: True jika ada yang dihapus.
+        """
+        if nama != "hasil_plot":
+            data = self.baca_section(survey, nama)
+            if not isinstance(data, dict) or key not in data:
+                return False
+            del data[key]
+            self.tulis_sections(survey, {nama: data})
+            return True
+
+        def kerja(cur):
+            survey_id = self._id_survey(cur, survey)
+            if survey_id is None:
+                return False
+            cur.execute("DELETE FROM hasil_plot WHERE survey_id = ? AND kunci = ?", (survey_id, key))
+            dihapus = cur.rowcount > 0
+            if dihapus:
+                self._tandai_berubah(cur, survey_id)
+            return dihapus
+
+        return self._transaksi(kerja)
+
+    def hapus_sections(self, survey, nama_sections):
+        """Hapus seluruh isi beberapa section (beserta tabel trafo / hasil_plot miliknya)."""
+        def kerja(cur):
+            survey_id = self._id_survey(cur, survey)
+            if survey_id is None:
+                return
+            for nama in nama_sections:
+                cur.execute("DELETE FROM section WHERE survey_id = ? AND nama = ?", (survey_id, nama))
+                if nama == "formulir_laporan":
+                    cur.execute("DELETE FROM trafo WHERE survey_id = ?", (survey_id,))
+                elif nama == "hasil_plot":
+                    cur.execute("DELETE FROM hasil_plot WHERE survey_id = ?", (survey_id,))
+            self._tandai_berubah(cur, survey_id)
+
+        self._transaksi(kerja)
+
+    # ---------------------------------------------------------
+    # IMPOR DARI JSON
+    # ---------------------------------------------------------
+    def impor_json(self, json_file, survey="aktif"):
+        """
+        Impor file JSON lama (saved_data.json / plot_data.json) ke survey tertentu.
+        File dibaca lewat JurnalData (ikut dipulihkan dari jurnal jika rusak).
+
+        Return:
+            list of str: nama section yang diimpor.
+        """
+        if not os.path.exists(json_file) and not os.path.exists(f"{json_file}.jurnal"):
+            raise FileNotFoundError(json_file)
+        data = JurnalData(json_file).baca()
+        if data:
+            self.tulis_sections(survey, data)
+        return list(data)
+
+
+# Satu koneksi per file database untuk seluruh aplikasi
+_penyimpanan = {}
+_kunci_penyimpanan = threading.Lock()
+
+
+def buka_penyimpanan(db_file="survey_pd.db"):
+    """Ambil (atau buka) PenyimpananSQLite untuk file database tertentu."""
+    path = os.path.abspath(db_file)
+    with _kunci_penyimpanan:
+        if path not in _penyimpanan:
+            _penyimpanan[path] = PenyimpananSQLite(path)
+        return _penyimpanan[path]
@@ -1,5 +1,5 @@
-import json
 from PySide6.QtWidgets import QMessageBox
+from .jurnal import JurnalData
 
 # =========================================================
 # MODUL : FUNGSI RESET HALAMAN EKSTRAKSI
@@ -18,6 +18,7 @@ class DataResetExtract:
             json_file (str): Nama file JSON yang akan di-reset.
         """
         self.json_file = json_file
+        self.jurnal = JurnalData(json_file)  # penulisan atomik + jurnal perubahan
         self.section_resetters = {}  # Dictionary untuk menyimpan callback reset per section
 
     def register_section_reset(self, section_name, reset_callback):
@@ -32,8 +33,7 @@ class DataResetExtract:
         Reset seluruh isi JSON dan panggil semua reset callback.
         """
         try:
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump({}, f, indent=4)
+            self.jurnal.tulis({}, [{"op": "kosongkan"}])
 
             for _, reset_cb in self.section_resetters.items():
                 reset_cb()
@@ -52,8 +52,7 @@ class DataResetExtract:
             section (str): nama section dalam JSON (default: 'hasil_plot')
         """
         try:
-            with open(self.json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self.jurnal.baca()
 
             removed = False
 
@@ -62,8 +61,7 @@ class DataResetExtract:
                 del data[section][key]
                 removed = True
 
-                with open(self.json_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
+                self.jurnal.tulis(data, [{"op": "hapus", "section": section, "key": key}])
 
             # Panggil callback kalau ada (reset widget)
             if section in self.section_resetters:
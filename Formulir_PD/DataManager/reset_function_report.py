@@ -1,5 +1,7 @@
-import json
+import os
+import weakref
 from PySide6.QtWidgets import QMessageBox
+from .jurnal import JurnalData
 
 # =========================================================
 # MODUL : FUNGSI RESET HALAMAN LAPORAN
@@ -8,9 +10,11 @@ class DataResetReport:
     """
     Modul untuk mereset data halaman laporan di file JSON.
     - reset_current: reset hanya 1 section (halaman saat ini)
-    - reset_file: reset seluruh isi JSON
+    - reset_file: reset seluruh isi JSON (widget semua halaman yang memakai file ini ikut dikosongkan)
     """
 
+    _semua = weakref.WeakSet()  # instance yang masih hidup (halaman tetap hidup di PengaturHalaman)
+
     def __init__(self, json_file="saved_data.json"):
         """
         Inisialisasi class DataResetCover.
@@ -19,7 +23,9 @@ class DataResetReport:
             json_file (str): Nama file JSON yang akan di-reset.
         """
         self.json_file = json_file
+        self.jurnal = JurnalData(json_file)  # penulisan atomik + jurnal perubahan
         self.section_resetters = {}  # Dictionary untuk menyimpan callback reset per section
+        DataResetReport._semua.add(self)
 
     def register_section_reset(self, section_name, reset_callback):
         """
@@ -40,11 +46,16 @@ class DataResetReport:
         Reset seluruh isi JSON dan panggil semua reset callback.
         """
         try:
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump({}, f, indent=4)
+            self.jurnal.tulis({}, [{"op": "kosongkan"}])
 
-            for _, reset_cb in self.section_resetters.items():
-                reset_cb()
+            # Halaman lain yang memakai file yang sama tetap hidup → widget-nya ikut dikosongkan,
+            # supaya autosave berikutnya tidak menulis ulang data lama ke file yang sudah di-reset
+            path = os.path.abspath(self.json_file)
+            lainnya = [r for r in list(DataResetReport._semua)
+                       if r is not self and os.path.abspath(r.json_file) == path]
+            for reset in [self] + lainnya:
+                for _, reset_cb in reset.section_resetters.items():
+                    reset_cb()
 
             QMessageBox.information(None, "Sukses", "Seluruh data berhasil di-reset.")
             return True
@@ -68,19 +79,14 @@ class DataResetReport:
             if section is None:
                 raise ValueError("Nama section harus diberikan untuk reset_current.")
 
-            # baca file JSON
-            try:
-                with open(self.json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                data = {}
+            # baca file JSON (dipulihkan dari jurnal jika rusak)
+            data = self.jurnal.baca()
 
             # reset section ini
             data[section] = {}
 
-            # tulis balik JSON
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            # tulis balik JSON (jurnal dulu, lalu file secara atomik)
+            self.jurnal.tulis(data, [{"op": "set", "section": section, "data": {}}])
 
             # panggil callback kalau ada
             if section in self.section_resetters:
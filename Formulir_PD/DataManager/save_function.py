@@ -1,6 +1,10 @@
 import json
 import os
+import copy
+import threading
 from PySide6.QtWidgets import QMessageBox
+from .jurnal import JurnalData
+from .autosave import penulis_latar
 
 # =========================================================
 # MODUL : FUNGSI SAVE
@@ -19,9 +23,18 @@ class DataSave:
             json_file (str): Nama file JSON yang akan digunakan untuk menyimpan data.
         """
         self.json_file = json_file
+        self.jurnal = JurnalData(json_file)  # penulisan atomik + jurnal perubahan
         self.section_callbacks = {}  # Dictionary untuk menyimpan callback per section
         self.data = {}  # Menyimpan data terakhir yang disimpan (internal)
 
+        # Dirty-tracking: isi file terakhir yang diketahui, per section
+        self._tanda_file = None  # (mtime_ns, size) file saat terakhir dibaca/ditulis
+        self._snapshot = {}      # section → salinan data yang ada di file
+        self._fragmen = {}       # section → teks JSON section (format indent=4) yang ada di file
+        self._berubah_tertunda = set()  # section yang berubah tapi belum tercatat di jurnal
+        self._terkirim = None    # snapshot terakhir yang dikirim instance ini ke PenulisLatar
+        self._kunci = threading.RLock()  # dipakai bersama thread PenulisLatar
+
     def register_section_save(self, section_name, get_data_callback):
         """
         Mendaftarkan section untuk disimpan.
@@ -37,34 +50,166 @@ class DataSave:
         """
         Menyimpan semua section yang sudah didaftarkan ke file JSON.
         Data baru akan digabungkan dengan data lama jika file sudah ada.
+        Hanya section yang hasil callback-nya berubah sejak penulisan terakhir yang
+        diserialisasi ulang; jika tidak ada yang berubah, file tidak ditulis sama sekali.
         Menampilkan pesan informasi/error sesuai hasil.
+
+        Return:
+            bool: True jika file ditulis, False jika dilewati (tidak ada perubahan) atau gagal.
         """
         try:
-            # Load data lama jika file JSON sudah ada
-            if os.path.exists(self.json_file):
-                try:
-                    with open(self.json_file, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
-                except json.JSONDecodeError:
-                    # Jika file corrupt atau kosong, buat dictionary kosong
-                    existing_data = {}
-            else:
-                existing_data = {}
-
-            # Update hanya section yang sudah didaftarkan
-            for section, callback in self.section_callbacks.items():
-                new_data = callback(existing_data.get(section, {}))  
-                existing_data[section] = new_data
-
-            # Simpan ke atribut internal juga
-            self.data = existing_data
+            # Selesaikan dulu autosave yang masih tertunda agar urutan penulisan terjaga
+            penulis_latar.tunggu()
 
-            # Simpan data gabungan kembali ke file JSON
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, indent=4, ensure_ascii=False)
+            data_beku = self._siapkan_snapshot()
+            ditulis = False
+            if data_beku is not None:
+                self._tulis(data_beku)
+                ditulis = True
+
+            # Tunggu juga penulisan pendukung yang dijadwalkan callback (misal sidecar titik)
+            penulis_latar.tunggu()
 
             # Tampilkan pesan sukses
             QMessageBox.information(None, "Sukses", "Data berhasil disimpan.")
+            return ditulis
         except Exception as e:
             # Tampilkan pesan error jika gagal
             QMessageBox.critical(None, "Kesalahan", f"Data gagal disimpan: {e}")
+            return False
+
+    def save_in_background(self):
+        """
+        Autosave untuk navigasi halaman: snapshot data diambil di thread UI,
+        serialisasi & penulisan (fsync) dikerjakan PenulisLatar di latar belakang.
+        Tidak menampilkan pesan sukses; error penulisan sebelumnya ditampilkan saat autosave berikutnya.
+
+        Return:
+            bool: True jika penulisan dijadwalkan, False jika tidak ada perubahan atau gagal.
+        """
+        try:
+            galat = penulis_latar.ambil_galat(self.json_file)
+            if galat:
+                QMessageBox.critical(None, "Kesalahan", f"Autosave sebelumnya gagal: {galat}")
+
+            data_beku = self._siapkan_snapshot()
+            if data_beku is None:
+                return False
+            self._terkirim = data_beku
+            penulis_latar.kirim(self.json_file, lambda: self._tulis(data_beku), data=data_beku)
+            return True
+        except Exception as e:
+            QMessageBox.critical(None, "Kesalahan", f"Data gagal disimpan: {e}")
+            return False
+
+    def _siapkan_snapshot(self):
+        """
+        Panggil semua callback section (di thread UI) dan bandingkan dengan isi file terakhir.
+
+        Return:
+            dict | None: snapshot beku seluruh isi file yang harus ditulis, atau None jika tidak ada perubahan.
+        """
+        # Load data lama (dipakai ulang dari memori jika file tidak berubah sejak terakhir dibaca/ditulis)
+        existing_data = self._muat_data_lama()
+
+        # Update hanya section yang sudah didaftarkan, catat yang berubah
+        berubah = []
+        for section, callback in self.section_callbacks.items():
+            new_data = callback(existing_data.get(section, {}))
+            existing_data[section] = new_data
+            if section not in self._snapshot or self._snapshot[section] != new_data:
+                berubah.append(section)
+
+        # Simpan ke atribut internal juga
+        self.data = existing_data
+
+        if not berubah and self._tanda_file is not None:
+            return None
+
+        with self._kunci:
+            for section in berubah:
+                self._snapshot[section] = copy.deepcopy(existing_data[section])
+                self._berubah_tertunda.add(section)
+            # Snapshot tidak pernah diubah di tempat (hanya diganti), aman dibaca thread lain
+            return {section: self._snapshot[section] for section in existing_data}
+
+    def _tulis(self, data):
+        """Catat section yang berubah ke jurnal, lalu tulis file JSON secara atomik."""
+        with self._kunci:
+            berubah, self._berubah_tertunda = self._berubah_tertunda, set()
+            try:
+                for section in berubah:
+                    self._fragmen.pop(section, None)
+                operasi = [{"op": "set", "section": section, "data": data[section]}
+                           for section in berubah if section in data]
+                self.jurnal.tulis(data, operasi, teks=self._susun_json(data), menunggu=False)
+                self._tanda_file = self._baca_tanda_file()
+            except Exception:
+                # Isi file tidak pasti → baca ulang & tulis ulang pada save berikutnya
+                self._tanda_file = None
+                raise
+
+    # ---------------------------------------------------------
+    # DIRTY-TRACKING
+    # ---------------------------------------------------------
+    def _baca_tanda_file(self):
+        """Tanda file (mtime_ns, size) untuk mendeteksi perubahan oleh instance/halaman lain."""
+        try:
+            st = os.stat(self.json_file)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _muat_data_lama(self):
+        """
+        Kembalikan isi file JSON saat ini.
+        Jika file tidak berubah sejak terakhir dibaca/ditulis instance ini, data di memori dipakai ulang.
+        """
+        with self._kunci:
+            # Autosave halaman lain yang belum ditulis → isi terbaru ada di antrean, bukan di file
+            tertunda = penulis_latar.data_tertunda(self.json_file)
+            if tertunda is not None and tertunda is not self._terkirim:
+                return self._ambil_alih_tertunda(tertunda)
+
+            tanda = self._baca_tanda_file()
+            if tanda is not None and tanda == self._tanda_file:
+                return self.data
+
+            # Baca file (jika rusak/tertinggal, dipulihkan dari jurnal; data autosave tertunda ikut terbaca)
+            existing_data = self.jurnal.baca()
+            tanda = self._baca_tanda_file()
+
+            # Isi file berubah dari luar → snapshot diambil ulang dari file
+            self.data = existing_data
+            self._snapshot = {section: copy.deepcopy(nilai) for section, nilai in existing_data.items()}
+            self._fragmen = {}
+            self._tanda_file = tanda if existing_data else None
+            return existing_data
+
+    def _ambil_alih_tertunda(self, tertunda):
+        """
+        Pakai data autosave instance lain yang belum ditulis sebagai isi terkini.
+        Kiriman berikutnya menggantikan autosave tersebut di antrean PenulisLatar (coalescing per file),
+        sehingga semua section-nya ditandai berubah agar tetap dijurnal & ditulis.
+        """
+        existing_data = copy.deepcopy(tertunda)
+        self.data = existing_data
+        self._snapshot = {section: copy.deepcopy(nilai) for section, nilai in existing_data.items()}
+        self._fragmen = {}
+        self._berubah_tertunda.update(existing_data)
+        self._tanda_file = None
+        return existing_data
+
+    def _susun_json(self, data):
+        """
+        Susun teks JSON (format sama dengan json.dump indent=4) dari fragmen per section.
+        Fragmen section yang tidak berubah dipakai ulang tanpa serialisasi ulang.
+        """
+        if not data:
+            return "{}"
+        baris = []
+        for section, nilai in data.items():
+            if section not in self._fragmen:
+                self._fragmen[section] = json.dumps(nilai, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+            baris.append(f"    {json.dumps(section, ensure_ascii=False)}: {self._fragmen[section]}")
+        return "{\n" + ",\n".join(baris) + "\n}"
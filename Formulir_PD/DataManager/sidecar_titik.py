@@ -0,0 +1,104 @@
+import io
+import os
+import re
+import hashlib
+from .jurnal import tulis_atomik
+from .autosave import penulis_latar
+
+# =========================================================
+# MODUL : PENYIMPANAN TITIK PLOT (SIDECAR .NPZ)
+# =========================================================
+class SidecarTitik:
+    """
+    Menyimpan awan titik hasil ekstraksi (PRPD/waveform) sebagai file NumPy
+    terkompresi (.npz, float32) di samping file JSON, satu file per key 'Lokasi|Sensor'.
+    File JSON cukup menyimpan nama file sidecar + fitur & indikasi PD,
+    sehingga save/load JSON tidak perlu mem-parsing puluhan ribu titik.
+    """
+
+    def __init__(self, json_file="plot_data.json"):
+        """
+        Args:
+            json_file (str): file JSON induk; sidecar disimpan di folder "<nama>_titik" di sebelahnya.
+        """
+        self.json_file = json_file
+        self.base_dir = os.path.dirname(os.path.abspath(json_file))
+        self.folder = f"{os.path.splitext(os.path.basename(json_file))[0]}_titik"
+
+    def nama_file(self, key):
+        """
+        Nama file sidecar (relatif terhadap folder JSON) untuk key tertentu.
+        Karakter selain huruf/angka diganti '_', ditambah hash singkat agar tetap unik.
+        """
+        aman = re.sub(r"[^0-9A-Za-z]+", "_", key).strip("_")
+        kode = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        return f"{self.folder}/{aman}_{kode}.npz"
+
+    def _path(self, nama_file):
+        return os.path.join(self.base_dir, *nama_file.split("/"))
+
+    def simpan(self, key, kelompok):
+        """
+        Simpan titik untuk satu key.
+        Array disalin (float32) di thread pemanggil; kompresi & penulisan dikerjakan PenulisLatar.
+
+        Args:
+            key (str): key 'Lokasi|Sensor'.
+            kelompok (dict): nama kelompok ("waveform"/"prpd") → dict kolom → array.
+
+        Return:
+            str: nama file sidecar (disimpan di JSON).
+        """
+        import numpy as np   # hanya halaman ekstraksi yang butuh, tidak ikut dimuat saat startup
+        nama_file = self.nama_file(key)
+        path = self._path(nama_file)
+
+        arrays = {}
+        for nama_kelompok, kolom in kelompok.items():
+            for nama_kolom, nilai in kolom.items():
+                arrays[f"{nama_kelompok}__{nama_kolom}"] = np.asarray(nilai, dtype=np.float32)
+
+        def tulis():
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, **arrays)
+            tulis_atomik(path, buffer.getvalue())
+
+        penulis_latar.kirim(path, tulis)
+        return nama_file
+
+    def muat(self, nama_file):
+        """
+        Muat titik dari file sidecar.
+
+        Return:
+            dict: nama kelompok → dict kolom → np.ndarray (float64). Kosong jika file tidak ada.
+        """
+        import numpy as np
+        path = self._path(nama_file)
+        penulis_latar.tunggu(path)
+        if not os.path.exists(path):
+            return {}
+
+        kelompok = {}
+        with np.load(path, allow_pickle=False) as data:
+            for nama in data.files:
+                nama_kelompok, _, nama_kolom = nama.partition("__")
+                kelompok.setdefault(nama_kelompok, {})[nama_kolom] = data[nama].astype(np.float64)
+        return kelompok
+
+    def hapus(self, key):
+        """Hapus file sidecar milik key tertentu (jika ada)."""
+        path = self._path(self.nama_file(key))
+        penulis_latar.tunggu(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def hapus_semua(self):
+        """Hapus seluruh file sidecar milik file JSON ini."""
+        penulis_latar.tunggu()
+        folder = os.path.join(self.base_dir, self.folder)
+        if not os.path.isdir(folder):
+            return
+        for nama in os.listdir(folder):
+            if nama.endswith(".npz"):
+                os.remove(os.path.join(folder, nama))
@@ -0,0 +1,214 @@
+import os
+import copy
+from PySide6.QtWidgets import QMessageBox
+from .save_function import DataSave
+from .load_function import DataLoad
+from .autosave import penulis_latar
+from .penyimpanan_sqlite import buka_penyimpanan
+
+# =========================================================
+# MODUL : FUNGSI SAVE / LOAD / RESET DENGAN BACKEND SQLITE
+# =========================================================
+# Kelompok section yang dulu berada dalam satu file JSON (dipakai reset_file)
+SECTION_LAPORAN = ("halaman_depan", "formulir_laporan")   # saved_data.json
+SECTION_EKSTRAKSI = ("hasil_plot",)                      # plot_data.json
+
+
+def _kunci_latar(db_file, survey):
+    """Kunci PenulisLatar untuk satu survey (dipakai bersama save & load)."""
+    return f"{os.path.abspath(db_file)}#{survey}"
+
+
+class DataSaveSQLite(DataSave):
+    """
+    Pengganti DataSave yang menyimpan ke database SQLite (lihat PenyimpananSQLite).
+    Callback register_section_save, dirty-tracking per section, dan autosave latar belakang
+    bekerja sama persis; hanya section yang berubah yang ditulis, dan di dalam section
+    hanya baris tabel / entri hasil_plot yang berubah.
+
+    Contoh:
+        self.data_save = DataSaveSQLite(survey="aktif")
+        self.data_save.register_section_save("hasil_plot", self.save_plot_result)
+    """
+
+    def __init__(self, db_file="survey_pd.db", survey="aktif"):
+        """
+        Args:
+            db_file (str): file database SQLite.
+            survey (str): nama survey yang sedang dikerjakan.
+        """
+        super().__init__(json_file=_kunci_latar(db_file, survey))
+        self.jurnal = None
+        self.penyimpanan = buka_penyimpanan(db_file)
+        self.survey = survey
+
+    def _muat_data_lama(self):
+        """Isi section yang didaftarkan; dipakai ulang dari memori jika versi survey tidak berubah."""
+        with self._kunci:
+            tertunda = penulis_latar.data_tertunda(self.json_file)
+            if tertunda is not None and tertunda is not self._terkirim:
+                return self._ambil_alih_tertunda(tertunda)
+
+            versi = self.penyimpanan.versi(self.survey)
+            if versi and versi == self._tanda_file:
+                return self.data
+
+            tertunda = tertunda or {}
+            existing_data = {}
+            for section in self.section_callbacks:
+                if section in tertunda:
+                    existing_data[section] = copy.deepcopy(tertunda[section])
+                    continue
+                isi = self.penyimpanan.baca_section(self.survey, section)
+                if isi is not None:
+                    existing_data[section] = isi
+
+            self.data = existing_data
+            self._snapshot = {section: copy.deepcopy(nilai) for section, nilai in existing_data.items()}
+            self._tanda_file = versi or None
+            return existing_data
+
+    def _ambil_alih_tertunda(self, tertunda):
+        """Seperti DataSave, ditambah section terdaftar yang tidak ada di data tertunda (dibaca dari database)."""
+        existing_data = super()._ambil_alih_tertunda(tertunda)
+        for section in self.section_callbacks:
+            if section not in existing_data:
+                isi = self.penyimpanan.baca_section(self.survey, section)
+                if isi is not None:
+                    existing_data[section] = isi
+                    self._snapshot[section] = copy.deepcopy(isi)
+        return existing_data
+
+    def _tulis(self, data):
+        """Tulis section yang berubah dalam satu transaksi SQLite."""
+        with self._kunci:
+            berubah, self._berubah_tertunda = self._berubah_tertunda, set()
+            try:
+                self._tanda_file = self.penyimpanan.tulis_sections(
+                    self.survey, {section: data[section] for section in berubah if section in data}
+                )
+            except Exception:
+                self._tanda_file = None
+                raise
+
+
+class DataLoadSQLite(DataLoad):
+    """
+    Pengganti DataLoad yang membaca dari database SQLite.
+    load_key("hasil_plot", 'Lokasi|Sensor') hanya membaca satu baris tabel hasil_plot.
+    """
+
+    def __init__(self, db_file="survey_pd.db", survey="aktif"):
+        """
+        Args:
+            db_file (str): file database SQLite.
+            survey (str): nama survey yang dibaca.
+        """
+        super().__init__(json_file=_kunci_latar(db_file, survey))
+        self.jurnal = None
+        self.penyimpanan = buka_penyimpanan(db_file)
+        self.survey = survey
+
+    def _tertunda(self):
+        return penulis_latar.data_tertunda(self.json_file) or {}
+
+    def _tersedia(self):
+        return bool(self.penyimpanan.versi(self.survey) or self._tertunda())
+
+    def _daftar_section(self):
+        daftar = self.penyimpanan.daftar_section(self.survey)
+        return daftar + [section for section in self._tertunda() if section not in daftar]
+
+    def _baca_section(self, section):
+        tertunda = self._tertunda()
+        if section in tertunda:
+            return tertunda[section]
+        return self.penyimpanan.baca_section(self.survey, section)
+
+    def _baca_key(self, section, key):
+        tertunda = self._tertunda()
+        if section in tertunda:
+            isi = tertunda[section]
+            return isi.get(key) if isinstance(isi, dict) else None
+        return self.penyimpanan.baca_key(self.survey, section, key)
+
+
+class DataResetSQLite:
+    """
+    Pengganti DataResetReport / DataResetExtract untuk backend SQLite.
+    - reset_current(section)        → kosongkan satu section (gaya DataResetReport)
+    - reset_current(key, section)   → hapus satu entri, misal 'Lokasi|Sensor' (gaya DataResetExtract)
+    - reset_file()                  → kosongkan kelompok section (default: semua yang didaftarkan)
+    """
+
+    def __init__(self, db_file="survey_pd.db", survey="aktif", sections=None):
+        """
+        Args:
+            db_file (str): file database SQLite.
+            survey (str): nama survey.
+            sections (tuple of str): section yang dikosongkan reset_file (misal SECTION_LAPORAN).
+        """
+        self.db_file = db_file
+        self.survey = survey
+        self.sections = sections
+        self.penyimpanan = buka_penyimpanan(db_file)
+        self.section_resetters = {}  # Dictionary untuk menyimpan callback reset per section
+
+    def register_section_reset(self, section_name, reset_callback):
+        """
+        Mendaftarkan fungsi reset untuk sebuah section.
+        Callback ini akan dipanggil saat reset dilakukan.
+        """
+        self.section_resetters[section_name] = reset_callback
+
+    def reset_file(self):
+        """
+        Kosongkan seluruh section kelompok ini dan panggil semua reset callback.
+        """
+        try:
+            penulis_latar.tunggu(_kunci_latar(self.db_file, self.survey))
+            self.penyimpanan.hapus_sections(self.survey, self.sections or list(self.section_resetters))
+
+            for _, reset_cb in self.section_resetters.items():
+                reset_cb()
+
+            QMessageBox.information(None, "Sukses", "Seluruh data berhasil di-reset.")
+            return True
+        except Exception as e:
+            QMessageBox.critical(None, "Kesalahan", f"Data gagal di-reset: {e}")
+            return False
+
+    def reset_current(self, key=None, section=None):
+        """
+        Reset satu section, atau satu key di dalam section.
+
+        Args:
+            key (str): key unik (contoh: 'Lokasi|Sensor'); jika section tidak diberikan,
+                       argumen pertama dianggap nama section.
+            section (str): nama section.
+        """
+        try:
+            if section is None:
+                section, key = key, None
+            if section is None:
+                raise ValueError("Nama section harus diberikan untuk reset_current.")
+
+            penulis_latar.tunggu(_kunci_latar(self.db_file, self.survey))
+            if key is None:
+                self.penyimpanan.tulis_sections(self.survey, {section: {}})
+                removed = True
+                pesan = f"Data untuk '{section}' berhasil di-reset."
+            else:
+                removed = self.penyimpanan.hapus_key(self.survey, section, key)
+                pesan = f"Data untuk '{key}' di section '{section}' berhasil di-reset."
+
+            # Panggil callback kalau ada (reset widget)
+            if section in self.section_resetters:
+                self.section_resetters[section]()
+
+            if removed:
+                QMessageBox.information(None, "Sukses", pesan)
+            return True
+        except Exception as e:
+            QMessageBox.critical(None, "Kesalahan", f"Gagal reset data: {e}")
+            return False
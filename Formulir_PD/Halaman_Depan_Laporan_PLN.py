@@ -5,7 +5,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QFont, QPixmap
 from PySide6.QtCore import Qt
-from MyWidget import PlaceholderLineEdit, PlaceholderComboBox, MenuBar
+from MyWidget import PlaceholderLineEdit, PlaceholderComboBox, MenuBar, PengaturHalaman
 from DataManager import DataSave, DataLoad, DataResetReport
 
 # =========================================================
@@ -172,14 +172,10 @@ class HalamanDepanLaporanPLN(QMainWindow):
     
     def go_next(self):
         """Pindah ke halaman konversi data gambar"""
-        from Halaman_Konversi_Data_Gambar_Filtered import HalamanEkstraksiPRPD
         if not self.validate():
             return
-        self.data_save.save_to_file()
-        next_page = HalamanEkstraksiPRPD()
-        next_page.show()
-        QApplication.processEvents()
-        self.close()
+        self.data_save.save_in_background()  # Autosave (ditulis di latar belakang)
+        PengaturHalaman.pindah(self, "ekstraksi")
 
     # ---------------------------------------------------------
     # PENGATUR DATA (SAVE, LOAD, RESET)
@@ -213,10 +209,9 @@ class HalamanDepanLaporanPLN(QMainWindow):
         self.jam_entry.clear(); self.menit_entry.clear()
 
     def refresh_data(self):
-        """Muat ulang JSON ketika navigasi balik ke halaman ini."""
+        """Muat JSON saat halaman dibuat (halaman tetap hidup selama navigasi, tidak dimuat ulang)."""
         try:
-            self.data_load.load_from_file()
-            data = self.data_load.data.get("halaman_depan", {})
+            data = self.data_load.load_section("halaman_depan")
             if data:
                 self.load_data(data)
                 print("Data halaman depan dimuat ulang")
@@ -230,6 +225,8 @@ class HalamanDepanLaporanPLN(QMainWindow):
 # ---------------------------------------------------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    cover = HalamanDepanLaporanPLN()
-    cover.show()
+    window = PengaturHalaman()
+    window.tambah_halaman("depan", HalamanDepanLaporanPLN())
+    window.tampilkan("depan")
+    window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,12 +1,20 @@
-import sys, json
+import sys, copy
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QGridLayout, 
     QTabWidget, QScrollArea, QLabel, QLineEdit, QPushButton
 )
-from MyWidget import CheckableComboBox, MenuBar
+from MyWidget import CheckableComboBox, MenuBar, PengaturHalaman
 from DataManager import DataSave, DataLoad, DataResetReport
 from Table import IndikasiPD, JalurKabel20kV, KabelPower20kV, KubikelIncoming20kV, SisiLVTrafo
 
+# Sub-tab per trafo: (key di JSON, judul tab, kelas widget, atribut dict widget)
+SUB_TAB_TRAFO = (
+    ("sisi_lv_trafo", "SISI LV TRAFO", SisiLVTrafo, "sisi_lv_widgets"),
+    ("kabel_power", "KABEL POWER 20kV", KabelPower20kV, "kabel_power_widgets"),
+    ("jalur_kabel", "JALUR KABEL 20KV", JalurKabel20kV, "jalur_kabel_widgets"),
+    ("kubikel_incoming", "KUBIKEL INCOMING 20KV", KubikelIncoming20kV, "kubikel_widgets"),
+)
+
 # =========================================================
 # HALAMAN : FORMULIR LAPORAN
 # =========================================================
@@ -26,14 +34,21 @@ class HalamanFormulirLaporanPLN(QWidget):
         # Registrasi fungsi pengatur data per section
         self.data_save.register_section_save("formulir_laporan", self.save_all_form)
         self.data_load.register_section_load("formulir_laporan", self.load_main_form)
-        self.data_reset.register_section_reset("formulir_laporan", self.reset_main_form)
+        self.data_reset.register_section_reset("formulir_laporan", self.reset_all_widgets)
 
         # Deklarasi awal dictionary data tab formulir tiap trafo
+        # (hanya berisi widget yang sudah dibangun, lihat bangun_sub_tab)
         self.sisi_lv_widgets = {}
         self.kabel_power_widgets = {}
         self.jalur_kabel_widgets = {}
         self.kubikel_widgets = {}
 
+        # Sub-tab trafo yang belum dibuka: dibangun saat pertama kali tampil
+        self.trafo_aktif = []                                    # nomor trafo sesuai urutan tab
+        self.slot_sub_tab = {}                                   # (key, nomor) → QScrollArea
+        self.data_tertunda = {key: {} for key, *_ in SUB_TAB_TRAFO}  # key → {nomor: dict tersimpan}
+        self._data_bawaan = {}                                   # key → save_tab() widget kosong
+
         # Panggil fungsi untuk membangun UI
         self.init_ui()
 
@@ -101,6 +116,7 @@ class HalamanFormulirLaporanPLN(QWidget):
 
         # ===== Tab Formulir Halaman =====
         self.tabs = QTabWidget()
+        self.tabs.currentChanged.connect(self.bangun_tab_tampil)
         main_layout.addWidget(self.tabs)
 
         self.setLayout(main_layout)
@@ -121,9 +137,19 @@ class HalamanFormulirLaporanPLN(QWidget):
         self.trafo_combobox.ItemsList = [str(i) for i in range(1, jumlah + 1)]
 
     def generate_tabs(self):
-        """Buat ulang tab sesuai trafo yang dipilih."""
+        """
+        Buat ulang tab sesuai trafo yang dipilih.
+        Sub-tab trafo hanya disiapkan slotnya; widget dibangun saat tab pertama kali dibuka
+        dan data tersimpannya disimpan sebagai dict sampai saat itu.
+        """
+        self.tabs.blockSignals(True)
         self.tabs.clear()
-        self.jalur_kabel_widgets.clear()
+        self.tabs.blockSignals(False)
+        self.trafo_aktif = []
+        self.slot_sub_tab.clear()
+        for key, _, _, atribut in SUB_TAB_TRAFO:
+            getattr(self, atribut).clear()
+            self.data_tertunda[key] = {}
 
         # Ambil jumlah trafo
         try:
@@ -142,87 +168,108 @@ class HalamanFormulirLaporanPLN(QWidget):
         self.indikasi_pd_tab = IndikasiPD(selected_trafos)
         self.tabs.addTab(self.indikasi_pd_tab, "Indikasi PD")
 
-        # Buat tab per trafo
-        for num in selected_numbers:
-            self.add_trafo_tab(num)
-
-        # Jika ada data tersimpan → load kembali
-        saved_indikasi = self.data_save.data.get("formulir_laporan", {}).get("indikasi_pd", [])
+        # Jika ada data tersimpan → load kembali (sub-tab trafo: ditunda sampai dibuka)
+        saved_form = self.data_save.data.get("formulir_laporan", {})
+        saved_indikasi = saved_form.get("indikasi_pd", [])
         if saved_indikasi:
             self.indikasi_pd_tab.load_tab(saved_indikasi)
 
-        saved_lv = self.data_save.data.get("formulir_laporan", {}).get("sisi_lv_trafo", {})
-        for num, widget in self.sisi_lv_widgets.items():
-            if str(num) in saved_lv:
-                widget.load_tab(saved_lv[str(num)])
+        for key, *_ in SUB_TAB_TRAFO:
+            saved = saved_form.get(key, {})
+            for num in selected_numbers:
+                if str(num) in saved:
+                    self.data_tertunda[key][num] = saved[str(num)]
 
-        saved_kabel = self.data_save.data.get("formulir_laporan", {}).get("kabel_power", {})
-        for num, widget in self.kabel_power_widgets.items():
-            if str(num) in saved_kabel:
-                widget.load_tab(saved_kabel[str(num)])
-
-        saved_jalur = self.data_save.data.get("formulir_laporan", {}).get("jalur_kabel", {})
-        for num, widget in self.jalur_kabel_widgets.items():
-            if str(num) in saved_jalur:
-                widget.load_tab(saved_jalur[str(num)])
-
-        saved_kubikel = self.data_save.data.get("formulir_laporan", {}).get("kubikel_incoming", {})
-        for num, widget in self.kubikel_widgets.items():
-            if str(num) in saved_kubikel:
-                widget.load_tab(saved_kubikel[str(num)])
+        # Buat tab per trafo
+        for num in selected_numbers:
+            self.add_trafo_tab(num)
 
     def add_scrollable_tab(self, tab_widget: QTabWidget, widget: QWidget, title: str):
         """Tambahkan widget ke dalam tab dengan scrollable support."""
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)       # Supaya isi ikut ukuran
-        scroll.setWidget(widget)              # Masukkan widget ke scroll area
+        if widget is not None:
+            scroll.setWidget(widget)          # Masukkan widget ke scroll area
         tab_widget.addTab(scroll, title)
+        return scroll
 
     def add_trafo_tab(self, trafo_number):
-        """Tambahkan tab-tab detail untuk setiap trafo dengan scroll."""
+        """Tambahkan tab-tab detail untuk setiap trafo (slot kosong dengan scroll)."""
         trafo_tab = QTabWidget()
+        self.trafo_aktif.append(trafo_number)
 
-        # Sisi LV Trafo
-        sisi_lv_widget = SisiLVTrafo()
-        self.sisi_lv_widgets[trafo_number] = sisi_lv_widget
-        self.add_scrollable_tab(trafo_tab, sisi_lv_widget, "SISI LV TRAFO")
-
-        # Kabel Power 20kV
-        kabel_power_widget = KabelPower20kV()
-        self.kabel_power_widgets[trafo_number] = kabel_power_widget
-        self.add_scrollable_tab(trafo_tab, kabel_power_widget, "KABEL POWER 20kV")
+        for key, judul, _, _ in SUB_TAB_TRAFO:
+            self.slot_sub_tab[(key, trafo_number)] = self.add_scrollable_tab(trafo_tab, None, judul)
 
-        # Jalur Kabel 20kV
-        jalur_kabel_widget = JalurKabel20kV()
-        self.jalur_kabel_widgets[trafo_number] = jalur_kabel_widget
-        self.add_scrollable_tab(trafo_tab, jalur_kabel_widget, "JALUR KABEL 20KV")
-
-        # Kubikel Incoming 20kV
-        kubikel_widget = KubikelIncoming20kV()
-        self.kubikel_widgets[trafo_number] = kubikel_widget
-        self.add_scrollable_tab(trafo_tab, kubikel_widget, "KUBIKEL INCOMING 20KV")
+        # Sub-tab dibangun saat dipilih
+        trafo_tab.currentChanged.connect(
+            lambda index, num=trafo_number: self.bangun_sub_tab(SUB_TAB_TRAFO[index][0], num) if index >= 0 else None
+        )
 
         # Tambahkan ke tab utama
         self.tabs.addTab(trafo_tab, f"TRAFO {trafo_number}")
 
+    def bangun_tab_tampil(self, index):
+        """Tab TRAFO n dibuka → bangun sub-tab yang sedang tampil di dalamnya."""
+        trafo_tab = self.tabs.widget(index)
+        tab_name = self.tabs.tabText(index)
+        if isinstance(trafo_tab, QTabWidget) and tab_name.startswith("TRAFO ") and trafo_tab.currentIndex() >= 0:
+            num = tab_name.replace("TRAFO ", "").strip()
+            self.bangun_sub_tab(SUB_TAB_TRAFO[trafo_tab.currentIndex()][0], num)
+
+    def bangun_sub_tab(self, key, trafo_number):
+        """
+        Bangun widget sub-tab trafo (sekali saja) lalu isi dengan data tertunda jika ada.
+
+        Return:
+            QWidget: widget sub-tab (None jika trafo tidak ada di tab aktif).
+        """
+        _, _, kelas, atribut = next(sub for sub in SUB_TAB_TRAFO if sub[0] == key)
+        widgets = getattr(self, atribut)
+        if trafo_number in widgets:
+            return widgets[trafo_number]
+        slot = self.slot_sub_tab.get((key, trafo_number))
+        if slot is None:
+            return None
+
+        widget = kelas()
+        saved = self.data_tertunda[key].pop(trafo_number, None)
+        if saved:
+            widget.load_tab(saved)
+        widgets[trafo_number] = widget
+        slot.setWidget(widget)
+        return widget
+
+    def data_sub_tab(self, key, trafo_number):
+        """
+        Isi sub-tab untuk disimpan: dari widget jika sudah dibangun, dari data tertunda jika belum,
+        atau isi default widget kosong jika trafo belum punya data sama sekali.
+        """
+        _, _, kelas, atribut = next(sub for sub in SUB_TAB_TRAFO if sub[0] == key)
+        widget = getattr(self, atribut).get(trafo_number)
+        if widget is not None:
+            return widget.save_tab()
+        if trafo_number in self.data_tertunda[key]:
+            return self.data_tertunda[key][trafo_number]
+        if key not in self._data_bawaan:
+            # Satu widget sementara per jenis tab, bukan satu per trafo
+            kosong = kelas()
+            self._data_bawaan[key] = kosong.save_tab()
+            kosong.deleteLater()
+        return copy.deepcopy(self._data_bawaan[key])
+
     # ---------------------------------------------------------
     # NAVIGASI HALAMAN (Next/Prev)
     # ---------------------------------------------------------
     def go_prev(self):
-        """Pindah ke halaman depan laporan"""
-        from Halaman_Konversi_Data_Gambar_Filtered import HalamanEkstraksiPRPD
-        self.data_save.save_to_file()  # Autosave
-        self.new_window = HalamanEkstraksiPRPD()
-        self.new_window.show()
-        self.close()
+        """Pindah ke halaman ekstraksi data gambar"""
+        self.data_save.save_in_background()  # Autosave (ditulis di latar belakang)
+        PengaturHalaman.pindah(self, "ekstraksi")
 
     def go_next(self):
-        """Pindah ke halaman konversi laporan"""
-        from Halaman_Konversi_Laporan_PLN import HalamanKonversiLaporanPLN
-        self.data_save.save_to_file()  # Autosave
-        self.new_window = HalamanKonversiLaporanPLN()
-        self.new_window.show()
-        self.close()
+        """Pindah ke halaman konversi laporan (membaca saved_data.json saat ekspor)"""
+        self.data_save.save_in_background()  # Autosave (ditulis di latar belakang)
+        PengaturHalaman.pindah(self, "konversi")
 
     # ---------------------------------------------------------
     # PENGATUR DATA (SAVE, LOAD, RESET)
@@ -239,12 +286,8 @@ class HalamanFormulirLaporanPLN(QWidget):
     def load_main_form(self, data=None):
         """Load data bagian atas (data umum)."""
         if not data:
-            self.data_load.load_from_file()
-            data = (
-                self.data_load.data
-                .get("formulir_laporan", {})
-                .get("data_umum", {})
-            )
+            # Hanya section formulir_laporan yang diparse (dari cache jika file tidak berubah)
+            data = self.data_load.load_section("formulir_laporan").get("data_umum", {})
 
         if data:
             self.suhu_entry.setText(data.get("suhu", ""))
@@ -261,6 +304,8 @@ class HalamanFormulirLaporanPLN(QWidget):
         self.jumlah_trafo_entry.clear()
         self.trafo_combobox.ItemsList = []
         self.tabs.clear()
+        self.trafo_aktif = []
+        self.slot_sub_tab.clear()
     
     def save_all_form(self, old_data=None):
         if not self.suhu_entry.text() and not self.kelembaban_entry.text() and not self.jumlah_trafo_entry.text():
@@ -272,17 +317,16 @@ class HalamanFormulirLaporanPLN(QWidget):
                 self.indikasi_pd_tab.save_tab() 
                 if hasattr(self, "indikasi_pd_tab") else {}
             ),
-            "sisi_lv_trafo": {str(num): w.save_tab() for num, w in self.sisi_lv_widgets.items()},
-            "kabel_power" : {str(num): w.save_tab() for num, w in self.kabel_power_widgets.items()},
-            "jalur_kabel": {str(num): w.save_tab() for num, w in self.jalur_kabel_widgets.items()},
-            "kubikel_incoming": {str(num): w.save_tab() for num, w in self.kubikel_widgets.items()}
+            **{
+                key: {str(num): self.data_sub_tab(key, num) for num in self.trafo_aktif}
+                for key, *_ in SUB_TAB_TRAFO
+            }
         }
 
     def load_all_form(self, data=None):
         """Load semua bagian form dari JSON."""
         if not data:
-            self.data_load.load_from_file()
-            data = self.data_load.data.get("formulir_laporan", {})
+            data = self.data_load.load_section("formulir_laporan")
 
         if not data:
             return
@@ -297,29 +341,35 @@ class HalamanFormulirLaporanPLN(QWidget):
         if "indikasi_pd" in data and hasattr(self, "indikasi_pd_tab"):
             self.indikasi_pd_tab.load_tab(data["indikasi_pd"])
 
-        if "sisi_lv_trafo" in data:
-            for num, widget in self.sisi_lv_widgets.items():
-                if str(num) in data["sisi_lv_trafo"]:
-                    widget.load_tab(data["sisi_lv_trafo"][str(num)])
-
-        if "kabel_power" in data:
-            for num, widget in self.kabel_power_widgets.items():
-                if str(num) in data["kabel_power"]:
-                    widget.load_tab(data["kabel_power"][str(num)])
-
-        if "jalur_kabel" in data:
-            for num, widget in self.jalur_kabel_widgets.items():
-                if str(num) in data["jalur_kabel"]:
-                    widget.load_tab(data["jalur_kabel"][str(num)])
-
-        if "kubikel_incoming" in data:
-            for num, widget in self.kubikel_widgets.items():
-                if str(num) in data["kubikel_incoming"]:
-                    widget.load_tab(data["kubikel_incoming"][str(num)])
+        # Sub-tab yang sudah dibangun langsung di-load, sisanya menunggu dibuka
+        for key, _, _, atribut in SUB_TAB_TRAFO:
+            if key not in data:
+                continue
+            widgets = getattr(self, atribut)
+            for num in self.trafo_aktif:
+                if str(num) not in data[key]:
+                    continue
+                if num in widgets:
+                    widgets[num].load_tab(data[key][str(num)])
+                else:
+                    self.data_tertunda[key][num] = data[key][str(num)]
 
     def reset_all_form(self):
         """Reset seluruh form, tapi biarkan halaman depan tetap ada."""
         # Reset UI (hapus data widgets/tabs)
+        self.reset_all_widgets()
+
+        # Load JSON
+        data = self.data_load.load_from_file() or {}
+
+        # Hapus semua isi formulir laporan sepenuhnya di JSON
+        if "formulir_laporan" in data:
+            data["formulir_laporan"] = {}
+        self.data_save.data = data
+        self.data_save.save_to_file()
+
+    def reset_all_widgets(self):
+        """Kosongkan seluruh widget formulir (form utama, tab, dan data sub-tab yang belum dibangun)."""
         self.reset_main_form()
         if hasattr(self, "indikasi_pd_tab"):
             self.indikasi_pd_tab.reset_tab()
@@ -331,15 +381,8 @@ class HalamanFormulirLaporanPLN(QWidget):
             widget.reset_tab()
         for widget in self.kubikel_widgets.values():
             widget.reset_tab()
-
-        # Load JSON
-        data = self.data_load.load_from_file() or {}
-
-        # Hapus semua isi formulir laporan sepenuhnya di JSON
-        if "formulir_laporan" in data:
-            data["formulir_laporan"] = {}
-        self.data_save.data = data
-        self.data_save.save_to_file()
+        for tertunda in self.data_tertunda.values():
+            tertunda.clear()
 
     def reset_current_trafo(self):
         """
@@ -365,12 +408,8 @@ class HalamanFormulirLaporanPLN(QWidget):
             trafo_num = tab_name.replace("TRAFO ", "").strip()
             trf_key = f"TRF#{trafo_num}"     
 
-            # Muat seluruh JSON
-            try:
-                with open(self.data_save.json_file, "r", encoding="utf-8") as f:
-                    full_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                full_data = {}
+            # Muat seluruh JSON (termasuk autosave yang masih tertunda / dipulihkan dari jurnal)
+            full_data = self.data_reset.jurnal.baca()
 
             formulir = full_data.get("formulir_laporan", {})
             indikasi = formulir.get("indikasi_pd", {})
@@ -406,9 +445,9 @@ class HalamanFormulirLaporanPLN(QWidget):
                     del formulir[section_name][trafo_num]
 
             # Simpan ulang modifikasi data ke JSON
+            # (jurnal dulu, lalu file secara atomik → reset tidak hilang jika proses mati saat menulis)
             full_data["formulir_laporan"] = formulir
-            with open(self.data_save.json_file, "w", encoding="utf-8") as f:
-                json.dump(full_data, f, indent=4, ensure_ascii=False)
+            self.data_reset.jurnal.tulis(full_data, [{"op": "set", "section": "formulir_laporan", "data": formulir}])
 
             # Reset tampilan UI trafo-n
             if col_index is not None and hasattr(self, "indikasi_pd_tab"):
@@ -424,6 +463,8 @@ class HalamanFormulirLaporanPLN(QWidget):
                 ("jalur_kabel", self.jalur_kabel_widgets),
                 ("kubikel_incoming", self.kubikel_widgets)
             ]:
+                # Sub-tab yang belum dibuka cukup dibuang data tertundanya
+                self.data_tertunda[dname].pop(trafo_num, None)
                 widget = d.get(trafo_num)
                 if widget and hasattr(widget, "reset_tab"):
                     try:
@@ -441,6 +482,8 @@ class HalamanFormulirLaporanPLN(QWidget):
 # ---------------------------------------------------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = HalamanFormulirLaporanPLN()
+    window = PengaturHalaman()
+    window.tambah_halaman("formulir", HalamanFormulirLaporanPLN())
+    window.tampilkan("formulir")
     window.show()
     sys.exit(app.exec())
@@ -3,18 +3,17 @@ matplotlib.use("QtAgg")
 matplotlib.rcParams["interactive"] = False
 matplotlib.rcParams["figure.autolayout"] = True
 import sys, os
-import pandas as pd
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QScrollArea, QLabel, QPushButton, QFileDialog, QTextEdit, QMessageBox
+    QScrollArea, QLabel, QPushButton, QFileDialog, QTextEdit, QMessageBox, QProgressBar
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, Slot
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from MyWidget import PlaceholderComboBox, PlaceholderLineEdit, MenuBar
-from DataManager import DataSave, DataLoad, DataResetExtract
-from PlotAnalysis import ProsesorPRPD, ProsesorWaveform
+from MyWidget import PlaceholderComboBox, PlaceholderLineEdit, MenuBar, PekerjaAnalisis, PengaturHalaman
+from DataManager import DataSave, DataLoad, DataResetExtract, SidecarTitik
+from PlotAnalysis import DataTitik, CacheHasil, LapisanPRPD, LapisanWaveform
 
 class MplCanvas(FigureCanvas):
     def __init__(self, parent=None, width=5, height=3, dpi=100):
@@ -22,6 +21,9 @@ class MplCanvas(FigureCanvas):
         self.axes = fig.add_subplot(111)
         super().__init__(fig)
 
+# Sensor yang indikasi PD-nya dibandingkan berdampingan
+SENSOR_PEMBANDING = ["TEV", "HFCT", "Ultrasonik"]
+
 # =========================================================
 # HALAMAN : EKSTRAKSI & ANALISIS PLOT HASIL PENGUKURAN
 # =========================================================
@@ -38,6 +40,10 @@ class HalamanEkstraksiPRPD(QWidget):
         self.data_load = DataLoad(json_file="plot_data.json")
         self.data_reset = DataResetExtract(json_file="plot_data.json")
 
+        # Titik hasil ekstraksi disimpan terpisah (.npz per lokasi|sensor), JSON hanya fitur & indikasi
+        self.sidecar_titik = SidecarTitik(json_file="plot_data.json")
+        self.titik_tersimpan = {}  # key → (titik waveform, titik PRPD) yang terakhir ditulis ke sidecar
+
         # Registrasi fungsi pengatur data per section (gabungan PRPD + Waveform)
         self.data_save.register_section_save("hasil_plot", self.save_plot_result)
         self.data_load.register_section_load("hasil_plot", self.load_plot_result)
@@ -48,6 +54,18 @@ class HalamanEkstraksiPRPD(QWidget):
         self.waveform_file = ""
         self.last_prpd_result = {}
         self.last_waveform_result = {}
+        self.kunci_hasil = {}  # "waveform" / "prpd" → 'Lokasi|Sensor' tempat hasil terakhir diekstraksi/dimuat
+
+        # Cache hasil ekstraksi (gambar sama → fitur langsung diambil dari disk)
+        self.cache_hasil = CacheHasil()
+
+        # Lapisan plot aktif per canvas ("waveform" / "prpd" → LapisanWaveform / LapisanPRPD)
+        self.lapisan_plot = {}
+
+        # Pekerja analisis di latar belakang ("waveform" / "prpd" → PekerjaAnalisis)
+        self.thread_pool = QThreadPool.globalInstance()
+        self.pekerja_aktif = {}
+        self.pekerja_dibatalkan = {}    # pekerja yang dibatalkan tapi run() belum selesai
 
         # ===== Layout utama =====
         main_layout = QVBoxLayout()
@@ -56,7 +74,7 @@ class HalamanEkstraksiPRPD(QWidget):
         menu_bar = MenuBar(
             self,
             save_function=self.data_save.save_to_file,
-            load_function=self.data_load.load_from_file,
+            load_function=self.load_current_result,
             reset_all_function=self.reset_all_page,
             reset_current_function=self.reset_current_page,
             next_page=self.go_next,
@@ -100,9 +118,10 @@ class HalamanEkstraksiPRPD(QWidget):
         form_layout.addWidget(sensor_colon, 1, 1)
         form_layout.addWidget(sensor_combo_widget, 1, 2)
 
-        # Ketika isi combobox berubah, widget hasil akan di clear
+        # Ketika lokasi berubah, widget hasil akan di clear
+        # Ketika sensor berubah, hasil yang ada cukup dinilai ulang (tanpa ekstraksi ulang)
         self.combo_lokasi.currentIndexChanged.connect(self.clear_current_widgets)
-        self.combo_sensor.currentIndexChanged.connect(self.clear_current_widgets)
+        self.combo_sensor.currentIndexChanged.connect(self.evaluate_ulang_sensor)
 
         # Tambahkan ke layout utama
         main_layout.addLayout(form_layout)
@@ -126,12 +145,23 @@ class HalamanEkstraksiPRPD(QWidget):
         self.wf_result.setMinimumHeight(150)
         self.wf_result.setReadOnly(True)
         
-        btn_wf_analyze = QPushButton("Ekstrak && Analisis")
-        btn_wf_analyze.clicked.connect(self.process_waveform)
+        self.btn_wf_analyze = QPushButton("Ekstrak && Analisis")
+        self.btn_wf_analyze.clicked.connect(self.process_waveform)
         wf_result_layout.addWidget(self.wf_result)
-        wf_result_layout.addWidget(btn_wf_analyze)
+        wf_result_layout.addWidget(self.btn_wf_analyze)
         main_layout.addLayout(wf_result_layout)
 
+        # Indikator proses + tombol batal (hanya tampil saat analisis berjalan)
+        wf_progres_layout = QHBoxLayout()
+        self.progres_wf = QProgressBar()
+        self.progres_wf.setVisible(False)
+        self.btn_wf_batal = QPushButton("Batal")
+        self.btn_wf_batal.setVisible(False)
+        self.btn_wf_batal.clicked.connect(lambda: self.batalkan_analisis("waveform"))
+        wf_progres_layout.addWidget(self.progres_wf)
+        wf_progres_layout.addWidget(self.btn_wf_batal)
+        main_layout.addLayout(wf_progres_layout)
+
         # Waveform canvas + toolbar
         self.canvas_waveform = MplCanvas(self, width=5, height=10, dpi=100)
         self.toolbar_waveform = NavigationToolbar(self.canvas_waveform, self)
@@ -159,12 +189,29 @@ class HalamanEkstraksiPRPD(QWidget):
         self.prpd_result.setMinimumHeight(150)
         self.prpd_result.setReadOnly(True)
         
-        btn_prpd_analyze = QPushButton("Ekstrak && Analisis")
-        btn_prpd_analyze.clicked.connect(self.process_prpd)
+        self.btn_prpd_analyze = QPushButton("Ekstrak && Analisis")
+        self.btn_prpd_analyze.clicked.connect(self.process_prpd)
         prpd_result_layout.addWidget(self.prpd_result)
-        prpd_result_layout.addWidget(btn_prpd_analyze)
+        prpd_result_layout.addWidget(self.btn_prpd_analyze)
         main_layout.addLayout(prpd_result_layout)
 
+        # Indikator proses + tombol batal (hanya tampil saat analisis berjalan)
+        prpd_progres_layout = QHBoxLayout()
+        self.progres_prpd = QProgressBar()
+        self.progres_prpd.setVisible(False)
+        self.btn_prpd_batal = QPushButton("Batal")
+        self.btn_prpd_batal.setVisible(False)
+        self.btn_prpd_batal.clicked.connect(lambda: self.batalkan_analisis("prpd"))
+        prpd_progres_layout.addWidget(self.progres_prpd)
+        prpd_progres_layout.addWidget(self.btn_prpd_batal)
+        main_layout.addLayout(prpd_progres_layout)
+
+        # Kontrol analisis per jenis plot: (progress bar, tombol analisis, tombol batal, widget hasil)
+        self.kontrol_analisis = {
+            "waveform": (self.progres_wf, self.btn_wf_analyze, self.btn_wf_batal, self.wf_result),
+            "prpd": (self.progres_prpd, self.btn_prpd_analyze, self.btn_prpd_batal, self.prpd_result),
+        }
+
         self.canvas_prpd = MplCanvas(self, width=5, height=10, dpi=100)
         self.toolbar_prpd = NavigationToolbar(self.canvas_prpd, self)
         self.canvas_prpd.setMinimumWidth(1200)
@@ -199,6 +246,7 @@ class HalamanEkstraksiPRPD(QWidget):
         import matplotlib.pyplot as plt
         import gc
 
+        self.lepas_lapisan_plot()
         for name in ["canvas_waveform", "canvas_prpd"]:
             canvas = getattr(self, name, None)
             if canvas:
@@ -234,31 +282,20 @@ class HalamanEkstraksiPRPD(QWidget):
     # ---------------------------------------------------------
     def closeEvent(self, event):
         """Override Qt close event untuk melepas Matplotlib objects secara aman."""
+        self.batalkan_semua_analisis()
         self.cleanup_canvas()
         event.accept()
 
+    # Halaman tetap hidup di PengaturHalaman: canvas & analisis yang berjalan tidak dihentikan saat pindah
     def go_prev(self):
         """Pindah ke halaman depan laporan"""
-        from Halaman_Depan_Laporan_PLN import HalamanDepanLaporanPLN
-        self.data_save.save_to_file()
-        QApplication.processEvents()
-        self.cleanup_canvas()
-        QApplication.processEvents()
-        self.new_window = HalamanDepanLaporanPLN()
-        self.new_window.show()
-        self.close()
-
+        self.data_save.save_in_background()  # Autosave (ditulis di latar belakang)
+        PengaturHalaman.pindah(self, "depan")
 
     def go_next(self):
         """Pindah ke halaman formulir laporan"""
-        from Halaman_Formulir_Laporan_PLN import HalamanFormulirLaporanPLN
-        self.data_save.save_to_file()
-        QApplication.processEvents()
-        self.cleanup_canvas()
-        QApplication.processEvents()  
-        self.new_window = HalamanFormulirLaporanPLN()
-        self.new_window.show()
-        self.close()
+        self.data_save.save_in_background()  # Autosave (ditulis di latar belakang)
+        PengaturHalaman.pindah(self, "formulir")
 
     # ---------------------------------------------------------
     # MEMUAT GAMBAR PLOT
@@ -283,56 +320,244 @@ class HalamanEkstraksiPRPD(QWidget):
         if not valid:
             return
 
+        from PlotAnalysis import ProsesorWaveform   # cv2/scipy dimuat saat analisis pertama
         sensor_type = self.combo_sensor.currentText()
-        processor = ProsesorWaveform(self.waveform_file, sensor_type)
-        result = processor.process_waveform()
-        self.last_waveform_result = result # Simpan hasil supaya bisa diakses save_plot_result
-
-        # Plot ke canvas
-        df = pd.DataFrame(result["waveform_data_points"])
-        self.canvas_waveform.axes.clear()
-        if not df.empty:
-            self.canvas_waveform.axes.plot(df["time_us"], df["amplitude_dB"], c="red", linewidth=1)
-            self.canvas_waveform.axes.set_xlabel("Time (µs)")
-            self.canvas_waveform.axes.set_ylabel("Amplitude (dB)")
-            self.canvas_waveform.axes.set_title("Extracted Waveform Data")
-            self.canvas_waveform.axes.grid(True)
-        self.canvas_waveform.draw()
-
-        # Update dan tampilkan hasil
-        msg = "Fitur Waveform:\n"
-        for k, v in result["features"].items():
-            msg += f" - {k}: {v:.3f}\n" if isinstance(v, float) else f" - {k}: {v}\n"
-        msg += "\n🔎 Indikasi PD: " + result["indikasi_pd"]
-        self.wf_result.setText(msg)
+        processor = ProsesorWaveform(self.waveform_file, sensor_type, cache=self.cache_hasil)
+        self.mulai_analisis("waveform", processor, processor.process_waveform)
 
     def process_prpd(self):
         valid, sensor_type = self.validate_inputs(self.prpd_file, is_prpd=True)
         if not valid:
             return
 
+        from PlotAnalysis import ProsesorPRPD
         sensor_type = self.combo_sensor.currentText()
-        processor = ProsesorPRPD(self.prpd_file, sensor_type)
-        result = processor.process_prpd()
+        processor = ProsesorPRPD(self.prpd_file, sensor_type, cache=self.cache_hasil)
+        self.mulai_analisis("prpd", processor, processor.process_prpd)
+
+    # ---------------------------------------------------------
+    # GAMBAR PLOT (kerapatan / desimasi, detail penuh saat di-zoom)
+    # ---------------------------------------------------------
+    def gambar_waveform(self, titik):
+        """Gambar ulang canvas waveform (min/max per kolom piksel, garis asli saat di-zoom)."""
+        self.lepas_lapisan_plot("waveform")
+        axes = self.canvas_waveform.axes
+        axes.clear()
+        axes.set_xlabel("Time (µs)")
+        axes.set_ylabel("Amplitude (dB)")
+        axes.set_title("Extracted Waveform Data")
+        axes.grid(True)
+        if len(titik) > 0:
+            self.lapisan_plot["waveform"] = LapisanWaveform(axes, titik["time_us"], titik["amplitude_dB"], c="red", linewidth=1)
+        self.canvas_waveform.draw()
+
+    def gambar_prpd(self, titik):
+        """Gambar ulang canvas PRPD (gambar kerapatan, scatter asli saat di-zoom)."""
+        self.lepas_lapisan_plot("prpd")
+        axes = self.canvas_prpd.axes
+        axes.clear()
+        axes.set_xlabel("Phase (deg)")
+        axes.set_ylabel("Amplitude (dB)")
+        axes.set_title("Grafik Data PRPD (Terfilter)")
+        axes.grid(True)
+        if len(titik) > 0:
+            self.lapisan_plot["prpd"] = LapisanPRPD(axes, titik["phase_deg"], titik["intensity_dB"], s=5, c="blue")
+        self.canvas_prpd.draw()
+
+    def lepas_lapisan_plot(self, nama=None):
+        """Lepas lapisan plot (satu canvas, atau semua jika nama=None) sebelum axes dibersihkan."""
+        for key in ([nama] if nama else list(self.lapisan_plot)):
+            lapisan = self.lapisan_plot.pop(key, None)
+            if lapisan is not None:
+                lapisan.lepas()
+
+    def tampilkan_waveform(self, result, processor):
+        self.last_waveform_result = result # Simpan hasil supaya bisa diakses save_plot_result
+
+        # Plot ke canvas
+        self.gambar_waveform(result["waveform_data_points"])
+
+        # Update dan tampilkan hasil
+        self.tampilkan_hasil(self.wf_result, "Fitur Waveform:", result, processor)
+
+    def tampilkan_prpd(self, result, processor):
         self.last_prpd_result = result # Simpan hasil supaya bisa diakses save_plot_result
 
         # Plot ke canvas
-        df = pd.DataFrame(result["prpd_data_points"])
-        self.canvas_prpd.axes.clear()
-        if not df.empty:
-            self.canvas_prpd.axes.scatter(df["phase_deg"], df["intensity_dB"], s=5, c="blue")
-            self.canvas_prpd.axes.set_xlabel("Phase (deg)")
-            self.canvas_prpd.axes.set_ylabel("Amplitude (dB)")
-            self.canvas_prpd.axes.set_title("Grafik Data PRPD (Terfilter)")
-            self.canvas_prpd.axes.grid(True)
-        self.canvas_prpd.draw()
+        self.gambar_prpd(result["prpd_data_points"])
 
         # Update dan tampilkan hasil
-        msg = "Fitur PRPD:\n"
-        for k, v in result["features"].items():
+        self.tampilkan_hasil(self.prpd_result, "Fitur PRPD:", result, processor)
+
+    # ---------------------------------------------------------
+    # PEKERJA ANALISIS (LATAR BELAKANG)
+    # ---------------------------------------------------------
+    def mulai_analisis(self, jenis, processor, fungsi):
+        """
+        Jalankan fungsi analisis di QThreadPool, tampilkan progress bar & tombol batal.
+
+        Args:
+            jenis (str): "waveform" / "prpd".
+            processor: objek ProsesorWaveform / ProsesorPRPD (dipakai saat menampilkan hasil).
+            fungsi (callable): method analisis yang menerima argumen progres.
+        """
+        if jenis in self.pekerja_aktif or jenis in self.pekerja_dibatalkan:
+            return
+
+        pekerja = PekerjaAnalisis(fungsi)
+        pekerja.processor = processor
+        pekerja.kunci = f"{self.combo_lokasi.currentText()}|{self.combo_sensor.currentText()}"
+        pekerja.sinyal.progres.connect(self.on_progres_analisis)
+        pekerja.sinyal.selesai.connect(self.on_analisis_selesai)
+        pekerja.sinyal.gagal.connect(self.on_analisis_gagal)
+        pekerja.sinyal.dibatalkan.connect(self.on_analisis_dibatalkan)
+        self.pekerja_aktif[jenis] = pekerja
+
+        progres, btn_analisis, btn_batal, _ = self.kontrol_analisis[jenis]
+        progres.setValue(0)
+        progres.setFormat("Menyiapkan analisis... %p%")
+        progres.setVisible(True)
+        btn_batal.setVisible(True)
+        btn_analisis.setEnabled(False)
+
+        self.thread_pool.start(pekerja)
+
+    def akhiri_analisis(self, jenis):
+        """Kembalikan tampilan kontrol analisis ke keadaan diam."""
+        self.pekerja_aktif.pop(jenis, None)
+        progres, btn_analisis, btn_batal, _ = self.kontrol_analisis[jenis]
+        progres.setVisible(False)
+        btn_batal.setVisible(False)
+        # Pekerja yang dibatalkan baru berhenti di titik progres berikutnya → tombol aktif setelah sinyal akhirnya tiba
+        btn_analisis.setEnabled(jenis not in self.pekerja_dibatalkan)
+
+    def batalkan_analisis(self, jenis):
+        """Batalkan analisis yang sedang berjalan (berhenti di tahap berikutnya)."""
+        pekerja = self.pekerja_aktif.get(jenis)
+        if pekerja is None:
+            return
+        pekerja.batalkan()
+        # setAutoDelete(False) → referensi di sini satu-satunya pemilik objek Python selama run() masih berjalan
+        self.pekerja_dibatalkan[jenis] = pekerja
+        self.akhiri_analisis(jenis)
+        self.kontrol_analisis[jenis][3].setText("Analisis dibatalkan.")
+
+    def batalkan_semua_analisis(self):
+        for jenis in list(self.pekerja_aktif):
+            self.batalkan_analisis(jenis)
+
+    def _pekerja_pengirim(self):
+        """Cari jenis analisis dari sinyal pengirim; None jika pekerja sudah tidak aktif (dibatalkan)."""
+        sinyal = self.sender()
+        for jenis, pekerja in self.pekerja_aktif.items():
+            if pekerja.sinyal is sinyal:
+                return jenis, pekerja
+        return None, None
+
+    def _lepas_pekerja_dibatalkan(self):
+        """Sinyal akhir dari pekerja yang dibatalkan: lepas referensinya & aktifkan lagi tombol analisis."""
+        sinyal = self.sender()
+        for jenis, pekerja in list(self.pekerja_dibatalkan.items()):
+            if pekerja.sinyal is sinyal:
+                del self.pekerja_dibatalkan[jenis]
+                self.kontrol_analisis[jenis][1].setEnabled(True)
+                return
+
+    @Slot(int, str)
+    def on_progres_analisis(self, persen, pesan):
+        jenis, _ = self._pekerja_pengirim()
+        if jenis is None:
+            return
+        progres = self.kontrol_analisis[jenis][0]
+        progres.setValue(persen)
+        progres.setFormat(f"{pesan}... %p%")
+
+    @Slot(object)
+    def on_analisis_selesai(self, result):
+        jenis, pekerja = self._pekerja_pengirim()
+        if jenis is None:
+            self._lepas_pekerja_dibatalkan()
+            return
+        self.akhiri_analisis(jenis)
+
+        # Sensor bisa saja diganti selama analisis berjalan → nilai ulang untuk sensor terpilih
+        processor = pekerja.processor
+        sensor_type = self.combo_sensor.currentText()
+        if sensor_type and sensor_type != processor.sensor_type:
+            processor.sensor_type = sensor_type
+            result["indikasi_pd"] = processor.evaluate(sensor_type, result["features"])
+
+        # Hasil plot lain dari lokasi+sensor berbeda tidak boleh ikut tersimpan di bawah key ini
+        lain = "prpd" if jenis == "waveform" else "waveform"
+        if self.kunci_hasil.get(lain) not in (None, pekerja.kunci):
+            self.kosongkan_hasil(lain)
+
+        self.kunci_hasil[jenis] = pekerja.kunci
+        if jenis == "waveform":
+            self.tampilkan_waveform(result, processor)
+        else:
+            self.tampilkan_prpd(result, processor)
+
+    @Slot(str)
+    def on_analisis_gagal(self, pesan):
+        jenis, _ = self._pekerja_pengirim()
+        if jenis is None:
+            self._lepas_pekerja_dibatalkan()
+            return
+        self.akhiri_analisis(jenis)
+        QMessageBox.critical(self, "Error", f"Gagal melakukan ekstraksi & analisis:\n{pesan}")
+
+    @Slot()
+    def on_analisis_dibatalkan(self):
+        jenis, _ = self._pekerja_pengirim()
+        if jenis is None:
+            self._lepas_pekerja_dibatalkan()
+            return
+        self.akhiri_analisis(jenis)
+
+    def tampilkan_hasil(self, widget, judul, result, processor):
+        """
+        Tampilkan fitur + indikasi PD sensor terpilih, serta indikasi PD
+        untuk setiap sensor pembanding (TEV, HFCT, Ultrasonik) berdampingan.
+        Penilaian ulang hanya memakai fitur, tanpa ekstraksi ulang.
+        """
+        features = result.get("features", {})
+        msg = f"{judul}\n"
+        for k, v in features.items():
             msg += f" - {k}: {v:.3f}\n" if isinstance(v, float) else f" - {k}: {v}\n"
-        msg += "\n🔎 Indikasi PD: " + result["indikasi_pd"]
-        self.prpd_result.setText(msg)
+        msg += "\n🔎 Indikasi PD: " + result.get("indikasi_pd", "Tidak ada")
+        if features:
+            perbandingan = "   |   ".join(
+                f"{sensor}: {processor.evaluate(sensor, features)}" for sensor in SENSOR_PEMBANDING
+            )
+            msg += "\n⚖️ Indikasi PD per Sensor: " + perbandingan
+        widget.setText(msg)
+
+    def evaluate_ulang_sensor(self):
+        """
+        Nilai ulang indikasi PD hasil yang sudah ada untuk sensor yang baru dipilih.
+        Jika belum ada hasil, widget dibersihkan seperti biasa.
+        """
+        sensor_type = self.combo_sensor.currentText()
+        if not sensor_type or not (self.last_prpd_result.get("features") or self.last_waveform_result.get("features")):
+            if not self.pekerja_aktif:
+                self.clear_current_widgets()
+            return
+
+        from PlotAnalysis import ProsesorPRPD, ProsesorWaveform
+        if self.last_waveform_result.get("features"):
+            processor = ProsesorWaveform(sensor_type=sensor_type)
+            self.last_waveform_result["indikasi_pd"] = processor.evaluate(
+                sensor_type, self.last_waveform_result["features"]
+            )
+            self.tampilkan_hasil(self.wf_result, "Fitur Waveform:", self.last_waveform_result, processor)
+
+        if self.last_prpd_result.get("features"):
+            processor = ProsesorPRPD(sensor_type=sensor_type)
+            self.last_prpd_result["indikasi_pd"] = processor.evaluate(
+                sensor_type, self.last_prpd_result["features"]
+            )
+            self.tampilkan_hasil(self.prpd_result, "Fitur PRPD:", self.last_prpd_result, processor)
 
     def validate_inputs(self, file_path: str, is_prpd: bool = False) -> tuple[bool, str]:
         """
@@ -375,6 +600,13 @@ class HalamanEkstraksiPRPD(QWidget):
         if not self.last_prpd_result and not self.last_waveform_result:
             return all_data if all_data else {}
 
+        # Hasil hanya disimpan di bawah lokasi+sensor tempat ia diekstraksi/dimuat
+        # (setelah sensor diganti, hasil lama hanya dinilai ulang untuk ditampilkan)
+        asal = {kunci for kunci in self.kunci_hasil.values() if kunci}
+        if asal and asal != {key}:
+            print(f"⚠️ Hasil milik {', '.join(sorted(asal))} tidak disimpan sebagai {key}")
+            return all_data if all_data else {}
+
         # kalau belum ada data lama, buat dict kosong
         if all_data is None:
             all_data = {}
@@ -384,17 +616,34 @@ class HalamanEkstraksiPRPD(QWidget):
         else:
             print(f"Tambah data baru untuk {key}")
 
+        # titik PRPD & waveform → file sidecar .npz, JSON cukup menyimpan nama filenya
+        # (tidak ditulis ulang jika titiknya masih sama dengan yang terakhir disimpan)
+        titik_wf = DataTitik.ensure(
+            self.last_waveform_result.get("waveform_data_points"), ["time_us", "amplitude_dB"]
+        )
+        titik_prpd = DataTitik.ensure(
+            self.last_prpd_result.get("prpd_data_points"), ["phase_deg", "intensity_dB"]
+        )
+        self.last_waveform_result["waveform_data_points"] = titik_wf
+        self.last_prpd_result["prpd_data_points"] = titik_prpd
+
+        titik_file = self.sidecar_titik.nama_file(key)
+        terakhir = self.titik_tersimpan.get(key)
+        if (terakhir is None or terakhir[0] is not titik_wf or terakhir[1] is not titik_prpd
+                or all_data.get(key, {}).get("titik_file") != titik_file):
+            titik_file = self.sidecar_titik.simpan(key, {"waveform": titik_wf.kolom, "prpd": titik_prpd.kolom})
+            self.titik_tersimpan[key] = (titik_wf, titik_prpd)
+
         # update / tambahkan entry untuk key spesifik
         all_data[key] = {
+            "titik_file": titik_file,
             "waveform": {
                 "path": self.waveform_file if self.waveform_file else "",
-                "waveform_data_points": self.last_waveform_result.get("waveform_data_points", []),
                 "features": self.last_waveform_result.get("features", {}),
                 "indikasi_pd": self.last_waveform_result.get("indikasi_pd", "Tidak ada")
             },
             "prpd": {
                 "path": self.prpd_file if self.prpd_file else "",
-                "prpd_data_points": self.last_prpd_result.get("prpd_data_points", []),
                 "features": self.last_prpd_result.get("features", {}),
                 "indikasi_pd": self.last_prpd_result.get("indikasi_pd", "Tidak ada")
             }
@@ -403,6 +652,24 @@ class HalamanEkstraksiPRPD(QWidget):
         return all_data
 
     # ===== Fungsi Load =====
+    def load_current_result(self):
+        """Muat hasil untuk lokasi+sensor saat ini saja (key lain di plot_data.json tidak diparse)."""
+        lokasi = self.combo_lokasi.currentText().strip()
+        sensor = self.combo_sensor.currentText().strip()
+        if not lokasi or not sensor:
+            self.load_plot_result({})
+            return
+
+        key = f"{lokasi}|{sensor}"
+        try:
+            if not self.data_load.file_tersedia():
+                return
+            selected = self.data_load.load_key("hasil_plot", key)
+        except Exception as e:
+            QMessageBox.critical(self, "Kesalahan", f"Data gagal dimuat: {e}")
+            return
+        self.load_plot_result({key: selected} if selected else {})
+
     def load_plot_result(self, data):
         """Muat path + hasil ekstraksi PRPD & waveform untuk lokasi+sensor tertentu."""
         lokasi = self.combo_lokasi.currentText().strip()
@@ -421,7 +688,11 @@ class HalamanEkstraksiPRPD(QWidget):
             return
 
         # Kalau ada, muat data
+        from PlotAnalysis import ProsesorPRPD, ProsesorWaveform
         selected = data[key]
+
+        # Titik dari file sidecar; data lama (titik tersimpan langsung di JSON) tetap didukung
+        titik = self.sidecar_titik.muat(selected["titik_file"]) if selected.get("titik_file") else {}
         self.prpd_result.setText("Data berhasil dimuat.")
         QMessageBox.information(self, "Sukses", f"Data berhasil dimuat untuk:\n\nLokasi: {lokasi}\nSensor: {sensor}")
 
@@ -430,92 +701,106 @@ class HalamanEkstraksiPRPD(QWidget):
             waveform = selected["waveform"]
             self.waveform_file = waveform.get("path", "")
             self.line_waveform.setText(self.waveform_file)
+            self.kunci_hasil["waveform"] = key
             self.last_waveform_result = {
-                "waveform_data_points": waveform.get("waveform_data_points", []),
+                "waveform_data_points": DataTitik(**titik["waveform"]) if "waveform" in titik else DataTitik.ensure(
+                    waveform.get("waveform_data_points"), ["time_us", "amplitude_dB"]
+                ),
                 "features": waveform.get("features", {}),
                 "indikasi_pd": waveform.get("indikasi_pd", "Tidak ada")
             }
 
             # tampilkan text hasil waveform
-            msg_wf = "📈 Waveform Data:\n"
-            for k, v in self.last_waveform_result["features"].items():
-                msg_wf += f" - {k}: {v:.3f}\n" if isinstance(v, float) else f" - {k}: {v}\n"
-            msg_wf += f"\n🔎 Indikasi PD: {self.last_waveform_result['indikasi_pd']}\n"
-            self.wf_result.setText(msg_wf)
+            self.tampilkan_hasil(self.wf_result, "📈 Waveform Data:", self.last_waveform_result,
+                                 ProsesorWaveform(sensor_type=sensor))
 
             # gambar ulang ke canvas
-            df_wf = pd.DataFrame(self.last_waveform_result["waveform_data_points"])
-            self.canvas_waveform.axes.clear()
-            if not df_wf.empty:
-                self.canvas_waveform.axes.plot(df_wf["time_us"], df_wf["amplitude_dB"], c="red", linewidth=1)
-                self.canvas_waveform.axes.set_xlabel("Time (µs)")
-                self.canvas_waveform.axes.set_ylabel("Amplitude (dB)")
-                self.canvas_waveform.axes.set_title("Extracted Waveform Data")
-                self.canvas_waveform.axes.grid(True)
-            self.canvas_waveform.draw()
+            self.gambar_waveform(self.last_waveform_result["waveform_data_points"])
 
         # --- PRPD ---
         if "prpd" in selected:
             prpd = selected["prpd"]
             self.prpd_file = prpd.get("path", "")
             self.line_prpd.setText(self.prpd_file)
+            self.kunci_hasil["prpd"] = key
             self.last_prpd_result = {
-                "prpd_data_points": prpd.get("prpd_data_points", []),
+                "prpd_data_points": DataTitik(**titik["prpd"]) if "prpd" in titik else DataTitik.ensure(
+                    prpd.get("prpd_data_points"), ["phase_deg", "intensity_dB"]
+                ),
                 "features": prpd.get("features", {}),
                 "indikasi_pd": prpd.get("indikasi_pd", "Tidak ada")
             }
 
             # tampilkan text hasil PRPD
-            msg_prpd = "📊 PRPD Data:\n"
-            for k, v in self.last_prpd_result["features"].items():
-                msg_prpd += f" - {k}: {v:.3f}\n" if isinstance(v, float) else f" - {k}: {v}\n"
-            msg_prpd += f"\n🔎 Indikasi PD: {self.last_prpd_result['indikasi_pd']}\n"
-            self.prpd_result.setText(msg_prpd)
+            self.tampilkan_hasil(self.prpd_result, "📊 PRPD Data:", self.last_prpd_result,
+                                 ProsesorPRPD(sensor_type=sensor))
 
             # gambar ulang ke canvas
-            df_prpd = pd.DataFrame(self.last_prpd_result["prpd_data_points"])
-            self.canvas_prpd.axes.clear()
-            if not df_prpd.empty:
-                self.canvas_prpd.axes.scatter(df_prpd["phase_deg"], df_prpd["intensity_dB"], s=5, c="blue")
-                self.canvas_prpd.axes.set_xlabel("Phase (deg)")
-                self.canvas_prpd.axes.set_ylabel("Amplitude (dB)")
-                self.canvas_prpd.axes.set_title("Grafik Data PRPD (Terfilter)")
-                self.canvas_prpd.axes.grid(True)
-            self.canvas_prpd.draw()
+            self.gambar_prpd(self.last_prpd_result["prpd_data_points"])
+
+        # Titik yang baru dimuat dari sidecar tidak perlu ditulis ulang saat save berikutnya
+        if "waveform" in titik and "prpd" in titik and self.last_waveform_result and self.last_prpd_result:
+            self.titik_tersimpan[key] = (
+                self.last_waveform_result["waveform_data_points"], self.last_prpd_result["prpd_data_points"]
+            )
 
     def reset_all_page(self):
         """Reset seluruh isi JSON (hapus semua data PRPD + waveform)."""
-        self.data_reset.reset_file()
+        if self.data_reset.reset_file():
+            self.sidecar_titik.hapus_semua()
         self.prpd_result.clear()
         self.wf_result.clear()
         self.line_waveform.clear()
         self.line_prpd.clear()
+        self.lepas_lapisan_plot()
         self.canvas_waveform.axes.clear()
         self.canvas_prpd.axes.clear()
         self.canvas_waveform.draw()
         self.canvas_prpd.draw()
         self.last_prpd_result = {}
         self.last_waveform_result = {}
+        self.kunci_hasil = {}
 
     def reset_current_page(self):
         """Reset hanya data untuk lokasi+sensor saat ini."""
         lokasi = self.combo_lokasi.currentText()
         sensor = self.combo_sensor.currentText()
         key = f"{lokasi}|{sensor}"
-        self.data_reset.reset_current(key, section="hasil_plot")
+        if self.data_reset.reset_current(key, section="hasil_plot"):
+            self.sidecar_titik.hapus(key)
 
     def clear_current_widgets(self):
         """Hanya bersihkan tampilan halaman (widget & variabel), TIDAK menyentuh JSON."""
+        self.batalkan_semua_analisis()
         self.prpd_result.clear()
         self.wf_result.clear()
         self.line_waveform.clear()
         self.line_prpd.clear()
+        self.lepas_lapisan_plot()
         self.canvas_waveform.axes.clear()
         self.canvas_prpd.axes.clear()
         self.canvas_waveform.draw()
         self.canvas_prpd.draw()
         self.last_prpd_result = {}
         self.last_waveform_result = {}
+        self.kunci_hasil = {}
+
+    def kosongkan_hasil(self, jenis):
+        """Bersihkan hasil & tampilan satu plot saja ("waveform" / "prpd"), TIDAK menyentuh JSON."""
+        self.lepas_lapisan_plot(jenis)
+        if jenis == "waveform":
+            self.wf_result.clear()
+            self.line_waveform.clear()
+            self.canvas_waveform.axes.clear()
+            self.canvas_waveform.draw()
+            self.last_waveform_result = {}
+        else:
+            self.prpd_result.clear()
+            self.line_prpd.clear()
+            self.canvas_prpd.axes.clear()
+            self.canvas_prpd.draw()
+            self.last_prpd_result = {}
+        self.kunci_hasil.pop(jenis, None)
 
 # ---------------------------------------------------------
 # MAIN PROGRAM
@@ -530,7 +815,9 @@ if __name__ == "__main__":
     if app is None:
         app = QApplication(sys.argv)
 
-    window = HalamanEkstraksiPRPD()
+    window = PengaturHalaman()
+    window.tambah_halaman("ekstraksi", HalamanEkstraksiPRPD())
+    window.tampilkan("ekstraksi")
     window.show()
     sys.exit(app.exec())
 
@@ -1,8 +1,8 @@
 import sys, os
 from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QMessageBox
-from docxtpl import DocxTemplate
-from docx2pdf import convert
-from MyWidget import MenuBar
+from MyWidget import MenuBar, PengaturHalaman
+from DataManager import ArsipSurvey
+from DataManager.jurnal import JurnalData
 
 # =========================================================
 # HALAMAN : KONVERSI/EKSPOR LAPORAN
@@ -52,6 +52,8 @@ class HalamanKonversiLaporanPLN(QWidget):
             BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
         self.json_file = os.path.join(BASE_DIR, "saved_data.json")
+        self.plot_file = os.path.join(BASE_DIR, "plot_data.json")
+        self.arsip_file = os.path.join(BASE_DIR, "arsip_survey.db")
         self.template_file = os.path.join(BASE_DIR, "Document", "Form Pengujian PD Kabel Power dan Incoming 20KV.docx")
 
     # ---------------------------------------------------------
@@ -62,6 +64,7 @@ class HalamanKonversiLaporanPLN(QWidget):
         if not data:
             return
         try:
+            from docxtpl import DocxTemplate   # library ekspor baru dimuat saat tombol ekspor dipakai
             doc = DocxTemplate(self.template_file)
             doc.render(data)
             out_file = "Form_Pengujian_PD_(terisi).docx"
@@ -70,6 +73,30 @@ class HalamanKonversiLaporanPLN(QWidget):
                 QMessageBox.information(self, "Sukses", f"DOCX tersimpan di {os.path.abspath(out_file)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
+            return
+
+        # Laporan selesai → simpan ke arsip survey (gardu induk / tanggal / trafo)
+        self.arsipkan_laporan()
+
+    # ---------------------------------------------------------
+    # ARSIP SURVEY
+    # ---------------------------------------------------------
+    def arsipkan_laporan(self):
+        """Simpan laporan saat ini (saved_data + plot_data) ke arsip_survey.db."""
+        try:
+            data = JurnalData(self.json_file).baca()
+            hasil_plot = JurnalData(self.plot_file).baca().get("hasil_plot")
+            if hasil_plot:
+                data["hasil_plot"] = hasil_plot
+
+            arsip = ArsipSurvey(self.arsip_file)
+            try:
+                kunci = arsip.arsipkan(data)
+            finally:
+                arsip.tutup()
+            print(f"Laporan diarsipkan: {kunci}")
+        except Exception as e:
+            QMessageBox.warning(self, "Peringatan", f"Laporan gagal diarsipkan: {e}")
 
     # ---------------------------------------------------------
     # EKSPOR PDF
@@ -77,6 +104,7 @@ class HalamanKonversiLaporanPLN(QWidget):
     def export_pdf(self):
         self.export_docx(silent=True)
         try:
+            from docx2pdf import convert
             out_docx = "Form_Pengujian_PD_(terisi).docx"
             out_pdf = "Form_Pengujian_PD_(terisi).pdf"
             convert(out_docx, out_pdf)
@@ -88,21 +116,18 @@ class HalamanKonversiLaporanPLN(QWidget):
     # NAVIGASI HALAMAN
     # ---------------------------------------------------------
     def go_prev(self):
-        from Halaman_Formulir_Laporan_PLN import HalamanFormulirLaporanPLN
-        self.close()
-        new_page = HalamanFormulirLaporanPLN()
-        new_page.show()
+        """Kembali ke halaman formulir laporan"""
+        PengaturHalaman.pindah(self, "formulir")
 
     # ---------------------------------------------------------
     # MEMUAT DATA JSON
     # ---------------------------------------------------------
     def load_data(self):
-        import json
-        if not os.path.exists(self.json_file):
+        # Autosave dari halaman formulir mungkin belum selesai ditulis → baca lewat JurnalData
+        data = JurnalData(self.json_file).baca()
+        if not data:
             QMessageBox.warning(self, "Error", f"{self.json_file} tidak ditemukan!")
             return None
-        with open(self.json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
         if "formulir_laporan" in data and "indikasi_pd" in data["formulir_laporan"]:
             beban = data["formulir_laporan"]["indikasi_pd"].get("beban_trafo")
@@ -117,6 +142,8 @@ class HalamanKonversiLaporanPLN(QWidget):
 # ---------------------------------------------------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = HalamanKonversiLaporanPLN()
+    window = PengaturHalaman()
+    window.tambah_halaman("konversi", HalamanKonversiLaporanPLN())
+    window.tampilkan("konversi")
     window.show()
     sys.exit(app.exec())
@@ -3,6 +3,9 @@ from .checkable_combobox import CheckableComboBox
 from .row_editor_button import RowEditors
 from .menubar import MenuBar
 from .table_utility import TableUtility
+from .pekerja_analisis import PekerjaAnalisis, AnalisisDibatalkan
+from .tabel_pengukuran import KolomTabel, ModelTabelPengukuran, DelegasiPengukuran, TabelPengukuran
+from .pengatur_halaman import PengaturHalaman
 
 __all__ = [
     "PlaceholderLineEdit",
@@ -10,5 +13,12 @@ __all__ = [
     "CheckableComboBox",
     "RowEditors",
     "MenuBar",
-    "TableUtility"
+    "TableUtility",
+    "PekerjaAnalisis",
+    "AnalisisDibatalkan",
+    "KolomTabel",
+    "ModelTabelPengukuran",
+    "DelegasiPengukuran",
+    "TabelPengukuran",
+    "PengaturHalaman"
 ]
@@ -0,0 +1,74 @@
+import threading
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+# =========================================================
+# WIDGET : PEKERJA ANALISIS DI LATAR BELAKANG (QThreadPool)
+# =========================================================
+class AnalisisDibatalkan(Exception):
+    """Dilempar dari callback progres ketika pekerjaan dibatalkan."""
+
+
+class SinyalPekerja(QObject):
+    """
+    Sinyal dari thread pekerja ke thread UI (otomatis lewat queued connection).
+    - progres(persen, pesan)
+    - selesai(hasil)
+    - gagal(pesan_error)
+    - dibatalkan()
+    """
+    progres = Signal(int, str)
+    selesai = Signal(object)
+    gagal = Signal(str)
+    dibatalkan = Signal()
+
+
+class PekerjaAnalisis(QRunnable):
+    """
+    Menjalankan fungsi analisis berat (OpenCV, klaster) di QThreadPool agar UI tetap responsif.
+    Fungsi dipanggil sebagai fungsi(*args, progres=callback, **kwargs); callback progres
+    mengirim sinyal ke UI dan sekaligus titik pembatalan (melempar AnalisisDibatalkan).
+
+    Contoh:
+        pekerja = PekerjaAnalisis(processor.process_prpd)
+        pekerja.sinyal.selesai.connect(self.tampilkan)
+        QThreadPool.globalInstance().start(pekerja)
+    """
+
+    def __init__(self, fungsi, *args, **kwargs):
+        super().__init__()
+        self.fungsi = fungsi
+        self.args = args
+        self.kwargs = kwargs
+        self.sinyal = SinyalPekerja()
+        self._batal = threading.Event()
+        # Objek Python tetap dipegang pemanggil → jangan dihapus otomatis oleh Qt
+        self.setAutoDelete(False)
+
+    def batalkan(self):
+        """Minta pekerjaan berhenti di titik progres berikutnya."""
+        self._batal.set()
+
+    @property
+    def dibatalkan(self):
+        return self._batal.is_set()
+
+    def _progres(self, persen, pesan=""):
+        if self._batal.is_set():
+            raise AnalisisDibatalkan()
+        self.sinyal.progres.emit(int(persen), pesan)
+
+    @Slot()
+    def run(self):
+        try:
+            hasil = self.fungsi(*self.args, progres=self._progres, **self.kwargs)
+        except AnalisisDibatalkan:
+            self.sinyal.dibatalkan.emit()
+            return
+        except Exception as e:
+            self.sinyal.gagal.emit(str(e))
+            return
+
+        if self._batal.is_set():
+            self.sinyal.dibatalkan.emit()
+        else:
+            self.sinyal.selesai.emit(hasil)
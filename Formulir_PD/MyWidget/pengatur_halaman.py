@@ -0,0 +1,123 @@
+import importlib
+from PySide6.QtWidgets import QMainWindow, QStackedWidget, QSizePolicy
+
+# Halaman aplikasi: nama → (modul, kelas). Modul baru diimpor saat halaman pertama kali dibuka.
+HALAMAN_APLIKASI = {
+    "depan": ("Halaman_Depan_Laporan_PLN", "HalamanDepanLaporanPLN"),
+    "ekstraksi": ("Halaman_Konversi_Data_Gambar_Filtered", "HalamanEkstraksiPRPD"),
+    "formulir": ("Halaman_Formulir_Laporan_PLN", "HalamanFormulirLaporanPLN"),
+    "konversi": ("Halaman_Konversi_Laporan_PLN", "HalamanKonversiLaporanPLN"),
+}
+
+_UKURAN_MAKS = 16777215     # QWIDGETSIZE_MAX
+
+# =========================================================
+# WIDGET : PENGATUR HALAMAN (SATU JENDELA UTAMA)
+# =========================================================
+class PengaturHalaman(QMainWindow):
+    """
+    Jendela utama tunggal berisi QStackedWidget.
+    Setiap halaman dibuat sekali saat pertama kali dibuka lalu tetap hidup, sehingga navigasi
+    maju/mundur cukup mengganti halaman yang tampil (tanpa membangun ulang tabel/canvas
+    dan tanpa memuat ulang JSON).
+
+    Contoh:
+        window = PengaturHalaman()
+        window.tambah_halaman("depan", HalamanDepanLaporanPLN())
+        window.tampilkan("depan")
+        window.show()
+
+        # Di go_next halaman:
+        PengaturHalaman.pindah(self, "formulir")
+    """
+
+    def __init__(self, daftar_halaman=None, parent=None):
+        super().__init__(parent)
+        self.daftar_halaman = dict(daftar_halaman or HALAMAN_APLIKASI)
+        self.halaman = {}       # nama → widget halaman yang sudah dibuat
+        self.ukuran = {}        # nama → (ukuran jendela terakhir, ukuran tetap?)
+        self.aktif = None       # nama halaman yang sedang tampil
+
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+
+    # ---------------------------------------------------------
+    # NAVIGASI
+    # ---------------------------------------------------------
+    @classmethod
+    def pindah(cls, asal, nama):
+        """
+        Tampilkan halaman `nama` di jendela utama milik halaman `asal`.
+        Jika `asal` dijalankan sendiri (belum di dalam PengaturHalaman), jendela utama dibuat
+        dan `asal` ikut dimasukkan agar bisa dikunjungi kembali.
+        """
+        pengatur = asal.window()
+        if not isinstance(pengatur, cls):
+            pengatur = cls()
+            nama_asal = next(
+                (n for n, (_, kelas) in pengatur.daftar_halaman.items() if kelas == type(asal).__name__),
+                type(asal).__name__
+            )
+            pengatur.tambah_halaman(nama_asal, asal)
+            pengatur.tampilkan(nama_asal)
+            pengatur.show()
+        return pengatur.tampilkan(nama)
+
+    def tampilkan(self, nama):
+        """Ganti halaman yang tampil (dibuat dulu jika belum ada). Return: widget halaman."""
+        halaman = self.ambil_halaman(nama)
+        if self.aktif == nama:
+            return halaman
+
+        if self.aktif is not None:
+            # Ingat ukuran jendela untuk halaman lama; halaman tersembunyi tidak ikut menentukan ukuran minimum
+            self.ukuran[self.aktif] = (self.size(), self.ukuran[self.aktif][1])
+            self.halaman[self.aktif].setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+
+        halaman.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self.stack.setCurrentWidget(halaman)
+        self.setWindowTitle(halaman.windowTitle())
+
+        ukuran, tetap = self.ukuran[nama]
+        if tetap:
+            self.setFixedSize(ukuran)
+        else:
+            self.setMinimumSize(0, 0)
+            self.setMaximumSize(_UKURAN_MAKS, _UKURAN_MAKS)
+            self.resize(ukuran)
+
+        self.aktif = nama
+        return halaman
+
+    # ---------------------------------------------------------
+    # PEMBUATAN HALAMAN
+    # ---------------------------------------------------------
+    def ambil_halaman(self, nama):
+        """Ambil halaman yang sudah dibuat, atau impor modulnya dan buat sekarang."""
+        if nama not in self.halaman:
+            modul, kelas = self.daftar_halaman[nama]
+            self.tambah_halaman(nama, getattr(importlib.import_module(modul), kelas)())
+        return self.halaman[nama]
+
+    def tambah_halaman(self, nama, halaman):
+        """Masukkan halaman yang sudah dibuat ke stack (ukuran awalnya dipakai sebagai ukuran jendela)."""
+        tetap = halaman.minimumSize() == halaman.maximumSize()
+        self.ukuran[nama] = (halaman.size(), tetap)
+        if tetap:
+            # Ukuran tetap dipindah ke jendela utama saat halaman ini tampil
+            halaman.setMinimumSize(0, 0)
+            halaman.setMaximumSize(_UKURAN_MAKS, _UKURAN_MAKS)
+
+        halaman.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.stack.addWidget(halaman)
+        self.halaman[nama] = halaman
+        return halaman
+
+    # ---------------------------------------------------------
+    # PENUTUPAN
+    # ---------------------------------------------------------
+    def closeEvent(self, event):
+        """Tutup semua halaman agar closeEvent masing-masing (misal cleanup Matplotlib) tetap jalan."""
+        for halaman in self.halaman.values():
+            halaman.close()
+        event.accept()
@@ -1,23 +1,21 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QComboBox, QPushButton, 
-    QTableWidgetItem, QMessageBox
+    QLabel, QComboBox, QPushButton, QMessageBox
 )
-from PySide6.QtCore import Qt
 
 # =========================================================
 # MODUL : TOMBOL PENGATUR BARIS
 # =========================================================
 class RowEditors(QWidget):
     """
-    Widget untuk mengatur penambahan dan penghapusan baris pada satu atau lebih QTableWidget.
+    Widget untuk mengatur penambahan dan penghapusan baris pada satu atau lebih TabelPengukuran.
     Memungkinkan memilih posisi baris baru (Atas/Bawah) dan memanggil callback untuk setup baris.
     """
     
     def __init__(self, tables, row_setup_callback=None, parent=None):
         """
-        :param tables: list QTableWidget yang akan dikontrol
-        :param row_setup_callback: Fungsi untuk mengatur widget/item pada baris baru
+        :param tables: list TabelPengukuran yang akan dikontrol
+        :param row_setup_callback: Fungsi untuk mengatur isi default / override sel pada baris baru
                                    Signature: (table, row_index: int) -> None
         """
         super().__init__(parent)
@@ -76,13 +74,10 @@ class RowEditors(QWidget):
         Memberi nomor urut pada kolom 'Titik' mulai dari 1.
         Kolom ini dibuat read-only agar tidak bisa diubah user.
         """
-        for r in range(table.rowCount()):
-            item = table.item(r, 0)
-            if not item:
-                item = QTableWidgetItem()
-                table.setItem(r, 0, item)
-            item.setText(str(r + 1))
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Tetap read-only
+        model = table.model()
+        for r in range(model.rowCount()):
+            model.setel(r, 0, str(r + 1))
+            model.setel_baca_saja(r, 0)  # Tetap read-only
 
     # ---------------------------------------------------------
     # Fungsi editor
@@ -101,7 +96,7 @@ class RowEditors(QWidget):
             return
 
         # Ambil baris yang dipilih
-        selected_rows = set(idx.row() for idx in table.selectedIndexes())
+        selected_rows = table.selectedRows()
         if not selected_rows:
             QMessageBox.warning(self, "Peringatan", "Pilih baris sebagai acuan penambahan.")
             return
@@ -125,7 +120,7 @@ class RowEditors(QWidget):
         Selalu menjaga minimal 1 baris di tabel; jika tinggal 1 baris, hanya dikosongkan.
         """
         table = self.current_table
-        selected_rows = sorted(set(idx.row() for idx in table.selectedIndexes()), reverse=True)
+        selected_rows = sorted(table.selectedRows(), reverse=True)
 
         if not selected_rows:
             QMessageBox.warning(self, "Peringatan", "Pilih baris yang ingin dihapus.")
@@ -134,13 +129,7 @@ class RowEditors(QWidget):
         for row in selected_rows:
             if table.rowCount() == 1:
                 # Jika hanya ada 1 baris, kosongkan kontennya
-                for col in range(table.columnCount()):
-                    item = table.item(0, col)
-                    if item:
-                        item.setText("")
-                    widget = table.cellWidget(0, col)
-                    if isinstance(widget, QComboBox):
-                        widget.setCurrentIndex(-1)
+                table.model().kosongkan_baris(0, range(table.columnCount()))
                 self.renumber_titik(table)
                 return
             else:
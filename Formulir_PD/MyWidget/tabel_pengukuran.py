@@ -0,0 +1,465 @@
+from collections import namedtuple
+from PySide6.QtWidgets import (
+    QTableView, QStyledItemDelegate, QComboBox, QLineEdit,
+    QWidget, QHBoxLayout, QLabel, QAbstractItemView
+)
+from PySide6.QtGui import QRegularExpressionValidator
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QRegularExpression, QTimer, Signal
+)
+
+# =========================================================
+# MODUL : TABEL PENGUKURAN (MODEL / VIEW)
+# =========================================================
+# Pengganti QTableWidget + QComboBox per sel untuk tabel pengukuran di folder Table/.
+# - ModelTabelPengukuran : isi tabel disimpan per kolom (list), bertipe sesuai KolomTabel
+# - DelegasiPengukuran   : editor (combobox / line edit angka) dibuat hanya saat sel diedit
+# - TabelPengukuran      : QTableView + sinyal cellChanged(row, col) seperti QTableWidget
+#
+# Jenis kolom:
+#   "teks"          → str bebas
+#   "angka"         → str berisi angka (editor hanya menerima angka)
+#   "pilihan"       → str salah satu dari `pilihan` ("" = belum dipilih)
+#   "pilihan_ganda" → tuple str, satu per sub-key (misal Fasa + Core); key & pilihan berupa tuple
+#   "centang"       → (bool, str): centang ✔/✖ + teks yang hanya bisa diisi jika dicentang
+
+KolomTabel = namedtuple(
+    "KolomTabel",
+    ["key", "judul", "jenis", "pilihan", "baca_saja", "label"],
+    defaults=("teks", (), False, ())
+)
+
+_POLA_ANGKA = QRegularExpression(r"^[-+]?\d*\.?\d*$")
+
+# Role & flag sebagai int: data() / flags() dipanggil ribuan kali saat tabel digambar,
+# dan perbandingan int jauh lebih murah daripada perbandingan enum Qt di PySide6
+_PERAN_TAMPIL = Qt.DisplayRole.value
+_PERAN_EDIT = Qt.EditRole.value
+_PERAN_CENTANG = Qt.CheckStateRole.value
+_HORIZONTAL = Qt.Horizontal.value
+_PERAN_DIUBAH = [Qt.DisplayRole, Qt.EditRole, Qt.CheckStateRole]
+_CENTANG = Qt.Checked.value
+_TANPA_CENTANG = Qt.Unchecked.value
+_FLAG_DASAR = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_FLAG_EDIT = _FLAG_DASAR | Qt.ItemIsEditable
+_FLAG_CENTANG = _FLAG_DASAR | Qt.ItemIsUserCheckable
+_FLAG_CENTANG_EDIT = _FLAG_CENTANG | Qt.ItemIsEditable
+
+
+class ModelTabelPengukuran(QAbstractTableModel):
+    """
+    Model tabel pengukuran berbasis array kolom.
+    Selain nilai per sel, model menyimpan override per sel (baca-saja dan daftar pilihan)
+    yang ikut bergeser saat baris disisipkan / dihapus.
+    """
+
+    def __init__(self, kolom, jumlah_baris=0, parent=None):
+        """
+        Args:
+            kolom (list of KolomTabel): definisi kolom.
+            jumlah_baris (int): jumlah baris awal (kosong).
+        """
+        super().__init__(parent)
+        self.kolom = list(kolom)
+        self._isi = [[self._kosong(k) for _ in range(jumlah_baris)] for k in self.kolom]
+        self._baca_saja_sel = {}   # col → list (None = ikut kolom)
+        self._pilihan_sel = {}     # col → list (None = ikut kolom)
+        self._key = {}             # key → (col, sub-indeks atau None)
+        for col, k in enumerate(self.kolom):
+            if isinstance(k.key, tuple):
+                for i, sub in enumerate(k.key):
+                    self._key[sub] = (col, i)
+            elif k.key:
+                self._key[k.key] = (col, None)
+
+    @staticmethod
+    def _kosong(kolom):
+        if kolom.jenis == "pilihan_ganda":
+            return ("",) * len(kolom.key)
+        if kolom.jenis == "centang":
+            return (False, "")
+        return ""
+
+    # ---------------------------------------------------------
+    # API QAbstractTableModel
+    # ---------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or not self._isi:
+            return 0
+        return len(self._isi[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.kolom)
+
+    def headerData(self, section, orientation, role=_PERAN_TAMPIL):
+        if getattr(role, "value", role) != _PERAN_TAMPIL:
+            return None
+        if getattr(orientation, "value", orientation) == _HORIZONTAL:
+            return self.kolom[section].judul if section < len(self.kolom) else None
+        return section + 1  # nomor baris (sama dengan QTableWidget)
+
+    def data(self, index, role=_PERAN_TAMPIL):
+        role = getattr(role, "value", role)
+        if role != _PERAN_TAMPIL and role != _PERAN_EDIT and role != _PERAN_CENTANG:
+            return None
+        col = index.column()
+        kolom = self.kolom[col]
+        nilai = self._isi[col][index.row()]
+
+        if role == _PERAN_TAMPIL:
+            return self._tampilan(kolom, nilai)
+        if role == _PERAN_EDIT:
+            return nilai[1] if kolom.jenis == "centang" else nilai
+        if kolom.jenis == "centang":
+            return _CENTANG if nilai[0] else _TANPA_CENTANG
+        return None
+
+    @staticmethod
+    def _tampilan(kolom, nilai):
+        if kolom.jenis == "pilihan_ganda":
+            if not any(nilai):
+                return ""
+            return "  ".join(f"{label} {isi}".strip() for label, isi in zip(kolom.label, nilai))
+        if kolom.jenis == "centang":
+            return nilai[1]
+        return nilai
+
+    def setData(self, index, value, role=_PERAN_EDIT):
+        if not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        kolom = self.kolom[col]
+        lama = self._isi[col][row]
+        role = getattr(role, "value", role)
+
+        if role == _PERAN_CENTANG and kolom.jenis == "centang":
+            centang = value if isinstance(value, bool) else getattr(value, "value", value) == _CENTANG
+            # ✖ → teks lokasi dikosongkan
+            baru = (centang, lama[1] if centang else "")
+        elif role == _PERAN_EDIT:
+            baru = self._normalisasi(row, col, value)
+            if baru is None:
+                return False
+        else:
+            return False
+
+        if baru == lama:
+            return True
+        self._isi[col][row] = baru
+        self.dataChanged.emit(index, index, _PERAN_DIUBAH)
+        return True
+
+    def _normalisasi(self, row, col, value):
+        """Nilai masuk → nilai tersimpan sesuai jenis kolom (None = ditolak)."""
+        kolom = self.kolom[col]
+        if kolom.jenis == "pilihan_ganda":
+            value = tuple(value) if isinstance(value, (tuple, list)) else ("",) * len(kolom.key)
+            return tuple(
+                (str(v) if str(v) in pilihan else "")
+                for v, pilihan in zip(value, kolom.pilihan)
+            )
+        if kolom.jenis == "centang":
+            if isinstance(value, tuple):
+                return (bool(value[0]), str(value[1]) if value[0] else "")
+            lama = self._isi[col][row]
+            return (lama[0], str(value or "")) if lama[0] else None
+        teks = "" if value is None else str(value)
+        if self.berpilihan(row, col) and teks not in self.pilihan(row, col):
+            # Sama dengan QComboBox.setCurrentText: teks di luar pilihan diabaikan → kosong
+            return ""
+        return teks
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        row, col = index.row(), index.column()
+        if self.baca_saja(row, col):
+            return _FLAG_DASAR
+        if self.kolom[col].jenis == "centang":
+            return _FLAG_CENTANG_EDIT if self._isi[col][row][0] else _FLAG_CENTANG
+        return _FLAG_EDIT
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        for col, kolom in enumerate(self.kolom):
+            self._isi[col][row:row] = [self._kosong(kolom) for _ in range(count)]
+        for override in (self._baca_saja_sel, self._pilihan_sel):
+            for daftar in override.values():
+                daftar[row:row] = [None] * count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row + count > self.rowCount():
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        for isi in self._isi:
+            del isi[row:row + count]
+        for override in (self._baca_saja_sel, self._pilihan_sel):
+            for daftar in override.values():
+                del daftar[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    # ---------------------------------------------------------
+    # OVERRIDE PER SEL
+    # ---------------------------------------------------------
+    def _override(self, tempat, col):
+        if col not in tempat:
+            tempat[col] = [None] * self.rowCount()
+        return tempat[col]
+
+    def baca_saja(self, row, col):
+        override = self._baca_saja_sel.get(col)
+        if override is not None and override[row] is not None:
+            return override[row]
+        return self.kolom[col].baca_saja
+
+    def setel_baca_saja(self, row, col, baca_saja=True):
+        self._override(self._baca_saja_sel, col)[row] = baca_saja
+
+    def pilihan(self, row, col):
+        override = self._pilihan_sel.get(col)
+        if override is not None and override[row] is not None:
+            return override[row]
+        return self.kolom[col].pilihan
+
+    def setel_pilihan(self, row, col, pilihan):
+        """
+        Daftar pilihan khusus untuk satu sel (None = ikut kolom).
+        Sel teks dengan daftar pilihan diperlakukan seperti sel pilihan (misal titik Busbar).
+        """
+        self._override(self._pilihan_sel, col)[row] = tuple(pilihan) if pilihan is not None else None
+
+    def berpilihan(self, row, col):
+        """True jika sel diisi lewat combobox (kolom pilihan atau sel dengan daftar pilihan)."""
+        jenis = self.kolom[col].jenis
+        return jenis == "pilihan" or (jenis in ("teks", "angka") and bool(self.pilihan(row, col)))
+
+    # ---------------------------------------------------------
+    # AKSES NILAI
+    # ---------------------------------------------------------
+    def nilai(self, row, col):
+        return self._isi[col][row]
+
+    def teks(self, row, col):
+        return self._tampilan(self.kolom[col], self._isi[col][row])
+
+    def setel(self, row, col, value):
+        """Setel nilai satu sel (tanpa memeriksa baca-saja; dipakai kode, bukan user)."""
+        baru = self._normalisasi(row, col, value)
+        if baru is None or baru == self._isi[col][row]:
+            return
+        self._isi[col][row] = baru
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, _PERAN_DIUBAH)
+
+    def kosongkan_baris(self, row, kolom=None):
+        """Kosongkan sel-sel satu baris (default: semua kolom yang bisa diedit)."""
+        for col in (kolom if kolom is not None else range(len(self.kolom))):
+            if kolom is None and self.kolom[col].baca_saja:
+                continue
+            self.setel(row, col, self._kosong(self.kolom[col]))
+
+    def setRowCount(self, jumlah):
+        if jumlah > self.rowCount():
+            self.insertRows(self.rowCount(), jumlah - self.rowCount())
+        elif jumlah < self.rowCount():
+            self.removeRows(jumlah, self.rowCount() - jumlah)
+
+    # ---------------------------------------------------------
+    # SERIALISASI
+    # ---------------------------------------------------------
+    def ke_list(self, keys):
+        """
+        Isi tabel → list of dict (satu per baris) untuk key yang diminta, urut sesuai keys.
+        Sub-key kolom pilihan_ganda ditulis sebagai key terpisah.
+        """
+        lokasi = [(key, self._key[key]) for key in keys]
+        hasil = []
+        for row in range(self.rowCount()):
+            baris = {}
+            for key, (col, sub) in lokasi:
+                nilai = self._isi[col][row]
+                baris[key] = nilai[sub] if sub is not None else nilai
+            hasil.append(baris)
+        return hasil
+
+    def dari_list(self, data, keys, ubah_jumlah_baris=True, isi_baris=None):
+        """
+        list of dict → isi tabel, sekaligus (satu sinyal dataChanged, bukan satu per sel).
+
+        Args:
+            data (list of dict): hasil ke_list / data JSON lama.
+            keys (list of str): key yang dibaca dari setiap dict.
+            ubah_jumlah_baris (bool): True → tabel dikosongkan lalu jumlah baris = len(data);
+                                      False → hanya baris yang sudah ada yang diisi (tabel tetap).
+            isi_baris (callable): (row, row_data) → None, dipanggil setelah baris diisi untuk
+                                  pengaturan khusus (override per sel, nilai turunan).
+        """
+        if ubah_jumlah_baris:
+            # Lewat removeRows/insertRows agar TableUtility & summary ikut menyesuaikan
+            self.setRowCount(0)
+            self.setRowCount(len(data))
+        jumlah = min(len(data), self.rowCount())
+
+        lokasi = [(key, self._key[key]) for key in keys if key in self._key]
+        for row in range(jumlah):
+            row_data = data[row]
+            for key, (col, sub) in lokasi:
+                # Key yang tidak ada → sel dikosongkan (sama seperti row_data.get(key, ""))
+                if sub is None:
+                    baru = self._normalisasi(row, col, row_data.get(key, ""))
+                else:
+                    sekarang = list(self._isi[col][row])
+                    sekarang[sub] = row_data.get(key, "")
+                    baru = self._normalisasi(row, col, tuple(sekarang))
+                if baru is not None:
+                    self._isi[col][row] = baru
+            if isi_baris:
+                isi_baris(row, row_data)
+
+        if jumlah:
+            self.dataChanged.emit(self.index(0, 0), self.index(jumlah - 1, len(self.kolom) - 1))
+
+
+# =========================================================
+# MODUL : DELEGASI EDITOR (DIBUAT HANYA SAAT EDIT)
+# =========================================================
+class DelegasiPengukuran(QStyledItemDelegate):
+    """Editor sesuai jenis kolom: combobox untuk pilihan, line edit angka untuk angka."""
+
+    def createEditor(self, parent, option, index):
+        model = index.model()
+        kolom = model.kolom[index.column()]
+
+        if model.berpilihan(index.row(), index.column()):
+            combo = QComboBox(parent)
+            combo.addItems(model.pilihan(index.row(), index.column()))
+            # Popup langsung terbuka agar satu klik cukup untuk memilih
+            QTimer.singleShot(0, combo.showPopup)
+            combo.activated.connect(lambda _, c=combo: self._selesai(c))
+            return combo
+
+        if kolom.jenis == "pilihan_ganda":
+            editor = QWidget(parent)
+            editor.setAutoFillBackground(True)
+            hbox = QHBoxLayout(editor)
+            hbox.setContentsMargins(0, 0, 0, 0)
+            hbox.setSpacing(5)
+            editor.combos = []
+            for label, pilihan in zip(kolom.label, kolom.pilihan):
+                hbox.addWidget(QLabel(label))
+                combo = QComboBox()
+                combo.addItems(pilihan)
+                hbox.addWidget(combo)
+                editor.combos.append(combo)
+            return editor
+
+        editor = QLineEdit(parent)
+        if kolom.jenis == "angka":
+            editor.setValidator(QRegularExpressionValidator(_POLA_ANGKA, editor))
+        return editor
+
+    def _selesai(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor, index):
+        nilai = index.model().data(index, Qt.EditRole)
+        if isinstance(editor, QComboBox):
+            editor.setCurrentIndex(editor.findText(nilai))
+        elif hasattr(editor, "combos"):
+            for combo, isi in zip(editor.combos, nilai):
+                combo.setCurrentIndex(combo.findText(isi))
+        else:
+            editor.setText(nilai)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QComboBox):
+            if editor.currentIndex() >= 0:
+                model.setData(index, editor.currentText(), Qt.EditRole)
+        elif hasattr(editor, "combos"):
+            model.setData(index, tuple(c.currentText() for c in editor.combos), Qt.EditRole)
+        else:
+            model.setData(index, editor.text(), Qt.EditRole)
+
+
+# =========================================================
+# MODUL : VIEW TABEL PENGUKURAN
+# =========================================================
+class TabelPengukuran(QTableView):
+    """
+    QTableView untuk ModelTabelPengukuran dengan API ringkas mirip QTableWidget
+    (rowCount, insertRow, removeRow, setRowCount, sinyal cellChanged) agar TableUtility,
+    RowEditors, dan UpdateHasilKlasifikasi dapat dipakai langsung.
+
+    cellChanged(row, col) dipancarkan sekali per sel untuk perubahan satu sel, dan sekali
+    per baris (col = kolom kiri) untuk perubahan banyak sel sekaligus (misal dari_list).
+    blockSignals(True) pada view menahan cellChanged, tampilan tetap ikut model.
+
+    Contoh:
+        tabel = TabelPengukuran([
+            KolomTabel("titik", "Titik", baca_saja=True),
+            KolomTabel("nilai", "Nilai (dBμV)", "angka"),
+            KolomTabel("interpretasi", "Interpretasi", "pilihan", ("PD", "Noise")),
+        ], jumlah_baris=1)
+        data = tabel.model().ke_list(["titik", "nilai", "interpretasi"])
+    """
+    cellChanged = Signal(int, int)
+
+    def __init__(self, kolom, jumlah_baris=0, parent=None):
+        super().__init__(parent)
+        self.setModel(ModelTabelPengukuran(kolom, jumlah_baris, self))
+        self.setItemDelegate(DelegasiPengukuran(self))
+        self.setEditTriggers(
+            QAbstractItemView.SelectedClicked | QAbstractItemView.DoubleClicked
+            | QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed
+        )
+        self.model().dataChanged.connect(self._teruskan_perubahan)
+
+    def _teruskan_perubahan(self, kiri_atas, kanan_bawah, roles=()):
+        for row in range(kiri_atas.row(), kanan_bawah.row() + 1):
+            self.cellChanged.emit(row, kiri_atas.column())
+
+    def mousePressEvent(self, event):
+        # Klik pertama pada sel pilihan langsung membuka editor (seperti combobox per sel dulu)
+        super().mousePressEvent(event)
+        index = self.indexAt(event.position().toPoint())
+        if not index.isValid() or event.button() != Qt.LeftButton:
+            return
+        model = self.model()
+        berpilihan = model.berpilihan(index.row(), index.column()) \
+            or model.kolom[index.column()].jenis == "pilihan_ganda"
+        if berpilihan and model.flags(index) & Qt.ItemIsEditable:
+            self.edit(index)
+
+    # ---------------------------------------------------------
+    # API MIRIP QTABLEWIDGET
+    # ---------------------------------------------------------
+    def rowCount(self):
+        return self.model().rowCount()
+
+    def columnCount(self):
+        return self.model().columnCount()
+
+    def insertRow(self, row):
+        self.model().insertRows(row, 1)
+
+    def removeRow(self, row):
+        self.model().removeRows(row, 1)
+
+    def setRowCount(self, jumlah):
+        self.model().setRowCount(jumlah)
+
+    def teks(self, row, col):
+        return self.model().teks(row, col)
+
+    def setel(self, row, col, value):
+        self.model().setel(row, col, value)
+
+    def selectedRows(self):
+        """Nomor baris yang memiliki sel terpilih."""
+        return sorted({index.row() for index in self.selectionModel().selectedIndexes()})
@@ -6,7 +6,7 @@ from PySide6.QtCore import Qt
 # =========================================================
 class TableUtility:
     """
-    Kumpulan fungsi utilitas untuk QTableWidget
+    Kumpulan fungsi utilitas untuk QTableWidget / TabelPengukuran
     agar tinggi tabel otomatis menyesuaikan jumlah baris.
     """
 
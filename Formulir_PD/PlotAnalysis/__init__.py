@@ -1,7 +1,31 @@
-from .ekstraksi_analisis_prpd import ProsesorPRPD
-from .ekstraksi_analisis_waveform import ProsesorWaveform
+from .data_titik import DataTitik
+from .cache_hasil import CacheHasil
+from .lapisan_plot import LapisanPRPD, LapisanWaveform
+
 
 __all__ = [
-    "ProsesorPRPD"
-    "ProsesorWaveform"
+    "ProsesorPRPD",
+    "ProsesorWaveform",
+    "DataTitik",
+    "sebaran_fasa",
+    "EksekutorParalel",
+    "CacheHasil",
+    "LapisanPRPD",
+    "LapisanWaveform"
 ]
+
+
+def __getattr__(nama):
+    """
+    Modul ekstraksi (cv2, scipy, pandas) dan eksekutor baru diimpor saat pertama kali dipakai,
+    supaya halaman yang hanya butuh DataTitik / CacheHasil tetap cepat dibuka.
+    """
+    if nama in ("ProsesorPRPD", "sebaran_fasa"):
+        from . import ekstraksi_analisis_prpd as modul
+    elif nama == "ProsesorWaveform":
+        from . import ekstraksi_analisis_waveform as modul
+    elif nama == "EksekutorParalel":
+        from . import eksekutor_paralel as modul
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {nama!r}")
+    return getattr(modul, nama)
@@ -0,0 +1,161 @@
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import numpy as np
+
+# === Setup path agar bisa dijalankan sebagai "python -m PlotAnalysis.batch" dari folder proyek ===
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from PlotAnalysis.ekstraksi_analisis_prpd import ProsesorPRPD
+from PlotAnalysis.ekstraksi_analisis_waveform import ProsesorWaveform
+from PlotAnalysis.eksekutor_paralel import EksekutorParalel
+from PlotAnalysis.cache_hasil import CacheHasil
+
+EKSTENSI_GAMBAR = (".png", ".jpg", ".jpeg")
+
+# =========================================================
+# MODUL : ANALISIS BATCH (TANPA GUI)
+# =========================================================
+def cari_gambar(sumber):
+    """
+    Kumpulkan daftar file gambar dari folder atau pola glob.
+
+    Args:
+        sumber (str): path folder (semua gambar di dalamnya) atau pola glob (misal "survey/*.png").
+
+    Return:
+        list of str: path gambar terurut.
+    """
+    if os.path.isdir(sumber):
+        kandidat = [os.path.join(sumber, nama) for nama in os.listdir(sumber)]
+    else:
+        kandidat = glob.glob(sumber, recursive=True)
+    return sorted(p for p in kandidat if os.path.isfile(p) and p.lower().endswith(EKSTENSI_GAMBAR))
+
+
+def analisis_gambar(path, jenis="prpd", sensor_type="Umum", klaster="grid", folder_cache=None):
+    """
+    Analisis satu gambar PRPD / waveform tanpa GUI.
+
+    Args:
+        folder_cache (str): folder CacheHasil (None = tanpa cache).
+
+    Return:
+        dict: {"path", "features", "indikasi_pd", "durasi_detik"} atau {"path", "error", "durasi_detik"}.
+    """
+    mulai = time.perf_counter()
+    try:
+        cache = CacheHasil(folder_cache) if folder_cache else None
+        if jenis == "prpd":
+            result = ProsesorPRPD(path, sensor_type, klaster=klaster, cache=cache).process_prpd()
+        elif jenis == "waveform":
+            result = ProsesorWaveform(path, sensor_type, cache=cache).process_waveform()
+        else:
+            raise ValueError(f"Jenis plot tidak dikenal: {jenis}")
+        hasil = {
+            "path": path,
+            "features": result.get("features", {}),
+            "indikasi_pd": result.get("indikasi_pd", "Tidak ada"),
+        }
+    except Exception as e:
+        hasil = {"path": path, "error": str(e)}
+    hasil["durasi_detik"] = time.perf_counter() - mulai
+    return hasil
+
+
+def ringkasan_throughput(durasi_per_gambar, total_detik):
+    """
+    Hitung statistik throughput batch.
+
+    Args:
+        durasi_per_gambar (list of float): latensi tiap gambar (detik);
+            None = tidak terukur (misal melewati batas waktu), tidak ikut p50/p95.
+        total_detik (float): waktu total (wall-clock) batch.
+    """
+    latensi = np.asarray([d for d in durasi_per_gambar if d is not None], dtype=float) * 1000.0
+    return {
+        "jumlah_gambar": len(durasi_per_gambar),
+        "total_detik": float(total_detik),
+        "gambar_per_detik": float(len(durasi_per_gambar) / total_detik) if total_detik > 0 else 0.0,
+        "latensi_p50_ms": float(np.percentile(latensi, 50)) if len(latensi) else 0.0,
+        "latensi_p95_ms": float(np.percentile(latensi, 95)) if len(latensi) else 0.0,
+    }
+
+
+def jalankan_batch(paths, jenis="prpd", sensor_type="Umum", klaster="grid",
+                   workers=1, chunk_size=4, timeout=None, berurutan=True, folder_cache=None):
+    """
+    Analisis seluruh gambar, berurutan (workers <= 1) atau paralel lewat EksekutorParalel.
+
+    Return:
+        tuple: (list hasil per gambar, dict ringkasan throughput)
+    """
+    mulai = time.perf_counter()
+    if workers and workers > 1:
+        eksekutor = EksekutorParalel(max_workers=workers, chunk_size=chunk_size,
+                                     timeout=timeout, berurutan=berurutan)
+        hasil = list(eksekutor.map(paths, jenis, sensor_type, klaster, folder_cache))
+    else:
+        hasil = [analisis_gambar(p, jenis, sensor_type, klaster, folder_cache) for p in paths]
+    total = time.perf_counter() - mulai
+    return hasil, ringkasan_throughput([h["durasi_detik"] for h in hasil], total)
+
+
+# ---------------------------------------------------------
+# MAIN PROGRAM
+# ---------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m PlotAnalysis.batch",
+        description="Ekstraksi & analisis batch gambar PRPD / waveform tanpa GUI."
+    )
+    parser.add_argument("sumber", help="Folder gambar atau pola glob (contoh: \"survey/*.png\")")
+    parser.add_argument("--jenis", choices=["prpd", "waveform"], default="prpd", help="Jenis plot (default: prpd)")
+    parser.add_argument("--sensor", choices=["TEV", "HFCT", "Ultrasonik", "Umum"], default="Umum", help="Jenis sensor")
+    parser.add_argument("--klaster", choices=["grid", "dbscan"], default="grid", help="Backend klaster PRPD")
+    parser.add_argument("--output", default="hasil_batch.json", help="File JSON hasil gabungan")
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah proses paralel (0 = semua core, 1 = berurutan)")
+    parser.add_argument("--chunk", type=int, default=4, help="Jumlah gambar per pengiriman ke worker (diabaikan jika --timeout dipakai)")
+    parser.add_argument("--timeout", type=float, default=None, help="Batas waktu per gambar (detik)")
+    parser.add_argument("--urutan", choices=["input", "selesai"], default="input",
+                        help="Urutan hasil: sesuai input atau sesuai selesai")
+    parser.add_argument("--cache", default=None, metavar="FOLDER",
+                        help="Folder cache hasil ekstraksi (gambar yang sama tidak diekstraksi ulang)")
+    args = parser.parse_args(argv)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    paths = cari_gambar(args.sumber)
+    if not paths:
+        print(f"Tidak ditemukan gambar di: {args.sumber}")
+        return 1
+
+    print(f"Memproses {len(paths)} gambar {args.jenis.upper()} (sensor: {args.sensor}, worker: {workers})...")
+    hasil, ringkasan = jalankan_batch(
+        paths, args.jenis, args.sensor, args.klaster,
+        workers=workers, chunk_size=args.chunk, timeout=args.timeout,
+        berurutan=(args.urutan == "input"), folder_cache=args.cache
+    )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "jenis": args.jenis,
+            "sensor": args.sensor,
+            "ringkasan": ringkasan,
+            "hasil": hasil,
+        }, f, indent=4, ensure_ascii=False)
+
+    gagal = sum(1 for h in hasil if "error" in h)
+    print(f"Selesai: {ringkasan['jumlah_gambar']} gambar, {gagal} gagal → {os.path.abspath(args.output)}")
+    print(f" - Throughput : {ringkasan['gambar_per_detik']:.2f} gambar/detik")
+    print(f" - Latensi p50: {ringkasan['latensi_p50_ms']:.1f} ms")
+    print(f" - Latensi p95: {ringkasan['latensi_p95_ms']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import os
+import sys
+import json
+import hashlib
+import threading
+import numpy as np
+
+# =========================================================
+# MODUL : CACHE HASIL EKSTRAKSI (BERBASIS ISI GAMBAR)
+# =========================================================
+class CacheHasil:
+    """
+    Cache hasil ekstraksi gambar di disk.
+    Kunci = hash isi gambar + jenis & versi prosesor + parameter kalibrasi,
+    sehingga gambar yang sama (walau dipindah/diganti nama) langsung memakai hasil lama,
+    sedangkan perubahan algoritma/kalibrasi otomatis membuat kunci baru.
+    Entri paling lama tidak dipakai (LRU, berdasarkan waktu akses) dihapus
+    jika jumlah atau ukuran total cache melebihi batas.
+    """
+
+    def __init__(self, folder=None, maks_mb=512, maks_entri=2000):
+        """
+        Args:
+            folder (str): folder cache (default: "cache_analisis" di samping aplikasi).
+            maks_mb (float): batas ukuran total cache (MB).
+            maks_entri (int): batas jumlah entri cache.
+        """
+        if folder is None:
+            if getattr(sys, 'frozen', False):
+                BASE_DIR = os.path.dirname(sys.executable)
+            else:
+                BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            folder = os.path.join(BASE_DIR, "cache_analisis")
+        self.folder = folder
+        self.maks_bytes = int(maks_mb * 1024 * 1024)
+        self.maks_entri = maks_entri
+        os.makedirs(self.folder, exist_ok=True)
+
+    # ---------------------------------------------------------
+    # KUNCI
+    # ---------------------------------------------------------
+    @staticmethod
+    def hash_file(filepath, blok=1 << 20):
+        """Hash SHA-256 dari isi file gambar."""
+        h = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for potongan in iter(lambda: f.read(blok), b""):
+                h.update(potongan)
+        return h.hexdigest()
+
+    def kunci(self, filepath, jenis, versi, parameter):
+        """
+        Bentuk kunci cache.
+
+        Args:
+            filepath (str): path gambar.
+            jenis (str): jenis prosesor ("prpd" / "waveform").
+            versi (str): versi algoritma prosesor.
+            parameter (dict): parameter kalibrasi yang memengaruhi hasil ekstraksi.
+        """
+        identitas = json.dumps(
+            {"gambar": self.hash_file(filepath), "jenis": jenis, "versi": versi, "parameter": parameter},
+            sort_keys=True
+        )
+        return hashlib.sha256(identitas.encode("utf-8")).hexdigest()
+
+    def _path(self, kunci):
+        return os.path.join(self.folder, f"{kunci}.npz")
+
+    # ---------------------------------------------------------
+    # AMBIL & SIMPAN
+    # ---------------------------------------------------------
+    def ambil(self, kunci):
+        """
+        Ambil entri cache.
+
+        Return:
+            tuple | None: (features dict, kolom dict of np.ndarray) atau None jika tidak ada/rusak.
+        """
+        path = self._path(kunci)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                features = json.loads(str(data["__features__"]))
+                kolom = {nama: data[nama] for nama in data.files if nama != "__features__"}
+            os.utime(path)  # tandai baru dipakai (LRU)
+            return features, kolom
+        except Exception:
+            # Entri rusak → hapus, nanti dihitung ulang
+            self._hapus(path)
+            return None
+
+    def simpan(self, kunci, features, kolom):
+        """
+        Simpan fitur + kolom titik ke cache (tulis ke file sementara lalu rename).
+        Cache bersifat pelengkap: kegagalan menulis tidak menggagalkan analisis.
+
+        Args:
+            kunci (str): kunci dari kunci().
+            features (dict): fitur hasil ekstraksi (tidak bergantung sensor).
+            kolom (dict): nama kolom → np.ndarray titik hasil ekstraksi.
+        """
+        path = self._path(kunci)
+        sementara = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(sementara, "wb") as f:
+                np.savez_compressed(f, __features__=np.array(json.dumps(features, ensure_ascii=False)), **kolom)
+            os.replace(sementara, path)
+        except OSError:
+            return False
+        finally:
+            self._hapus(sementara)
+        self._evict()
+        return True
+
+    def bersihkan(self):
+        """Hapus seluruh isi cache."""
+        for nama in os.listdir(self.folder):
+            if nama.endswith(".npz"):
+                self._hapus(os.path.join(self.folder, nama))
+
+    # ---------------------------------------------------------
+    # EVICTION (LRU + UKURAN)
+    # ---------------------------------------------------------
+    def _evict(self):
+        entri = []
+        try:
+            daftar = os.listdir(self.folder)
+        except OSError:
+            return
+        for nama in daftar:
+            if not nama.endswith(".npz"):
+                continue
+            path = os.path.join(self.folder, nama)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entri.append((st.st_mtime, st.st_size, path))
+
+        entri.sort()  # paling lama dipakai di depan
+        total = sum(ukuran for _, ukuran, _ in entri)
+        while entri and (total > self.maks_bytes or len(entri) > self.maks_entri):
+            _, ukuran, path = entri.pop(0)
+            self._hapus(path)
+            total -= ukuran
+
+    @staticmethod
+    def _hapus(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from scipy.spatial import cKDTree
+
+# === Setup path agar bisa dijalankan sebagai "python -m PlotAnalysis.cek_klaster_prpd" dari folder proyek ===
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from PlotAnalysis.klaster_prpd import klaster_grid, klaster_dbscan
+
+# =========================================================
+# MODUL : CEK KESETARAAN KLASTER GRID VS DBSCAN
+# =========================================================
+# Membandingkan backend klaster_grid dengan DBSCAN (sklearn) pada awan titik acak:
+# cluster Gaussian, rantai cluster berjarak sekitar eps (kasus yang mudah tergabung
+# keliru), titik berkisi piksel / kembar, dan noise seragam. Opsional juga awan titik
+# hasil ekstraksi gambar PRPD. Yang dicek:
+# - jumlah klaster dan himpunan titik noise identik,
+# - pembagian titik inti ke klaster identik (sampai penomoran ulang),
+# - setiap titik tepi berlabel klaster salah satu titik inti dalam jarak eps.
+#
+# Pemakaian:
+#   python -m PlotAnalysis.cek_klaster_prpd
+#   python -m PlotAnalysis.cek_klaster_prpd --jumlah 500 --seed 3 --gambar survey/prpd_1.png
+
+
+# ---------------------------------------------------------
+# AWAN TITIK ACAK
+# ---------------------------------------------------------
+def buat_awan(acak, eps=5.0):
+    """Satu awan titik [fasa, dB] acak dari campuran beberapa bentuk kasus."""
+    bagian = []
+    for _ in range(acak.integers(1, 8)):
+        bentuk = acak.integers(4)
+        n = int(acak.integers(5, 400))
+        pusat = acak.uniform([0, 0], [360, 80])
+        if bentuk == 0:         # cluster Gaussian
+            bagian.append(pusat + acak.normal(0, acak.uniform(0.5, 6), (n, 2)))
+        elif bentuk == 1:       # rantai cluster kecil berjarak ≈ eps (tepat di batas penggabungan)
+            arah = acak.normal(size=2)
+            arah /= np.linalg.norm(arah)
+            for i in range(int(acak.integers(2, 6))):
+                titik = pusat + arah * i * eps * acak.uniform(0.8, 1.4)
+                bagian.append(titik + acak.normal(0, 0.4, (max(n // 5, 10), 2)))
+        elif bentuk == 2:       # titik berkisi piksel (banyak kembar / segaris)
+            bagian.append(np.round(pusat + acak.normal(0, acak.uniform(1, 8), (n, 2))) * acak.choice([0.5, 1.0]))
+        else:                   # noise seragam
+            bagian.append(acak.uniform([0, 0], [360, 80], (n, 2)))
+    return np.concatenate(bagian)
+
+
+def ekstrak_gambar(path):
+    """Awan titik [fasa, dB] hasil ekstraksi gambar PRPD."""
+    from PlotAnalysis.ekstraksi_analisis_prpd import ProsesorPRPD
+    titik = ProsesorPRPD(path).extract_features()["prpd_data_points"]
+    return np.column_stack((titik["phase_deg"], titik["intensity_dB"]))
+
+
+# ---------------------------------------------------------
+# PEMBANDINGAN
+# ---------------------------------------------------------
+def bandingkan(arr, eps=5.0, min_samples=10):
+    """
+    Bandingkan klaster_grid dengan DBSCAN pada satu awan titik.
+
+    Return:
+        tuple: (jumlah klaster, waktu grid detik, waktu DBSCAN detik)
+
+    Raise:
+        AssertionError jika hasil berbeda.
+    """
+    from sklearn.cluster import DBSCAN
+
+    t0 = time.perf_counter()
+    grid = klaster_grid(arr, eps, min_samples)
+    t1 = time.perf_counter()
+    model = DBSCAN(eps=eps, min_samples=min_samples).fit(arr)
+    t2 = time.perf_counter()
+    acuan = model.labels_
+
+    k_grid = len(set(grid.tolist()) - {-1})
+    k_acuan = len(set(acuan.tolist()) - {-1})
+    assert k_grid == k_acuan, f"Jumlah klaster berbeda: grid {k_grid} != DBSCAN {k_acuan} (N={len(arr)})"
+    assert np.array_equal(grid == -1, acuan == -1), "Himpunan titik noise berbeda"
+
+    # Titik inti: pemetaan label grid ↔ label DBSCAN harus satu-satu
+    inti = np.zeros(len(arr), dtype=bool)
+    inti[model.core_sample_indices_] = True
+    pasangan = set(zip(grid[inti].tolist(), acuan[inti].tolist()))
+    assert len(pasangan) == len({g for g, _ in pasangan}) == len({a for _, a in pasangan}), \
+        "Pembagian titik inti ke klaster berbeda"
+
+    # Titik tepi: label harus milik salah satu titik inti dalam jarak eps
+    tepi = np.flatnonzero(~inti & (grid != -1))
+    if len(tepi):
+        idx_inti = np.flatnonzero(inti)
+        tetangga = cKDTree(arr[idx_inti]).query_ball_point(arr[tepi], r=eps)
+        for i, daftar in zip(tepi, tetangga):
+            assert grid[i] in set(grid[idx_inti[daftar]].tolist()), f"Label titik tepi {i} tidak valid"
+    return k_grid, t1 - t0, t2 - t1
+
+
+def cek_properti(jumlah=200, seed=0, eps=5.0, min_samples=10):
+    """Jalankan bandingkan() pada `jumlah` awan titik acak. Return: jumlah awan yang dicek."""
+    acak = np.random.default_rng(seed)
+    for _ in range(jumlah):
+        bandingkan(buat_awan(acak, eps), eps, min_samples)
+    return jumlah
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cek kesetaraan klaster_grid dengan DBSCAN")
+    parser.add_argument("--jumlah", type=int, default=200, help="Jumlah awan titik acak")
+    parser.add_argument("--seed", type=int, default=0, help="Seed data acak")
+    parser.add_argument("--eps", type=float, default=5.0, help="Radius tetangga (default sama dengan ProsesorPRPD)")
+    parser.add_argument("--min-samples", type=int, default=10, help="Minimum tetangga titik inti")
+    parser.add_argument("--gambar", nargs="*", default=[], help="Gambar PRPD tambahan yang ikut dicek")
+    args = parser.parse_args(argv)
+
+    cek_properti(args.jumlah, args.seed, args.eps, args.min_samples)
+    print(f"klaster_grid identik dengan DBSCAN untuk {args.jumlah} awan titik acak.")
+
+    for path in args.gambar:
+        arr = ekstrak_gambar(path)
+        k, t_grid, t_dbscan = bandingkan(arr, args.eps, args.min_samples)
+        print(f"{os.path.basename(path)}: {len(arr)} titik, {k} klaster identik "
+              f"(grid {t_grid * 1e3:.1f} ms, DBSCAN {t_dbscan * 1e3:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# === Setup path agar bisa dijalankan sebagai "python -m PlotAnalysis.cek_sebaran_fasa" dari folder proyek ===
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from PlotAnalysis.ekstraksi_analisis_prpd import sebaran_fasa
+
+# =========================================================
+# MODUL : CEK PROPERTI SEBARAN FASA
+# =========================================================
+# Membandingkan sebaran_fasa (jendela geser vektor) dengan implementasi referensi loop
+# Python yang dulu dipakai di ProsesorPRPD.process_prpd, pada input acak: awan titik
+# biasa, titik kembar, N = 0 / 1 / kecil, dan awan yang melewati batas 0°/360°.
+# Selain lebar busur, batas awal/akhir busur juga dicek harus memuat minimal k titik.
+#
+# Pemakaian:
+#   python -m PlotAnalysis.cek_sebaran_fasa
+#   python -m PlotAnalysis.cek_sebaran_fasa --jumlah 20000 --seed 7 --titik 50000
+
+
+# ---------------------------------------------------------
+# IMPLEMENTASI REFERENSI (LOOP LAMA)
+# ---------------------------------------------------------
+def _referensi_sebaran(phase_deg, fraksi=0.9):
+    N = len(phase_deg)
+    if N == 0:
+        return 360.0
+    phases_sorted = np.sort(phase_deg)
+    arr = np.concatenate([phases_sorted, phases_sorted + 360])
+    k = int(fraksi * N)
+    min_width = 360.0
+    for i in range(len(phases_sorted)):
+        j = i + k - 1
+        if j < len(arr):
+            min_width = min(min_width, arr[j] - arr[i])
+    return float(min_width)
+
+
+# ---------------------------------------------------------
+# INPUT ACAK
+# ---------------------------------------------------------
+def buat_fasa(acak):
+    """Satu awan fasa acak (derajat, 0–360) dari salah satu bentuk kasus."""
+    bentuk = acak.integers(5)
+    N = int(acak.choice([0, 1, 2, 3, 5, 10, 37, 200, 1000]))
+    if bentuk == 0:         # seragam
+        fasa = acak.uniform(0, 360, N)
+    elif bentuk == 1:       # titik kembar (diambil dari sedikit nilai)
+        fasa = acak.choice(acak.uniform(0, 360, max(1, N // 4)), N)
+    elif bentuk == 2:       # cluster melewati 0°/360°
+        fasa = acak.normal(0, acak.uniform(1, 40), N) % 360
+    elif bentuk == 3:       # dua cluster berlawanan (pola PD internal)
+        pusat = acak.choice([90.0, 270.0], N)
+        fasa = (pusat + acak.normal(0, acak.uniform(1, 30), N)) % 360
+    else:                   # fasa bulat (derajat) → banyak kembar
+        fasa = np.round(acak.uniform(0, 360, N)) % 360
+    return fasa
+
+
+def _tercakup(fasa, awal, lebar):
+    """Jumlah titik di busur [awal, awal + lebar] (melingkar)."""
+    return int(np.sum((fasa - awal) % 360 <= lebar + 1e-9))
+
+
+def cek_properti(jumlah=5000, seed=0):
+    """
+    Bandingkan sebaran_fasa dengan referensi pada `jumlah` input acak.
+
+    Return:
+        int: jumlah kasus yang dicek.
+
+    Raise:
+        AssertionError jika lebar berbeda dari referensi atau busur tidak memuat k titik.
+    """
+    acak = np.random.default_rng(seed)
+    for _ in range(jumlah):
+        fasa = buat_fasa(acak)
+        N = len(fasa)
+        fraksi = 0.9 if acak.random() < 0.5 else float(acak.uniform(0.05, 1.0))
+        k = int(fraksi * N)
+        if N > 1 and k < 1:
+            # Loop lama tidak terdefinisi untuk k = 0 dengan N > 1 (lebar negatif) → pakai fraksi bawaan
+            fraksi, k = 0.9, int(0.9 * N)
+
+        lebar, awal, akhir = sebaran_fasa(fasa, fraksi)
+        harapan = _referensi_sebaran(fasa, fraksi)
+        assert lebar == harapan, f"Lebar berbeda (N={N}, fraksi={fraksi}): {lebar} != {harapan}\n{fasa}"
+
+        if k >= 1:
+            assert 0 <= awal < 360 and 0 <= akhir < 360, f"Batas di luar 0–360°: {awal}, {akhir}"
+            assert _tercakup(fasa, awal, lebar) >= k, f"Busur {awal}+{lebar} memuat < {k} titik\n{fasa}"
+            if lebar < 360:
+                assert np.isclose((awal + lebar) % 360, akhir), f"Batas akhir {akhir} != {awal} + {lebar}"
+    return jumlah
+
+
+def _waktu(fungsi, ulang=3):
+    """Waktu terbaik dari beberapa pengulangan (detik)."""
+    terbaik = float("inf")
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        fungsi()
+        terbaik = min(terbaik, time.perf_counter() - t0)
+    return terbaik
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cek properti sebaran_fasa terhadap loop referensi")
+    parser.add_argument("--jumlah", type=int, default=5000, help="Jumlah input acak")
+    parser.add_argument("--seed", type=int, default=0, help="Seed data acak")
+    parser.add_argument("--titik", type=int, default=20000, help="Jumlah titik untuk perbandingan waktu")
+    args = parser.parse_args(argv)
+
+    cek_properti(args.jumlah, args.seed)
+    print(f"sebaran_fasa identik dengan referensi untuk {args.jumlah} input acak.")
+
+    fasa = np.random.default_rng(args.seed).uniform(0, 360, args.titik)
+    t_referensi = _waktu(lambda: _referensi_sebaran(fasa))
+    t_vektor = _waktu(lambda: sebaran_fasa(fasa))
+    print(f"{args.titik} titik: referensi {t_referensi * 1e3:.2f} ms, "
+          f"vektor {t_vektor * 1e3:.2f} ms ({t_referensi / t_vektor:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
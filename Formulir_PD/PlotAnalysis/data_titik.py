@@ -0,0 +1,66 @@
+import numpy as np
+
+# =========================================================
+# MODUL : DATA TITIK HASIL EKSTRAKSI (KOLOMNAR)
+# =========================================================
+class DataTitik:
+    """
+    Wadah titik hasil ekstraksi plot dalam bentuk kolom NumPy.
+    Setiap kolom (misal "phase_deg", "intensity_dB") disimpan sebagai array float,
+    sehingga analisis bisa langsung memakai operasi vektor tanpa list of dict.
+    Bentuk list of dict hanya dibuat saat dibutuhkan lapisan JSON (to_records).
+    """
+
+    def __init__(self, **kolom):
+        """
+        Args:
+            **kolom: pasangan nama kolom → array/list nilai (panjang harus sama).
+        """
+        self.kolom = {nama: np.asarray(nilai, dtype=float) for nama, nilai in kolom.items()}
+        panjang = {len(v) for v in self.kolom.values()}
+        if len(panjang) > 1:
+            raise ValueError("Panjang setiap kolom DataTitik harus sama!")
+
+    def __len__(self):
+        for nilai in self.kolom.values():
+            return len(nilai)
+        return 0
+
+    def __getitem__(self, nama):
+        return self.kolom[nama]
+
+    def __contains__(self, nama):
+        return nama in self.kolom
+
+    @property
+    def columns(self):
+        """Daftar nama kolom sesuai urutan saat dibuat."""
+        return list(self.kolom.keys())
+
+    # ---------------------------------------------------------
+    # KONVERSI
+    # ---------------------------------------------------------
+    def to_records(self):
+        """Ubah ke list of dict (format lama di JSON)."""
+        nama = self.columns
+        nilai = [v.tolist() for v in self.kolom.values()]
+        return [dict(zip(nama, baris)) for baris in zip(*nilai)]
+
+    @classmethod
+    def from_records(cls, records, columns):
+        """
+        Buat DataTitik dari list of dict (format lama di JSON).
+
+        Args:
+            records (list of dict): data titik, misal [{"phase_deg": .., "intensity_dB": ..}, ...]
+            columns (list of str): nama kolom yang diambil dari setiap dict.
+        """
+        records = records or []
+        return cls(**{nama: [r.get(nama, 0.0) for r in records] for nama in columns})
+
+    @classmethod
+    def ensure(cls, data, columns):
+        """Kembalikan DataTitik dari DataTitik / list of dict / None."""
+        if isinstance(data, cls):
+            return data
+        return cls.from_records(data, columns)
@@ -0,0 +1,215 @@
+import os
+import time
+import queue
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+INTERVAL_CEK_MULAI = 0.05   # detik; jeda memeriksa kabar "tugas mulai" dari worker
+MAKS_ULANG_POOL_RUSAK = 1   # berapa kali chunk dikirim ulang jika pool rusak (worker mati mendadak) saat ia berjalan
+
+# =========================================================
+# MODUL : EKSEKUTOR PARALEL (PROCESS POOL)
+# =========================================================
+_antrean_mulai = None       # (di proses worker) antrean kabar ke proses utama: ("pid", pid) / ("mulai", idx)
+
+
+def _inisialisasi_worker(antrean_mulai):
+    global _antrean_mulai
+    _antrean_mulai = antrean_mulai
+    if antrean_mulai is not None:
+        antrean_mulai.put(("pid", os.getpid()))
+
+
+def _analisis_chunk(idx, paths, jenis, sensor_type, klaster, folder_cache=None):
+    """Dijalankan di proses worker: analisis satu chunk gambar secara berurutan."""
+    from .batch import analisis_gambar
+    if _antrean_mulai is not None:
+        _antrean_mulai.put(("mulai", idx))
+    return [analisis_gambar(p, jenis, sensor_type, klaster, folder_cache) for p in paths]
+
+
+def _hentikan_paksa(executor, pid_worker):
+    """
+    Matikan paksa proses worker pool (tugas yang sedang berjalan ikut berhenti).
+    pid_worker: pid yang dilaporkan worker saat inisialisasi; hanya anak proses yang masih hidup
+    dengan pid tersebut yang dimatikan. Worker yang belum sempat melapor tidak sedang mengerjakan
+    tugas, dan ikut dihentikan oleh pool begitu pool mendeteksi worker lain mati.
+    """
+    if hasattr(executor, "terminate_workers"):     # Python >= 3.14
+        executor.terminate_workers()
+        return
+    proses = [p for p in multiprocessing.active_children() if p.pid in pid_worker]
+    for p in proses:
+        p.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+    for p in proses:
+        p.join()
+
+
+class EksekutorParalel:
+    """
+    Menyebar analisis ProsesorPRPD / ProsesorWaveform ke beberapa proses (ProcessPoolExecutor).
+    - Gambar dikirim per chunk untuk mengurangi overhead antar-proses
+      (jika timeout dipakai, satu gambar per tugas).
+    - Jumlah tugas yang berjalan dibatasi (= jumlah worker), sehingga memori tetap terkendali.
+    - Batas waktu dihitung sejak worker benar-benar mulai mengerjakan gambar (dilaporkan worker).
+    - Gambar yang melewati batas waktu ditandai gagal ("error"); pool dimatikan paksa dan dibuat
+      ulang, lalu gambar lain yang sedang berjalan dikirim ulang.
+    - Jika pool rusak (worker mati mendadak), pool dibuat ulang; chunk yang sedang berjalan dikirim
+      ulang sendirian satu per satu (maks. MAKS_ULANG_POOL_RUSAK kali, setelah itu ditandai gagal) dan
+      sisa gambar tetap diproses.
+    - Hasil bisa dikirim sesuai urutan input atau segera setelah selesai.
+    """
+
+    def __init__(self, max_workers=None, chunk_size=4, timeout=None, berurutan=True):
+        """
+        Args:
+            max_workers (int): jumlah proses worker (default: jumlah core CPU).
+            chunk_size (int): jumlah gambar per pengiriman ke worker (diabaikan jika timeout dipakai).
+            timeout (float): batas waktu per gambar (detik), None = tanpa batas.
+            berurutan (bool): True → hasil sesuai urutan input, False → sesuai urutan selesai.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, int(chunk_size))
+        self.timeout = timeout
+        self.berurutan = berurutan
+
+    def _buat_pool(self):
+        antrean_mulai = multiprocessing.Queue() if self.timeout else None
+        executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                       initializer=_inisialisasi_worker, initargs=(antrean_mulai,))
+        return executor, antrean_mulai
+
+    def map(self, paths, jenis="prpd", sensor_type="Umum", klaster="grid", folder_cache=None):
+        """
+        Analisis semua gambar secara paralel.
+
+        Yield:
+            dict: hasil per gambar (format sama dengan analisis_gambar;
+                  gambar yang gagal / melewati batas waktu berisi "error" dan durasi_detik None).
+        """
+        paths = list(paths)
+        # Dengan batas waktu, satu gambar per tugas → tugas yang macet hanya menggagalkan gambarnya sendiri
+        ukuran = 1 if self.timeout else self.chunk_size
+        chunks = [paths[i:i + ukuran] for i in range(0, len(paths), ukuran)]
+        selesai = {}            # indeks chunk → list hasil (untuk mode berurutan)
+        berikutnya = 0          # indeks chunk berikutnya yang diserahkan ke pemanggil (mode berurutan)
+        antrean = deque(range(len(chunks)))     # indeks chunk yang belum dikirim
+        berjalan = {}           # future → indeks chunk
+        batas = {}              # indeks chunk → batas waktu (diisi saat worker mulai mengerjakan)
+        ulang = {}              # indeks chunk → berapa kali dikirim ulang karena pool rusak
+        pid_worker = set()      # pid worker pool saat ini (dilaporkan worker, untuk mematikan paksa)
+
+        def gagal(idx, pesan):
+            return [{"path": p, "error": pesan, "durasi_detik": None} for p in chunks[idx]]
+
+        executor, antrean_mulai = self._buat_pool()
+        try:
+            while antrean or berjalan:
+                rusak = None    # BrokenProcessPool jika pool rusak pada putaran ini
+                while antrean and len(berjalan) < self.max_workers:
+                    idx = antrean[0]
+                    # Chunk kiriman ulang (pool rusak) dijalankan sendirian → jika pool rusak lagi, pasti chunk itu penyebabnya
+                    if berjalan and (idx in ulang or any(i in ulang for i in berjalan.values())):
+                        break
+                    antrean.popleft()
+                    try:
+                        future = executor.submit(_analisis_chunk, idx, chunks[idx], jenis, sensor_type, klaster, folder_cache)
+                    except BrokenProcessPool as e:
+                        antrean.appendleft(idx)
+                        rusak = e
+                        break
+                    berjalan[future] = idx
+
+                # Tunggu sampai ada yang selesai / batas waktu terdekat / saatnya memeriksa kabar mulai
+                tunggu = None
+                if self.timeout:
+                    sekarang = time.monotonic()
+                    aktif = set(berjalan.values())
+                    try:
+                        while True:
+                            kabar, nilai = antrean_mulai.get_nowait()
+                            if kabar == "pid":
+                                pid_worker.add(nilai)
+                            elif nilai in aktif:
+                                batas.setdefault(nilai, sekarang + self.timeout)
+                    except queue.Empty:
+                        pass
+                    batas_aktif = [batas[idx] for idx in aktif if idx in batas]
+                    if batas_aktif:
+                        tunggu = max(0.0, min(batas_aktif) - sekarang)
+                    if len(batas_aktif) < len(aktif):
+                        tunggu = INTERVAL_CEK_MULAI if tunggu is None else min(tunggu, INTERVAL_CEK_MULAI)
+                beres = set()
+                if rusak is None:
+                    beres, _ = wait(list(berjalan), timeout=tunggu, return_when=FIRST_COMPLETED)
+
+                keluaran = []
+                for future in beres:
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        rusak = future.exception()  # ditangani di bawah bersama tugas lain yang sedang berjalan
+                        continue
+                    idx = berjalan.pop(future)
+                    batas.pop(idx, None)
+                    try:
+                        keluaran.append((idx, future.result()))
+                    except Exception as e:
+                        keluaran.append((idx, gagal(idx, str(e))))
+
+                # Gambar yang melewati batas waktu
+                sekarang = time.monotonic()
+                macet = [future for future, idx in berjalan.items()
+                         if idx in batas and sekarang >= batas[idx] and not future.done()]
+                if rusak is not None:
+                    # Pool tidak bisa dipakai lagi → semua tugas yang belum selesai ikut gagal;
+                    # tidak diketahui chunk mana penyebabnya, jadi semuanya dikirim ulang (dengan batas)
+                    for future, idx in berjalan.items():
+                        if future.done() and future.exception() is None:
+                            keluaran.append((idx, future.result()))
+                        elif ulang.get(idx, 0) < MAKS_ULANG_POOL_RUSAK:
+                            ulang[idx] = ulang.get(idx, 0) + 1
+                            antrean.appendleft(idx)
+                        else:
+                            keluaran.append((idx, gagal(idx, f"Proses worker berhenti mendadak: {rusak}")))
+                    antrean = deque(sorted(antrean))
+                    berjalan.clear()
+                    batas.clear()
+                    pid_worker.clear()
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    if antrean_mulai is not None:
+                        antrean_mulai.close()
+                    executor, antrean_mulai = self._buat_pool()
+                elif macet:
+                    for future in macet:
+                        idx = berjalan.pop(future)
+                        keluaran.append((idx, gagal(idx, f"Melebihi batas waktu {self.timeout} detik")))
+
+                    # future.cancel() tidak bisa menghentikan tugas yang sudah berjalan →
+                    # matikan worker, buat pool baru, kirim ulang tugas lain yang belum selesai
+                    for future, idx in berjalan.items():
+                        if future.done() and future.exception() is None:
+                            keluaran.append((idx, future.result()))
+                        else:
+                            antrean.appendleft(idx)
+                    antrean = deque(sorted(antrean))
+                    berjalan.clear()
+                    batas.clear()
+                    _hentikan_paksa(executor, pid_worker)
+                    pid_worker.clear()
+                    antrean_mulai.close()
+                    executor, antrean_mulai = self._buat_pool()
+
+                for idx, hasil_chunk in keluaran:
+                    if self.berurutan:
+                        selesai[idx] = hasil_chunk
+                    else:
+                        yield from hasil_chunk
+
+                if self.berurutan:
+                    while berikutnya in selesai:
+                        yield from selesai.pop(berikutnya)
+                        berikutnya += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
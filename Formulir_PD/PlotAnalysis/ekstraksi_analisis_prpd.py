@@ -2,10 +2,49 @@ import cv2
 import json
 import math
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from scipy.stats import skew, kurtosis, entropy
-from sklearn.cluster import DBSCAN
+from .data_titik import DataTitik
+from .klaster_prpd import BACKEND_KLASTER
+
+# =========================================================
+# KERNEL : SEBARAN FASA (JENDELA GESER MELINGKAR)
+# =========================================================
+def sebaran_fasa(phase_deg, fraksi=0.9):
+    """
+    Lebar busur fasa terkecil yang memuat `fraksi` bagian titik (misal 90%).
+    Fasa bersifat melingkar (0–360°), sehingga data digandakan (+360°)
+    lalu lebar setiap jendela k titik dihitung sekaligus secara vektor:
+    arr[k-1 : k-1+N] - arr[:N].
+    Kesetaraan dengan loop lama dicek lewat: python -m PlotAnalysis.cek_sebaran_fasa
+
+    Args:
+        phase_deg (array): fasa setiap titik (derajat), tidak harus terurut.
+        fraksi (float): bagian titik yang harus tercakup (default 0.9).
+
+    Return:
+        tuple: (lebar_deg, fasa_awal_deg, fasa_akhir_deg)
+            - lebar_deg: lebar busur minimum (maks 360°)
+            - fasa_awal_deg / fasa_akhir_deg: batas busur (0–360°, bisa melewati 0°)
+    """
+    phases_sorted = np.sort(np.asarray(phase_deg, dtype=float))
+    N = len(phases_sorted)
+    if N == 0:
+        return 360.0, 0.0, 360.0
+
+    k = int(fraksi * N)
+    if k < 1:
+        # Satu titik → seluruh lingkaran (sama dengan perilaku loop lama)
+        lebar_min = min(360.0, float((phases_sorted[-1] + 360) - phases_sorted[0]))
+        return lebar_min, float(phases_sorted[0]), float(phases_sorted[0])
+
+    arr = np.concatenate([phases_sorted, phases_sorted + 360])
+    lebar = arr[k - 1:k - 1 + N] - arr[:N]
+    i = int(np.argmin(lebar))
+
+    lebar_min = min(360.0, float(lebar[i]))
+    fasa_awal = float(arr[i])
+    fasa_akhir = float(arr[i + k - 1] % 360)
+    return lebar_min, fasa_awal, fasa_akhir
 
 # =========================================================
 # MODUL : EKSTRAKSI & ANALISIS PLOT PRPD
@@ -15,21 +54,80 @@ class ProsesorPRPD:
     Kelas untuk ekstraksi + analisis PRPD
     """
 
-    def __init__(self, filepath=None, sensor_type="Umum"):
+    # Naikkan VERSI setiap kali algoritma ekstraksi/fitur berubah (membatalkan cache lama)
+    VERSI = "1"
+    RENTANG_FASA = (0, 360)         # derajat
+    RENTANG_AMPLITUDO = (0, 60)     # dB
+    EPS_KLASTER = 5
+    MIN_SAMPLES_KLASTER = 10
+
+    def __init__(self, filepath=None, sensor_type="Umum", klaster="grid", cache=None):
+        """
+        Args:
+            filepath (str): path gambar PRPD.
+            sensor_type (str): "TEV", "HFCT", "Ultrasonik" atau "Umum".
+            klaster (str): backend klaster ("grid" = default cepat, "dbscan" = validasi).
+            cache (CacheHasil): cache hasil ekstraksi (opsional).
+        """
+        if klaster not in BACKEND_KLASTER:
+            raise ValueError(f"Backend klaster tidak dikenal: {klaster}")
         self.filepath = filepath
         self.sensor_type = sensor_type
+        self.klaster = klaster
+        self.cache = cache
         self.result = {}
 
-    def process_prpd(self):
+    def parameter_kalibrasi(self):
+        """Parameter yang memengaruhi hasil ekstraksi (bagian dari kunci cache)."""
+        return {
+            "rentang_fasa": list(self.RENTANG_FASA),
+            "rentang_amplitudo": list(self.RENTANG_AMPLITUDO),
+            "eps": self.EPS_KLASTER,
+            "min_samples": self.MIN_SAMPLES_KLASTER,
+            "klaster": self.klaster,
+        }
+
+    def process_prpd(self, progres=None):
         """
-        Ekstraksi & analisis PRPD dari gambar hasil pengukuran PD.
+        Ekstraksi & analisis PRPD dari gambar hasil pengukuran PD
+        (extract_features + evaluate untuk self.sensor_type).
+        """
+        hasil = self.extract_features(progres)
+        self.result = {**hasil, "indikasi_pd": self.evaluate(self.sensor_type, hasil["features"])}
+        return self.result
+
+    def extract_features(self, progres=None):
+        """
+        Ekstraksi titik & fitur PRPD (tidak bergantung jenis sensor).
+        Hasil diambil dari / disimpan ke cache bila tersedia.
+
+        Args:
+            progres (callable): opsional, dipanggil progres(persen, pesan) di setiap tahap
+                (dipakai pekerja latar belakang untuk progres & pembatalan).
+
+        Return:
+            dict: {"prpd_data_points": DataTitik, "features": dict}
         """
         if not self.filepath:
             raise ValueError("Filepath belum diisi!")
+        lapor = progres or (lambda persen, pesan="": None)
+        lapor(0, "Memeriksa cache")
+
+        # ---------------------------------------------------------
+        # 0) Cek cache (gambar + versi + kalibrasi sama → pakai fitur lama)
+        # ---------------------------------------------------------
+        kunci_cache = None
+        if self.cache is not None:
+            kunci_cache = self.cache.kunci(self.filepath, "prpd", self.VERSI, self.parameter_kalibrasi())
+            tersimpan = self.cache.ambil(kunci_cache)
+            if tersimpan is not None:
+                features, kolom = tersimpan
+                return {"prpd_data_points": DataTitik(**kolom), "features": features}
         
         # ---------------------------------------------------------
         # 1️) Muat gambar
         # ---------------------------------------------------------
+        lapor(10, "Memuat gambar")
         img = cv2.imread(self.filepath)
         if img is None:
             raise ValueError(f"Gagal membaca file gambar: {self.filepath}")
@@ -37,6 +135,7 @@ class ProsesorPRPD:
         # ---------------------------------------------------------
         # 2️) Mask warna (disesuaikan dengan plot PRPD)
         # ---------------------------------------------------------
+        lapor(20, "Mask warna & filter noise")
         hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
         mask_blue = cv2.inRange(hsv, (100, 80, 80), (130, 255, 255))
         mask_red1 = cv2.inRange(hsv, (0, 80, 80), (10, 255, 255))
@@ -57,28 +156,34 @@ class ProsesorPRPD:
         # ---------------------------------------------------------
         points = cv2.findNonZero(mask)
         if points is None:
-            return {"prpd_data_points": [], "features": {}, "indikasi_pd": "Tidak ada titik"}
+            return {"prpd_data_points": DataTitik(phase_deg=[], intensity_dB=[]), "features": {}}
 
         points = points.reshape(-1, 2)
 
         # ---------------------------------------------------------
         # 5️) Kalibrasi ke skala PRPD
         # ---------------------------------------------------------
+        lapor(35, "Kalibrasi titik")
         gh, gw, _ = img.shape
-        phase_min, phase_max = 0, 360
-        amp_min, amp_max = 0, 60
+        phase_min, phase_max = self.RENTANG_FASA
+        amp_min, amp_max = self.RENTANG_AMPLITUDO
+
+        # Konversi seluruh titik sekaligus (vektor), lalu urutkan berdasarkan fasa
+        px = points[:, 0].astype(np.float64)
+        py = points[:, 1].astype(np.float64)
+        phase = (px / gw) * (phase_max - phase_min) + phase_min
+        intensity_dB = (1 - py / gh) * (amp_max - amp_min) + amp_min
 
-        prpd_data_points = []
-        for (px, py) in points:
-            phase = (px / gw) * (phase_max - phase_min) + phase_min
-            intensity_dB = (1 - py / gh) * (amp_max - amp_min) + amp_min
-            prpd_data_points.append({"phase_deg": float(phase), "intensity_dB": float(intensity_dB)})
+        urutan = np.argsort(phase, kind="stable")
+        prpd_data_points = DataTitik(phase_deg=phase[urutan], intensity_dB=intensity_dB[urutan])
 
-        df = pd.DataFrame(prpd_data_points).sort_values("phase_deg")
+        import pandas as pd
+        df = pd.DataFrame(prpd_data_points.kolom, copy=False)
 
         # ---------------------------------------------------------
         # 6) Analisis fitur PRPD
         # ---------------------------------------------------------
+        lapor(50, "Analisis fitur")
         N = len(df)
 
         # ===== Statistik amplitudo =====
@@ -108,24 +213,15 @@ class ProsesorPRPD:
         polarity_ratio = float(n_pos / n_neg) if n_neg > 0 else float("inf") if n_pos > 0 else 0.0
 
         # Sebaran fasa 90%
-        if N > 0:
-            phases_sorted = np.sort(df["phase_deg"].values)
-            arr = np.concatenate([phases_sorted, phases_sorted + 360])
-            k = int(0.9 * N)
-            min_width = 360.0
-            for i in range(len(phases_sorted)):
-                j = i + k - 1
-                if j < len(arr):
-                    min_width = min(min_width, arr[j] - arr[i])
-            phase_spread_90 = float(min_width)
-        else:
-            phase_spread_90 = 360.0
+        phase_spread_90, spread_start, spread_end = sebaran_fasa(df["phase_deg"].values, 0.9)
 
         # ===== Pola PD =====
+        lapor(65, "Klasterisasi titik")
         if N >= 10:
             arr2 = df[["phase_deg", "intensity_dB"]].values
-            db = DBSCAN(eps=5, min_samples=10).fit(arr2)
-            labels = db.labels_
+            labels = BACKEND_KLASTER[self.klaster](
+                arr2, eps=self.EPS_KLASTER, min_samples=self.MIN_SAMPLES_KLASTER
+            )
             n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
             in_cluster_frac = float(np.sum(labels != -1) / len(labels))
         else:
@@ -159,6 +255,8 @@ class ProsesorPRPD:
             "Koefisien Konsentrasi Fasa (R)": float(R),
             "Rata-rata Fasa (derajat)": float(mean_phase_deg),
             "Sebaran Fasa 90%": float(phase_spread_90),
+            "Batas Awal Sebaran Fasa 90% (derajat)": float(spread_start),
+            "Batas Akhir Sebaran Fasa 90% (derajat)": float(spread_end),
             "Jumlah Titik Positif (0–180°)": int(n_pos),
             "Jumlah Titik Negatif (180–360°)": int(n_neg),
             "Rasio Polaritas": float(polarity_ratio),
@@ -169,29 +267,52 @@ class ProsesorPRPD:
             "Entropi Distribusi Fasa": float(entropy),
         }
 
-        # ---------------------------------------------------------
-        # 8) Indikasi PD Waveform (aturan threshold sederhana)
-        # ---------------------------------------------------------
+        lapor(95, "Menyimpan hasil")
+        if kunci_cache is not None:
+            self.cache.simpan(kunci_cache, features, prpd_data_points.kolom)
+
+        return {"prpd_data_points": prpd_data_points, "features": features}
+
+    def evaluate(self, sensor_type=None, features=None):
+        """
+        Indikasi PD PRPD (aturan threshold sederhana) untuk satu jenis sensor.
+        Hanya membaca fitur, sehingga bisa dinilai ulang untuk sensor lain tanpa ekstraksi ulang.
+
+        Args:
+            sensor_type (str): jenis sensor (default: self.sensor_type).
+            features (dict): fitur hasil extract_features (default: fitur di self.result).
+
+        Return:
+            str: "Ada", "Tidak signifikan" atau "Tidak ada titik".
+        """
+        if sensor_type is None:
+            sensor_type = self.sensor_type
+        if features is None:
+            features = self.result.get("features", {})
+        if not features:
+            return "Tidak ada titik"
+
+        ppc = features["Pulse per Cycle (PPC)"]
+        mean_amp = features["Rata-rata dB"]
+        energy_proxy = features["Proksi Energi"]
+        R = features["Koefisien Konsentrasi Fasa (R)"]
+        in_cluster_frac = features["Fraksi Titik dalam Klaster"]
+
         pd_flag = False
-        if self.sensor_type == "TEV":
+        if sensor_type == "TEV":
             if ppc >= 30 or mean_amp >= 2.0 or energy_proxy >= 5000:
                 pd_flag = True
-        elif self.sensor_type == "HFCT":
+        elif sensor_type == "HFCT":
             if ppc >= 100 or mean_amp >= 6.0 or (R >= 0.3 and in_cluster_frac >= 0.25) or energy_proxy >= 20000:
                 pd_flag = True
-        elif self.sensor_type == "Ultrasonik":
+        elif sensor_type == "Ultrasonik":
             if ppc >= 50 or mean_amp >= 8.0 or (R >= 0.4 and in_cluster_frac >= 0.2) or energy_proxy >= 10000:
                 pd_flag = True
         else:
             if ppc >= 50 or mean_amp >= 5.0:
                 pd_flag = True
 
-        self.result = {
-            "prpd_data_points": prpd_data_points,
-            "features": features,
-            "indikasi_pd": "Ada" if pd_flag else "Tidak signifikan"
-        }
-        return self.result
+        return "Ada" if pd_flag else "Tidak signifikan"
 
     # ---------------------------------------------------------
     # PENGATUR DATA
@@ -202,8 +323,12 @@ class ProsesorPRPD:
         """
         if not self.result:
             raise ValueError("Belum ada hasil. Jalankan process() dulu.")
+        hasil = dict(self.result)
+        hasil["prpd_data_points"] = DataTitik.ensure(
+            hasil.get("prpd_data_points"), ["phase_deg", "intensity_dB"]
+        ).to_records()
         with open(json_out, "w", encoding="utf-8") as f:
-            json.dump(self.result, f, indent=4)
+            json.dump(hasil, f, indent=4)
 
     def load_plot_result(self, json_file):
         """
@@ -212,10 +337,13 @@ class ProsesorPRPD:
         try:
             with open(json_file, "r", encoding="utf-8") as f:
                 self.result = json.load(f)
+            self.result["prpd_data_points"] = DataTitik.ensure(
+                self.result.get("prpd_data_points"), ["phase_deg", "intensity_dB"]
+            )
             return self.result
         except Exception as e:
             self.result = {
-                "prpd_data_points": [],
+                "prpd_data_points": DataTitik(phase_deg=[], intensity_dB=[]),
                 "features": {},
                 "indikasi_pd": f"Gagal load: {e}",
             }
@@ -2,8 +2,104 @@ import cv2
 import json
 import math
 import numpy as np
-import pandas as pd
 from scipy.stats import skew, kurtosis, entropy
+from .data_titik import DataTitik
+
+# =========================================================
+# KERNEL : FITUR BENTUK PULSA (NUMPY)
+# =========================================================
+def waktu_lintasan(time_us, amplitude_dB, batas):
+    """
+    Cari waktu pertama & terakhir saat amplitudo >= batas.
+    Memakai cumulative max (maju & mundur) + searchsorted, sehingga
+    tidak perlu filter boolean pada seluruh data untuk setiap ambang.
+
+    Args:
+        time_us (np.ndarray): waktu, sudah terurut naik.
+        amplitude_dB (np.ndarray): amplitudo sesuai urutan waktu.
+        batas (float | array): satu atau beberapa ambang amplitudo.
+
+    Return:
+        tuple: (waktu_awal, waktu_akhir), NaN jika tidak ada titik yang melewati ambang.
+    """
+    N = len(amplitude_dB)
+    batas = np.atleast_1d(np.asarray(batas, dtype=float))
+    if N == 0:
+        kosong = np.full(batas.shape, np.nan)
+        return kosong, kosong
+
+    maks_maju = np.maximum.accumulate(amplitude_dB)
+    maks_mundur = np.maximum.accumulate(amplitude_dB[::-1])
+
+    idx_awal = np.searchsorted(maks_maju, batas, side="left")
+    idx_akhir = np.searchsorted(maks_mundur, batas, side="left")
+
+    ada = idx_awal < N
+    waktu_awal = np.where(ada, time_us[np.minimum(idx_awal, N - 1)], np.nan)
+    waktu_akhir = np.where(ada, time_us[N - 1 - np.minimum(idx_akhir, N - 1)], np.nan)
+    return waktu_awal, waktu_akhir
+
+
+def fitur_waveform(time_us, amplitude_dB):
+    """
+    Hitung seluruh fitur waveform dari array terurut waktu dalam satu kali jalan.
+
+    Args:
+        time_us (np.ndarray): waktu (µs), terurut naik.
+        amplitude_dB (np.ndarray): amplitudo (dB) sesuai urutan waktu.
+
+    Return:
+        dict: nilai mentah fitur (peak, rms, energi, lebar pulsa, waktu naik/turun, dst.)
+    """
+    N = len(amplitude_dB)
+    if N == 0:
+        return {
+            "peak_val": 0.0, "peak_time": 0.0, "mean_val": 0.0, "std_val": 0.0,
+            "rms_val": 0.0, "energy_proxy": 0.0, "crest_factor": 0.0,
+            "skew_val": 0.0, "kurt_val": 0.0, "pulse_width": 0.0,
+            "rise_time": 0.0, "fall_time": 0.0, "time_centroid": 0.0, "ent_val": 0.0,
+        }
+
+    # ===== Statistik dasar =====
+    idx_puncak = int(np.argmax(amplitude_dB))
+    peak_val = float(amplitude_dB[idx_puncak])
+    peak_time = float(time_us[idx_puncak])
+    kuadrat = amplitude_dB ** 2
+    mean_val = float(np.mean(amplitude_dB))
+    std_val = float(np.std(amplitude_dB))
+
+    # ===== Energi =====
+    energy_proxy = float(np.sum(kuadrat))
+    rms_val = float(np.sqrt(energy_proxy / N))
+    crest_factor = peak_val / rms_val if rms_val > 0 else 0.0
+
+    # ===== Statistik distribusi =====
+    skew_val = float(skew(amplitude_dB, bias=False))
+    kurt_val = float(kurtosis(amplitude_dB, bias=False))
+
+    # ===== Bentuk pulsa =====
+    # Ambang 50% (FWHM), 10% dan 90% dihitung sekaligus
+    awal, akhir = waktu_lintasan(time_us, amplitude_dB, [peak_val * 0.5, peak_val * 0.1, peak_val * 0.9])
+    t50, t10, t90 = awal
+    t50_akhir, t10_fall, t90_fall = akhir
+
+    pulse_width = float(t50_akhir - t50) if not np.isnan(t50) else 0.0
+    rise_time = float(t90 - t10)           # 10% → 90%
+    fall_time = float(t10_fall - t90_fall) # 90% → 10%
+
+    # Time centroid (weighted by amplitude^2)
+    time_centroid = float(np.sum(time_us * kuadrat) / energy_proxy)
+
+    # ===== Entropi =====
+    hist, _ = np.histogram(amplitude_dB, bins=50, density=True)
+    ent_val = float(entropy(hist + 1e-12))
+
+    return {
+        "peak_val": peak_val, "peak_time": peak_time, "mean_val": mean_val, "std_val": std_val,
+        "rms_val": rms_val, "energy_proxy": energy_proxy, "crest_factor": crest_factor,
+        "skew_val": skew_val, "kurt_val": kurt_val, "pulse_width": pulse_width,
+        "rise_time": rise_time, "fall_time": fall_time, "time_centroid": time_centroid, "ent_val": ent_val,
+    }
 
 # =========================================================
 # MODUL : EKSTRAKSI & ANALISIS PLOT WAVEFORM
@@ -13,21 +109,65 @@ class ProsesorWaveform:
     Kelas untuk ekstraksi + analisis Waveform PD
     """
 
-    def __init__(self, filepath=None, sensor_type="TEV"):
+    # Naikkan VERSI setiap kali algoritma ekstraksi/fitur berubah (membatalkan cache lama)
+    VERSI = "1"
+    RENTANG_WAKTU = (-5.0, 6.0)         # µs
+    RENTANG_AMPLITUDO = (-10.0, 25.0)   # dB
+
+    def __init__(self, filepath=None, sensor_type="TEV", cache=None):
         self.filepath = filepath
         self.sensor_type = sensor_type
+        self.cache = cache
         self.result = {}
 
-    def process_waveform(self):
+    def parameter_kalibrasi(self):
+        """Parameter yang memengaruhi hasil ekstraksi (bagian dari kunci cache)."""
+        return {
+            "rentang_waktu": list(self.RENTANG_WAKTU),
+            "rentang_amplitudo": list(self.RENTANG_AMPLITUDO),
+        }
+
+    def process_waveform(self, progres=None):
         """
-        Ekstraksi & analisis waveform dari gambar hasil pengukuran PD.
+        Ekstraksi & analisis waveform dari gambar hasil pengukuran PD
+        (extract_features + evaluate untuk self.sensor_type).
+        """
+        hasil = self.extract_features(progres)
+        self.result = {**hasil, "indikasi_pd": self.evaluate(self.sensor_type, hasil["features"])}
+        return self.result
+
+    def extract_features(self, progres=None):
+        """
+        Ekstraksi titik & fitur waveform (tidak bergantung jenis sensor).
+        Hasil diambil dari / disimpan ke cache bila tersedia.
+
+        Args:
+            progres (callable): opsional, dipanggil progres(persen, pesan) di setiap tahap
+                (dipakai pekerja latar belakang untuk progres & pembatalan).
+
+        Return:
+            dict: {"waveform_data_points": DataTitik, "features": dict}
         """
         if not self.filepath:
             raise ValueError("Filepath belum diisi!")
+        lapor = progres or (lambda persen, pesan="": None)
+        lapor(0, "Memeriksa cache")
+
+        # ---------------------------------------------------------
+        # 0) Cek cache (gambar + versi + kalibrasi sama → pakai fitur lama)
+        # ---------------------------------------------------------
+        kunci_cache = None
+        if self.cache is not None:
+            kunci_cache = self.cache.kunci(self.filepath, "waveform", self.VERSI, self.parameter_kalibrasi())
+            tersimpan = self.cache.ambil(kunci_cache)
+            if tersimpan is not None:
+                features, kolom = tersimpan
+                return {"waveform_data_points": DataTitik(**kolom), "features": features}
 
         # ---------------------------------------------------------
         # 1) Muat gambar
         # ---------------------------------------------------------
+        lapor(10, "Memuat gambar")
         img = cv2.imread(self.filepath)
         if img is None:
             raise ValueError(f"Gagal membaca file gambar: {self.filepath}")
@@ -35,6 +175,7 @@ class ProsesorWaveform:
         # ---------------------------------------------------------
         # 2) Konversi ke grayscale & threshold
         # ---------------------------------------------------------
+        lapor(30, "Threshold jejak")
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         _, mask = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY_INV)
 
@@ -43,7 +184,7 @@ class ProsesorWaveform:
         # ---------------------------------------------------------
         points = cv2.findNonZero(mask)
         if points is None:
-            return {"waveform_data_points": [], "features": {}, "indikasi_pd": "Tidak ada jejak"}
+            return {"waveform_data_points": DataTitik(time_us=[], amplitude_dB=[]), "features": {}}
 
         points = points.reshape(-1, 2)
         gh, gw = img.shape[:2]
@@ -51,78 +192,32 @@ class ProsesorWaveform:
         # ---------------------------------------------------------
         # 4) Konversi pixel ke skala (time: -5 → +6 µs, amplitude: -10 → +25 dB)
         # ---------------------------------------------------------
-        t_min, t_max = -5.0, 6.0  # µs
-        amp_min, amp_max = -10.0, 25.0  # dB
+        lapor(50, "Kalibrasi titik")
+        t_min, t_max = self.RENTANG_WAKTU
+        amp_min, amp_max = self.RENTANG_AMPLITUDO
 
-        waveform_data_points = []
-        for (px, py) in points:
-            t = (px / gw) * (t_max - t_min) + t_min
-            amp = (1 - py / gh) * (amp_max - amp_min) + amp_min
-            waveform_data_points.append({"time_us": float(t), "amplitude_dB": float(amp)})
+        # Konversi seluruh titik sekaligus (vektor), lalu urutkan berdasarkan waktu
+        px = points[:, 0].astype(np.float64)
+        py = points[:, 1].astype(np.float64)
+        t = (px / gw) * (t_max - t_min) + t_min
+        amp = (1 - py / gh) * (amp_max - amp_min) + amp_min
 
-        df = pd.DataFrame(waveform_data_points).sort_values("time_us")
+        urutan = np.argsort(t, kind="stable")
+        waveform_data_points = DataTitik(time_us=t[urutan], amplitude_dB=amp[urutan])
 
         # ---------------------------------------------------------
         # 5) Analisis fitur waveform
         # ---------------------------------------------------------
-        N = len(df)
-
-        if N > 0:
-            # ===== Statistik dasar =====
-            peak_val = float(df["amplitude_dB"].max())
-            peak_time = float(df.loc[df["amplitude_dB"].idxmax(), "time_us"])
-            mean_val = float(df["amplitude_dB"].mean())
-            std_val = float(df["amplitude_dB"].std(ddof=0))
-            rms_val = float(np.sqrt(np.mean(df["amplitude_dB"]**2)))
-
-            # ===== Energi =====
-            energy_proxy = float(np.sum(df["amplitude_dB"]**2))
-            crest_factor = peak_val / rms_val if rms_val > 0 else 0.0
-
-            # ===== Statistik distribusi =====
-            skew_val = float(skew(df["amplitude_dB"], bias=False))
-            kurt_val = float(kurtosis(df["amplitude_dB"], bias=False))
-
-            # ===== Bentuk pulsa =====
-            # Pulse width (FWHM)
-            half_peak = peak_val * 0.5
-            above_half = df[df["amplitude_dB"] >= half_peak]
-            if not above_half.empty:
-                pulse_width = float(above_half["time_us"].max() - above_half["time_us"].min())
-            else:
-                pulse_width = 0.0
-
-            # Rise time (10% → 90%)
-            tenth = peak_val * 0.1
-            ninetieth = peak_val * 0.9
-            try:
-                t10 = float(df[df["amplitude_dB"] >= tenth]["time_us"].min())
-                t90 = float(df[df["amplitude_dB"] >= ninetieth]["time_us"].min())
-                rise_time = t90 - t10
-            except:
-                rise_time = 0.0
-
-            # Fall time (90% → 10%)
-            try:
-                t90_fall = float(df[df["amplitude_dB"] >= ninetieth]["time_us"].max())
-                t10_fall = float(df[df["amplitude_dB"] >= tenth]["time_us"].max())
-                fall_time = t10_fall - t90_fall
-            except:
-                fall_time = 0.0
-
-            # Time centroid (weighted by amplitude^2)
-            weights = df["amplitude_dB"]**2
-            time_centroid = float(np.sum(df["time_us"] * weights) / np.sum(weights))
-
-            # ===== Entropi =====
-            hist, _ = np.histogram(df["amplitude_dB"], bins=50, density=True)
-            ent_val = float(entropy(hist + 1e-12))
+        lapor(70, "Analisis fitur")
+        N = len(waveform_data_points)
+        fitur = fitur_waveform(waveform_data_points["time_us"], waveform_data_points["amplitude_dB"])
 
-        else:
-            peak_val = peak_time = mean_val = std_val = rms_val = 0.0
-            energy_proxy = crest_factor = skew_val = kurt_val = 0.0
-            pulse_width = rise_time = fall_time = time_centroid = 0.0
-            ent_val = 0.0
+        peak_val, peak_time = fitur["peak_val"], fitur["peak_time"]
+        mean_val, std_val, rms_val = fitur["mean_val"], fitur["std_val"], fitur["rms_val"]
+        energy_proxy, crest_factor = fitur["energy_proxy"], fitur["crest_factor"]
+        skew_val, kurt_val = fitur["skew_val"], fitur["kurt_val"]
+        pulse_width, rise_time, fall_time = fitur["pulse_width"], fitur["rise_time"], fitur["fall_time"]
+        time_centroid, ent_val = fitur["time_centroid"], fitur["ent_val"]
 
         # ---------------------------------------------------------
         # 6) Tampilkan hasil analisis waveform
@@ -152,26 +247,47 @@ class ProsesorWaveform:
             "Entropi": float(ent_val),
         }
 
-        # ---------------------------------------------------------
-        # 7) Indikasi PD Waveform (aturan threshold sederhana)
-        # ---------------------------------------------------------
+        lapor(95, "Menyimpan hasil")
+        if kunci_cache is not None:
+            self.cache.simpan(kunci_cache, features, waveform_data_points.kolom)
+
+        return {"waveform_data_points": waveform_data_points, "features": features}
+
+    def evaluate(self, sensor_type=None, features=None):
+        """
+        Indikasi PD waveform (aturan threshold sederhana) untuk satu jenis sensor.
+        Hanya membaca fitur, sehingga bisa dinilai ulang untuk sensor lain tanpa ekstraksi ulang.
+
+        Args:
+            sensor_type (str): jenis sensor (default: self.sensor_type).
+            features (dict): fitur hasil extract_features (default: fitur di self.result).
+
+        Return:
+            str: "Ada", "Tidak signifikan" atau "Tidak ada jejak".
+        """
+        if sensor_type is None:
+            sensor_type = self.sensor_type
+        if features is None:
+            features = self.result.get("features", {})
+        if not features:
+            return "Tidak ada jejak"
+
+        peak_val = features["Puncak (dB)"]
+        rms_val = features["RMS (dB)"]
+        energy_proxy = features["Proksi Energi"]
+
         pd_flag = False
-        if self.sensor_type == "TEV":
+        if sensor_type == "TEV":
             if peak_val >= 20 or rms_val >= 5:
                 pd_flag = True
-        elif self.sensor_type == "HFCT":
+        elif sensor_type == "HFCT":
             if peak_val >= 30 or energy_proxy >= 10000:
                 pd_flag = True
         else:
             if peak_val >= 15:
                 pd_flag = True
 
-        self.result = {
-            "waveform_data_points": waveform_data_points,
-            "features": features,
-            "indikasi_pd": "Ada" if pd_flag else "Tidak signifikan"
-        }
-        return self.result
+        return "Ada" if pd_flag else "Tidak signifikan"
 
     
     # ---------------------------------------------------------
@@ -183,8 +299,12 @@ class ProsesorWaveform:
         """
         if not self.result:
             raise ValueError("Belum ada hasil. Jalankan proses ektraksi & analisis() dulu.")
+        hasil = dict(self.result)
+        hasil["waveform_data_points"] = DataTitik.ensure(
+            hasil.get("waveform_data_points"), ["time_us", "amplitude_dB"]
+        ).to_records()
         with open(json_out, "w", encoding="utf-8") as f:
-            json.dump(self.result, f, indent=4)
+            json.dump(hasil, f, indent=4)
 
     def load_waveform_result(self, json_file):
         """
@@ -193,10 +313,13 @@ class ProsesorWaveform:
         try:
             with open(json_file, "r", encoding="utf-8") as f:
                 self.result = json.load(f)
+            self.result["waveform_data_points"] = DataTitik.ensure(
+                self.result.get("waveform_data_points"), ["time_us", "amplitude_dB"]
+            )
             return self.result
         except Exception as e:
             self.result = {
-                "waveform_data_points": [],
+                "waveform_data_points": DataTitik(time_us=[], amplitude_dB=[]),
                 "features": {},
                 "indikasi_pd": f"Gagal memuat: {e}",
             }
@@ -0,0 +1,170 @@
+import math
+import numpy as np
+from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+# =========================================================
+# MODUL : BACKEND KLASTER PRPD
+# =========================================================
+# Setiap backend menerima array titik (N, 2) = [fasa, dB] dan mengembalikan
+# label per titik seperti DBSCAN (-1 = noise, 0..k-1 = nomor klaster).
+# Kesetaraan backend grid dengan DBSCAN dicek lewat: python -m PlotAnalysis.cek_klaster_prpd
+
+
+def klaster_dbscan(arr, eps=5.0, min_samples=10):
+    """
+    Backend klaster DBSCAN (sklearn). Akurat, tetapi waktu & memori
+    membengkak pada awan titik PRPD yang padat. Dipakai untuk validasi.
+    """
+    from sklearn.cluster import DBSCAN
+    return DBSCAN(eps=eps, min_samples=min_samples).fit(arr).labels_
+
+
+def klaster_grid(arr, eps=5.0, min_samples=10):
+    """
+    Backend klaster berbasis grid okupansi 2D (hasil sama dengan DBSCAN, hampir linear).
+
+    Langkah:
+    1) Bidang fasa–dB dibagi sel berukuran eps/√2, sehingga semua titik
+       dalam satu sel pasti saling bertetangga (jarak <= eps).
+    2) Sel berisi >= min_samples titik → semua titiknya dianggap inti.
+       Titik di sel jarang dihitung tetangganya secara eksak (KD-tree lokal).
+    3) Titik inti yang berjarak <= eps digabung secara eksak per pasangan sel
+       bertetangga (KD-tree + connected components, lihat _gabung_inti) → klaster.
+    4) Titik non-inti yang berjarak <= eps dari titik inti menjadi titik tepi.
+    """
+    arr = np.asarray(arr, dtype=float)
+    N = len(arr)
+    labels = np.full(N, -1, dtype=np.int64)
+    if N == 0:
+        return labels
+
+    # 1) Indeks sel setiap titik
+    sisi = eps / math.sqrt(2)
+    sel = np.floor((arr - arr.min(axis=0)) / sisi).astype(np.int64)
+    nx, ny = (sel.max(axis=0) + 1).tolist()
+    sel_id = sel[:, 0] * ny + sel[:, 1]
+    okupansi = np.bincount(sel_id, minlength=nx * ny)
+
+    # 2) Titik inti
+    inti = okupansi[sel_id] >= min_samples
+    jangkauan = int(math.ceil(eps / sisi))          # jarak sel maksimum antar tetangga
+    struktur = np.ones((2 * jangkauan + 1, 2 * jangkauan + 1), dtype=bool)
+
+    jarang = np.flatnonzero(~inti)
+    kandidat = None
+    if len(jarang) > 0:
+        # Hanya titik di sekitar sel jarang yang masuk KD-tree
+        grid_jarang = np.zeros(nx * ny, dtype=bool)
+        grid_jarang[sel_id[jarang]] = True
+        grid_jarang = ndimage.binary_dilation(grid_jarang.reshape(nx, ny), structure=struktur).ravel()
+        kandidat = np.flatnonzero(grid_jarang[sel_id])
+        jumlah = cKDTree(arr[kandidat]).query_ball_point(arr[jarang], r=eps, return_length=True)
+        inti[jarang] = jumlah >= min_samples
+
+    if not inti.any():
+        return labels
+
+    # 3) Gabungkan titik inti yang berjarak <= eps → klaster
+    labels[inti] = _gabung_inti(arr[inti], sel[inti], ny, eps)
+
+    # 4) Titik tepi: non-inti yang dekat dengan titik inti
+    tepi = np.flatnonzero(~inti)
+    if len(tepi) > 0 and kandidat is not None:
+        inti_lokal = kandidat[inti[kandidat]]
+        if len(inti_lokal) > 0:
+            jarak, idx = cKDTree(arr[inti_lokal]).query(arr[tepi], k=1, distance_upper_bound=eps * (1 + 1e-9))
+            dekat = np.isfinite(jarak)
+            labels[tepi[dekat]] = labels[inti_lokal[idx[dekat]]]
+
+    # Nomori ulang label klaster menjadi 0..k-1
+    terpakai = labels >= 0
+    if terpakai.any():
+        _, labels[terpakai] = np.unique(labels[terpakai], return_inverse=True)
+    return labels
+
+
+def _gabung_inti(titik, sel, ny, eps):
+    """
+    Label komponen terhubung titik inti: dua titik inti bertetangga jika jaraknya <= eps (eksak).
+
+    - Titik dalam satu sel (sisi eps/√2) pasti saling bertetangga → cukup menghubungkan sel.
+    - Pasangan sel bertetangga (selisih indeks <= 2) diuji dulu dengan titik ekstrem tiap sel
+      (uji cepat, cukup untuk sel padat yang bersebelahan).
+    - Pasangan yang masih berada di komponen berbeda diuji dengan semua titiknya.
+    Kedua uji memakai satu KD-tree 3D dengan koordinat ketiga = nomor sel × jarak besar,
+    sehingga tetangga dalam jarak eps hanya bisa ditemukan di sel yang dituju.
+    """
+    sel_id = sel[:, 0] * ny + sel[:, 1]
+    sel_unik, nomor = np.unique(sel_id, return_inverse=True)
+    K = len(sel_unik)
+    urutan = np.argsort(nomor, kind="stable")
+    awal = np.searchsorted(nomor[urutan], np.arange(K + 1))
+    jumlah = np.diff(awal)
+
+    # Pasangan sel inti bertetangga (setengah stensil 5×5 → tiap pasangan sekali)
+    cx, cy = sel_unik // ny, sel_unik % ny
+    pasangan = []
+    for dx in range(0, 3):
+        for dy in range(-2, 3):
+            if dx == 0 and dy <= 0:
+                continue
+            tx, ty = cx + dx, cy + dy
+            kunci = tx * ny + ty
+            j = np.minimum(np.searchsorted(sel_unik, kunci), K - 1)
+            ada = (ty >= 0) & (ty < ny) & (sel_unik[j] == kunci)
+            pasangan.append(np.column_stack((np.flatnonzero(ada), j[ada])))
+    pasangan = np.concatenate(pasangan)
+    if len(pasangan) == 0:
+        return nomor
+
+    skala = 4.0 * eps
+    pohon = cKDTree(np.column_stack((titik, nomor * skala)))
+
+    def bertetangga(idx_titik, sel_tujuan):
+        """True jika titik[idx_titik] punya titik inti dalam jarak eps di sel_tujuan."""
+        kueri = np.column_stack((titik[idx_titik], sel_tujuan * skala))
+        jarak, _ = pohon.query(kueri, k=1, distance_upper_bound=eps * (1 + 1e-9))
+        return jarak <= eps
+
+    def komponen(tersambung):
+        a, b = tersambung[:, 0], tersambung[:, 1]
+        graf = coo_matrix((np.ones(len(a), dtype=np.int8), (a, b)), shape=(K, K))
+        return connected_components(graf, directed=False)[1]
+
+    # Uji cepat: titik ekstrem (min/maks x, y, x+y, x−y) tiap sel terhadap seluruh sel tetangganya
+    wakil = []
+    for nilai in (titik[:, 0], titik[:, 1], titik[:, 0] + titik[:, 1], titik[:, 0] - titik[:, 1]):
+        urut_nilai = np.lexsort((nilai, nomor))
+        wakil += [urut_nilai[awal[:-1]], urut_nilai[awal[1:] - 1]]
+    wakil = np.stack(wakil, axis=1)                         # (K, 8) indeks titik wakil
+    n_wakil = wakil.shape[1]
+    kiri, kanan = pasangan[:, 0], pasangan[:, 1]
+    idx = np.concatenate((wakil[kiri].ravel(), wakil[kanan].ravel()))
+    tujuan = np.concatenate((np.repeat(kanan, n_wakil), np.repeat(kiri, n_wakil)))
+    cocok = bertetangga(idx, tujuan).reshape(2, len(pasangan), n_wakil).any(axis=(0, 2))
+    tersambung = pasangan[cocok]
+    label_sel = komponen(tersambung)
+
+    # Uji lengkap: pasangan yang belum tersambung → semua titik sel yang lebih kecil
+    sisa = pasangan[label_sel[kiri] != label_sel[kanan]]
+    if len(sisa):
+        tukar = jumlah[sisa[:, 0]] > jumlah[sisa[:, 1]]
+        asal = np.where(tukar, sisa[:, 1], sisa[:, 0])
+        tujuan = np.where(tukar, sisa[:, 0], sisa[:, 1])
+        n = jumlah[asal]
+        ke_pasangan = np.repeat(np.arange(len(sisa)), n)
+        posisi = awal[asal][ke_pasangan] + np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        cocok = bertetangga(urutan[posisi], tujuan[ke_pasangan])
+        sambung = np.bincount(ke_pasangan[cocok], minlength=len(sisa)) > 0
+        label_sel = komponen(np.concatenate((tersambung, sisa[sambung])))
+
+    return label_sel[nomor]
+
+
+BACKEND_KLASTER = {
+    "grid": klaster_grid,
+    "dbscan": klaster_dbscan,
+}
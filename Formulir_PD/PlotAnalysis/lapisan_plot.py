@@ -0,0 +1,182 @@
+import numpy as np
+
+# =========================================================
+# MODUL : LAPISAN PLOT DINAMIS (KERAPATAN PRPD & DESIMASI WAVEFORM)
+# =========================================================
+# Awan titik hasil ekstraksi bisa berisi ratusan ribu titik. Menggambar semuanya sebagai
+# scatter/line membuat draw dan setiap pan/zoom NavigationToolbar sangat lambat.
+# Lapisan di sini hanya menggambar sebanyak piksel yang tampil:
+# - PRPD     : histogram 2D area pandang → gambar kerapatan (imshow); scatter asli saat di-zoom.
+# - Waveform : min/max per kolom piksel; garis asli saat di-zoom.
+# Setiap perubahan batas axes (zoom, pan, home, resize) menjadwalkan satu hitung ulang.
+
+BATAS_TITIK_DETAIL = 20000  # titik PRPD terlihat maksimum untuk digambar sebagai scatter asli
+PIKSEL_PER_SEL = 2          # ukuran sel histogram PRPD di layar (≈ marker scatter s=5)
+WARNA_KERAPATAN = ("#9ecae1", "#08306b")   # biru muda (jarang) → biru tua (rapat)
+
+
+def _urut(x, *kolom):
+    """Urutkan kolom menurut x (dilewati jika sudah urut, misal hasil ProsesorPRPD)."""
+    x = np.asarray(x, dtype=float)
+    kolom = [np.asarray(k, dtype=float) for k in kolom]
+    if len(x) > 1 and np.any(np.diff(x) < 0):
+        urutan = np.argsort(x, kind="stable")
+        return (x[urutan], *(k[urutan] for k in kolom))
+    return (x, *kolom)
+
+
+class _LapisanDinamis:
+    """Dasar lapisan yang digambar ulang sesuai area pandang axes (bukan sesuai jumlah data)."""
+
+    def __init__(self, axes, x, y):
+        self.axes = axes
+        self.canvas = axes.figure.canvas
+        self.x, self.y = _urut(x, y)
+        self._kunci = None      # (batas x, batas y, ukuran piksel) terakhir yang digambar
+        self._aktif = True
+
+        # Batas awal = seluruh data (dengan margin bawaan axes), lalu autoscale dimatikan
+        # agar artist yang isinya berganti tidak ikut menggeser batas pandang
+        axes.update_datalim([(self.x.min(), self.y.min()), (self.x.max(), self.y.max())])
+        axes.autoscale_view()
+        axes.set_autoscale_on(False)
+
+        # Pan/zoom mengubah xlim & ylim berturut-turut → digabung jadi satu hitung ulang
+        self._timer = self.canvas.new_timer(interval=0)
+        self._timer.single_shot = True
+        self._timer.add_callback(self._gambar_ulang)
+        self._cid_axes = [
+            axes.callbacks.connect("xlim_changed", self._jadwalkan),
+            axes.callbacks.connect("ylim_changed", self._jadwalkan),
+        ]
+        self._cid_canvas = self.canvas.mpl_connect("resize_event", self._jadwalkan)
+
+    def _jadwalkan(self, *_):
+        if self._aktif:
+            self._timer.start()
+
+    def _gambar_ulang(self):
+        if self._aktif and self.perbarui():
+            self.canvas.draw_idle()
+
+    def perbarui(self):
+        """
+        Hitung ulang isi artist untuk area pandang saat ini.
+
+        Return:
+            bool: True jika artist berubah (perlu draw ulang).
+        """
+        x0, x1 = sorted(self.axes.get_xlim())
+        y0, y1 = sorted(self.axes.get_ylim())
+        lebar = max(int(self.axes.bbox.width), 1)
+        tinggi = max(int(self.axes.bbox.height), 1)
+        kunci = (x0, x1, y0, y1, lebar, tinggi)
+        if kunci == self._kunci:
+            return False
+        self._kunci = kunci
+        self._render(x0, x1 if x1 > x0 else x0 + 1.0, y0, y1 if y1 > y0 else y0 + 1.0, lebar, tinggi)
+        return True
+
+    def _render(self, x0, x1, y0, y1, lebar, tinggi):
+        raise NotImplementedError
+
+    def lepas(self):
+        """Putuskan callback & timer (dipanggil sebelum axes dibersihkan / canvas dihapus)."""
+        if not self._aktif:
+            return
+        self._aktif = False
+        self._timer.stop()
+        for cid in self._cid_axes:
+            self.axes.callbacks.disconnect(cid)
+        self.canvas.mpl_disconnect(self._cid_canvas)
+
+
+# ---------------------------------------------------------
+# PRPD : GAMBAR KERAPATAN / SCATTER
+# ---------------------------------------------------------
+class LapisanPRPD(_LapisanDinamis):
+    """
+    Awan titik PRPD sebagai gambar kerapatan (log jumlah titik per sel piksel).
+    Jika titik di area pandang <= batas_detail, titik asli digambar sebagai scatter.
+
+    Contoh:
+        lapisan = LapisanPRPD(canvas.axes, titik["phase_deg"], titik["intensity_dB"], c="blue")
+        canvas.draw()
+        ...
+        lapisan.lepas(); canvas.axes.clear()
+    """
+
+    def __init__(self, axes, phase_deg, intensity_dB, batas_detail=BATAS_TITIK_DETAIL, s=5, c="blue"):
+        from matplotlib.colors import LinearSegmentedColormap
+
+        super().__init__(axes, phase_deg, intensity_dB)
+        self.batas_detail = batas_detail
+
+        self.titik = axes.scatter([], [], s=s, c=c)
+        self.kerapatan = axes.imshow(
+            np.ma.masked_all((1, 1)), origin="lower", aspect="auto", interpolation="nearest",
+            cmap=LinearSegmentedColormap.from_list("kerapatan_prpd", WARNA_KERAPATAN)
+        )
+        self.perbarui()
+
+    def _render(self, x0, x1, y0, y1, lebar, tinggi):
+        # Titik sudah urut menurut fasa → potongan area pandang lewat binary search
+        i0 = np.searchsorted(self.x, x0, side="left")
+        i1 = np.searchsorted(self.x, x1, side="right")
+        x, y = self.x[i0:i1], self.y[i0:i1]
+        tampak = (y >= y0) & (y <= y1)
+        x, y = x[tampak], y[tampak]
+
+        if len(x) <= self.batas_detail:
+            self.titik.set_offsets(np.column_stack((x, y)))
+            self.titik.set_visible(True)
+            self.kerapatan.set_visible(False)
+            return
+
+        nx = max(lebar // PIKSEL_PER_SEL, 1)
+        ny = max(tinggi // PIKSEL_PER_SEL, 1)
+        ix = np.minimum(((x - x0) * (nx / (x1 - x0))).astype(np.intp), nx - 1)
+        iy = np.minimum(((y - y0) * (ny / (y1 - y0))).astype(np.intp), ny - 1)
+        jumlah = np.bincount(iy * nx + ix, minlength=nx * ny).reshape(ny, nx)
+
+        # Sel kosong transparan; skala log supaya cluster jarang tetap terlihat di samping cluster rapat
+        nilai = np.log1p(jumlah)
+        self.kerapatan.set_data(np.ma.masked_equal(nilai, 0))
+        self.kerapatan.set_extent((x0, x1, y0, y1))
+        self.kerapatan.set_clim(0, max(nilai.max(), 1.0))
+        self.kerapatan.set_visible(True)
+        self.titik.set_visible(False)
+
+
+# ---------------------------------------------------------
+# WAVEFORM : DESIMASI MIN/MAX PER KOLOM PIKSEL
+# ---------------------------------------------------------
+class LapisanWaveform(_LapisanDinamis):
+    """
+    Garis waveform yang dipangkas menjadi pasangan min/max per kolom piksel.
+    Jika sampel di area pandang <= 2 × lebar piksel, sampel asli digambar apa adanya.
+
+    Contoh:
+        lapisan = LapisanWaveform(canvas.axes, titik["time_us"], titik["amplitude_dB"], c="red", linewidth=1)
+    """
+
+    def __init__(self, axes, time_us, amplitude_dB, **gaya):
+        super().__init__(axes, time_us, amplitude_dB)
+        self.garis, = axes.plot([], [], **gaya)
+        self.perbarui()
+
+    def _render(self, x0, x1, y0, y1, lebar, tinggi):
+        # Satu sampel di luar area pandang di kiri & kanan agar garis tidak terputus di tepi
+        i0 = max(np.searchsorted(self.x, x0, side="left") - 1, 0)
+        i1 = min(np.searchsorted(self.x, x1, side="right") + 1, len(self.x))
+        t, a = self.x[i0:i1], self.y[i0:i1]
+
+        if len(t) <= 2 * lebar:
+            self.garis.set_data(t, a)
+            return
+
+        kolom = ((t - x0) * (lebar / (x1 - x0))).astype(np.intp)
+        awal = np.concatenate(([0], np.flatnonzero(np.diff(kolom)) + 1))
+        minimum = np.minimum.reduceat(a, awal)
+        maksimum = np.maximum.reduceat(a, awal)
+        self.garis.set_data(np.repeat(t[awal], 2), np.column_stack((minimum, maksimum)).ravel())
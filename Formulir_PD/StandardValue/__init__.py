@@ -2,12 +2,27 @@ from .klasifikasi_pd_tev import KlasifikasiPDTEV
 from .klasifikasi_pd_hfct import KlasifikasiPDHFCT
 from .klasifikasi_pd_ultrasonik import KlasifikasiPDUltrasonik
 from .klasifikasi_pd_final import KlasifikasiPDFinal
+from .tabel_keputusan import TABEL_KEPUTUSAN, muat_tabel_keputusan, ekspor_aturan_bawaan
 from .update_hasil_klasifikasi import UpdateHasilKlasifikasi
 
 __all__ = [
     "KlasifikasiPDTEV",
     "KlasifikasiPDHFCT",
-    "KlasifikasiPDUltrasonik"
-    "KlasifikasiPDFinal"
+    "KlasifikasiPDUltrasonik",
+    "KlasifikasiPDFinal",
+    "KlasifikasiPDTEVBatch",
+    "KlasifikasiPDHFCTBatch",
+    "KlasifikasiPDUltrasonikBatch",
+    "TABEL_KEPUTUSAN",
+    "muat_tabel_keputusan",
+    "ekspor_aturan_bawaan",
     "UpdateHasilKlasifikasi"
 ]
+
+
+def __getattr__(nama):
+    """Versi batch (numpy) baru diimpor saat pertama kali dipakai; tabel formulir cukup versi skalar."""
+    if nama in ("KlasifikasiPDTEVBatch", "KlasifikasiPDHFCTBatch", "KlasifikasiPDUltrasonikBatch"):
+        from . import klasifikasi_pd_batch
+        return getattr(klasifikasi_pd_batch, nama)
+    raise AttributeError(f"module {__name__!r} has no attribute {nama!r}")
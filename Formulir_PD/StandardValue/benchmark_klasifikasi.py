@@ -0,0 +1,299 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+# === Setup path agar bisa dijalankan sebagai "python -m StandardValue.benchmark_klasifikasi" dari folder proyek ===
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from StandardValue.klasifikasi_pd_tev import KlasifikasiPDTEV
+from StandardValue.klasifikasi_pd_hfct import KlasifikasiPDHFCT
+from StandardValue.klasifikasi_pd_ultrasonik import KlasifikasiPDUltrasonik
+from StandardValue.klasifikasi_pd_batch import (
+    KlasifikasiPDTEVBatch, KlasifikasiPDHFCTBatch, KlasifikasiPDUltrasonikBatch
+)
+
+# =========================================================
+# MODUL : MICRO-BENCHMARK KLASIFIKASI PD
+# =========================================================
+# Membandingkan fungsi klasifikasi berbasis tabel keputusan (tabel_keputusan.py) dengan
+# implementasi referensi if-else (matriks & teks disusun ulang di setiap panggilan), sekaligus
+# memastikan keduanya memberi hasil identik pada sampel acak yang sama.
+#
+# Pemakaian:
+#   python -m StandardValue.benchmark_klasifikasi --jumlah 50000
+
+
+# ---------------------------------------------------------
+# IMPLEMENTASI REFERENSI (ATURAN BAWAAN, TANPA TABEL)
+# ---------------------------------------------------------
+def _referensi_tev(nilai_db=None, ppc=None, interpretasi=None):
+    if (nilai_db is None or nilai_db == 0) and (ppc is None or ppc == 0) and not interpretasi:
+        return {"tingkat_keparahan": "Tidak Ada Data",
+                "rekomendasi": "Tidak dapat menentukan – data tidak tersedia"}
+    nilai_db = nilai_db or 0
+    ppc = ppc or 0
+
+    if nilai_db < 10:
+        d_zone = "D0"
+    elif 10 <= nilai_db <= 19:
+        d_zone = "D1"
+    elif 20 <= nilai_db <= 29:
+        d_zone = "D2"
+    else:
+        d_zone = "D3"
+
+    if ppc <= 4:
+        p_zone, tipe_ppc = "P0", "Sangat rendah / kemungkinan noise"
+    elif 5 <= ppc <= 19:
+        p_zone, tipe_ppc = "P1", "Discharge berulang (rendah–menengah)"
+    else:
+        p_zone, tipe_ppc = "P2", "Discharge signifikan / permukaan"
+
+    matrix = {
+        ("D0", "P0"): ("a", "Tidak memerlukan perhatian"),
+        ("D0", "P1"): ("b", "PPC tinggi, kemungkinan noise"),
+        ("D0", "P2"): ("d", "Kemungkinan discharge permukaan – cek ultrasonik"),
+        ("D1", "P0"): ("a", "Tidak memerlukan perhatian"),
+        ("D1", "P1"): ("c", "Kemungkinan PD tingkat rendah"),
+        ("D1", "P2"): ("d", "Kemungkinan discharge permukaan – cek ultrasonik"),
+        ("D2", "P0"): ("e", "Kemungkinan PD tingkat menengah"),
+        ("D2", "P1"): ("e", "Kemungkinan PD tingkat menengah"),
+        ("D2", "P2"): ("d", "Kemungkinan discharge permukaan – cek ultrasonik"),
+        ("D3", "P0"): ("f", "Kemungkinan PD tingkat tinggi"),
+        ("D3", "P1"): ("f", "Kemungkinan PD tingkat tinggi"),
+        ("D3", "P2"): ("g", "Kemungkinan logam mengambang / koneksi jelek (atau noise sangat tinggi)"),
+    }
+    kode, dasar_kode = matrix[(d_zone, p_zone)]
+
+    if (d_zone, p_zone) in [("D0", "P0"), ("D1", "P0"), ("D0", "P1")]:
+        tingkat_keparahan = "Noise / Insignifikan"
+        dasar_db = "Tidak memerlukan perhatian; survey ulang 12 bulan"
+    elif (d_zone, p_zone) in [("D0", "P2"), ("D1", "P1"), ("D1", "P2")]:
+        tingkat_keparahan = "Rendah"
+        dasar_db = "Survey ulang 6 bulan untuk trending"
+    elif d_zone == "D2":
+        tingkat_keparahan = "Sedang"
+        dasar_db = "Investigasi & penlokasi PD; perbaiki secepat praktis"
+    else:
+        tingkat_keparahan = "Tinggi"
+        dasar_db = "Prioritas tinggi; perbaiki secepatnya"
+
+    aturan_ppc = ""
+    if p_zone == "P2":
+        aturan_ppc = "Cek ultrasonik & validasi fase/PRPD"
+        if ppc >= 50:
+            aturan_ppc += " | PPC sangat tinggi → curigai noise/EMI atau koneksi longgar"
+
+    if interpretasi and interpretasi.lower() in list("abcdefg"):
+        kode = interpretasi.lower()
+
+    return {"tingkat_keparahan": tingkat_keparahan,
+            "rekomendasi": f"[{kode}], {dasar_kode}, {dasar_db}, {tipe_ppc}, {aturan_ppc}"}
+
+
+def _referensi_hfct(nilai_pc=None, ppc=None, unipolar_waveform=None, cluster_dua_gelombang=None):
+    if (not nilai_pc or nilai_pc == 0) and (not ppc or ppc == 0) \
+       and (not unipolar_waveform) and (not cluster_dua_gelombang):
+        return {"tingkat_keparahan": "Tidak Ada Data",
+                "rekomendasi": "Tidak dapat menentukan – data tidak tersedia"}
+    nilai_pc = nilai_pc or 0
+    ppc = ppc or 0
+    unipolar_waveform = (unipolar_waveform or "").lower()
+    cluster_dua_gelombang = (cluster_dua_gelombang or "").lower()
+
+    if cluster_dua_gelombang != "ada":
+        if nilai_pc > 500:
+            level, flag = 2, "Flagged suspect noise (cek coupling / sensor lain)"
+        elif ppc > 50:
+            level, flag = 0, "Kemungkinan noise/EMI – pola repetitif tanpa cluster"
+        else:
+            level, flag = 0, "Tidak signifikan; kemungkinan noise"
+    else:
+        if nilai_pc < 250:
+            level = 1
+        elif 250 <= nilai_pc <= 500:
+            level = 2
+        else:
+            level = 3
+        flag = ""
+        if 5 <= ppc <= 20:
+            level = min(level + 1, 3)
+        elif ppc > 20:
+            level = min(level + 2, 3)
+
+    if unipolar_waveform == "ada":
+        if cluster_dua_gelombang == "ada":
+            level = max(level - 1, 1)
+            flag += " (Unipolar → PD lemah)"
+        else:
+            level = max(level - 1, 0)
+            flag += " (Unipolar tanpa cluster → lebih noise-like)"
+
+    tingkat = {0: "Noise / Insignifikan", 1: "Rendah", 2: "Sedang", 3: "Tinggi"}[level]
+    rekomendasi = {
+        0: "Survey ulang dalam 12 bulan",
+        1: "Survey ulang dalam 6 bulan (trending)",
+        2: "Investigasi & penlokasi PD; perbaiki secepat praktis",
+        3: "Prioritas tinggi; perbaiki secepatnya"
+    }[level]
+    if flag:
+        rekomendasi += f" → {flag.strip()}"
+    return {"tingkat_keparahan": tingkat, "rekomendasi": rekomendasi}
+
+
+def _referensi_ultrasonik(nilai_dbuv=None, kepastian=None, cluster_dua_gelombang=None,
+                          suara_gemerosok=None, interpretasi=None, sensor="UltraDish"):
+    nilai_dbuv = nilai_dbuv or 0
+    kepastian = kepastian or 0
+    cluster_dua_gelombang = (cluster_dua_gelombang or "").lower()
+    suara_gemerosok = (suara_gemerosok or "").lower()
+    interpretasi = (interpretasi or "").lower()
+
+    if nilai_dbuv < 3:
+        level = 1 if kepastian > 70 else 0
+    elif 3 <= nilai_dbuv <= 6:
+        level = 0 if kepastian <= 50 else 1 if kepastian <= 70 else 2
+    else:
+        level = 1 if kepastian <= 50 else 2 if kepastian <= 70 else 3
+
+    if cluster_dua_gelombang == "ada":
+        level = min(level + 1, 3)
+    elif cluster_dua_gelombang == "tidak ada":
+        if nilai_dbuv > 6 and kepastian > 70:
+            level = max(level - 1, 0)
+        elif nilai_dbuv > 500:
+            level = 2
+        else:
+            level = 0
+    if suara_gemerosok == "ada":
+        level = min(level + 1, 3)
+    if interpretasi == "noise" and level > 0:
+        level = max(level - 1, 0)
+
+    bobot = {"contact probe": 1.2, "ultradish": 1.0, "flexible mic": 0.8}.get(sensor.lower(), 1.0)
+    level = max(0, min(round(level * bobot), 3))
+    tingkat = {0: "Noise / Insignifikan", 1: "Rendah", 2: "Sedang", 3: "Tinggi"}[level]
+    rekomendasi = {
+        0: "Survey ulang dalam 12 bulan untuk trending",
+        1: "Survey ulang dalam 6 bulan untuk trending",
+        2: "Investigasi & penlokasi PD; perbaiki secepat praktis",
+        3: "Prioritas tinggi; perbaiki secepatnya"
+    }[level]
+    return {"tingkat_keparahan": tingkat, "rekomendasi": rekomendasi}
+
+
+# ---------------------------------------------------------
+# DATA SAMPEL & PENGUKURAN
+# ---------------------------------------------------------
+def _angka(acak, batas):
+    """Nilai acak: kosong, tepat di batas zona, atau bebas (termasuk pecahan)."""
+    r = acak.random()
+    if r < 0.1:
+        return None
+    if r < 0.5:
+        return acak.choice(batas)
+    return round(acak.uniform(-5, max(batas) * 1.3), acak.choice([0, 0, 1, 2]))
+
+
+def _teks(acak, pilihan):
+    return acak.choice(list(pilihan) + [None, ""])
+
+
+def buat_sampel(jumlah, seed=0):
+    """Baris input acak per sensor (dict nama → list of kwargs)."""
+    acak = random.Random(seed)
+    return {
+        "TEV": [dict(nilai_db=_angka(acak, [0, 9, 10, 19, 19.5, 20, 29, 30]),
+                     ppc=_angka(acak, [0, 4, 5, 19, 20, 50]),
+                     interpretasi=_teks(acak, "abcdefgh"))
+                for _ in range(jumlah)],
+        "HFCT": [dict(nilai_pc=_angka(acak, [0, 249, 250, 500, 501]),
+                      ppc=_angka(acak, [0, 4, 5, 20, 21, 50, 51]),
+                      unipolar_waveform=_teks(acak, ["Ada", "Tidak Ada"]),
+                      cluster_dua_gelombang=_teks(acak, ["Ada", "Tidak Ada"]))
+                 for _ in range(jumlah)],
+        "Ultrasonik": [dict(nilai_dbuv=_angka(acak, [0, 3, 6, 7, 501]),
+                            kepastian=_angka(acak, [0, 50, 70, 71, 100]),
+                            cluster_dua_gelombang=_teks(acak, ["Ada", "Tidak Ada"]),
+                            suara_gemerosok=_teks(acak, ["Ada", "Tidak Ada"]),
+                            interpretasi=_teks(acak, ["Noise", "PD"]),
+                            sensor=acak.choice(["UltraDish", "Contact Probe", "Flexible Mic"]))
+                       for _ in range(jumlah)]
+    }
+
+
+def _waktu(fungsi, ulang):
+    """Waktu terbaik dari beberapa pengulangan (detik)."""
+    terbaik = float("inf")
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        fungsi()
+        terbaik = min(terbaik, time.perf_counter() - t0)
+    return terbaik
+
+
+def jalankan_benchmark(jumlah=20000, ulang=5, seed=0):
+    """
+    Ukur waktu per baris untuk referensi, fungsi tabel (skalar), dan versi batch.
+
+    Return:
+        list of dict: sensor, referensi_us, tabel_us, batch_us, percepatan (referensi / tabel).
+
+    Raise:
+        AssertionError jika hasil fungsi tabel / batch berbeda dengan referensi.
+    """
+    sampel = buat_sampel(jumlah, seed)
+    pasangan = {
+        "TEV": (_referensi_tev, KlasifikasiPDTEV, KlasifikasiPDTEVBatch),
+        "HFCT": (_referensi_hfct, KlasifikasiPDHFCT, KlasifikasiPDHFCTBatch),
+        "Ultrasonik": (_referensi_ultrasonik, KlasifikasiPDUltrasonik, KlasifikasiPDUltrasonikBatch),
+    }
+
+    laporan = []
+    for sensor, (referensi, tabel, batch) in pasangan.items():
+        baris = sampel[sensor]
+        kolom = {key: [b[key] for b in baris] for key in baris[0]}
+
+        harapan = [referensi(**b) for b in baris]
+        hasil_batch = batch(**kolom)
+        for i, b in enumerate(baris):
+            hasil = tabel(**b)
+            assert hasil == harapan[i], f"{sensor} berbeda untuk {b}: {hasil} != {harapan[i]}"
+            assert hasil_batch["tingkat_keparahan"][i] == hasil["tingkat_keparahan"] \
+                and hasil_batch["rekomendasi"][i] == hasil["rekomendasi"], f"{sensor} batch berbeda untuk {b}"
+
+        t_referensi = _waktu(lambda: [referensi(**b) for b in baris], ulang)
+        t_tabel = _waktu(lambda: [tabel(**b) for b in baris], ulang)
+        t_batch = _waktu(lambda: batch(**kolom), ulang)
+        laporan.append({
+            "sensor": sensor,
+            "referensi_us": t_referensi / jumlah * 1e6,
+            "tabel_us": t_tabel / jumlah * 1e6,
+            "batch_us": t_batch / jumlah * 1e6,
+            "percepatan": t_referensi / t_tabel
+        })
+    return laporan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark klasifikasi PD (tabel keputusan vs if-else)")
+    parser.add_argument("--jumlah", type=int, default=20000, help="Jumlah baris acak per sensor")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan (diambil yang tercepat)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed data acak")
+    args = parser.parse_args(argv)
+
+    laporan = jalankan_benchmark(args.jumlah, args.ulang, args.seed)
+    print(f"Hasil identik dengan referensi untuk {args.jumlah} baris per sensor.")
+    print(f"{'Sensor':<12}{'Referensi':>14}{'Tabel':>14}{'Batch':>14}{'Percepatan':>12}")
+    for b in laporan:
+        print(f"{b['sensor']:<12}{b['referensi_us']:>11.2f} µs{b['tabel_us']:>11.2f} µs"
+              f"{b['batch_us']:>11.2f} µs{b['percepatan']:>11.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
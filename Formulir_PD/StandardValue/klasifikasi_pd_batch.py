@@ -0,0 +1,228 @@
+import numpy as np
+from .tabel_keputusan import TABEL_KEPUTUSAN, FLAG_HFCT_UNIPOLAR_TANPA_CLUSTER, FLAG_HFCT_UNIPOLAR_CLUSTER
+
+# =========================================================
+# STANDAR : KLASIFIKASI PD VERSI BATCH (ARRAY MASUK → ARRAY KELUAR)
+# =========================================================
+# Versi vektor dari KlasifikasiPDTEV / KlasifikasiPDHFCT / KlasifikasiPDUltrasonik untuk
+# mengklasifikasi ulang banyak baris sekaligus (arsip survey, pipeline batch).
+# Hasil identik dengan fungsi skalar: keduanya memakai TABEL_KEPUTUSAN yang sama (tabel_keputusan.py).
+# Zona dihitung dengan np.searchsorted pada titik batas zona, lalu dipetakan lewat tabel lookup,
+# termasuk celah non-bulat (misal TEV 19.5 dB jatuh ke D3).
+#
+# Konvensi input:
+#   - angka : array-like float; None / NaN dianggap kosong (sama dengan None di fungsi skalar)
+#   - teks  : array-like str / None, atau satu nilai untuk semua baris
+# Output: dict {"tingkat_keparahan": ndarray(object), "rekomendasi": ndarray(object)}
+
+_TABEL = TABEL_KEPUTUSAN
+LABEL_KEPARAHAN = np.array(_TABEL.label_keparahan, dtype=object)
+TIDAK_ADA_DATA = (_TABEL.tidak_ada_data["tingkat_keparahan"], _TABEL.tidak_ada_data["rekomendasi"])
+
+
+def _array_zona(tabel):
+    """Zona (tuple) → (titik, hasil) ndarray untuk _zona."""
+    return np.array(tabel.titik, dtype=float), np.array(tabel.hasil), tabel.lainnya
+
+
+def _zona(tabel_array, x):
+    """Versi vektor tabel_keputusan.zona: searchsorted pada titik batas, lalu lookup potongan."""
+    titik, hasil, lainnya = tabel_array
+    if len(titik) == 0:
+        return np.full(len(x), hasil[0])
+    i = np.searchsorted(titik, x, side="left")
+    tepat = (i < len(titik)) & (titik[np.minimum(i, len(titik) - 1)] == x)
+    return np.where(np.isnan(x), lainnya, hasil[2 * i + tepat])
+
+
+def _jumlah_baris(*kolom):
+    for nilai in kolom:
+        if nilai is not None and not isinstance(nilai, str) and np.ndim(nilai) > 0:
+            return len(nilai)
+    return 1
+
+
+def _angka(nilai, n):
+    """Array angka → (nilai float dengan kosong = 0, mask kosong)."""
+    if nilai is None:
+        return np.zeros(n), np.ones(n, dtype=bool)
+    arr = np.broadcast_to(np.asarray(nilai, dtype=float), (n,))
+    kosong = np.isnan(arr)
+    return np.where(kosong, 0.0, arr), kosong
+
+
+def _teks(nilai, n):
+    """Array teks → array object huruf kecil (None → "")."""
+    if nilai is None or isinstance(nilai, str):
+        return np.full(n, (nilai or "").lower(), dtype=object)
+    return np.array([(v or "").lower() for v in nilai], dtype=object)
+
+
+def _hasil(tingkat, rekomendasi, tanpa_data=None):
+    tingkat = np.asarray(tingkat, dtype=object)
+    rekomendasi = np.asarray(rekomendasi, dtype=object)
+    if tanpa_data is not None and tanpa_data.any():
+        tingkat = tingkat.copy()
+        rekomendasi = rekomendasi.copy()
+        tingkat[tanpa_data] = TIDAK_ADA_DATA[0]
+        rekomendasi[tanpa_data] = TIDAK_ADA_DATA[1]
+    return {"tingkat_keparahan": tingkat, "rekomendasi": rekomendasi}
+
+
+# ---------------------------------------------------------
+# TEV
+# ---------------------------------------------------------
+_TEV = _TABEL.tev
+_TEV_ZONA_D = _array_zona(_TEV.zona_db)
+_TEV_ZONA_P = _array_zona(_TEV.zona_ppc)
+_TEV_LEVEL = np.array([[_TABEL.label_keparahan.index(k) for k in baris] for baris in _TEV.keparahan])
+_TEV_KODE_MATRIKS = np.array(_TEV.kode)
+_TEV_REKOMENDASI = np.array(_TEV.rekomendasi, dtype=object)
+
+
+def KlasifikasiPDTEVBatch(nilai_db=None, ppc=None, interpretasi=None):
+    """
+    Versi batch KlasifikasiPDTEV.
+
+    Parameter:
+        nilai_db (array-like float) : Level TEV dalam dB
+        ppc (array-like int)        : Pulses per cycle
+        interpretasi (array-like str / str) : Interpretasi (a–g) dari UltraTev 2 Plus
+
+    Return:
+        dict: {'tingkat_keparahan': ndarray, 'rekomendasi': ndarray}
+    """
+    n = _jumlah_baris(nilai_db, ppc, interpretasi)
+    db, db_kosong = _angka(nilai_db, n)
+    p, p_kosong = _angka(ppc, n)
+    interp = _teks(interpretasi, n)
+
+    tanpa_data = (db_kosong | (db == 0)) & (p_kosong | (p == 0)) & (interp == "")
+
+    d_zona = _zona(_TEV_ZONA_D, db)
+    p_zona = _zona(_TEV_ZONA_P, p)
+    level = _TEV_LEVEL[d_zona, p_zona]
+
+    # Kode dari matriks, ditimpa interpretasi manual a–g
+    kode = _TEV_KODE_MATRIKS[d_zona, p_zona]
+    for huruf, k in _TEV.kode_manual.items():
+        kode[interp == huruf] = k
+
+    aturan = np.where(p_zona == _TEV.zona_aturan_ppc, np.where(p >= _TEV.batas_ppc_sangat_tinggi, 2, 1), 0)
+    return _hasil(LABEL_KEPARAHAN[level], _TEV_REKOMENDASI[kode, d_zona, p_zona, aturan], tanpa_data)
+
+
+# ---------------------------------------------------------
+# HFCT
+# ---------------------------------------------------------
+_HFCT = _TABEL.hfct
+_HFCT_ZONA_PC = _array_zona(_HFCT.zona_pc)
+_HFCT_KENAIKAN_PPC = _array_zona(_HFCT.kenaikan_ppc)
+_HFCT_REKOMENDASI = np.array(_HFCT.rekomendasi, dtype=object)
+
+
+def KlasifikasiPDHFCTBatch(nilai_pc=None, ppc=None, unipolar_waveform=None, cluster_dua_gelombang=None):
+    """
+    Versi batch KlasifikasiPDHFCT.
+
+    Parameter:
+        nilai_pc (array-like float)            : Nilai discharge dalam pC
+        ppc (array-like int)                   : Pulses per cycle
+        unipolar_waveform (array-like str)     : "Ada" jika terdeteksi unipolar
+        cluster_dua_gelombang (array-like str) : "Ada" jika ada cluster 2 gelombang stabil (PRPD)
+
+    Return:
+        dict: {'tingkat_keparahan': ndarray, 'rekomendasi': ndarray}
+    """
+    n = _jumlah_baris(nilai_pc, ppc, unipolar_waveform, cluster_dua_gelombang)
+    pc, pc_kosong = _angka(nilai_pc, n)
+    p, p_kosong = _angka(ppc, n)
+    unipolar = _teks(unipolar_waveform, n)
+    cluster = _teks(cluster_dua_gelombang, n)
+
+    tanpa_data = (pc_kosong | (pc == 0)) & (p_kosong | (p == 0)) & (unipolar == "") & (cluster == "")
+    ada_cluster = cluster == "ada"
+    ada_unipolar = unipolar == "ada"
+
+    # Tanpa cluster: level khusus jika pC besar, selain itu 0 (flag 1/2/3)
+    flag = np.where(pc > _HFCT.batas_pc_besar, 1, np.where(p > _HFCT.batas_ppc_tinggi, 2, 3))
+    level = np.where(pc > _HFCT.batas_pc_besar, _HFCT.level_pc_besar, 0)
+
+    # Dengan cluster: level dari pC, lalu naik sesuai PPC (maks 3)
+    level_cluster = np.minimum(_zona(_HFCT_ZONA_PC, pc) + _zona(_HFCT_KENAIKAN_PPC, p), 3)
+    level = np.where(ada_cluster, level_cluster, level)
+    flag = np.where(ada_cluster, 0, flag)
+
+    # Unipolar: turun 1 level (min 1 jika ada cluster, min 0 jika tidak)
+    level = np.where(ada_unipolar, np.maximum(level - 1, np.where(ada_cluster, 1, 0)), level)
+    flag = np.where(ada_unipolar,
+                    np.where(ada_cluster, FLAG_HFCT_UNIPOLAR_CLUSTER, flag + FLAG_HFCT_UNIPOLAR_TANPA_CLUSTER), flag)
+
+    return _hasil(LABEL_KEPARAHAN[level], _HFCT_REKOMENDASI[level, flag], tanpa_data)
+
+
+# ---------------------------------------------------------
+# ULTRASONIK
+# ---------------------------------------------------------
+_US = _TABEL.ultrasonik
+_US_ZONA_DBUV = _array_zona(_US.zona_dbuv)
+_US_ZONA_KEPASTIAN = _array_zona(_US.zona_kepastian)
+_US_LEVEL_DASAR = np.array(_US.level_dasar)
+_US_REKOMENDASI = np.array(_US.rekomendasi, dtype=object)
+
+
+def _tabel_bobot(sensor):
+    """Jenis sensor → array level 0–3 setelah pembobotan (lihat TabelUltrasonik.level_bobot)."""
+    return np.array(_US.level_bobot.get(sensor.lower(), _US.level_bobot_lainnya))
+
+
+def KlasifikasiPDUltrasonikBatch(nilai_dbuv=None, kepastian=None,
+                                 cluster_dua_gelombang=None,
+                                 suara_gemerosok=None,
+                                 interpretasi=None,
+                                 sensor="UltraDish"):
+    """
+    Versi batch KlasifikasiPDUltrasonik.
+
+    Parameter:
+        nilai_dbuv (array-like float)          : Level ultrasonik dalam dBµV
+        kepastian (array-like float)           : Kepastian (%) dari alat
+        cluster_dua_gelombang (array-like str) : "Ada" / "Tidak Ada"
+        suara_gemerosok (array-like str)       : "Ada" jika terdengar suara khas PD
+        interpretasi (array-like str)          : Interpretasi langsung alat ("Noise", "PD", dll.)
+        sensor (str / array-like str)          : Jenis sensor ("Contact Probe", "UltraDish", "Flexible Mic")
+
+    Return:
+        dict: {'tingkat_keparahan': ndarray, 'rekomendasi': ndarray}
+    """
+    n = _jumlah_baris(nilai_dbuv, kepastian, cluster_dua_gelombang, suara_gemerosok, interpretasi, sensor)
+    x, _ = _angka(nilai_dbuv, n)
+    kep, _ = _angka(kepastian, n)
+    cluster = _teks(cluster_dua_gelombang, n)
+    suara = _teks(suara_gemerosok, n)
+    interp = _teks(interpretasi, n)
+
+    # Zona dasar dBµV × kepastian
+    level = _US_LEVEL_DASAR[_zona(_US_ZONA_DBUV, x), _zona(_US_ZONA_KEPASTIAN, kep)]
+
+    # Cluster dua gelombang
+    level = np.where(cluster == "ada", np.minimum(level + 1, 3), level)
+    tidak_ada = cluster == "tidak ada"
+    level_tidak_ada = np.where((x > _US.batas_dbuv) & (kep > _US.batas_kepastian), np.maximum(level - 1, 0),
+                               np.where(x > _US.batas_dbuv_khusus, _US.level_khusus, 0))
+    level = np.where(tidak_ada, level_tidak_ada, level)
+
+    # Suara gemerosok & interpretasi alat
+    level = np.where(suara == "ada", np.minimum(level + 1, 3), level)
+    level = np.where((interp == "noise") & (level > 0), level - 1, level)
+
+    # Pembobotan jenis sensor (lewat tabel level per sensor)
+    if isinstance(sensor, str):
+        level = _tabel_bobot(sensor)[level]
+    else:
+        sensor = np.array([s.lower() for s in sensor], dtype=object)
+        for jenis in set(sensor):
+            pilih = sensor == jenis
+            level[pilih] = _tabel_bobot(jenis)[level[pilih]]
+
+    return _hasil(LABEL_KEPARAHAN[level], _US_REKOMENDASI[level])
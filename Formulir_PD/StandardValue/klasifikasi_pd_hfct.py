@@ -1,3 +1,5 @@
+from .tabel_keputusan import TABEL_KEPUTUSAN, zona, FLAG_HFCT_UNIPOLAR_TANPA_CLUSTER, FLAG_HFCT_UNIPOLAR_CLUSTER
+
 # =========================================================
 # STANDAR : KLASIFIKASI PD HFCT
 # =========================================================
@@ -18,84 +20,46 @@ def KlasifikasiPDHFCT(nilai_pc=None, ppc=None, unipolar_waveform=None, cluster_d
         }
     """
 
+    tabel = TABEL_KEPUTUSAN.hfct
+
     #  1) Tangani kasus tidak ada data 
     if (not nilai_pc or nilai_pc == 0) and (not ppc or ppc == 0) \
        and (not unipolar_waveform) and (not cluster_dua_gelombang):
-        return {
-            "tingkat_keparahan": "Tidak Ada Data",
-            "rekomendasi": "Tidak dapat menentukan – data tidak tersedia"
-        }
+        return dict(TABEL_KEPUTUSAN.tidak_ada_data)
 
     # Default agar tidak error jika None
     nilai_pc = nilai_pc or 0
     ppc = ppc or 0
-    unipolar_waveform = (unipolar_waveform or "").lower()
-    cluster_dua_gelombang = (cluster_dua_gelombang or "").lower()
+    ada_unipolar = (unipolar_waveform or "").lower() == "ada"
+    ada_cluster = (cluster_dua_gelombang or "").lower() == "ada"
 
     #  2) Basis klasifikasi dari nilai pC & cluster 
-    if cluster_dua_gelombang != "ada":
-        if nilai_pc > 500:
+    if not ada_cluster:
+        if nilai_pc > tabel.batas_pc_besar:
             # Kasus khusus: besar tapi tanpa cluster
-            level = 2   # Sedang
-            rekomendasi_flag = "Flagged suspect noise (cek coupling / sensor lain)"
-        elif ppc > 50:
-            level = 0   # Noise / Insignifikan
-            rekomendasi_flag = "Kemungkinan noise/EMI – pola repetitif tanpa cluster"
+            level, flag = tabel.level_pc_besar, 1
+        elif ppc > tabel.batas_ppc_tinggi:
+            level, flag = 0, 2
         else:
-            level = 0   # Noise / Insignifikan
-            rekomendasi_flag = "Tidak signifikan; kemungkinan noise"
+            level, flag = 0, 3
     else:
-        # Ada cluster → tentukan level dari pC
-        if nilai_pc < 250:
-            level = 1  # Rendah
-        elif 250 <= nilai_pc <= 500:
-            level = 2  # Sedang
-        else:  # >500
-            level = 3  # Tinggi
-        rekomendasi_flag = ""
-
-    #  3) Aturan tambahan berbasis PPC 
-    if cluster_dua_gelombang == "ada":
-        if 5 <= ppc <= 20:
-            level = min(level + 1, 3)  # naik 1 level
-        elif ppc > 20:
-            level = min(level + 2, 3)  # naik 2 level
+        # Ada cluster → level dari pC, naik sesuai PPC (maks Tinggi)
+        level = min(zona(tabel.zona_pc, nilai_pc) + zona(tabel.kenaikan_ppc, ppc), 3)
+        flag = 0
 
-    #  4) Aturan tambahan berbasis unipolar waveform 
-    if unipolar_waveform == "ada":
-        if cluster_dua_gelombang == "ada":
+    #  3) Aturan tambahan berbasis unipolar waveform 
+    if ada_unipolar:
+        if ada_cluster:
             # Jika ada cluster, turunkan 1 level tapi tidak boleh <1
             level = max(level - 1, 1)
-            rekomendasi_flag += " (Unipolar → PD lemah)"
+            flag = FLAG_HFCT_UNIPOLAR_CLUSTER
         else:
             # Jika tidak ada cluster → lebih mirip noise
             level = max(level - 1, 0)
-            rekomendasi_flag += " (Unipolar tanpa cluster → lebih noise-like)"
-
-    #  5) Mapping level ke tingkat keparahan 
-    reverse_map = {
-        0: "Noise / Insignifikan",
-        1: "Rendah",
-        2: "Sedang",
-        3: "Tinggi"
-    }
-    tingkat_keparahan = reverse_map[level]
-
-    #  6) Tentukan rekomendasi aksi 
-    if level == 0:
-        rekomendasi = "Survey ulang dalam 12 bulan"
-    elif level == 1:
-        rekomendasi = "Survey ulang dalam 6 bulan (trending)"
-    elif level == 2:
-        rekomendasi = "Investigasi & penlokasi PD; perbaiki secepat praktis"
-    else:  # Tinggi
-        rekomendasi = "Prioritas tinggi; perbaiki secepatnya"
-
-    # Tambahkan catatan flag khusus jika ada
-    if rekomendasi_flag:
-        rekomendasi += f" → {rekomendasi_flag.strip()}"
+            flag += FLAG_HFCT_UNIPOLAR_TANPA_CLUSTER
 
+    #  4) Tingkat keparahan & rekomendasi (termasuk catatan flag) dari tabel keputusan
     return {
-        "tingkat_keparahan": tingkat_keparahan,
-        "rekomendasi": rekomendasi
+        "tingkat_keparahan": TABEL_KEPUTUSAN.label_keparahan[level],
+        "rekomendasi": tabel.rekomendasi[level][flag]
     }
@@ -1,3 +1,5 @@
+from .tabel_keputusan import TABEL_KEPUTUSAN, zona
+
 # =========================================================
 # STANDAR : KLASIFIKASI PD ULTRASONIK
 # =========================================================
@@ -26,6 +28,8 @@ def KlasifikasiPDUltrasonik(nilai_dbuv=None, kepastian=None,
         }
     """
 
+    tabel = TABEL_KEPUTUSAN.ultrasonik
+
     # 1) Default handling untuk nilai None
     nilai_dbuv = nilai_dbuv or 0
     kepastian = kepastian or 0
@@ -34,31 +38,16 @@ def KlasifikasiPDUltrasonik(nilai_dbuv=None, kepastian=None,
     interpretasi = (interpretasi or "").lower()
 
     # 2) Zona dasar (berdasarkan dBµV + kepastian)
-    if nilai_dbuv < 3:
-        level = 1 if kepastian > 70 else 0
-    elif 3 <= nilai_dbuv <= 6:
-        if kepastian <= 50:
-            level = 0
-        elif 50 < kepastian <= 70:
-            level = 1
-        else:  # >70
-            level = 2
-    else:  # >6 dBµV
-        if kepastian <= 50:
-            level = 1
-        elif 50 < kepastian <= 70:
-            level = 2
-        else:  # >70
-            level = 3
+    level = tabel.level_dasar[zona(tabel.zona_dbuv, nilai_dbuv)][zona(tabel.zona_kepastian, kepastian)]
 
     # 3) Aturan cluster dua gelombang
     if cluster_dua_gelombang == "ada":
         level = min(level + 1, 3)
     elif cluster_dua_gelombang == "tidak ada":
-        if nilai_dbuv > 6 and kepastian > 70:
+        if nilai_dbuv > tabel.batas_dbuv and kepastian > tabel.batas_kepastian:
             level = max(level - 1, 0)
-        elif nilai_dbuv > 500:  # kasus khusus
-            level = 2
+        elif nilai_dbuv > tabel.batas_dbuv_khusus:  # kasus khusus
+            level = tabel.level_khusus
         else:
             level = 0
 
@@ -70,36 +59,11 @@ def KlasifikasiPDUltrasonik(nilai_dbuv=None, kepastian=None,
     if interpretasi == "noise" and level > 0:
         level = max(level - 1, 0)
 
-    # 6) Pembobotan jenis sensor
-    bobot_sensor = {
-        "contact probe": 1.2,
-        "ultradish": 1.0,
-        "flexible mic": 0.8
-    }
-    bobot = bobot_sensor.get(sensor.lower(), 1.0)
-    level = round(level * bobot)
-    level = max(0, min(level, 3))  # clamp ke 0–3
-
-    # 7) Mapping level → label keparahan
-    reverse_map = {
-        0: "Noise / Insignifikan",
-        1: "Rendah",
-        2: "Sedang",
-        3: "Tinggi"
-    }
-    tingkat_keparahan = reverse_map[level]
-
-    # 8) Rekomendasi aksi
-    if level == 0:
-        rekomendasi = "Survey ulang dalam 12 bulan untuk trending"
-    elif level == 1:
-        rekomendasi = "Survey ulang dalam 6 bulan untuk trending"
-    elif level == 2:
-        rekomendasi = "Investigasi & penlokasi PD; perbaiki secepat praktis"
-    else:  # Tinggi
-        rekomendasi = "Prioritas tinggi; perbaiki secepatnya"
+    # 6) Pembobotan jenis sensor (tabel level per sensor, sudah di-clamp ke 0–3)
+    level = tabel.level_bobot.get(sensor.lower(), tabel.level_bobot_lainnya)[level]
 
+    # 7) Tingkat keparahan & rekomendasi aksi
     return {
-        "tingkat_keparahan": tingkat_keparahan,
-        "rekomendasi": rekomendasi
+        "tingkat_keparahan": TABEL_KEPUTUSAN.label_keparahan[level],
+        "rekomendasi": tabel.rekomendasi[level]
     }
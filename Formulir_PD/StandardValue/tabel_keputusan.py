@@ -0,0 +1,465 @@
+import os
+import re
+import sys
+import copy
+import json
+from bisect import bisect_left
+from collections import namedtuple
+from types import MappingProxyType
+
+# =========================================================
+# STANDAR : TABEL KEPUTUSAN KLASIFIKASI PD (TEV / HFCT / ULTRASONIK)
+# =========================================================
+# Semua batas zona, matriks, dan teks rekomendasi standar dikumpulkan di sini sebagai data.
+# Data dikompilasi SEKALI saat modul di-import menjadi tabel tidak dapat diubah (tuple /
+# MappingProxyType) berisi string yang sudah di-intern, sehingga fungsi klasifikasi hanya
+# melakukan lookup tabel.
+#
+# Standar dapat diperbarui tanpa mengubah kode: letakkan 'aturan_klasifikasi.json' di folder
+# aplikasi (atau tunjuk lewat variabel lingkungan PD_ATURAN_KLASIFIKASI). Isinya menimpa
+# ATURAN_BAWAAN per key; contoh lengkapnya dapat dibuat dengan ekspor_aturan_bawaan().
+#
+# Penulisan batas zona: "x < 10", "10 <= x <= 19", "50 < x <= 70", "x > 20", atau "lainnya"
+# (zona untuk nilai yang tidak memenuhi syarat mana pun). Syarat dicek berurutan, yang pertama
+# cocok dipakai.
+
+NAMA_FILE_ATURAN = "aturan_klasifikasi.json"
+ENV_FILE_ATURAN = "PD_ATURAN_KLASIFIKASI"
+LAINNYA = "lainnya"
+
+ATURAN_BAWAAN = {
+    "label_keparahan": ["Noise / Insignifikan", "Rendah", "Sedang", "Tinggi"],
+    "tidak_ada_data": {
+        "tingkat_keparahan": "Tidak Ada Data",
+        "rekomendasi": "Tidak dapat menentukan – data tidak tersedia"
+    },
+    "tev": {
+        "zona_db": {
+            "D0": "x < 10",
+            "D1": "10 <= x <= 19",
+            "D2": "20 <= x <= 29",
+            "D3": "lainnya"
+        },
+        "zona_ppc": {
+            "P0": "x <= 4",
+            "P1": "5 <= x <= 19",
+            "P2": "lainnya"
+        },
+        "tipe_ppc": {
+            "P0": "Sangat rendah / kemungkinan noise",
+            "P1": "Discharge berulang (rendah–menengah)",
+            "P2": "Discharge signifikan / permukaan"
+        },
+        # [zona dB][zona PPC] → [kode interpretasi, dasar kode]
+        "matriks": {
+            "D0": {
+                "P0": ["a", "Tidak memerlukan perhatian"],
+                "P1": ["b", "PPC tinggi, kemungkinan noise"],
+                "P2": ["d", "Kemungkinan discharge permukaan – cek ultrasonik"]
+            },
+            "D1": {
+                "P0": ["a", "Tidak memerlukan perhatian"],
+                "P1": ["c", "Kemungkinan PD tingkat rendah"],
+                "P2": ["d", "Kemungkinan discharge permukaan – cek ultrasonik"]
+            },
+            "D2": {
+                "P0": ["e", "Kemungkinan PD tingkat menengah"],
+                "P1": ["e", "Kemungkinan PD tingkat menengah"],
+                "P2": ["d", "Kemungkinan discharge permukaan – cek ultrasonik"]
+            },
+            "D3": {
+                "P0": ["f", "Kemungkinan PD tingkat tinggi"],
+                "P1": ["f", "Kemungkinan PD tingkat tinggi"],
+                "P2": ["g", "Kemungkinan logam mengambang / koneksi jelek (atau noise sangat tinggi)"]
+            }
+        },
+        # [zona dB][zona PPC] → tingkat keparahan
+        "keparahan": {
+            "D0": {"P0": "Noise / Insignifikan", "P1": "Noise / Insignifikan", "P2": "Rendah"},
+            "D1": {"P0": "Noise / Insignifikan", "P1": "Rendah", "P2": "Rendah"},
+            "D2": {"P0": "Sedang", "P1": "Sedang", "P2": "Sedang"},
+            "D3": {"P0": "Tinggi", "P1": "Tinggi", "P2": "Tinggi"}
+        },
+        "dasar_db": {
+            "Noise / Insignifikan": "Tidak memerlukan perhatian; survey ulang 12 bulan",
+            "Rendah": "Survey ulang 6 bulan untuk trending",
+            "Sedang": "Investigasi & penlokasi PD; perbaiki secepat praktis",
+            "Tinggi": "Prioritas tinggi; perbaiki secepatnya"
+        },
+        "aturan_ppc": {
+            "zona": "P2",
+            "teks": "Cek ultrasonik & validasi fase/PRPD",
+            "batas_sangat_tinggi": 50,
+            "teks_sangat_tinggi": " | PPC sangat tinggi → curigai noise/EMI atau koneksi longgar"
+        },
+        # Interpretasi manual UltraTev 2 Plus yang boleh menimpa kode matriks
+        "kode_manual": "abcdefg",
+        "format_rekomendasi": "[{kode}], {dasar_kode}, {dasar_db}, {tipe_ppc}, {aturan_ppc}"
+    },
+    "hfct": {
+        # Dengan cluster dua gelombang: keparahan dari pC, lalu naik sesuai PPC
+        "zona_pc": {
+            "Rendah": "x < 250",
+            "Sedang": "250 <= x <= 500",
+            "Tinggi": "lainnya"
+        },
+        "kenaikan_ppc": {
+            "1": "5 <= x <= 20",
+            "2": "x > 20",
+            "0": "lainnya"
+        },
+        # Tanpa cluster dua gelombang
+        "tanpa_cluster": {
+            "batas_pc": 500,
+            "keparahan_pc_besar": "Sedang",
+            "catatan_pc_besar": "Flagged suspect noise (cek coupling / sensor lain)",
+            "batas_ppc": 50,
+            "catatan_ppc_tinggi": "Kemungkinan noise/EMI – pola repetitif tanpa cluster",
+            "catatan_lainnya": "Tidak signifikan; kemungkinan noise"
+        },
+        "unipolar": {
+            "catatan_dengan_cluster": " (Unipolar → PD lemah)",
+            "catatan_tanpa_cluster": " (Unipolar tanpa cluster → lebih noise-like)"
+        },
+        "rekomendasi": {
+            "Noise / Insignifikan": "Survey ulang dalam 12 bulan",
+            "Rendah": "Survey ulang dalam 6 bulan (trending)",
+            "Sedang": "Investigasi & penlokasi PD; perbaiki secepat praktis",
+            "Tinggi": "Prioritas tinggi; perbaiki secepatnya"
+        }
+    },
+    "ultrasonik": {
+        "zona_dbuv": {
+            "rendah": "x < 3",
+            "sedang": "3 <= x <= 6",
+            "tinggi": "lainnya"
+        },
+        "zona_kepastian": {
+            "rendah": "x <= 50",
+            "sedang": "50 < x <= 70",
+            "tinggi": "lainnya"
+        },
+        # [zona dBµV] → level dasar (0–3) per zona kepastian (urut rendah, sedang, tinggi)
+        "level_dasar": {
+            "rendah": [0, 0, 1],
+            "sedang": [0, 1, 2],
+            "tinggi": [1, 2, 3]
+        },
+        # Cluster dua gelombang "Tidak Ada": turun 1 level jika dBµV & kepastian di atas batas,
+        # keparahan khusus jika dBµV di atas batas khusus, selain itu Noise / Insignifikan
+        "cluster_tidak_ada": {
+            "batas_dbuv": 6,
+            "batas_kepastian": 70,
+            "batas_dbuv_khusus": 500,
+            "keparahan_khusus": "Sedang"
+        },
+        "bobot_sensor": {
+            "contact probe": 1.2,
+            "ultradish": 1.0,
+            "flexible mic": 0.8
+        },
+        "bobot_lainnya": 1.0,
+        "rekomendasi": {
+            "Noise / Insignifikan": "Survey ulang dalam 12 bulan untuk trending",
+            "Rendah": "Survey ulang dalam 6 bulan untuk trending",
+            "Sedang": "Investigasi & penlokasi PD; perbaiki secepat praktis",
+            "Tinggi": "Prioritas tinggi; perbaiki secepatnya"
+        }
+    }
+}
+
+# ---------------------------------------------------------
+# STRUKTUR TABEL TERKOMPILASI (IMMUTABLE)
+# ---------------------------------------------------------
+# Zona: garis bilangan dipecah menjadi potongan (-inf, t0), [t0], (t0, t1), [t1], ..., (tn, inf);
+# hasil[i] = indeks zona potongan ke-i, lainnya = zona untuk NaN / nilai tak terdefinisi.
+Zona = namedtuple("Zona", ["titik", "hasil", "lainnya"])
+
+TabelTEV = namedtuple("TabelTEV", [
+    "zona_db", "zona_ppc",
+    "keparahan",            # [d][p] → label
+    "kode",                 # [d][p] → indeks kode matriks
+    "kode_manual",          # huruf → indeks kode
+    "zona_aturan_ppc", "batas_ppc_sangat_tinggi",
+    "rekomendasi"           # [kode][d][p][aturan 0/1/2] → teks
+])
+
+TabelHFCT = namedtuple("TabelHFCT", [
+    "zona_pc",              # zona → level (dengan cluster)
+    "kenaikan_ppc",         # zona → kenaikan level (dengan cluster)
+    "batas_pc_besar", "level_pc_besar", "batas_ppc_tinggi",
+    "rekomendasi"           # [level][flag] → teks (lihat FLAG_HFCT_*)
+])
+
+TabelUltrasonik = namedtuple("TabelUltrasonik", [
+    "zona_dbuv", "zona_kepastian",
+    "level_dasar",          # [zona dBµV][zona kepastian] → level
+    "batas_dbuv", "batas_kepastian", "batas_dbuv_khusus", "level_khusus",
+    "level_bobot",          # sensor (huruf kecil) → tuple level 0–3 setelah pembobotan
+    "level_bobot_lainnya",
+    "rekomendasi"           # [level] → teks
+])
+
+TabelKeputusan = namedtuple("TabelKeputusan", [
+    "label_keparahan", "tidak_ada_data", "tev", "hfct", "ultrasonik", "sumber"
+])
+
+# Indeks flag rekomendasi HFCT: 0 = tanpa catatan, 1..3 = tanpa cluster (pC besar / PPC tinggi /
+# lainnya), 4..6 = sama tetapi unipolar tanpa cluster, 7 = unipolar dengan cluster
+FLAG_HFCT_UNIPOLAR_TANPA_CLUSTER = 3
+FLAG_HFCT_UNIPOLAR_CLUSTER = 7
+
+_POLA_SYARAT = re.compile(
+    r"^\s*(?:(?P<bawah>[-+]?\d+(?:\.\d+)?)\s*(?P<op_bawah><=?)\s*)?x"
+    r"\s*(?:(?P<op_atas><=?)\s*(?P<atas>[-+]?\d+(?:\.\d+)?))?\s*$"
+)
+_POLA_SYARAT_LEBIH = re.compile(r"^\s*x\s*(?P<op>>=?)\s*(?P<bawah>[-+]?\d+(?:\.\d+)?)\s*$")
+
+
+def _intern(teks):
+    return sys.intern(str(teks))
+
+
+def _beku(nilai):
+    """list bersarang → tuple bersarang."""
+    if isinstance(nilai, (list, tuple)):
+        return tuple(_beku(v) for v in nilai)
+    return nilai
+
+
+def _parse_syarat(syarat):
+    """'10 <= x <= 19' → (bawah, bawah_inklusif, atas, atas_inklusif); None = tidak dibatasi."""
+    cocok = _POLA_SYARAT_LEBIH.match(syarat)
+    if cocok:
+        return float(cocok["bawah"]), cocok["op"] == ">=", None, False
+    cocok = _POLA_SYARAT.match(syarat)
+    if not cocok or (cocok["bawah"] is None and cocok["atas"] is None):
+        raise ValueError(f"Syarat zona tidak dikenali: '{syarat}'")
+    bawah = float(cocok["bawah"]) if cocok["bawah"] is not None else None
+    atas = float(cocok["atas"]) if cocok["atas"] is not None else None
+    return bawah, cocok["op_bawah"] == "<=", atas, cocok["op_atas"] == "<="
+
+
+def _memenuhi(x, syarat):
+    bawah, bawah_inklusif, atas, atas_inklusif = syarat
+    if bawah is not None and not (bawah <= x if bawah_inklusif else bawah < x):
+        return False
+    if atas is not None and not (x <= atas if atas_inklusif else x < atas):
+        return False
+    return True
+
+
+def _kompilasi_zona(definisi, nilai_zona=None):
+    """
+    {nama: syarat} → (Zona, tuple nama).
+    nilai_zona (callable): nama zona → nilai yang disimpan di tabel (default: indeks urutan).
+    """
+    nama = tuple(definisi)
+    nilai = [nilai_zona(n) if nilai_zona else i for i, n in enumerate(nama)]
+    lainnya = [v for n, v in zip(nama, nilai) if str(definisi[n]).strip().lower() == LAINNYA]
+    if len(lainnya) != 1:
+        raise ValueError(f"Zona {list(nama)} harus memiliki tepat satu zona '{LAINNYA}'.")
+    syarat = [(_parse_syarat(definisi[n]), v) for n, v in zip(nama, nilai)
+              if str(definisi[n]).strip().lower() != LAINNYA]
+
+    def zona_untuk(x):
+        return next((v for s, v in syarat if _memenuhi(x, s)), lainnya[0])
+
+    titik = sorted({b for s, _ in syarat for b in (s[0], s[2]) if b is not None})
+    # Wakil tiap potongan: titik batas itu sendiri, dan titik tengah di antara dua batas
+    wakil = [titik[0] - 1.0] if titik else [0.0]
+    for i, t in enumerate(titik):
+        wakil.append(t)
+        wakil.append((t + titik[i + 1]) / 2 if i + 1 < len(titik) else t + 1.0)
+    return Zona(tuple(titik), tuple(zona_untuk(w) for w in wakil), lainnya[0]), nama
+
+
+def zona(tabel, x):
+    """Lookup zona untuk satu nilai (lihat Zona)."""
+    if x != x:  # NaN
+        return tabel.lainnya
+    i = bisect_left(tabel.titik, x)
+    return tabel.hasil[2 * i + (i < len(tabel.titik) and tabel.titik[i] == x)]
+
+
+def _kompilasi_tev(aturan, label):
+    zona_db, nama_d = _kompilasi_zona(aturan["zona_db"])
+    zona_ppc, nama_p = _kompilasi_zona(aturan["zona_ppc"])
+    kode_manual = str(aturan["kode_manual"]).lower()
+    matriks = aturan["matriks"]
+    keparahan = aturan["keparahan"]
+
+    aturan_ppc = aturan["aturan_ppc"]
+    teks_aturan = (
+        "",
+        aturan_ppc["teks"],
+        aturan_ppc["teks"] + aturan_ppc["teks_sangat_tinggi"]
+    )
+
+    rekomendasi = tuple(
+        tuple(
+            tuple(
+                tuple(
+                    _intern(aturan["format_rekomendasi"].format(
+                        kode=kode,
+                        dasar_kode=matriks[d][p][1],
+                        dasar_db=aturan["dasar_db"][keparahan[d][p]],
+                        tipe_ppc=aturan["tipe_ppc"][p],
+                        aturan_ppc=teks
+                    ))
+                    for teks in teks_aturan
+                )
+                for p in nama_p
+            )
+            for d in nama_d
+        )
+        for kode in kode_manual
+    )
+    for d in nama_d:
+        for p in nama_p:
+            if keparahan[d][p] not in label:
+                raise ValueError(f"Keparahan TEV {d}/{p} tidak dikenal: '{keparahan[d][p]}'")
+
+    return TabelTEV(
+        zona_db=zona_db,
+        zona_ppc=zona_ppc,
+        keparahan=tuple(tuple(_intern(keparahan[d][p]) for p in nama_p) for d in nama_d),
+        kode=tuple(tuple(kode_manual.index(matriks[d][p][0].lower()) for p in nama_p) for d in nama_d),
+        kode_manual=MappingProxyType({huruf: k for k, huruf in enumerate(kode_manual)}),
+        zona_aturan_ppc=nama_p.index(aturan_ppc["zona"]),
+        batas_ppc_sangat_tinggi=aturan_ppc["batas_sangat_tinggi"],
+        rekomendasi=rekomendasi
+    )
+
+
+def _kompilasi_hfct(aturan, label):
+    zona_pc, _ = _kompilasi_zona(aturan["zona_pc"], label.index)
+    kenaikan_ppc, _ = _kompilasi_zona(aturan["kenaikan_ppc"], int)
+    tanpa = aturan["tanpa_cluster"]
+    unipolar = aturan["unipolar"]
+
+    flag_dasar = ("", tanpa["catatan_pc_besar"], tanpa["catatan_ppc_tinggi"], tanpa["catatan_lainnya"])
+    flag = (
+        flag_dasar
+        + tuple(f + unipolar["catatan_tanpa_cluster"] for f in flag_dasar[1:])
+        + (unipolar["catatan_dengan_cluster"],)
+    )
+    rekomendasi = tuple(
+        tuple(
+            _intern(aturan["rekomendasi"][nama] + (f" → {f.strip()}" if f else ""))
+            for f in flag
+        )
+        for nama in label
+    )
+    return TabelHFCT(
+        zona_pc=zona_pc,
+        kenaikan_ppc=kenaikan_ppc,
+        batas_pc_besar=tanpa["batas_pc"],
+        level_pc_besar=label.index(tanpa["keparahan_pc_besar"]),
+        batas_ppc_tinggi=tanpa["batas_ppc"],
+        rekomendasi=rekomendasi
+    )
+
+
+def _kompilasi_ultrasonik(aturan, label):
+    zona_dbuv, nama_dbuv = _kompilasi_zona(aturan["zona_dbuv"])
+    zona_kepastian, nama_kepastian = _kompilasi_zona(aturan["zona_kepastian"])
+    level_dasar = tuple(_beku(aturan["level_dasar"][n]) for n in nama_dbuv)
+    maks = len(label) - 1
+    if any(len(baris) != len(nama_kepastian) for baris in level_dasar):
+        raise ValueError("level_dasar ultrasonik harus berisi satu level per zona kepastian.")
+
+    def tabel_bobot(bobot):
+        # round bawaan Python (banker's rounding) + clamp, sama dengan perhitungan sebelumnya
+        return tuple(max(0, min(round(level * bobot), maks)) for level in range(len(label)))
+
+    tidak_ada = aturan["cluster_tidak_ada"]
+    return TabelUltrasonik(
+        zona_dbuv=zona_dbuv,
+        zona_kepastian=zona_kepastian,
+        level_dasar=level_dasar,
+        batas_dbuv=tidak_ada["batas_dbuv"],
+        batas_kepastian=tidak_ada["batas_kepastian"],
+        batas_dbuv_khusus=tidak_ada["batas_dbuv_khusus"],
+        level_khusus=label.index(tidak_ada["keparahan_khusus"]),
+        level_bobot=MappingProxyType({
+            _intern(sensor.lower()): tabel_bobot(bobot) for sensor, bobot in aturan["bobot_sensor"].items()
+        }),
+        level_bobot_lainnya=tabel_bobot(aturan["bobot_lainnya"]),
+        rekomendasi=tuple(_intern(aturan["rekomendasi"][nama]) for nama in label)
+    )
+
+
+def _gabung(dasar, tambahan):
+    """Timpa dict dasar dengan isi tambahan secara rekursif (per key)."""
+    for key, nilai in tambahan.items():
+        if isinstance(nilai, dict) and isinstance(dasar.get(key), dict):
+            _gabung(dasar[key], nilai)
+        else:
+            dasar[key] = nilai
+    return dasar
+
+
+def kompilasi_tabel_keputusan(aturan, sumber="bawaan"):
+    """
+    Kompilasi dict aturan (format ATURAN_BAWAAN) menjadi TabelKeputusan.
+
+    Raise:
+        ValueError / KeyError jika aturan tidak lengkap atau tidak konsisten.
+    """
+    label = tuple(_intern(l) for l in aturan["label_keparahan"])
+    tidak_ada = aturan["tidak_ada_data"]
+    return TabelKeputusan(
+        label_keparahan=label,
+        tidak_ada_data=MappingProxyType({
+            "tingkat_keparahan": _intern(tidak_ada["tingkat_keparahan"]),
+            "rekomendasi": _intern(tidak_ada["rekomendasi"])
+        }),
+        tev=_kompilasi_tev(aturan["tev"], label),
+        hfct=_kompilasi_hfct(aturan["hfct"], label),
+        ultrasonik=_kompilasi_ultrasonik(aturan["ultrasonik"], label),
+        sumber=sumber
+    )
+
+
+def lokasi_file_aturan():
+    """Path file aturan: variabel lingkungan PD_ATURAN_KLASIFIKASI, atau folder aplikasi."""
+    path = os.environ.get(ENV_FILE_ATURAN)
+    if path:
+        return path
+    if getattr(sys, "frozen", False):
+        BASE_DIR = os.path.dirname(sys.executable)
+    else:
+        BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    return os.path.join(BASE_DIR, NAMA_FILE_ATURAN)
+
+
+def muat_tabel_keputusan(path=None):
+    """
+    Muat aturan (ATURAN_BAWAAN ditimpa isi file JSON jika ada) lalu kompilasi.
+    File yang rusak / tidak konsisten diabaikan (dengan peringatan) dan aturan bawaan dipakai.
+
+    Args:
+        path (str): file aturan JSON; None → lokasi_file_aturan().
+    """
+    path = path or lokasi_file_aturan()
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                tambahan = json.load(f)
+            return kompilasi_tabel_keputusan(_gabung(copy.deepcopy(ATURAN_BAWAAN), tambahan), sumber=path)
+        except Exception as e:
+            print(f"⚠️ File aturan klasifikasi '{path}' diabaikan, memakai aturan bawaan: {e}")
+    return kompilasi_tabel_keputusan(ATURAN_BAWAAN)
+
+
+def ekspor_aturan_bawaan(path=None):
+    """Tulis ATURAN_BAWAAN ke file JSON sebagai titik awal pengubahan standar."""
+    path = path or lokasi_file_aturan()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(ATURAN_BAWAAN, f, indent=4, ensure_ascii=False)
+    return path
+
+
+# Dimuat sekali saat import; dipakai bersama fungsi skalar dan batch
+TABEL_KEPUTUSAN = muat_tabel_keputusan()
@@ -1,8 +1,87 @@
-from PySide6.QtWidgets import QMessageBox, QTableWidgetItem, QComboBox
+import weakref
+from PySide6.QtWidgets import QMessageBox
+from PySide6.QtCore import QTimer
 
 # Import fungsi klasifikasi tiap sensor
 from StandardValue import KlasifikasiPDTEV, KlasifikasiPDHFCT, KlasifikasiPDUltrasonik
 
+# =========================================================
+# MODUL : PENJADWAL UPDATE KLASIFIKASI (SEKALI PER PUTARAN EVENT LOOP)
+# =========================================================
+class PenjadwalKlasifikasi:
+    """
+    Antrean bersama untuk semua UpdateHasilKlasifikasi.
+    - Setiap cellChanged hanya menandai baris sebagai "kotor".
+    - Pada putaran event loop berikutnya semua baris kotor diklasifikasi sekali, lalu summary
+      dihitung ulang sekali, sehingga load_table_data / paste satu tabel penuh tidak memicu
+      klasifikasi per sel.
+    - Hasil klasifikasi baris r diteruskan ke summary yang memakai tabel tersebut, sehingga
+      summary hanya menghitung ulang baris r.
+    - Error dari satu putaran dikumpulkan dan ditampilkan dalam satu pesan per tabel.
+    """
+
+    def __init__(self):
+        self._baris = {}     # updater → dict baris (urut sesuai tanda)
+        self._summary = {}   # updater summary yang perlu diproses (urut sesuai tanda)
+        self._summary_terdaftar = weakref.WeakSet()
+        self._terjadwal = False
+        self._sedang_proses = False
+
+    def tandai_baris(self, updater, row):
+        self._baris.setdefault(updater, {})[row] = None
+        self._jadwalkan()
+
+    def tandai_summary(self, updater):
+        self._summary[updater] = None
+        self._jadwalkan()
+
+    def daftarkan_summary(self, updater):
+        """Summary yang didaftarkan menerima hasil klasifikasi baris dari tabel sensornya."""
+        self._summary_terdaftar.add(updater)
+
+    def teruskan_hasil(self, table, row, result):
+        for summary in list(self._summary_terdaftar):
+            summary.terima_hasil(table, row, result)
+
+    def _jadwalkan(self):
+        if not self._terjadwal and not self._sedang_proses:
+            self._terjadwal = True
+            QTimer.singleShot(0, self.proses)
+
+    def proses(self):
+        """Kerjakan seluruh antrean sekarang (klasifikasi individu dulu, lalu summary)."""
+        self._terjadwal = False
+        if self._sedang_proses:
+            return
+        self._sedang_proses = True
+        kesalahan = []
+        try:
+            # Summary membaca hasil klasifikasi individu → antrean individu dikosongkan dulu
+            while self._baris or self._summary:
+                while self._baris:
+                    updater = next(iter(self._baris))
+                    galat = updater.klasifikasi_baris(list(self._baris.pop(updater)))
+                    if galat:
+                        kesalahan.append((updater, galat))
+                if self._summary:
+                    updater = next(iter(self._summary))
+                    del self._summary[updater]
+                    updater.hitung_summary()
+        finally:
+            self._sedang_proses = False
+
+        for updater, galat in kesalahan:
+            updater.tampilkan_kesalahan(galat)
+
+        # Tanda baru selama pesan kesalahan ditampilkan
+        if self._baris or self._summary:
+            self._jadwalkan()
+
+
+# Satu penjadwal untuk seluruh aplikasi
+penjadwal_klasifikasi = PenjadwalKlasifikasi()
+
+
 # =========================================================
 # MODUL : UPDATE HASIL KLASIFIKASI
 # =========================================================
@@ -10,7 +89,7 @@ class UpdateHasilKlasifikasi:
     def __init__(self, table, sensor_type=None, col_map=None, output_cols=None, extra_params=None):
         """
         Args:
-            table (QTableWidget): tabel target
+            table (TabelPengukuran): tabel target
             sensor_type (str): jenis sensor ("TEV", "HFCT", "Ultrasonik") atau None jika untuk summary
             col_map (dict): mapping input kolom sensor (untuk single sensor)
             output_cols (tuple): (kolom_keparahan, kolom_rekomendasi)
@@ -22,124 +101,231 @@ class UpdateHasilKlasifikasi:
         self.output_cols = output_cols
         self.extra_params = extra_params or {}
 
+        # State mode summary (lihat update_summary)
+        self.row_map = None
+        self.summary_output_cols = None
+        self._ikatan_summary = None
+        self._cache_baris = {}      # row → {sensor: hasil klasifikasi} (cache per baris)
+        self._baris_summary = set() # baris summary yang perlu dihitung ulang
+        self._summary_penuh = False # True → hitung ulang semua baris (baris tabel berubah)
+
         # Jika mode sensor tunggal → hubungkan event
+        # (perubahan kolom pilihan juga lewat cellChanged karena semua sel ada di model)
         if self.sensor_type:
             self.table.cellChanged.connect(self.update_individual)
-            for r in range(self.table.rowCount()):
-                for key, col in self.col_map.items():
-                    combo = self.table.cellWidget(r, col)
-                    if isinstance(combo, QComboBox):
-                        combo.currentIndexChanged.connect(
-                            lambda _, rr=r: self.update_individual(row=rr)
-                )
 
     # ---------------------------------------------------------
     # UPDATE UNTUK SENSOR INDIVIDU
     # ---------------------------------------------------------
     def update_individual(self, row=None, col=None):
-        """Proses klasifikasi otomatis untuk baris tertentu (single sensor)."""
-        
+        """
+        Tandai baris untuk diklasifikasi ulang. Klasifikasi dijalankan sekali per baris
+        pada putaran event loop berikutnya (lihat PenjadwalKlasifikasi).
+        """
+        if row is None:
+            return
+        penjadwal_klasifikasi.tandai_baris(self, row)
+
+    def klasifikasi_baris(self, rows):
+        """
+        Klasifikasi ulang baris-baris tabel sekarang juga.
+
+        Return:
+            list of (row, Exception): baris yang gagal diproses.
+        """
+        kesalahan = []
         try:
-            if row is None:
-                return
-
-            # Ambil input dari tabel
-            data = {}
-            for key, col in self.col_map.items():
-                item = self.table.item(row, col)
-                widget = self.table.cellWidget(row, col)
-
-                if isinstance(widget, QComboBox):
-                    data[key] = widget.currentText().strip() if widget.currentText() else None
-                elif item and item.text():
-                    try:
-                        val = float(item.text())
-                        if key in ["ppc", "kepastian"]:
-                            val = int(val)
-                    except ValueError:
-                        val = item.text().strip()
-                    data[key] = val
-                else:
-                    data[key] = None
-
-            # Jalankan klasifikasi sesuai sensor
-            if self.sensor_type == "TEV":
-                result = KlasifikasiPDTEV(
-                    data.get("nilai", 0),
-                    data.get("ppc", 0),
-                    data.get("interpretasi")
-                )
-            elif self.sensor_type == "HFCT":
-                result = KlasifikasiPDHFCT(
-                    nilai_pc=data.get("nilai", 0),
-                    ppc=data.get("ppc", 0),
-                    unipolar_waveform=data.get("unipolar_waveform"),
-                    cluster_dua_gelombang=data.get("cluster_dua_gelombang")
-                )
-            elif self.sensor_type == "Ultrasonik":
-                result = KlasifikasiPDUltrasonik(
-                    nilai_dbuv=data.get("nilai", 0),
-                    kepastian=data.get("kepastian", 0),
-                    interpretasi=data.get("interpretasi"),
-                    suara_gemerosok=data.get("suara_gemerosok"),
-                    cluster_dua_gelombang=data.get("cluster_dua_gelombang"),
-                    sensor=self.extra_params.get("sensor", "unknown")
-                )
-            else:
-                result = {"tingkat_keparahan": "N/A", "rekomendasi": "Sensor tidak dikenali"}
+            jumlah_baris = self.table.rowCount()
+        except RuntimeError:
+            # Tabel sudah dihapus sebelum antrean diproses
+            return kesalahan
 
-            # Update tabel
-            self.table.blockSignals(True)
-            self.table.setItem(row, self.output_cols[0], QTableWidgetItem(result["tingkat_keparahan"]))
-            self.table.setItem(row, self.output_cols[1], QTableWidgetItem(str(result["rekomendasi"])))
+        # Sinyal view ditahan → cellChanged tidak dipancarkan, tampilan tetap ikut model
+        model = self.table.model()
+        self.table.blockSignals(True)
+        try:
+            for row in rows:
+                if row >= jumlah_baris:
+                    continue
+                try:
+                    result = self._klasifikasi(row)
+                    model.setel(row, self.output_cols[0], result["tingkat_keparahan"])
+                    model.setel(row, self.output_cols[1], str(result["rekomendasi"]))
+                except Exception as e:
+                    kesalahan.append((row, e))
+                    continue
+                penjadwal_klasifikasi.teruskan_hasil(self.table, row, result)
+        finally:
             self.table.blockSignals(False)
+        return kesalahan
 
-        except Exception as e:
-            self.table.blockSignals(False)
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Warning)
-            msg.setWindowTitle("Input Error")
-            msg.setText(f"Terjadi kesalahan pada tabel {self.sensor_type} baris {row+1}.")
-            msg.setInformativeText(f"Detail error: {str(e)}")
-            msg.setStandardButtons(QMessageBox.Ok)
-            msg.exec()
+    def _klasifikasi(self, row):
+        """Baca input satu baris dan jalankan klasifikasi sesuai sensor."""
+        # Ambil input dari model tabel
+        model = self.table.model()
+        data = {}
+        for key, col in self.col_map.items():
+            teks = model.teks(row, col)
+
+            if not teks:
+                data[key] = None
+            elif model.berpilihan(row, col):
+                data[key] = teks.strip()
+            else:
+                try:
+                    val = float(teks)
+                    if key in ["ppc", "kepastian"]:
+                        val = int(val)
+                except ValueError:
+                    val = teks.strip()
+                data[key] = val
+
+        # Jalankan klasifikasi sesuai sensor
+        if self.sensor_type == "TEV":
+            return KlasifikasiPDTEV(
+                data.get("nilai", 0),
+                data.get("ppc", 0),
+                data.get("interpretasi")
+            )
+        elif self.sensor_type == "HFCT":
+            return KlasifikasiPDHFCT(
+                nilai_pc=data.get("nilai", 0),
+                ppc=data.get("ppc", 0),
+                unipolar_waveform=data.get("unipolar_waveform"),
+                cluster_dua_gelombang=data.get("cluster_dua_gelombang")
+            )
+        elif self.sensor_type == "Ultrasonik":
+            return KlasifikasiPDUltrasonik(
+                nilai_dbuv=data.get("nilai", 0),
+                kepastian=data.get("kepastian", 0),
+                interpretasi=data.get("interpretasi"),
+                suara_gemerosok=data.get("suara_gemerosok"),
+                cluster_dua_gelombang=data.get("cluster_dua_gelombang"),
+                sensor=self.extra_params.get("sensor", "unknown")
+            )
+        return {"tingkat_keparahan": "N/A", "rekomendasi": "Sensor tidak dikenali"}
+
+    def tampilkan_kesalahan(self, kesalahan):
+        """Satu pesan untuk semua baris yang gagal dalam satu putaran."""
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Warning)
+        msg.setWindowTitle("Input Error")
+        baris = ", ".join(str(row + 1) for row, _ in kesalahan)
+        msg.setText(f"Terjadi kesalahan pada tabel {self.sensor_type} baris {baris}.")
+        msg.setInformativeText("\n".join(f"Baris {row + 1}: {e}" for row, e in kesalahan))
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.exec()
 
     # ---------------------------------------------------------
     # UPDATE UNTUK KOMBINASI SENSOR
     # ---------------------------------------------------------
-    def update_summary(self, row_map: dict, output_cols: tuple):
+    def update_summary(self, row_map: dict, output_cols: tuple, row=None):
         """
-        Update klasifikasi gabungan antar-sensor (legacy style).
+        Jadwalkan update klasifikasi gabungan antar-sensor (dihitung sekali per putaran
+        event loop, setelah klasifikasi individu yang tertunda selesai).
         Args:
             row_map (dict): mapping sensor → (table, col_keparahan, col_rekomendasi)
             output_cols (tuple): (col_keparahan_final, col_rekomendasi_final) di summary table
+            row (int): baris yang berubah; None → hitung ulang semua baris
+        """
+        self._ikat_summary(row_map, output_cols)
+        if row is None:
+            self._summary_penuh = True
+        else:
+            self._baris_summary.add(row)
+        penjadwal_klasifikasi.tandai_summary(self)
+
+    def _ikat_summary(self, row_map, output_cols):
+        """Simpan row_map; tabel baru → cache dikosongkan & perubahan jumlah baris dipantau."""
+        ikatan = tuple((sensor, id(t), col_k, col_r) for sensor, (t, col_k, col_r) in row_map.items())
+        if ikatan == self._ikatan_summary and output_cols == self.summary_output_cols:
+            return
+        self.row_map = dict(row_map)
+        self.summary_output_cols = output_cols
+        self._ikatan_summary = ikatan
+        self._cache_baris.clear()
+        self._summary_penuh = True
+        penjadwal_klasifikasi.daftarkan_summary(self)
+
+        # Baris disisipkan / dihapus → indeks baris bergeser, cache tidak berlaku lagi
+        for tabel, _, _ in self.row_map.values():
+            tabel.model().rowsInserted.connect(self._tandai_summary_penuh)
+            tabel.model().rowsRemoved.connect(self._tandai_summary_penuh)
+
+    def _tandai_summary_penuh(self, *_):
+        self._summary_penuh = True
+        penjadwal_klasifikasi.tandai_summary(self)
+
+    def terima_hasil(self, table, row, result):
+        """Hasil klasifikasi baris dari tabel sensor → perbarui cache & tandai baris summary."""
+        if not self.row_map:
+            return
+        for sensor, (tabel, _, _) in self.row_map.items():
+            if tabel is not table:
+                continue
+            if row in self._cache_baris:
+                self._cache_baris[row][sensor] = {
+                    "metode": sensor,
+                    "tingkat_keparahan": result["tingkat_keparahan"],
+                    "rekomendasi": str(result["rekomendasi"])
+                }
+            self._baris_summary.add(row)
+            penjadwal_klasifikasi.tandai_summary(self)
+
+    def _baca_baris(self, row):
+        """
+        Ambil hasil tiap sensor untuk satu baris dari tabel (dipakai sekali, lalu di-cache).
+        Sensor yang belum pernah diklasifikasi (keparahan kosong) dilewati.
+        """
+        hasil = {}
+        for sensor, (tabel, col_k, col_r) in self.row_map.items():
+            if row >= tabel.rowCount():
+                continue
+            keparahan = tabel.teks(row, col_k)
+            if keparahan:
+                hasil[sensor] = {
+                    "metode": sensor,
+                    "tingkat_keparahan": keparahan,
+                    "rekomendasi": tabel.teks(row, col_r)
+                }
+        return hasil
+
+    def hitung_summary(self):
+        """
+        Hitung ulang baris summary yang ditandai sekarang juga.
+        Baris yang belum ada di cache dibaca sekali dari tabel sensor; setelah itu cache
+        diperbarui lewat terima_hasil tanpa membaca tabel lagi.
         """
         from StandardValue import KlasifikasiPDFinal
 
-        row_count = max(t.rowCount() for _, (t, _, _) in row_map.items())
-        self.table.setRowCount(row_count)
-
-        for r in range(row_count):
-            hasil = []
-
-            # Gunakan get_result dari masing-masing sensor updater
-            for sensor, (tabel, col_k, col_r) in row_map.items():
-                # Ambil hasil langsung dari tabel → bentuk dict mirip get_result()
-                keparahan_item = tabel.item(r, col_k)
-                rekomendasi_item = tabel.item(r, col_r)
-
-                if keparahan_item and rekomendasi_item:
-                    hasil.append({
-                        "metode": sensor,
-                        "tingkat_keparahan": keparahan_item.text(),
-                        "rekomendasi": rekomendasi_item.text()
-                    })
-
-            final = KlasifikasiPDFinal(hasil) if hasil else {
-                "keparahan_final": "Tidak Ada Data",
-                "rekomendasi_final": "Tidak ada hasil"
-            }
-
-            # Update tabel summary
-            self.table.setItem(r, output_cols[0], QTableWidgetItem(final["keparahan_final"]))
-            self.table.setItem(r, output_cols[1], QTableWidgetItem(final["rekomendasi_final"]))
+        if not self.row_map:
+            return
+        output_cols = self.summary_output_cols
+        try:
+            row_count = max(t.rowCount() for _, (t, _, _) in self.row_map.items())
+            if self._summary_penuh:
+                self.table.setRowCount(row_count)
+                self._cache_baris.clear()
+                rows = range(row_count)
+            else:
+                rows = sorted(r for r in self._baris_summary if r < row_count)
+
+            for r in rows:
+                hasil = self._cache_baris.get(r)
+                if hasil is None:
+                    hasil = self._cache_baris[r] = self._baca_baris(r)
+
+                final = KlasifikasiPDFinal(list(hasil.values())) if hasil else {
+                    "keparahan_final": "Tidak Ada Data",
+                    "rekomendasi_final": "Tidak ada hasil"
+                }
+
+                # Update tabel summary
+                self.table.setel(r, output_cols[0], final["keparahan_final"])
+                self.table.setel(r, output_cols[1], final["rekomendasi_final"])
+        except RuntimeError:
+            # Tabel sudah dihapus sebelum / selama antrean diproses
+            return
+        finally:
+            self._summary_penuh = False
+            self._baris_summary = set()
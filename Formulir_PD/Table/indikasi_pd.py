@@ -1,8 +1,7 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QFrame, QHBoxLayout,
-    QGridLayout, QLabel, QRadioButton, QButtonGroup, QLineEdit, QHeaderView
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QLineEdit, QHeaderView
 )
-from PySide6.QtCore import Qt
+from MyWidget import KolomTabel, TabelPengukuran
 
 # =========================================================
 # TAB : INDIKASI PD KESELURUHAN
@@ -12,8 +11,8 @@ class IndikasiPD(QWidget):
     QWidget untuk tab Indikasi PD.
     Menyediakan:
     - Input beban trafo (Ampere) untuk tiap trafo
-    - Tabel titik pengujian dengan pilihan hasil (✔/✖) per sensor
-    - Kolom lokasi temuan (aktif hanya jika ✔ dipilih)
+    - Tabel titik pengujian dengan centang hasil (✔/✖) per sensor
+    - Lokasi temuan di sel yang sama (aktif hanya jika ✔ dicentang)
     """
 
     def __init__(self, trafo_names):
@@ -71,61 +70,21 @@ class IndikasiPD(QWidget):
         ]
 
         total_rows = sum(len(sensors) for _, sensors in data)
-        col_headers = ["Titik Pengujian", "Tipe Sensor"] + trafo_names
 
-        table = QTableWidget(total_rows, len(col_headers))
-        table.setHorizontalHeaderLabels(col_headers)
+        # Kolom trafo: centang ✔/✖ + lokasi temuan (teks hanya bisa diisi jika dicentang)
+        kolom = [
+            KolomTabel("titik", "Titik Pengujian", baca_saja=True),
+            KolomTabel("sensor", "Tipe Sensor", baca_saja=True),
+        ] + [KolomTabel(trafo, trafo, "centang") for trafo in trafo_names]
+
+        table = TabelPengukuran(kolom, jumlah_baris=total_rows)
+        model = table.model()
 
         row_index = 0
         for section, sensors in data:
             for sensor in sensors:
-                # Kolom titik (read-only)
-                titik_item = QTableWidgetItem(section)
-                titik_item.setFlags(titik_item.flags() & ~Qt.ItemIsEditable)
-                table.setItem(row_index, 0, titik_item)
-
-                # Kolom sensor (read-only)
-                sensor_item = QTableWidgetItem(sensor)
-                sensor_item.setFlags(sensor_item.flags() & ~Qt.ItemIsEditable)
-                table.setItem(row_index, 1, sensor_item)
-
-                # Kolom trafo (✔/✖ + lokasi)
-                for col in range(len(trafo_names)):
-                    frame = QFrame()
-                    frame_layout = QHBoxLayout(frame)
-                    frame_layout.setContentsMargins(0, 0, 0, 0)
-                    frame_layout.setSpacing(5)
-
-                    group = QButtonGroup(frame)
-
-                    # Tombol ✔ dan ✖
-                    btn_yes = QRadioButton("✔")
-                    btn_no = QRadioButton("✖")
-                    btn_no.setChecked(True)
-                    group.addButton(btn_yes)
-                    group.addButton(btn_no)
-
-                    # Input lokasi (aktif jika ✔)
-                    lokasi_edit = QLineEdit()
-                    lokasi_edit.setPlaceholderText("Lokasi Temuan")
-                    lokasi_edit.setReadOnly(True)
-                    lokasi_edit.setFixedWidth(120)
-
-                    def toggle_edit(checked, edit=lokasi_edit):
-                        edit.setReadOnly(not checked)
-                        if not checked:
-                            edit.clear()
-                    btn_yes.toggled.connect(toggle_edit)
-
-                    # Susun layout cell
-                    frame_layout.addWidget(btn_yes)
-                    frame_layout.addWidget(btn_no)
-                    frame_layout.addWidget(lokasi_edit)
-                    frame_layout.addStretch(1)
-                    frame.setMaximumWidth(220)
-
-                    table.setCellWidget(row_index, col + 2, frame)
-
+                model.setel(row_index, 0, section)
+                model.setel(row_index, 1, sensor)
                 row_index += 1
 
         # Merge kategori titik
@@ -133,7 +92,7 @@ class IndikasiPD(QWidget):
         start_row = 0
         span_count = 0
         for row in range(table.rowCount()):
-            text = table.item(row, 0).text()
+            text = table.teks(row, 0)
             if text == current_text:
                 span_count += 1
             else:
@@ -173,20 +132,19 @@ class IndikasiPD(QWidget):
             "beban_trafo": { "TRF#1": "...", ... }
         }
         """
+        model = self.table.model()
         result = []
-        for row in range(self.table.rowCount()):
+        for row in range(model.rowCount()):
             row_data = {
-                "titik": self.table.item(row, 0).text(),
-                "sensor": self.table.item(row, 1).text(),
+                "titik": model.teks(row, 0),
+                "sensor": model.teks(row, 1),
                 "trafo": []
             }
             for col in range(len(self.trafo_names)):
-                cell_widget = self.table.cellWidget(row, col + 2)
-                yes_button = cell_widget.layout().itemAt(0).widget()
-                lokasi_edit = cell_widget.layout().itemAt(2).widget()
+                yes, lokasi = model.nilai(row, col + 2)
                 row_data["trafo"].append({
-                    "yes": yes_button.isChecked(),
-                    "lokasi": lokasi_edit.text()
+                    "yes": yes,
+                    "lokasi": lokasi
                 })
             result.append(row_data)
 
@@ -201,19 +159,11 @@ class IndikasiPD(QWidget):
         - Isi lokasi temuan
         - Muat input beban trafo
         """
+        model = self.table.model()
         saved_rows = saved_data.get("rows", [])
-        for row, row_data in enumerate(saved_rows):
-            for col, trafo_info in enumerate(row_data.get("trafo", [])):
-                cell_widget = self.table.cellWidget(row, col + 2)
-                yes_button = cell_widget.layout().itemAt(0).widget()
-                no_button = cell_widget.layout().itemAt(1).widget()
-                lokasi_edit = cell_widget.layout().itemAt(2).widget()
-
-                if trafo_info["yes"]:
-                    yes_button.setChecked(True)
-                else:
-                    no_button.setChecked(True)
-                lokasi_edit.setText(trafo_info.get("lokasi", ""))
+        for row, row_data in enumerate(saved_rows[:model.rowCount()]):
+            for col, trafo_info in enumerate(row_data.get("trafo", [])[:len(self.trafo_names)]):
+                model.setel(row, col + 2, (trafo_info["yes"], trafo_info.get("lokasi", "")))
 
         beban_data = saved_data.get("beban_trafo", {})
         for trafo, edit in self.trafo_load_edits.items():
@@ -227,15 +177,9 @@ class IndikasiPD(QWidget):
         - Lokasi temuan kosong + disabled
         - Input beban kosong
         """
-        for row in range(self.table.rowCount()):
-            for col in range(len(self.trafo_names)):
-                cell_widget = self.table.cellWidget(row, col + 2)
-                no_button = cell_widget.layout().itemAt(1).widget()
-                lokasi_edit = cell_widget.layout().itemAt(2).widget()
-
-                no_button.setChecked(True)
-                lokasi_edit.clear()
-                lokasi_edit.setReadOnly(True)
+        model = self.table.model()
+        for row in range(model.rowCount()):
+            model.kosongkan_baris(row, range(2, model.columnCount()))
 
         for edit in self.trafo_load_edits.values():
             edit.clear()
@@ -243,7 +187,7 @@ class IndikasiPD(QWidget):
     def reset_trafo_column(self, trafo_index):
         """
         Setel ulang hanya satu kolom trafo di UI IndikasiPD:
-        - Atur semua radio ke ✖, hapus lokasi, nonaktifkan input lokasi
+        - Atur semua centang ke ✖ dan hapus lokasi (lokasi tidak bisa diisi)
         - Hapus kolom beban untuk trafo tersebut
         """
         # Kondisi tidak ada data
@@ -251,23 +195,12 @@ class IndikasiPD(QWidget):
             return
 
         # Reset kolom tabel
-        for row in range(self.table.rowCount()):
-            cell_widget = self.table.cellWidget(row, trafo_index + 2)
-            if not cell_widget:
-                continue
-            try:
-                yes_button = cell_widget.layout().itemAt(0).widget()
-                no_button  = cell_widget.layout().itemAt(1).widget()
-                lokasi_edit = cell_widget.layout().itemAt(2).widget()
-            except Exception:
-                continue
-
+        model = self.table.model()
+        if not 0 <= trafo_index < len(self.trafo_names):
+            return
+        for row in range(model.rowCount()):
             #  Atur ke ✖ dan menghapus lokasi
-            if no_button:
-                no_button.setChecked(True)
-            if lokasi_edit:
-                lokasi_edit.clear()
-                lokasi_edit.setReadOnly(True)
+            model.setel(row, trafo_index + 2, (False, ""))
 
         # Reset beban trafo
         try:
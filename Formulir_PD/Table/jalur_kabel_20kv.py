@@ -5,11 +5,9 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QGridLayout, QLabel, QComboBox, 
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QComboBox, QHeaderView
 )
-from PySide6.QtCore import Qt
-from MyWidget import RowEditors
+from MyWidget import RowEditors, KolomTabel, TabelPengukuran
 from StandardValue import KlasifikasiPDUltrasonik, UpdateHasilKlasifikasi
 
 
@@ -54,45 +52,27 @@ class JalurKabel20kV(QWidget):
         layout.addLayout(grid)
 
         # ---------------------------------------------------------
-        # WIDGET BANTU
+        # KOLOM TABEL
         # ---------------------------------------------------------
-        def make_interpretasi_combo():
-            combo = QComboBox()
-            combo.addItems(["PD", "Noise"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        def make_suara_gemerosok_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        def make_cluster_dua_gelombang_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
+        self.kolom = [
+            KolomTabel("titik", "Titik", baca_saja=True),
+            KolomTabel("nilai", "Nilai (dBμV)", "angka"),
+            KolomTabel("kepastian", "Kepastian (%)", "angka"),
+            KolomTabel("interpretasi", "Interpretasi", "pilihan", ("PD", "Noise")),
+            KolomTabel("suara_gemerosok", "Suara Gemeresok", "pilihan", ("Tidak Ada", "Ada")),
+            KolomTabel("cluster_dua_gelombang", "Cluster Dua Gelombang", "pilihan", ("Tidak Ada", "Ada")),
+            KolomTabel("lokasi_temuan", "Lokasi Temuan"),
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi", baca_saja=True),
+        ]
+        self.keys = [k.key for k in self.kolom]
 
         # ---------------------------------------------------------
         # SETUP ROW TABEL
         # ---------------------------------------------------------
         def setup_row(table, row_index):
-            """Buat struktur row default untuk tabel Jalur Kabel."""
-            # Kolom 0: nomor titik (read-only)
-            titik_item = QTableWidgetItem(str(row_index + 1))
-            titik_item.setFlags(titik_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(row_index, 0, titik_item)
-
-            # Kolom input
-            table.setItem(row_index, 1, QTableWidgetItem(""))                       # Nilai
-            table.setItem(row_index, 2, QTableWidgetItem(""))                       # Kepastian
-            table.setCellWidget(row_index, 3, make_interpretasi_combo())            # Interpretasi
-            table.setCellWidget(row_index, 4, make_suara_gemerosok_combo())         # Suara
-            table.setCellWidget(row_index, 5, make_cluster_dua_gelombang_combo())   # Cluster
-            table.setItem(row_index, 6, QTableWidgetItem(""))                       # Lokasi temuan
-            table.setItem(row_index, 7, QTableWidgetItem(""))                       # Keparahan
-            table.setItem(row_index, 8, QTableWidgetItem(""))                       # Rekomendasi
+            """Isi default row baru untuk tabel Jalur Kabel (nomor titik)."""
+            table.setel(row_index, 0, str(row_index + 1))
 
         # Simpan callback agar bisa dipanggil di fungsi load
         self.setup_row = setup_row
@@ -100,15 +80,7 @@ class JalurKabel20kV(QWidget):
         # -----------------------------------------------------
         # TABEL PENGUJIAN
         # -----------------------------------------------------
-        self.table = QTableWidget(0, 9)
-        self.table.setHorizontalHeaderLabels([
-            "Titik", "Nilai (dBμV)", "Kepastian (%)", "Interpretasi",
-            "Suara Gemeresok", "Cluster Dua Gelombang", "Lokasi Temuan",
-            "Tingkat Keparahan", "Rekomendasi Aksi"
-        ])
-
-        # Insert row pertama
-        self.table.insertRow(0)
+        self.table = TabelPengukuran(self.kolom, jumlah_baris=1)
         self.setup_row(self.table, 0)
 
         # Atur lebar kolom untuk hasil klasifikasi
@@ -158,22 +130,8 @@ class JalurKabel20kV(QWidget):
         }
     
     def save_table_data(self, table):
-        """Ambil isi tabel per row ke dalam list of dict."""
-        data = []
-        for row in range(table.rowCount()):
-            row_data = {
-                "titik": table.item(row, 0).text() if table.item(row, 0) else "",
-                "nilai": table.item(row, 1).text() if table.item(row, 1) else "",
-                "kepastian": table.item(row, 2).text() if table.item(row, 2) else "",
-                "interpretasi": table.cellWidget(row, 3).currentText() if table.cellWidget(row, 3) else "",
-                "suara_gemerosok": table.cellWidget(row, 4).currentText() if table.cellWidget(row, 4) else "",
-                "cluster_dua_gelombang": table.cellWidget(row, 5).currentText() if table.cellWidget(row, 5) else "",
-                "lokasi_temuan": table.item(row, 6).text() if table.item(row, 6) else "",
-                "tingkat_keparahan": table.item(row, 7).text() if table.item(row, 7) else "",
-                "rekomendasi": table.item(row, 8).text() if table.item(row, 8) else "",
-            }
-            data.append(row_data)
-        return data
+        """Ambil isi tabel per row ke dalam list of dict (langsung dari model)."""
+        return table.model().ke_list(self.keys)
 
     # ===== Fungsi Load =====
     def load_tab(self, saved_data):
@@ -184,21 +142,7 @@ class JalurKabel20kV(QWidget):
 
     def load_table_data(self, table, table_data):
         """Isi ulang tabel dari list of dict."""
-        table.setRowCount(0)
-        for i, row_data in enumerate(table_data):
-            table.insertRow(i)
-            self.setup_row(table, i)
-
-            # Mapping isi ke setiap kolom
-            if table.item(i, 0): table.item(i, 0).setText(row_data.get("titik", ""))
-            if table.item(i, 1): table.item(i, 1).setText(row_data.get("nilai", ""))
-            if table.item(i, 2): table.item(i, 2).setText(row_data.get("kepastian", ""))
-            if table.cellWidget(i, 3): table.cellWidget(i, 3).setCurrentText(row_data.get("interpretasi", ""))
-            if table.cellWidget(i, 4): table.cellWidget(i, 4).setCurrentText(row_data.get("suara_gemerosok", ""))
-            if table.cellWidget(i, 5): table.cellWidget(i, 5).setCurrentText(row_data.get("cluster_dua_gelombang", ""))
-            if table.item(i, 6): table.item(i, 6).setText(row_data.get("lokasi_temuan", ""))
-            table.setItem(i, 7, QTableWidgetItem(row_data.get("tingkat_keparahan", "")))
-            table.setItem(i, 8, QTableWidgetItem(row_data.get("rekomendasi", "")))
+        table.model().dari_list(table_data, self.keys)
 
     # ===== Fungsi Reset =====
     def reset_tab(self):
@@ -208,15 +152,6 @@ class JalurKabel20kV(QWidget):
 
     def reset_table_data(self, table):
         """Kosongkan isi tabel tanpa hapus struktur row/col."""
-        for row in range(table.rowCount()):
-            # Kosongkan teks di kolom 0–2, 6–8
-            for col in (0, 1, 2, 6, 7, 8):
-                item = table.item(row, col)
-                if item:
-                    item.setText("")
-
-            # Reset combobox (interpretasi, suara, cluster)
-            for col in (3, 4, 5):
-                widget = table.cellWidget(row, col)
-                if widget:
-                    widget.setCurrentIndex(-1)
+        model = table.model()
+        for row in range(model.rowCount()):
+            model.kosongkan_baris(row, range(model.columnCount()))
@@ -5,11 +5,9 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QGridLayout, QLabel, QLineEdit, QComboBox, 
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QLineEdit, QComboBox, QHeaderView
 )
-from PySide6.QtCore import Qt
-from MyWidget import TableUtility
+from MyWidget import TableUtility, KolomTabel, TabelPengukuran
 from StandardValue import KlasifikasiPDTEV, KlasifikasiPDHFCT, KlasifikasiPDFinal, UpdateHasilKlasifikasi
 
 # =========================================================
@@ -83,34 +81,35 @@ class KabelPower20kV(QWidget):
         layout.addLayout(grid)
 
         # ---------------------------------------------------------
-        # WIDGET BANTU
+        # KOLOM TABEL
         # ---------------------------------------------------------
-        # ComboBox untuk interpretasi TEV (kategori a–g).
-        def make_interpretasi_combo():
-            combo = QComboBox()
-            combo.addItems([chr(c) for c in range(ord("a"), ord("g") + 1)])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # ComboBox untuk status unipolar waveform (HFCT).
-        def make_unipolar_waveform_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # ComboBox untuk status cluster dua gelombang (HFCT).
-        def make_cluster_dua_gelombang_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # Membuat item tabel read-only (tidak bisa di-edit).
-        def make_readonly_item(text):
-            item = QTableWidgetItem(text)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            return item
+        ada_tidak = ("Tidak Ada", "Ada")
+        kolom_fasa_core = [
+            KolomTabel("fasa", "FASA", baca_saja=True),
+            KolomTabel("core", "CORE", baca_saja=True),
+        ]
+        # Interpretasi TEV (kategori a–g)
+        kolom_tev = kolom_fasa_core + [
+            KolomTabel("nilai", "Nilai (dB)", "angka"),
+            KolomTabel("ppc", "PPC", "angka"),
+            KolomTabel("interpretasi", "Interpretasi", "pilihan",
+                       tuple(chr(c) for c in range(ord("a"), ord("g") + 1))),
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi", baca_saja=True),
+        ]
+        # Unipolar waveform & cluster dua gelombang (HFCT)
+        kolom_hfct = kolom_fasa_core + [
+            KolomTabel("nilai", "Nilai (pC)", "angka"),
+            KolomTabel("ppc", "PPC", "angka"),
+            KolomTabel("unipolar_waveform", "Unipolar Waveform", "pilihan", ada_tidak),
+            KolomTabel("cluster_dua_gelombang", "Cluster Dua Gelombang", "pilihan", ada_tidak),
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi", baca_saja=True),
+        ]
+        kolom_summary = kolom_fasa_core + [
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan Keseluruhan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi Keseluruhan", baca_saja=True),
+        ]
 
         # ---------------------------------------------------------
         # TABEL PENGUJIAN
@@ -119,18 +118,21 @@ class KabelPower20kV(QWidget):
         phases = ["R", "S", "T"]
         cores_per_phase = 4
 
+        def make_table(kolom):
+            """Tabel fasa × core: kolom FASA di-merge per fasa, kolom CORE bernomor 1–4."""
+            table = TabelPengukuran(kolom, jumlah_baris=len(phases) * cores_per_phase)
+            model = table.model()
+            row_index = 0
+            for phase in phases:
+                table.setSpan(row_index, 0, cores_per_phase, 1)
+                model.setel(row_index, 0, phase)
+                for core in range(cores_per_phase):
+                    model.setel(row_index + core, 1, str(core + 1))
+                row_index += cores_per_phase
+            return table
+
         # ===== Tabel TEV =====
-        self.table_tev = QTableWidget(len(phases) * cores_per_phase, 7)
-        self.table_tev.setHorizontalHeaderLabels(["FASA", "CORE", "Nilai (dB)", "PPC", "Interpretasi", "Tingkat Keparahan", "Rekomendasi Aksi"])
-
-        row_index = 0
-        for phase in phases:
-            self.table_tev.setSpan(row_index, 0, cores_per_phase, 1)
-            self.table_tev.setItem(row_index, 0, make_readonly_item(phase))
-            for core in range(cores_per_phase):
-                self.table_tev.setItem(row_index + core, 1, make_readonly_item(str(core + 1)))
-                self.table_tev.setCellWidget(row_index + core, 4, make_interpretasi_combo())
-            row_index += cores_per_phase
+        self.table_tev = make_table(kolom_tev)
 
         TableUtility.update_table_height(self.table_tev)
         self.table_tev.resizeColumnsToContents()
@@ -140,7 +142,7 @@ class KabelPower20kV(QWidget):
         layout.addWidget(QLabel("<b>TEV</b>"))
         layout.addWidget(self.table_tev)
         
-        # Callback update klasifikasi TEV
+        # Callback update klasifikasi TEV (terhubung ke cellChanged tabel)
         self.tev_updater = UpdateHasilKlasifikasi(
             table=self.table_tev,
             sensor_type="TEV",
@@ -148,26 +150,8 @@ class KabelPower20kV(QWidget):
             output_cols=(5, 6)
         )
 
-        # Hubungkan event
-        self.table_tev.cellChanged.connect(self.tev_updater.update_individual)
-        for r in range(self.table_tev.rowCount()):
-            combo = self.table_tev.cellWidget(r, 4)  # interpretasi
-            if combo:
-                combo.currentIndexChanged.connect(lambda _, row=r: self.tev_updater.update_individual(row))
-        
         # ===== Tabel HFCT =====
-        self.table_hfct = QTableWidget(len(phases) * cores_per_phase, 8)
-        self.table_hfct.setHorizontalHeaderLabels(["FASA", "CORE", "Nilai (pC)", "PPC", "Unipolar Waveform", "Cluster Dua Gelombang", "Tingkat Keparahan", "Rekomendasi Aksi"])
-
-        row_index = 0
-        for phase in phases:
-            self.table_hfct.setSpan(row_index, 0, cores_per_phase, 1)
-            self.table_hfct.setItem(row_index, 0, make_readonly_item(phase))
-            for core in range(cores_per_phase):
-                self.table_hfct.setItem(row_index + core, 1, make_readonly_item(str(core + 1)))
-                self.table_hfct.setCellWidget(row_index + core, 4, make_unipolar_waveform_combo())
-                self.table_hfct.setCellWidget(row_index + core, 5, make_cluster_dua_gelombang_combo())
-            row_index += cores_per_phase
+        self.table_hfct = make_table(kolom_hfct)
 
         TableUtility.update_table_height(self.table_hfct)
         self.table_hfct.resizeColumnsToContents()
@@ -177,7 +161,7 @@ class KabelPower20kV(QWidget):
         layout.addWidget(QLabel("<b>HFCT</b>"))
         layout.addWidget(self.table_hfct)
 
-        # Callback update klasifikasi HFCT
+        # Callback update klasifikasi HFCT (terhubung ke cellChanged tabel)
         self.hfct_updater = UpdateHasilKlasifikasi(
             table=self.table_hfct,
             sensor_type="HFCT",
@@ -185,28 +169,8 @@ class KabelPower20kV(QWidget):
             output_cols=(6, 7)
         )
 
-        # Hubungkan event
-        self.table_hfct.cellChanged.connect(self.hfct_updater.update_individual)
-        for r in range(self.table_hfct.rowCount()):
-            for c in [4, 5]:
-                combo = self.table_hfct.cellWidget(r, c)
-                if combo:
-                    combo.currentIndexChanged.connect(lambda _, row=r: self.hfct_updater.update_individual(row))
-
-
         # ===== Tabel Rekap =====
-        self.table_summary = QTableWidget(len(phases) * cores_per_phase, 4)
-        self.table_summary.setHorizontalHeaderLabels([
-            "FASA", "CORE", "Tingkat Keparahan Keseluruhan", "Rekomendasi Aksi Keseluruhan"
-        ])
-
-        row_index = 0
-        for phase in phases:
-            self.table_summary.setSpan(row_index, 0, cores_per_phase, 1)
-            self.table_summary.setItem(row_index, 0, make_readonly_item(phase))
-            for core in range(cores_per_phase):
-                self.table_summary.setItem(row_index + core, 1, make_readonly_item(str(core + 1)))
-            row_index += cores_per_phase
+        self.table_summary = make_table(kolom_summary)
 
         TableUtility.update_table_height(self.table_summary)
         self.table_summary.resizeColumnsToContents()
@@ -229,19 +193,21 @@ class KabelPower20kV(QWidget):
         
         # Trigger summary setiap kali TEV berubah
         self.table_tev.cellChanged.connect(
-            lambda *_: self.summary_updater.update_summary(
+            lambda row, col: self.summary_updater.update_summary(
                 row_map={"TEV": (self.table_tev, 5, 6),
                         "HFCT": (self.table_hfct, 6, 7)},
-                output_cols=(2, 3)
+                output_cols=(2, 3),
+                row=row
             )
         )
 
         # Trigger summary setiap kali HFCT berubah
         self.table_hfct.cellChanged.connect(
-            lambda *_: self.summary_updater.update_summary(
+            lambda row, col: self.summary_updater.update_summary(
                 row_map={"TEV": (self.table_tev, 5, 6),
                         "HFCT": (self.table_hfct, 6, 7)},
-                output_cols=(2, 3)
+                output_cols=(2, 3),
+                row=row
             )
         )
     # ---------------------------------------------------------
@@ -265,30 +231,8 @@ class KabelPower20kV(QWidget):
         }
 
     def save_table_data(self, table, keys):
-        data = []
-        for row in range(table.rowCount()):
-            row_data = {}
-            # mapping kolom sesuai tabel
-            col_map = {
-                "nilai": 2,
-                "ppc": 3,
-                "interpretasi": 4,
-                "unipolar_waveform": 4,
-                "cluster_dua_gelombang": 5,
-                "tingkat_keparahan": table.columnCount() - 2,
-                "rekomendasi": table.columnCount() - 1
-            }
-
-            for key in keys:
-                col_idx = col_map[key]
-                widget = table.cellWidget(row, col_idx)
-                if widget:
-                    row_data[key] = widget.currentText()
-                else:
-                    item = table.item(row, col_idx)
-                    row_data[key] = item.text() if item else ""
-            data.append(row_data)
-        return data
+        """Ambil isi tabel per row (hanya key yang diminta), langsung dari model."""
+        return table.model().ke_list(keys)
 
     # ===== Fungsi Load =====
     def load_tab(self, saved_data):
@@ -313,29 +257,8 @@ class KabelPower20kV(QWidget):
         )
         
     def load_table_data(self, table, table_data, keys=None):
-        col_map = {
-            "nilai": 2,
-            "ppc": 3,
-            "interpretasi": 4,
-            "unipolar_waveform": 4,
-            "cluster_dua_gelombang": 5,
-            "tingkat_keparahan": table.columnCount() - 2,
-            "rekomendasi": table.columnCount() - 1
-        }
-
-        for row, row_data in enumerate(table_data):
-            for key in keys:
-                value = row_data.get(key, "")
-                col_idx = col_map[key]
-                widget = table.cellWidget(row, col_idx)
-                if widget:
-                    widget.setCurrentText(value)
-                else:
-                    item = table.item(row, col_idx)
-                    if not item:
-                        item = QTableWidgetItem()
-                        table.setItem(row, col_idx, item)
-                    item.setText(value)
+        """Isi tabel berukuran tetap (fasa × core) dari list of dict."""
+        table.model().dari_list(table_data, keys, ubah_jumlah_baris=False)
 
     # ===== Fungsi Reset =====
     def reset_tab(self):
@@ -357,16 +280,7 @@ class KabelPower20kV(QWidget):
         self.reset_table_data(self.table_hfct)
 
     def reset_table_data(self, table):
-        """Reset semua isi tabel (cellWidget/combo/item) ke default kosong."""
-        for row in range(table.rowCount()):
-            for col_idx in range(2, table.columnCount()):
-                widget = table.cellWidget(row, col_idx)
-                if widget:
-                    if widget.count() > 0:
-                        widget.setCurrentIndex(-1)  # kembali ke kosong
-                    else:
-                        widget.setCurrentText("")
-                else:
-                    item = table.item(row, col_idx)
-                    if item:
-                        item.setText("")
\ No newline at end of file
+        """Reset semua isi tabel (kecuali FASA & CORE) ke default kosong."""
+        model = table.model()
+        for row in range(model.rowCount()):
+            model.kosongkan_baris(row, range(2, model.columnCount()))
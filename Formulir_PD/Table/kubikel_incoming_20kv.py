@@ -5,12 +5,10 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
 
 from PySide6.QtWidgets import ( 
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
-    QLineEdit, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QLineEdit, QComboBox, QHeaderView
 )
-from PySide6.QtCore import Qt
 
-from MyWidget import RowEditors, TableUtility
+from MyWidget import RowEditors, TableUtility, KolomTabel, TabelPengukuran
 from StandardValue import KlasifikasiPDTEV, KlasifikasiPDUltrasonik, KlasifikasiPDFinal, UpdateHasilKlasifikasi
 
 # =========================================================
@@ -24,23 +22,29 @@ class KubikelIncoming20kV(QWidget):
     - Tabel hasil pengukuran (tev, contact probe, flexible mic)
     - Tabel rekapitulasi
     """
+    # Pilihan titik busbar (label "Busbar" + posisi Atas / Bawah)
+    PILIHAN_BUSBAR = ("Busbar", "Busbar Atas", "Busbar Bawah")
+
     def __init__(self):
         super().__init__()
-        self.busbar_combos = {}  # Menyimpan referensi combobox busbar untuk sinkronisasi
         self.init_ui()
 
-    #  Fungsi bantu untuk sinkronisasi combobox cell busbar
-    def sync_busbar(self, row_key, source_combo):
+    #  Fungsi bantu untuk sinkronisasi titik busbar
+    def sync_busbar(self, titik):
         """
-        Sinkronkan semua combobox busbar.
-        row_key: identitas unik busbar.
+        Sinkronkan titik busbar di tabel TEV, Contact Probe, dan rekap.
+        titik: "Busbar", "Busbar Atas", atau "Busbar Bawah".
         """
-        idx = source_combo.currentIndex()
-        for combo in self.busbar_combos.get(row_key, []):
-            if combo is not source_combo:
-                combo.blockSignals(True)
-                combo.setCurrentIndex(idx)
-                combo.blockSignals(False)
+        for table in (self.table1, self.table2, self.table_summary):
+            for row in range(table.rowCount()):
+                sekarang = table.teks(row, 0)
+                if sekarang.startswith("Busbar") and sekarang != titik:
+                    table.setel(row, 0, titik)
+
+    def titik_berubah(self, table, row, col):
+        """Titik busbar diganti di salah satu tabel → ikuti di tabel lain."""
+        if col == 0 and table.teks(row, 0).startswith("Busbar"):
+            self.sync_busbar(table.teks(row, 0))
 
     # ---------------------------------------------------------
     # INISIALISASI UI
@@ -83,126 +87,69 @@ class KubikelIncoming20kV(QWidget):
         titik_default = ["Ruang CT", "Ruang VT", "Busbar", "PMT 20kV"]
 
         # ---------------------------------------------------------
-        # WIDGET BANTU
+        # KOLOM TABEL
         # ---------------------------------------------------------
-        def make_interpretasi_tev_combo():
-            # Combobox untuk interpretasi hasil TEV (a - g)
-            combo = QComboBox()
-            combo.addItems([chr(c) for c in range(ord("a"), ord("g") + 1)])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # Combobox untuk interpretasi hasil ultrasonik (Noise / PD)
-        def make_interpretasi_ultrasonik_combo():
-            combo = QComboBox()
-            combo.addItems(["Noise", "PD"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # Combobox untuk kondisi suara gemeresok (Ada / Tidak Ada)
-        def make_suara_gemerosok_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-        
-        # Combobox untuk kondisi cluster dua gelombang (Ada / Tidak Ada)
-        def make_cluster_dua_gelombang_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-        
-        # Widget gabungan label + combobox busbar (Atas / Bawah)
-        def make_busbar_combo():
-            container = QWidget()
-            hbox = QHBoxLayout(container)
-            hbox.setContentsMargins(0, 0, 0, 0)
-            hbox.setSpacing(5)
-            label = QLabel("Busbar")
-            combo = QComboBox()
-            combo.addItems(["Atas", "Bawah"])
-            combo.setCurrentIndex(-1)
-            hbox.addWidget(label)
-            hbox.addWidget(combo)
-            return container
-
-        self.make_interpretasi_tev_combo = make_interpretasi_tev_combo
-        self.make_interpretasi_ultrasonik_combo = make_interpretasi_ultrasonik_combo
-        self.make_suara_gemerosok_combo = make_suara_gemerosok_combo
-        self.make_cluster_dua_gelombang_combo = make_cluster_dua_gelombang_combo
-        self.make_busbar_combo = make_busbar_combo
+        ada_tidak = ("Tidak Ada", "Ada")
+        kolom_ultrasonik = [
+            KolomTabel("nilai", "Nilai (dBμV)", "angka"),
+            KolomTabel("kepastian", "Kepastian (%)", "angka"),
+            KolomTabel("interpretasi", "Interpretasi", "pilihan", ("Noise", "PD")),
+            KolomTabel("suara_gemerosok", "Suara Gemeresok", "pilihan", ada_tidak),
+            KolomTabel("cluster_dua_gelombang", "Cluster Dua Gelombang", "pilihan", ada_tidak),
+        ]
+        kolom_hasil = [
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi", baca_saja=True),
+        ]
+        self.kolom = {
+            # TEV → interpretasi a–g
+            "tev": [
+                KolomTabel("titik", "Titik", baca_saja=True),
+                KolomTabel("nilai", "Nilai (dB)", "angka"),
+                KolomTabel("ppc", "PPC", "angka"),
+                KolomTabel("interpretasi", "Interpretasi", "pilihan",
+                           tuple(chr(c) for c in range(ord("a"), ord("g") + 1))),
+            ] + kolom_hasil,
+            # Contact Probe → interpretasi + suara + cluster
+            "contact_probe": [KolomTabel("titik", "Titik", baca_saja=True)] + kolom_ultrasonik + kolom_hasil,
+            # Flexible Mic → titik bisa diisi + lokasi temuan
+            "flexible_mic": [KolomTabel("titik", "Titik")] + kolom_ultrasonik + [
+                KolomTabel("lokasi_temuan", "Lokasi Temuan")
+            ] + kolom_hasil,
+        }
+        self.keys = {table_type: [k.key for k in kolom] for table_type, kolom in self.kolom.items()}
 
         # ---------------------------------------------------------
         # UNIVERSAL ROW SETUP
         # ---------------------------------------------------------
         def setup_row(table, row, table_type, titik=None):
             """
-            Membuat isi default untuk 1 baris pada tabel tertentu.
-            table_type menentukan format input (TEV / Contact Probe / Flexible Mic).
+            Isi titik default untuk 1 baris pada tabel tertentu.
+            table_type menentukan format titik (TEV / Contact Probe / Flexible Mic).
             """
+            model = table.model()
             if table_type in ["tev", "contact_probe"]:
                 if titik and titik.startswith("Busbar"):
-                    widget = self.make_busbar_combo()
-                    table.setCellWidget(row, 0, widget)
-
-                    combo = widget.findChild(QComboBox)
-                    if combo:
-                        self.busbar_combos.setdefault("busbar", []).append(combo)
-                        combo.currentIndexChanged.connect(
-                            lambda _, rr="busbar", c=combo: self.sync_busbar(rr, c)
-                        )
-                        if "Atas" in titik:
-                            combo.setCurrentText("Atas")
-                        elif "Bawah" in titik:
-                            combo.setCurrentText("Bawah")
-                else:
-                    if titik:
-                        item = QTableWidgetItem(titik)
-                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                        table.setItem(row, 0, item)
-
-                # Khusus TEV → interpretasi
-                if table_type == "tev":
-                    table.setCellWidget(row, 3, self.make_interpretasi_tev_combo())
-                # Khusus Contact Probe → interpretasi + suara + cluster
-                elif table_type == "contact_probe":
-                    table.setCellWidget(row, 3, self.make_interpretasi_ultrasonik_combo())
-                    table.setCellWidget(row, 4, self.make_suara_gemerosok_combo())
-                    table.setCellWidget(row, 5, self.make_cluster_dua_gelombang_combo())
+                    # Titik busbar → pilih posisi Atas / Bawah lewat combobox di sel titik
+                    model.setel_pilihan(row, 0, self.PILIHAN_BUSBAR)
+                    model.setel_baca_saja(row, 0, False)
+                    if "Atas" in titik:
+                        model.setel(row, 0, "Busbar Atas")
+                    elif "Bawah" in titik:
+                        model.setel(row, 0, "Busbar Bawah")
+                    else:
+                        model.setel(row, 0, "Busbar")
+                elif titik:
+                    model.setel(row, 0, titik)
 
             elif table_type == "flexible_mic":
                 if not titik:
-                    titik_item = QTableWidgetItem(str(row + 1))
+                    model.setel(row, 0, str(row + 1))
                     if row == 0:
-                        titik_item.setFlags(titik_item.flags() & ~Qt.ItemIsEditable)
-                    table.setItem(row, 0, titik_item)
+                        model.setel_baca_saja(row, 0)
                 else:
-                    item = QTableWidgetItem(titik)
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    table.setItem(row, 0, item)
-
-                # ===== Inisialisasi Kolom Input =====
-                # Kolom 1: Nilai (dBµV)
-                nilai_item = QTableWidgetItem("")
-                table.setItem(row, 1, nilai_item)
-
-                # Kolom 2: Kepastian (%)
-                table.setItem(row, 2, QTableWidgetItem(""))
-
-                # Kolom 3–5: ComboBox untuk interpretasi & fitur tambahan
-                table.setCellWidget(row, 3, self.make_interpretasi_ultrasonik_combo())  # Interpretasi
-                table.setCellWidget(row, 4, self.make_suara_gemerosok_combo())          # Suara gemeresok 
-                table.setCellWidget(row, 5, self.make_cluster_dua_gelombang_combo())    # Cluster dua gelombang
-
-                # Kolom 6: Lokasi temuan
-                table.setItem(row, 6, QTableWidgetItem(""))
-
-                # Kolom 7: Tingkat keparahan (hasil klasifikasi)
-                table.setItem(row, 7, QTableWidgetItem(""))
-
-                # Kolom 8: Rekomendasi aksi (hasil klasifikasi)
-                table.setItem(row, 8, QTableWidgetItem(""))
+                    model.setel(row, 0, titik)
+                    model.setel_baca_saja(row, 0)
         
         # Simpan callback agar bisa dipanggil di fungsi load
         self.setup_row = setup_row
@@ -211,11 +158,7 @@ class KubikelIncoming20kV(QWidget):
         # TABEL PENGUJIAN
         # ---------------------------------------------------------
         # ===== Tabel TEV =====
-        self.table1 = QTableWidget(len(titik_default), 6)  
-        self.table1.setHorizontalHeaderLabels([
-            "Titik", "Nilai (dB)", "PPC", "Interpretasi", 
-            "Tingkat Keparahan", "Rekomendasi Aksi"
-        ])
+        self.table1 = TabelPengukuran(self.kolom["tev"], jumlah_baris=len(titik_default))
 
         # Isi tabel awal
         for r, t in enumerate(titik_default):
@@ -241,11 +184,7 @@ class KubikelIncoming20kV(QWidget):
 )
 
         # ===== Tabel Contact Probe =====
-        self.table2 = QTableWidget(len(titik_default), 8)  # 8 kolom sesuai header
-        self.table2.setHorizontalHeaderLabels([
-            "Titik", "Nilai (dBμV)", "Kepastian (%)", "Interpretasi", "Suara Gemeresok",
-            "Cluster Dua Gelombang", "Tingkat Keparahan", "Rekomendasi Aksi"
-        ])
+        self.table2 = TabelPengukuran(self.kolom["contact_probe"], jumlah_baris=len(titik_default))
 
         # Isi baris default
         for r, t in enumerate(titik_default):
@@ -273,32 +212,19 @@ class KubikelIncoming20kV(QWidget):
         )
 
         # ===== Tabel Rekap TEV + Contact Probe =====
-        self.table_summary = QTableWidget(len(titik_default), 3)
-        self.table_summary.setHorizontalHeaderLabels([
-            "Titik", "Tingkat Keparahan Keseluruhan", "Rekomendasi Aksi Keseluruhan"
-        ])
+        self.table_summary = TabelPengukuran([
+            KolomTabel("titik", "Titik", baca_saja=True),
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan Keseluruhan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi Keseluruhan", baca_saja=True),
+        ], jumlah_baris=len(titik_default))
 
-        # Isi kolom titik
+        # Isi kolom titik (busbar hanya mengikuti tabel TEV / Contact Probe)
         for r, t in enumerate(titik_default):
-            if t == "Busbar":
-                # busbar pakai widget khusus
-                widget = self.make_busbar_combo()
-                self.table_summary.setCellWidget(r, 0, widget)
-
-                combo = widget.findChild(QComboBox)
-                if combo:
-                    combo.setEnabled(False)  # summary follow-only
-                    self.busbar_combos.setdefault("busbar", []).append(combo)
-
-            else:
-                # Titik normal → text read-only
-                item = QTableWidgetItem(t)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.table_summary.setItem(r, 0, item)
+            self.table_summary.setel(r, 0, t)
 
-            # Kolom keparahan + rekomendasi semula kosong
-            self.table_summary.setItem(r, 1, QTableWidgetItem(""))
-            self.table_summary.setItem(r, 2, QTableWidgetItem(""))
+        # Titik busbar TEV ↔ Contact Probe ↔ rekap selalu sama
+        for table in (self.table1, self.table2):
+            table.cellChanged.connect(lambda row, col, t=table: self.titik_berubah(t, row, col))
 
         # Fix tinggi agar 4 row pas
         TableUtility.update_table_height(self.table_summary)
@@ -323,34 +249,31 @@ class KubikelIncoming20kV(QWidget):
         )
         # Auto trigger summary kalau hasil TEV berubah
         self.table1.cellChanged.connect(
-            lambda *_: self.summary_updater.update_summary(
+            lambda row, col: self.summary_updater.update_summary(
                 row_map={
                     "TEV": (self.table1, 4, 5),
                     "Ultrasonik": (self.table2, 6, 7)
                 },
-                output_cols=(1, 2)
+                output_cols=(1, 2),
+                row=row
             )
         )
 
         # Auto trigger summary kalau hasil Contact Probe berubah
         self.table2.cellChanged.connect(
-            lambda *_: self.summary_updater.update_summary(
+            lambda row, col: self.summary_updater.update_summary(
                 row_map={
                     "TEV": (self.table1, 4, 5),
                     "Ultrasonik": (self.table2, 6, 7)
                 },
-                output_cols=(1, 2)
+                output_cols=(1, 2),
+                row=row
             )
         )
 
         # ===== Tabel Flexible Mic =====
-        self.table3 = QTableWidget(0, 9)
-        self.table3.setHorizontalHeaderLabels([
-            "Titik", "Nilai (dBμV)", "Kepastian (%)", "Interpretasi", "Suara Gemeresok", 
-            "Cluster Dua Gelombang", "Lokasi Temuan", "Tingkat Keparahan", "Rekomendasi Aksi"
-        ])
+        self.table3 = TabelPengukuran(self.kolom["flexible_mic"], jumlah_baris=1)
         # Mulai dengan 1 row default
-        self.table3.insertRow(0)
         self.setup_row(self.table3, 0, table_type="flexible_mic")
 
         layout.addWidget(QLabel("<b>Flexible Mic</b>"))
@@ -397,52 +320,8 @@ class KubikelIncoming20kV(QWidget):
         }
 
     def save_table_data(self, table, table_type):
-            data = []
-            for row in range(table.rowCount()):
-                row_data = {}
-
-                if table.cellWidget(row, 0):
-                    label = table.cellWidget(row, 0).layout().itemAt(0).widget().text()
-                    combo = table.cellWidget(row, 0).layout().itemAt(1).widget()
-                    row_data["titik"] = f"{label} {combo.currentText()}" if combo.currentText() else label
-                elif table.item(row, 0):
-                    row_data["titik"] = table.item(row, 0).text()
-
-                if table_type == "tev":
-                    row_data["nilai"] = table.item(row, 1).text() if table.item(row, 1) else ""
-                    row_data["ppc"] = table.item(row, 2).text() if table.item(row, 2) else ""
-                    combo = table.cellWidget(row, 3)
-                    row_data["interpretasi"] = combo.currentText() if combo else ""
-                    row_data["tingkat_keparahan"] = table.item(row, 4).text() if table.item(row, 4) else ""
-                    row_data["rekomendasi"] = table.item(row, 5).text() if table.item(row, 5) else ""
-
-                elif table_type == "contact_probe":
-                    row_data["nilai"] = table.item(row, 1).text() if table.item(row, 1) else ""
-                    row_data["kepastian"] = table.item(row, 2).text() if table.item(row, 2) else ""
-                    combo1 = table.cellWidget(row, 3)
-                    combo2 = table.cellWidget(row, 4)
-                    combo3 = table.cellWidget(row, 5)
-                    row_data["interpretasi"] = combo1.currentText() if combo1 else ""
-                    row_data["suara_gemerosok"] = combo2.currentText() if combo2 else ""
-                    row_data["cluster_dua_gelombang"] = combo3.currentText() if combo3 else ""
-                    row_data["tingkat_keparahan"] = table.item(row, 6).text() if table.item(row, 6) else ""
-                    row_data["rekomendasi"] = table.item(row, 7).text() if table.item(row, 7) else ""
-
-                elif table_type == "flexible_mic":
-                    row_data["nilai"] = table.item(row, 1).text() if table.item(row, 1) else ""
-                    row_data["kepastian"] = table.item(row, 2).text() if table.item(row, 2) else ""
-                    combo1 = table.cellWidget(row, 3)
-                    combo2 = table.cellWidget(row, 4)
-                    combo3 = table.cellWidget(row, 5)
-                    row_data["interpretasi"] = combo1.currentText() if combo1 else ""
-                    row_data["suara_gemerosok"] = combo2.currentText() if combo2 else ""
-                    row_data["cluster_dua_gelombang"] = combo3.currentText() if combo3 else ""
-                    row_data["lokasi_temuan"] = table.item(row, 6).text() if table.item(row, 6) else ""
-                    row_data["tingkat_keparahan"] = table.item(row, 7).text() if table.item(row, 7) else ""
-                    row_data["rekomendasi"] = table.item(row, 8).text() if table.item(row, 8) else ""
-
-                data.append(row_data)
-            return data
+        """Ambil isi tabel per row (key sesuai table_type), langsung dari model."""
+        return table.model().ke_list(self.keys[table_type])
 
     # ===== Fungsi Load =====
     def load_tab(self, saved_data):
@@ -454,55 +333,17 @@ class KubikelIncoming20kV(QWidget):
         self.load_table_data(self.table3, tables.get("flexible_mic", []), "flexible_mic")  
 
     def load_table_data(self, table, table_data, table_type):
-        table.setRowCount(0)
-
-        for i, row_data in enumerate(table_data):
-            table.insertRow(i)
+        """Isi ulang tabel dari list of dict; titik kosong diberi nama default."""
+        def isi_titik(i, row_data):
             titik = row_data.get("titik", "")
-
             if table_type in ("tev", "contact_probe") and "Busbar" in titik:
-                self.setup_row(table, i, table_type, "Busbar")
-                combo = table.cellWidget(i, 0).findChild(QComboBox)
-                if combo:
-                    if "Atas" in titik: combo.setCurrentText("Atas")
-                    elif "Bawah" in titik: combo.setCurrentText("Bawah")
-            
+                self.setup_row(table, i, table_type, "Busbar" + titik.split("Busbar", 1)[1])
             else:
                 if not titik:
                     titik = f"Titik {i+1}" if table_type != "flexible_mic" else str(i+1)
                 self.setup_row(table, i, table_type, titik)
 
-            if table_type == "tev":
-                if row_data.get("nilai"): table.setItem(i, 1, QTableWidgetItem(row_data["nilai"]))
-                if row_data.get("ppc"): table.setItem(i, 2, QTableWidgetItem(row_data["ppc"]))
-                if table.cellWidget(i, 3): table.cellWidget(i, 3).setCurrentText(row_data.get("interpretasi", ""))
-                if row_data.get("tingkat_keparahan"):   table.setItem(i, 4, QTableWidgetItem(row_data["tingkat_keparahan"]))
-                if row_data.get("rekomendasi"): table.setItem(i, 5, QTableWidgetItem(row_data["rekomendasi"]))
-            
-            elif table_type == "contact_probe":
-                if row_data.get("nilai"):       table.setItem(i, 1, QTableWidgetItem(row_data["nilai"]))
-                if row_data.get("kepastian"):   table.setItem(i, 2, QTableWidgetItem(row_data["kepastian"]))
-                if table.cellWidget(i, 3):      table.cellWidget(i, 3).setCurrentText(row_data.get("interpretasi", ""))
-                if table.cellWidget(i, 4):      table.cellWidget(i, 4).setCurrentText(row_data.get("suara_gemerosok", ""))
-                if table.cellWidget(i, 5):      table.cellWidget(i, 5).setCurrentText(row_data.get("cluster_dua_gelombang", ""))
-                if row_data.get("tingkat_keparahan"):   table.setItem(i, 6, QTableWidgetItem(row_data["tingkat_keparahan"]))
-                if row_data.get("rekomendasi"): table.setItem(i, 7, QTableWidgetItem(row_data["rekomendasi"]))
-
-                if titik and "Busbar" not in titik:
-                    table.setItem(i, 0, QTableWidgetItem(titik))
-
-            elif table_type == "flexible_mic":
-                if row_data.get("nilai"):       table.setItem(i, 1, QTableWidgetItem(row_data["nilai"]))
-                if row_data.get("kepastian"):   table.setItem(i, 2, QTableWidgetItem(row_data["kepastian"]))
-                if table.cellWidget(i, 3):      table.cellWidget(i, 3).setCurrentText(row_data.get("interpretasi", ""))
-                if table.cellWidget(i, 4):      table.cellWidget(i, 4).setCurrentText(row_data.get("suara_gemerosok", ""))
-                if table.cellWidget(i, 5):      table.cellWidget(i, 5).setCurrentText(row_data.get("cluster_dua_gelombang", ""))
-                if row_data.get("lokasi_temuan"):      table.setItem(i, 6, QTableWidgetItem(row_data["lokasi_temuan"]))
-                if row_data.get("tingkat_keparahan"):   table.setItem(i, 7, QTableWidgetItem(row_data["tingkat_keparahan"]))
-                if row_data.get("rekomendasi"): table.setItem(i, 8, QTableWidgetItem(row_data["rekomendasi"]))
-
-                if titik:
-                    table.setItem(i, 0, QTableWidgetItem(titik))
+        table.model().dari_list(table_data, self.keys[table_type], isi_baris=isi_titik)
 
     # ===== Fungsi Reset =====
     def reset_tab(self):
@@ -514,27 +355,7 @@ class KubikelIncoming20kV(QWidget):
 
 
     def reset_table(self, table, table_type):
+        """Sisakan satu baris kosong (titik default sesuai table_type)."""
         table.setRowCount(0)
-        table.insertRow(0)
+        table.setRowCount(1)
         self.setup_row(table, 0, table_type)
-
-        if table_type == "tev":
-            for col in range(1, 6):  # clear nilai, ppc, interp, keparahan, rekomendasi
-                if col in (1, 2, 4, 5) and table.item(0, col):
-                    table.item(0, col).setText("")
-                if col == 3 and table.cellWidget(0, col):
-                    table.cellWidget(0, col).setCurrentIndex(-1)
-
-        elif table_type == "contact_probe":
-            for col in range(1, 8):
-                if col in (1, 2, 6, 7) and table.item(0, col):
-                    table.item(0, col).setText("")
-                if col in (3, 4, 5) and table.cellWidget(0, col):
-                    table.cellWidget(0, col).setCurrentIndex(-1)
-
-        elif table_type == "flexible_mic":
-            for col in range(1, 9):
-                if col in (1, 2, 6, 7, 8) and table.item(0, col):
-                    table.item(0, col).setText("")
-                if col in (3, 4, 5) and table.cellWidget(0, col):
-                    table.cellWidget(0, col).setCurrentIndex(-1)
\ No newline at end of file
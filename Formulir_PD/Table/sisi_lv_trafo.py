@@ -5,11 +5,9 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
-    QComboBox, QTableWidget, QTableWidgetItem, QHeaderView
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QComboBox, QHeaderView
 )
-from PySide6.QtCore import Qt
-from MyWidget import RowEditors, TableUtility
+from MyWidget import RowEditors, TableUtility, KolomTabel, TabelPengukuran
 from StandardValue import KlasifikasiPDUltrasonik, KlasifikasiPDFinal, UpdateHasilKlasifikasi
 
 # =========================================================
@@ -53,83 +51,35 @@ class SisiLVTrafo(QWidget):
         layout.addLayout(grid)
 
         # ---------------------------------------------------------
-        # WIDGET BANTU
+        # KOLOM TABEL
         # ---------------------------------------------------------
-        # Combobox untuk interpretasi hasil (PD / Noise)
-        def make_interpretasi_combo():
-            combo = QComboBox()
-            combo.addItems(["PD", "Noise"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # Combobox untuk pilihan suara gemerosok
-        def make_suara_gemerosok_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # Combobox untuk cluster dua gelombang
-        def make_cluster_dua_gelombang_combo():
-            combo = QComboBox()
-            combo.addItems(["Tidak Ada", "Ada"])
-            combo.setCurrentIndex(-1)
-            return combo
-
-        # Widget gabungan lokasi PD (Fasa + Core)
-        def lokasi_muncul_pd_widget():
-            """Widget untuk memilih lokasi PD berdasarkan fasa dan core."""
-            container = QWidget()
-            hbox = QHBoxLayout(container)
-            hbox.setContentsMargins(0, 0, 0, 0)
-            hbox.setSpacing(5)
-
-            hbox.addWidget(QLabel("Fasa"))
-            combo_fasa = QComboBox()
-            combo_fasa.addItems(["R", "S", "T"])
-            combo_fasa.setCurrentIndex(-1)
-            hbox.addWidget(combo_fasa)
-
-            hbox.addWidget(QLabel("Core"))
-            combo_core = QComboBox()
-            combo_core.addItems(["1", "2", "3", "4"])
-            combo_core.setCurrentIndex(-1)
-            hbox.addWidget(combo_core)
-
-            return container
+        # Kolom 6: lokasi PD gabungan (Fasa + Core) → disimpan sebagai lokasi_fasa & lokasi_core
+        self.kolom = [
+            KolomTabel("titik", "Titik", baca_saja=True),
+            KolomTabel("nilai", "Nilai (dBμV)", "angka"),
+            KolomTabel("kepastian", "Kepastian (%)", "angka"),
+            KolomTabel("interpretasi", "Interpretasi", "pilihan", ("PD", "Noise")),
+            KolomTabel("suara_gemerosok", "Suara Gemerosok", "pilihan", ("Tidak Ada", "Ada")),
+            KolomTabel("cluster_dua_gelombang", "Cluster Dua Gelombang", "pilihan", ("Tidak Ada", "Ada")),
+            KolomTabel(("lokasi_fasa", "lokasi_core"), "Lokasi Muncul PD", "pilihan_ganda",
+                       (("R", "S", "T"), ("1", "2", "3", "4")), label=("Fasa", "Core")),
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi", baca_saja=True),
+        ]
+        self.keys = [
+            "titik", "nilai", "kepastian", "interpretasi", "suara_gemerosok",
+            "cluster_dua_gelombang", "lokasi_fasa", "lokasi_core", "tingkat_keparahan", "rekomendasi"
+        ]
 
         # ---------------------------------------------------------
         # UNIVERSAL ROW SETUP
         # ---------------------------------------------------------
         def setup_row(table, row):
             """
-            Membuat isi default untuk 1 baris pada tabel tertentu.
+            Isi default untuk 1 baris pada tabel tertentu (nomor titik).
             Kolom: Titik, Nilai, Kepastian, Interpretasi, Suara, Cluster, Lokasi, Keparahan, Rekomendasi
             """
-            # Kolom 0: Titik (read-only)
-            titik_item = QTableWidgetItem(str(row + 1))
-            titik_item.setFlags(titik_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(row, 0, titik_item)
-
-            # Kolom 1: Nilai (dBµV)
-            table.setItem(row, 1, QTableWidgetItem(""))
-            
-            # Kolom 2: Kepastian (%)
-            table.setItem(row, 2, QTableWidgetItem(""))
-
-            # Kolom 3-5: ComboBox untuk interpretasi & fitur tambahan
-            table.setCellWidget(row, 3, make_interpretasi_combo()) 
-            table.setCellWidget(row, 4, make_suara_gemerosok_combo())
-            table.setCellWidget(row, 5, make_cluster_dua_gelombang_combo())
-            
-            # Kolom 6: Lokasi temuan
-            table.setCellWidget(row, 6, lokasi_muncul_pd_widget())
-
-            # Kolom 7: Tingkat keparahan (hasil klasifikasi)
-            table.setItem(row, 7, QTableWidgetItem(""))
-
-            # Kolom 8: Rekomendasi aksi (hasil klasifikasi)
-            table.setItem(row, 8, QTableWidgetItem(""))
+            table.setel(row, 0, str(row + 1))
 
         # Simpan callback agar bisa dipanggil di fungsi load
         self.setup_row = setup_row
@@ -144,15 +94,9 @@ class SisiLVTrafo(QWidget):
             """
             layout.addWidget(QLabel(f"<b>{title}</b>"))
 
-            table = QTableWidget(0, 9)
-            table.setHorizontalHeaderLabels([
-                "Titik", "Nilai (dBμV)", "Kepastian (%)", "Interpretasi",
-                "Suara Gemerosok", "Cluster Dua Gelombang",
-                "Lokasi Muncul PD", "Tingkat Keparahan", "Rekomendasi Aksi"
-            ])
+            table = TabelPengukuran(self.kolom, jumlah_baris=1)
 
-            # Tambahkan 1 baris default
-            table.insertRow(0)
+            # Isi 1 baris default
             setup_row(table, 0)
 
             self.tables.append(table)
@@ -201,9 +145,10 @@ class SisiLVTrafo(QWidget):
         # ---------------------------------------------------------
         # TABEL REKAPITULASI KESELURUHAN
         # ---------------------------------------------------------
-        self.table_summary = QTableWidget(0, 3)
-        self.table_summary.setHorizontalHeaderLabels([
-            "Titik", "Tingkat Keparahan Keseluruhan", "Rekomendasi Aksi Keseluruhan"
+        self.table_summary = TabelPengukuran([
+            KolomTabel("titik", "Titik", baca_saja=True),
+            KolomTabel("tingkat_keparahan", "Tingkat Keparahan Keseluruhan", baca_saja=True),
+            KolomTabel("rekomendasi", "Rekomendasi Aksi Keseluruhan", baca_saja=True),
         ])
         header_summary = self.table_summary.horizontalHeader()
         header_summary.setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -230,7 +175,7 @@ class SisiLVTrafo(QWidget):
         # Hubungkan perubahan tabel sensor ke summary updater
         for table in [self.table1, self.table2, self.table3]:
             table.cellChanged.connect(
-                lambda row, col, t=table: self.summary_updater.update_summary(row_map, (1, 2))
+                lambda row, col, t=table: self.summary_updater.update_summary(row_map, (1, 2), row=row)
             )
 
     # ---------------------------------------------------------
@@ -249,23 +194,8 @@ class SisiLVTrafo(QWidget):
         }
 
     def save_table_data(self, table):
-        """Ambil isi tabel (per row) jadi list of dict."""
-        data = []
-        for row in range(table.rowCount()):
-            row_data = {
-                "titik": table.item(row, 0).text() if table.item(row, 0) else "",
-                "nilai": table.item(row, 1).text() if table.item(row, 1) else "",
-                "kepastian": table.item(row, 2).text() if table.item(row, 2) else "",
-                "interpretasi": table.cellWidget(row, 3).currentText() if table.cellWidget(row, 3) else "",
-                "suara_gemerosok": table.cellWidget(row, 4).currentText() if table.cellWidget(row, 4) else "",
-                "cluster_dua_gelombang": table.cellWidget(row, 5).currentText() if table.cellWidget(row, 5) else "",
-                "lokasi_fasa": table.cellWidget(row, 6).layout().itemAt(1).widget().currentText() if table.cellWidget(row, 6) else "",
-                "lokasi_core": table.cellWidget(row, 6).layout().itemAt(3).widget().currentText() if table.cellWidget(row, 6) else "",
-                "tingkat_keparahan": table.item(row, 7).text() if table.item(row, 7) else "",
-                "rekomendasi": table.item(row, 8).text() if table.item(row, 8) else "",
-            }
-            data.append(row_data)
-        return data
+        """Ambil isi tabel (per row) jadi list of dict, langsung dari model."""
+        return table.model().ke_list(self.keys)
     
     # ===== Fungsi Load =====
     def load_tab(self, saved_data):
@@ -278,24 +208,7 @@ class SisiLVTrafo(QWidget):
 
     def load_table_data(self, table, table_data):
         """Isi ulang tabel dari list of dict (data JSON)."""
-        table.setRowCount(0)
-        for i, row_data in enumerate(table_data):
-            table.insertRow(i)
-            self.setup_row(table, i)
-
-            # Isi data sesuai mapping kolom
-            if table.item(i, 0): table.item(i, 0).setText(row_data.get("titik", ""))
-            if table.item(i, 1): table.item(i, 1).setText(row_data.get("nilai", ""))
-            if table.item(i, 2): table.item(i, 2).setText(row_data.get("kepastian", ""))
-            if table.cellWidget(i, 3): table.cellWidget(i, 3).setCurrentText(row_data.get("interpretasi", ""))
-            if table.cellWidget(i, 4): table.cellWidget(i, 4).setCurrentText(row_data.get("suara_gemerosok", ""))
-            if table.cellWidget(i, 5): table.cellWidget(i, 5).setCurrentText(row_data.get("cluster_dua_gelombang", ""))
-            if table.cellWidget(i, 6):
-                layout = table.cellWidget(i, 6).layout()
-                layout.itemAt(1).widget().setCurrentText(row_data.get("lokasi_fasa", ""))
-                layout.itemAt(3).widget().setCurrentText(row_data.get("lokasi_core", ""))
-            if table.item(i, 7): table.setItem(i, 7, QTableWidgetItem(row_data.get("tingkat_keparahan", "")))
-            if table.item(i, 8): table.setItem(i, 8, QTableWidgetItem(row_data.get("rekomendasi", "")))
+        table.model().dari_list(table_data, self.keys)
 
     # ===== Fungsi Reset =====
     def reset_tab(self):
@@ -306,21 +219,6 @@ class SisiLVTrafo(QWidget):
 
     def reset_table_data(self, table):
         """Kosongkan isi tabel tanpa menghapus strukturnya."""
-        for row in range(table.rowCount()):
-            # Kosongkan kolom teks
-            for col in (0, 1, 2, 7, 8):
-                item = table.item(row, col)
-                if item:
-                    item.setText("")
-
-            # Reset combobox
-            for col in (3, 4, 5):
-                widget = table.cellWidget(row, col)
-                if widget:
-                    widget.setCurrentIndex(-1)
-
-            # Reset lokasi PD (fasa+core)
-            if table.cellWidget(row, 6):
-                layout = table.cellWidget(row, 6).layout()
-                layout.itemAt(1).widget().setCurrentIndex(-1)
-                layout.itemAt(3).widget().setCurrentIndex(-1)
+        model = table.model()
+        for row in range(model.rowCount()):
+            model.kosongkan_baris(row, range(model.columnCount()))
@@ -0,0 +1,109 @@
+import os
+import sys
+import argparse
+import subprocess
+
+# =========================================================
+# MODUL : LAPORAN WAKTU IMPOR (COLD START)
+# =========================================================
+# Menjalankan "python -X importtime -c 'import <modul>'" di proses baru, lalu merangkum
+# waktu impor per paket teratas. Dipakai untuk menjaga startup halaman depan tetap di
+# bawah anggaran, dan memastikan library analisis / plot / ekspor tidak ikut dimuat
+# sebelum halaman atau aksinya dipakai.
+#
+# Pemakaian:
+#   python cek_waktu_impor.py
+#   python cek_waktu_impor.py --modul Halaman_Formulir_Laporan_PLN --anggaran 600 --teratas 15
+#   python cek_waktu_impor.py --anggaran-peringatan      (dipakai skrip build: waktu hanya dilaporkan)
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Library berat yang TIDAK boleh dimuat saat aplikasi baru dibuka
+MODUL_BERAT = ("numpy", "cv2", "pandas", "scipy", "sklearn", "matplotlib", "docxtpl", "docx2pdf")
+
+
+# ---------------------------------------------------------
+# PENGUKURAN
+# ---------------------------------------------------------
+def ukur_impor(modul):
+    """
+    Impor `modul` di interpreter baru dengan -X importtime.
+
+    Return:
+        list of tuple: (nama modul, waktu sendiri µs, waktu kumulatif µs).
+
+    Raise:
+        RuntimeError jika impor gagal.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    proses = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modul}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if proses.returncode != 0:
+        raise RuntimeError(f"Impor {modul} gagal:\n{proses.stderr.strip().splitlines()[-1]}")
+
+    baris = []
+    for teks in proses.stderr.splitlines():
+        if not teks.startswith("import time:") or "self [us]" in teks:
+            continue
+        # Format: "import time: <self> | <kumulatif> | <indentasi><nama modul>"
+        sendiri, kumulatif, nama = teks[len("import time:"):].split("|", 2)
+        baris.append((nama.strip(), int(sendiri), int(kumulatif)))
+    return baris
+
+
+def rangkum(baris, modul):
+    """
+    Rangkum hasil ukur_impor.
+
+    Return:
+        dict: total_ms (kumulatif `modul`), per_paket (paket teratas → ms waktu sendiri),
+              berat (MODUL_BERAT yang ikut dimuat).
+    """
+    total = next((kumulatif for nama, _, kumulatif in baris if nama == modul), 0)
+    per_paket = {}
+    for nama, sendiri, _ in baris:
+        paket = nama.split(".")[0]
+        per_paket[paket] = per_paket.get(paket, 0) + sendiri
+    dimuat = {nama.split(".")[0] for nama, *_ in baris}
+    return {
+        "total_ms": total / 1000,
+        "per_paket": {paket: us / 1000 for paket, us in sorted(per_paket.items(), key=lambda x: -x[1])},
+        "berat": [nama for nama in MODUL_BERAT if nama in dimuat],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Laporan waktu impor (-X importtime) & anggaran startup")
+    parser.add_argument("--modul", default="Halaman_Depan_Laporan_PLN", help="Modul yang diimpor")
+    parser.add_argument("--anggaran", type=float, default=500.0, help="Batas waktu impor kumulatif (ms)")
+    parser.add_argument("--ulang", type=int, default=3, help="Jumlah pengulangan (diambil yang tercepat)")
+    parser.add_argument("--teratas", type=int, default=10, help="Jumlah paket yang ditampilkan")
+    parser.add_argument("--izinkan-berat", action="store_true", help="Jangan gagal jika MODUL_BERAT ikut dimuat")
+    parser.add_argument("--anggaran-peringatan", action="store_true",
+                        help="Waktu di atas anggaran hanya peringatan (waktu impor bergantung mesin); "
+                             "yang menggagalkan hanya MODUL_BERAT")
+    args = parser.parse_args(argv)
+
+    # Pengulangan pertama ikut mengompilasi .pyc; ambil hasil tercepat
+    hasil = min((rangkum(ukur_impor(args.modul), args.modul) for _ in range(max(args.ulang, 1))),
+                key=lambda r: r["total_ms"])
+
+    print(f"Impor {args.modul}: {hasil['total_ms']:.1f} ms (anggaran {args.anggaran:.0f} ms)")
+    print(f"{'Paket':<40}{'Waktu sendiri':>16}")
+    for paket, ms in list(hasil["per_paket"].items())[:args.teratas]:
+        print(f"{paket:<40}{ms:>13.1f} ms")
+
+    gagal = False
+    if hasil["total_ms"] > args.anggaran:
+        print(f"⚠️ Waktu impor melebihi anggaran: {hasil['total_ms']:.1f} ms > {args.anggaran:.0f} ms")
+        gagal = gagal or not args.anggaran_peringatan
+    if hasil["berat"] and not args.izinkan_berat:
+        print(f"⚠️ Library berat ikut dimuat saat startup: {', '.join(hasil['berat'])}")
+        gagal = True
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())